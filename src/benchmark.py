@@ -0,0 +1,878 @@
+import argparse
+import os
+import random
+import subprocess
+import sys
+import tempfile
+import time
+
+from chips.mos65c02 import M65C02
+from chips.mos65c02 import *
+
+from chips.memory import RAM
+from chips.memory import ROM
+from chips.memory import Memory64
+from chips.memory import IO
+from chips.memory import Mirror
+from chips.memory import InstructionCache
+from chips.translator import BlockTranslator
+from chips.Circuit import Circuit
+from chips.opcodes import CYCLES
+from chips.opcodes import MNEMONICS
+from chips.opcodes import coverage
+from chips.w65c22 import W65C22
+from chips.bitbang import SPIAdapter
+from chips.sdcard import SDCard
+
+
+def rom_image(code, reset=0x8000):
+    """
+        Builds a 32K ROM image mapped at $8000, with the reset vector set.
+
+        Args
+        ----
+        code : list of int
+            the machine code, placed at the beginning of the ROM.
+        reset : int, optional
+            the address of the reset routine.
+
+        Returns
+        -------
+        image : bytearray
+            the 32K content of the ROM.
+    """
+    image = bytearray(0x8000)
+    image[:len(code)] = bytes(code)
+    image[0x7ffc] = reset & 0xff
+    image[0x7ffd] = reset >> 8
+    return image
+
+
+# src/asm/main.s
+LOOP = rom_image([
+    0x4c, 0x00, 0x80,  # 8000 loop: JMP loop
+])
+
+# a loop exercising loads, stores, ALU, stack, subroutine and branch opcodes.
+HEAVY = rom_image([
+    0xa2, 0xff,        # 8000       LDX #$ff
+    0x9a,              # 8002       TXS
+    0xa9, 0x01,        # 8003 outer:LDA #$01
+    0xa0, 0x10,        # 8005       LDY #$10
+    0x85, 0x10,        # 8007 inner:STA $10
+    0x0a,              # 8009       ASL A
+    0x2a,              # 800a       ROL A
+    0x4a,              # 800b       LSR A
+    0x05, 0x10,        # 800c       ORA $10
+    0x29, 0x7f,        # 800e       AND #$7f
+    0x49, 0x55,        # 8010       EOR #$55
+    0xe6, 0x11,        # 8012       INC $11
+    0x48,              # 8014       PHA
+    0xaa,              # 8015       TAX
+    0xe8,              # 8016       INX
+    0x8a,              # 8017       TXA
+    0x68,              # 8018       PLA
+    0x20, 0x30, 0x80,  # 8019       JSR sub
+    0x88,              # 801c       DEY
+    0xf0, 0x03,        # 801d       BEQ next
+    0x4c, 0x07, 0x80,  # 801f       JMP inner
+    0x4c, 0x03, 0x80,  # 8022 next: JMP outer
+] + [0xea] * 11 + [
+    0xc9, 0x40,        # 8030 sub:  CMP #$40
+    0x18,              # 8032       CLC
+    0x38,              # 8033       SEC
+    0xea,              # 8034       NOP
+    0x60,              # 8035       RTS
+])
+
+# a page copy, reading the ROM with indexed loads.
+COPY = rom_image([
+    0xa2, 0x00,        # 8000 copy: LDX #$00
+    0xbd, 0x00, 0x81,  # 8002 byte: LDA $8100,X
+    0x9d, 0x00, 0x02,  # 8005       STA $0200,X
+    0xe8,              # 8008       INX
+    0xf0, 0x03,        # 8009       BEQ done
+    0x4c, 0x02, 0x80,  # 800b       JMP byte
+    0x4c, 0x00, 0x80,  # 800e done: JMP copy
+])
+
+# a 16-bit decimal counter.
+BCD = rom_image([
+    0xf8,              # 8000       SED
+    0x18,              # 8001 count:CLC
+    0xa5, 0x10,        # 8002       LDA $10
+    0x69, 0x01,        # 8004       ADC #$01
+    0x85, 0x10,        # 8006       STA $10
+    0xa5, 0x11,        # 8008       LDA $11
+    0x69, 0x00,        # 800a       ADC #$00
+    0x85, 0x11,        # 800c       STA $11
+    0x4c, 0x01, 0x80,  # 800e       JMP count
+])
+
+ROMS = {"loop": LOOP, "heavy": HEAVY, "copy": COPY, "bcd": BCD}
+
+# SD card reads bit-banged on the port B of a VIA at $6000, SCK on PB0, MOSI on PB1, CS on PB2
+# and MISO on PB6: the card is initialized, then its blocks are read one after the other into
+# $0200-$03ff, counted in $10-$11.
+SD = rom_image([
+    0xa2, 0xff,        # 8000 reset:LDX #$ff
+    0x9a,              # 8002       TXS
+    0xa9, 0x07,        # 8003       LDA #$07
+    0x8d, 0x02, 0x60,  # 8005       STA $6002
+    0xa9, 0x04,        # 8008       LDA #$04
+    0x85, 0x02,        # 800a       STA $02
+    0xa0, 0x0a,        # 800c       LDY #$0a
+    0xa9, 0xff,        # 800e wake: LDA #$ff
+    0x20, 0xaf, 0x80,  # 8010       JSR spi
+    0x88,              # 8013       DEY
+    0xd0, 0xf8,        # 8014       BNE wake
+    0x64, 0x02,        # 8016       STZ $02
+    0xa2, 0x00,        # 8018       LDX #$00
+    0x20, 0x84, 0x80,  # 801a       JSR setcmd
+    0x20, 0x93, 0x80,  # 801d       JSR command
+    0xa2, 0x06,        # 8020       LDX #$06
+    0x20, 0x84, 0x80,  # 8022       JSR setcmd
+    0x20, 0x93, 0x80,  # 8025       JSR command
+    0xa0, 0x04,        # 8028       LDY #$04
+    0xa9, 0xff,        # 802a r7:   LDA #$ff
+    0x20, 0xaf, 0x80,  # 802c       JSR spi
+    0x88,              # 802f       DEY
+    0xd0, 0xf8,        # 8030       BNE r7
+    0xa2, 0x0c,        # 8032 acmd: LDX #$0c
+    0x20, 0x84, 0x80,  # 8034       JSR setcmd
+    0x20, 0x93, 0x80,  # 8037       JSR command
+    0xa2, 0x12,        # 803a       LDX #$12
+    0x20, 0x84, 0x80,  # 803c       JSR setcmd
+    0x20, 0x93, 0x80,  # 803f       JSR command
+    0xc9, 0x00,        # 8042       CMP #$00
+    0xd0, 0xec,        # 8044       BNE acmd
+    0xa2, 0x18,        # 8046       LDX #$18
+    0x20, 0x84, 0x80,  # 8048       JSR setcmd
+    0x20, 0x93, 0x80,  # 804b read: JSR command
+    0xa9, 0xff,        # 804e token:LDA #$ff
+    0x20, 0xaf, 0x80,  # 8050       JSR spi
+    0xc9, 0xfe,        # 8053       CMP #$fe
+    0xd0, 0xf7,        # 8055       BNE token
+    0xa0, 0x00,        # 8057       LDY #$00
+    0xa9, 0xff,        # 8059 low:  LDA #$ff
+    0x20, 0xaf, 0x80,  # 805b       JSR spi
+    0x99, 0x00, 0x02,  # 805e       STA $0200,Y
+    0xc8,              # 8061       INY
+    0xd0, 0xf5,        # 8062       BNE low
+    0xa9, 0xff,        # 8064 high: LDA #$ff
+    0x20, 0xaf, 0x80,  # 8066       JSR spi
+    0x99, 0x00, 0x03,  # 8069       STA $0300,Y
+    0xc8,              # 806c       INY
+    0xd0, 0xf5,        # 806d       BNE high
+    0x20, 0xaf, 0x80,  # 806f       JSR spi
+    0x20, 0xaf, 0x80,  # 8072       JSR spi
+    0xe6, 0x0c,        # 8075       INC $0c
+    0xd0, 0x02,        # 8077       BNE count
+    0xe6, 0x0b,        # 8079       INC $0b
+    0xe6, 0x10,        # 807b count:INC $10
+    0xd0, 0xcc,        # 807d       BNE read
+    0xe6, 0x11,        # 807f       INC $11
+    0x4c, 0x4b, 0x80,  # 8081       JMP read
+    0xa0, 0x00,        # 8084 setcmd: LDY #$00
+    0xbd, 0xd5, 0x80,  # 8086 copy: LDA $80d5,X
+    0x99, 0x08, 0x00,  # 8089       STA $0008,Y
+    0xe8,              # 808c       INX
+    0xc8,              # 808d       INY
+    0xc0, 0x06,        # 808e       CPY #$06
+    0xd0, 0xf4,        # 8090       BNE copy
+    0x60,              # 8092       RTS
+    0xa9, 0xff,        # 8093 command: LDA #$ff
+    0x20, 0xaf, 0x80,  # 8095       JSR spi
+    0xa0, 0x00,        # 8098       LDY #$00
+    0xb9, 0x08, 0x00,  # 809a send: LDA $0008,Y
+    0x20, 0xaf, 0x80,  # 809d       JSR spi
+    0xc8,              # 80a0       INY
+    0xc0, 0x06,        # 80a1       CPY #$06
+    0xd0, 0xf5,        # 80a3       BNE send
+    0xa9, 0xff,        # 80a5 wait: LDA #$ff
+    0x20, 0xaf, 0x80,  # 80a7       JSR spi
+    0xc9, 0xff,        # 80aa       CMP #$ff
+    0xf0, 0xf7,        # 80ac       BEQ wait
+    0x60,              # 80ae       RTS
+    0x85, 0x00,        # 80af spi:  STA $00
+    0xa2, 0x08,        # 80b1       LDX #$08
+    0xa5, 0x02,        # 80b3 bit:  LDA $02
+    0x06, 0x00,        # 80b5       ASL $00
+    0x90, 0x02,        # 80b7       BCC zero
+    0x09, 0x02,        # 80b9       ORA #$02
+    0x8d, 0x00, 0x60,  # 80bb zero: STA $6000
+    0x09, 0x01,        # 80be       ORA #$01
+    0x8d, 0x00, 0x60,  # 80c0       STA $6000
+    0xad, 0x00, 0x60,  # 80c3       LDA $6000
+    0x0a,              # 80c6       ASL A
+    0x0a,              # 80c7       ASL A
+    0x26, 0x01,        # 80c8       ROL $01
+    0xca,              # 80ca       DEX
+    0xd0, 0xe6,        # 80cb       BNE bit
+    0xa5, 0x02,        # 80cd       LDA $02
+    0x8d, 0x00, 0x60,  # 80cf       STA $6000
+    0xa5, 0x01,        # 80d2       LDA $01
+    0x60,              # 80d4       RTS
+    0x40, 0x00, 0x00, 0x00, 0x00, 0x95,  # 80d5 table:CMD0
+    0x48, 0x00, 0x00, 0x01, 0xaa, 0x87,  # 80db       CMD8
+    0x77, 0x00, 0x00, 0x00, 0x00, 0x01,  # 80e1       CMD55
+    0x69, 0x40, 0x00, 0x00, 0x00, 0x01,  # 80e7       ACMD41
+    0x51, 0x00, 0x00, 0x00, 0x00, 0x01,  # 80ed       CMD17
+])
+
+
+def make_circuit(image, ram_bits=15, devices=()):
+    """
+        Builds the default machine, 32K of RAM at $0000 and the given ROM at
+        $8000, and the devices, given as (org, size, device), in between.
+    """
+    with tempfile.NamedTemporaryFile(suffix=".bin", delete=False) as file:
+        file.write(image)
+    try:
+        rom = ROM(file.name)
+    finally:
+        os.remove(file.name)
+    rom.set_org(0x8000)
+    ram = RAM(bits=ram_bits)
+    regions = [ram, rom]
+    for org, size, device in devices:
+        io = IO(device, size)
+        io.set_org(org)
+        regions.append(io)
+
+    cpu = M65C02()
+    pins = 0b0000000000000000000000000000000000000000
+    pins |= (M65C02_VCC|M65C02_RDY|M65C02_IRQB|M65C02_NMIB|M65C02_BE|M65C02_RESB|M65C02_SYNC)
+    circuit = Circuit(pins, cpu, Memory64(*regions))
+    cpu.attach_circuit(circuit)
+    for _, _, device in devices:
+        circuit.attach(device)
+    return circuit
+
+
+def bench_cycles(image, cycles):
+    """ runs the cycle-stepped core headless for a given number of cycles, returns cycles per second. """
+    circuit = make_circuit(image)
+    circuit.reset()
+
+    start = time.perf_counter()
+    elapsed = circuit.run(cycles)
+    return elapsed / (time.perf_counter() - start)
+
+
+def bench_instructions(image, cycles, lazy_flags=True, icache=False):
+    """ runs the instruction-level engine for a given number of cycles, returns cycles per second. """
+    circuit = make_circuit(image)
+    circuit.cpu.lazy_flags = lazy_flags
+    if icache:
+        circuit.cpu.icache = InstructionCache(circuit.memory)
+    circuit.cpu.reset()
+
+    start = time.perf_counter()
+    elapsed = circuit.cpu.run(cycles=cycles)
+    return elapsed / (time.perf_counter() - start)
+
+
+def bench_eager(image, cycles):
+    """ runs the instruction-level engine with eager flags, returns cycles per second. """
+    return bench_instructions(image, cycles, lazy_flags=False)
+
+
+def bench_cached(image, cycles):
+    """ runs the instruction-level engine over the instruction cache, returns cycles per second. """
+    return bench_instructions(image, cycles, icache=True)
+
+
+def bench_translated(image, cycles):
+    """ runs the translated blocks, translation included, returns cycles per second. """
+    circuit = make_circuit(image)
+    circuit.cpu.reset()
+    translator = BlockTranslator(circuit.cpu)
+
+    start = time.perf_counter()
+    elapsed = translator.run(cycles)
+    return elapsed / (time.perf_counter() - start)
+
+
+BENCHES = {"cycle": bench_cycles, "instruction": bench_instructions, "eager": bench_eager, "cached": bench_cached,
+           "translated": bench_translated}
+
+
+def bench_sd(mode, cycles):
+    """
+        Runs the SD ROM on an engine for a given number of cycles, the card
+        answering a byte at a time behind the SPI adapter.
+
+        Returns
+        -------
+        rates : tuple of float
+            the bytes transferred over SPI per second, and the cycles per second.
+    """
+    via = W65C22()
+    circuit = make_circuit(SD, ram_bits=14, devices=[(0x6000, 16, via)])
+    spi = SPIAdapter(via, SDCard(bytearray(range(256)) * 128))
+    cpu = circuit.cpu
+    cpu.lazy_flags = mode != "eager"
+    if mode == "cached":
+        cpu.icache = InstructionCache(circuit.memory)
+    translator = BlockTranslator(cpu) if mode == "translated" else None
+    if mode == "cycle":
+        circuit.reset()
+    else:
+        cpu.reset()
+
+    start = time.perf_counter()
+    if mode == "cycle":
+        elapsed = circuit.run(cycles)
+    elif translator is not None:
+        elapsed = translator.run(cycles)
+    else:
+        elapsed = cpu.run(cycles=cycles)
+    seconds = time.perf_counter() - start
+    return spi.transfers / seconds, elapsed / seconds
+
+
+# WAI and STP replaced by NOP in random memory.
+_NO_WAIT = bytes(0xea if b in (0xcb, 0xdb) else b for b in range(256))
+
+
+def check_lazy_flags(image, instructions, seed=0, icache=True):
+    """
+        Runs the instruction-level engine with eager and with lazy flags side by
+        side, the lazy one in random chunks of instructions and over the
+        instruction cache unless told otherwise, and checks that the registers,
+        P included, and the memory are identical after each chunk.
+        Inside a chunk, P is only observed by branches, PHP, BRK and PLP/RTI,
+        whose effects show up in PC and memory.
+
+        Args
+        ----
+        image : bytearray or None
+            the 32K ROM image, None for 64K of random RAM, WAI and STP excluded,
+            run from random registers for each chunk.
+        instructions : int
+            the number of instructions to compare.
+        seed : int, optional
+            the seed of the random RAM and chunks.
+        icache : bool, optional
+            whether the lazy engine runs over the instruction cache.
+
+        Returns
+        -------
+        mismatch : tuple or None
+            the first mismatching (eager, lazy) states, None if there is none.
+    """
+    rng = random.Random(seed)
+    circuits = []
+    for lazy_flags in (False, True):
+        if image is None:
+            rng.seed(seed)
+            ram = RAM(bits=16)
+            ram._bytes[:] = rng.randbytes(0x10000).translate(_NO_WAIT)
+            cpu = M65C02()
+            circuit = Circuit(M65C02_VCC|M65C02_RDY|M65C02_IRQB|M65C02_NMIB|M65C02_BE|M65C02_RESB, cpu, Memory64(ram))
+            cpu.attach_circuit(circuit)
+        else:
+            circuit = make_circuit(image)
+        circuit.cpu.lazy_flags = lazy_flags
+        if lazy_flags and icache:
+            circuit.cpu.icache = InstructionCache(circuit.memory)
+        circuit.cpu.reset()
+        circuits.append(circuit)
+
+    eager, lazy = (circuit.cpu for circuit in circuits)
+    done = 0
+    while done < instructions:
+        if image is None:
+            # random memory soon loops, restart both from the same random registers.
+            state = [rng.getrandbits(8) for _ in range(5)] + [rng.getrandbits(16)]
+            for circuit in circuits:
+                circuit.ram._bytes[:] = circuit.ram._bytes.translate(_NO_WAIT)
+                if circuit.cpu.icache is not None:
+                    circuit.cpu.icache.clear()
+                circuit.cpu._A, circuit.cpu._X, circuit.cpu._Y, circuit.cpu._S, circuit.cpu._P, circuit.cpu._PC = state
+        n = rng.randint(1, 64)
+        for _ in range(n):
+            eager.step_instruction()
+        lazy.run(instructions=n)
+        done += n
+        states = [(cpu._PC, cpu._A, cpu._X, cpu._Y, cpu._S, cpu._P, cpu._cycles) for cpu in (eager, lazy)]
+        if states[0] != states[1] or bytes(circuits[0].ram._bytes) != bytes(circuits[1].ram._bytes):
+            return tuple(states)
+    return None
+
+
+def check_translator(image, instructions, seed=0):
+    """
+        Runs the translated blocks and the instruction-level engine with eager
+        flags side by side, the latter catching up with the cycle count of the
+        former after each block, and checks that the registers and the memory
+        are identical.
+
+        Args
+        ----
+        image : bytearray or None
+            the 32K ROM image, None for 64K of random RAM, WAI and STP excluded,
+            run from random registers for every few blocks.
+        instructions : int
+            the number of instructions to compare, roughly.
+        seed : int, optional
+            the seed of the random RAM and registers.
+
+        Returns
+        -------
+        mismatch : tuple or None
+            the first mismatching (eager, translated) states, None if there is none.
+    """
+    rng = random.Random(seed)
+    circuits = []
+    for _ in range(2):
+        if image is None:
+            rng.seed(seed)
+            ram = RAM(bits=16)
+            ram._bytes[:] = rng.randbytes(0x10000).translate(_NO_WAIT)
+            cpu = M65C02()
+            circuit = Circuit(M65C02_VCC|M65C02_RDY|M65C02_IRQB|M65C02_NMIB|M65C02_BE|M65C02_RESB, cpu, Memory64(ram))
+            cpu.attach_circuit(circuit)
+        else:
+            circuit = make_circuit(image)
+        circuit.cpu.reset()
+        circuits.append(circuit)
+    circuits[0].cpu.lazy_flags = False
+    eager, translated = (circuit.cpu for circuit in circuits)
+    translator = BlockTranslator(translated)
+
+    done = 0
+    while done < instructions:
+        if image is None:
+            state = [rng.getrandbits(8) for _ in range(5)] + [rng.getrandbits(16)]
+            for circuit in circuits:
+                circuit.ram._bytes[:] = circuit.ram._bytes.translate(_NO_WAIT)
+                circuit.cpu._A, circuit.cpu._X, circuit.cpu._Y, circuit.cpu._S, circuit.cpu._P, circuit.cpu._PC = state
+            translator.clear()
+        for _ in range(rng.randint(1, 8)):
+            translator.step()
+            while eager._cycles < translated._cycles:
+                eager.step_instruction()
+                done += 1
+            states = [(cpu._PC, cpu._A, cpu._X, cpu._Y, cpu._S, cpu._P, cpu._cycles) for cpu in (eager, translated)]
+            if states[0] != states[1] or bytes(circuits[0].ram._bytes) != bytes(circuits[1].ram._bytes):
+                return tuple(states)
+    return None
+
+
+def check_cycle(image, instructions, seed=0):
+    """
+        Runs the cycle-stepped core and the instruction-level engine with eager
+        flags side by side, the former clocked up to the next opcode fetch, and
+        checks that the registers, the cycle count and the memory are identical
+        after each instruction, as the handoff between the two expects.
+
+        Args
+        ----
+        image : bytearray or None
+            the 32K ROM image, None for 64K of random RAM, WAI and STP excluded,
+            run from random registers for every few instructions.
+        instructions : int
+            the number of instructions to compare.
+        seed : int, optional
+            the seed of the random RAM and registers.
+
+        Returns
+        -------
+        mismatch : tuple or None
+            the first mismatching (cycle, instruction) states, None if there is none.
+    """
+    rng = random.Random(seed)
+    circuits = []
+    for _ in range(2):
+        if image is None:
+            rng.seed(seed)
+            ram = RAM(bits=16)
+            ram._bytes[:] = rng.randbytes(0x10000).translate(_NO_WAIT)
+            cpu = M65C02()
+            circuit = Circuit(M65C02_VCC|M65C02_RDY|M65C02_IRQB|M65C02_NMIB|M65C02_BE|M65C02_RESB, cpu, Memory64(ram))
+            cpu.attach_circuit(circuit)
+        else:
+            circuit = make_circuit(image)
+        circuit.cpu.lazy_flags = False
+        circuit.cpu.reset()
+        circuits.append(circuit)
+    cycle, eager = (circuit.cpu for circuit in circuits)
+    circuits[0].to_cycle()
+
+    done = 0
+    while done < instructions:
+        if image is None:
+            # random memory soon loops, restart both from the same random registers.
+            state = [rng.getrandbits(8) for _ in range(5)] + [rng.getrandbits(16)]
+            for circuit in circuits:
+                circuit.ram._bytes[:] = circuit.ram._bytes.translate(_NO_WAIT)
+                circuit.cpu._A, circuit.cpu._X, circuit.cpu._Y, circuit.cpu._S, circuit.cpu._P, circuit.cpu._PC = state
+            circuits[0].to_cycle()
+        for _ in range(rng.randint(1, 64)):
+            circuits[0].clock()
+            while not cycle._CTRL&M65C02_SYNC:
+                circuits[0].clock()
+            eager.step_instruction()
+            done += 1
+            states = [(cpu._PC, cpu._A, cpu._X, cpu._Y, cpu._S, cpu._P, cpu._cycles) for cpu in (cycle, eager)]
+            if states[0] != states[1] or bytes(circuits[0].ram._bytes) != bytes(circuits[1].ram._bytes):
+                return tuple(states)
+    return None
+
+
+def check_opcodes(readme=None):
+    """
+        Checks the hand-written parts of the emulator against the opcode table:
+        the base cycles returned by the handlers of the instruction-level
+        engine, eager and lazy, run without page crossing, taken branch or
+        decimal mode, and the table of the README.
+
+        Args
+        ----
+        readme : str, optional
+            the README file, next to the sources by default.
+
+        Returns
+        -------
+        mismatches : list of str
+            the opcodes and lines that disagree, empty if there is none.
+    """
+    mismatches = []
+    for op in range(256):
+        if op in (0xcb, 0xdb):
+            # WAI and STP park the CPU, their cycles are those of the opcode table.
+            continue
+        for lazy_flags in (False, True):
+            cycles = []
+            # zero and all-ones operands, all flags clear and all set but D: one of them
+            # leaves each branch not taken, X and Y are 0 for no page to be crossed.
+            for fill in (0x00, 0xFF):
+                for p in (0x00, 0xFF&~M65C02_DF):
+                    ram = RAM(bits=16)
+                    ram._bytes[:] = bytes([fill]) * 0x10000
+                    ram._bytes[0x0200] = op
+                    cpu = M65C02()
+                    circuit = Circuit(M65C02_VCC|M65C02_RDY|M65C02_IRQB|M65C02_NMIB|M65C02_BE|M65C02_RESB, cpu, Memory64(ram))
+                    cpu.attach_circuit(circuit)
+                    cpu.lazy_flags = lazy_flags
+                    cpu._A, cpu._X, cpu._Y, cpu._S, cpu._P, cpu._PC = 0x00, 0x00, 0x00, 0xFF, p, 0x0200
+                    cycles.append(cpu.step_instruction())
+            # BRA is always taken, one cycle more than its base.
+            expected = CYCLES[op] + (op == 0x80)
+            if min(cycles) != expected:
+                mismatches.append(f"{op:02x} {MNEMONICS[op]}: {min(cycles)} cycles, {expected} from the opcode table"
+                                  + (" (lazy flags)" if lazy_flags else ""))
+
+    readme = readme or os.path.join(os.path.dirname(os.path.realpath(__file__)), os.pardir, "README.md")
+    with open(readme) as file:
+        lines = file.read().split("\n")
+    table = coverage([1] * 256).split("\n")[:-1]
+    start = lines.index(table[0]) if table[0] in lines else len(lines)
+    for expected, line in zip(table, lines[start:start + len(table)] + [""] * len(table)):
+        if expected != line:
+            mismatches.append(f"README: '{line}' instead of '{expected}'")
+            break
+    return mismatches
+
+
+# a subroutine in RAM called at its mirror, rewritten at its own address between two calls,
+# then a subroutine rewriting its own next instruction at its own address.
+MIRROR = rom_image([
+    0xa2, 0xff,        # 8000       LDX #$ff
+    0x9a,              # 8002       TXS
+    0x20, 0x00, 0x42,  # 8003       JSR $4200
+    0xa9, 0x02,        # 8006       LDA #$02
+    0x8d, 0x01, 0x02,  # 8008       STA $0201
+    0x20, 0x00, 0x42,  # 800b       JSR $4200
+    0x85, 0x10,        # 800e       STA $10
+    0x20, 0x10, 0x42,  # 8010       JSR $4210
+    0x85, 0x11,        # 8013       STA $11
+    0x4c, 0x15, 0x80,  # 8015 done: JMP done
+])
+
+
+def check_mirror(mode):
+    """
+        Runs the MIRROR ROM on an engine caching code, over 16K of RAM mirrored
+        at $4000, and checks that the subroutines called at $4200 and $4210 run
+        their new bytes once rewritten through $0200.
+
+        Args
+        ----
+        mode : str
+            'cached' for the instruction cache, 'translated' for the block translator.
+
+        Returns
+        -------
+        mismatch : str or None
+            the values returned by the subroutines when stale, None if they are not.
+    """
+    with tempfile.NamedTemporaryFile(suffix=".bin", delete=False) as file:
+        file.write(MIRROR)
+    try:
+        rom = ROM(file.name)
+    finally:
+        os.remove(file.name)
+    rom.set_org(0x8000)
+    ram = RAM(bits=14)
+    ram._bytes[0x0200:0x0203] = bytes([0xa9, 0x01, 0x60])  # LDA #$01, RTS
+    ram._bytes[0x0210:0x0218] = bytes([0xa9, 0x02, 0x8d, 0x16, 0x02, 0xa9, 0x01, 0x60])  # LDA #$02, STA $0216, LDA #$01, RTS
+    mirror = Mirror(0x0000, 0x1000)
+    mirror.set_org(0x4000)
+    cpu = M65C02()
+    circuit = Circuit(M65C02_VCC|M65C02_RDY|M65C02_IRQB|M65C02_NMIB|M65C02_BE|M65C02_RESB, cpu, Memory64(ram, mirror, rom))
+    cpu.attach_circuit(circuit)
+    cpu.reset()
+    if mode == "translated":
+        BlockTranslator(cpu).run(200)
+    else:
+        cpu.icache = InstructionCache(circuit.memory)
+        cpu.run(cycles=200)
+    if ram._bytes[0x10:0x12] == b"\x02\x02":
+        return None
+    return f"${ram._bytes[0x10]:02x} ${ram._bytes[0x11]:02x} returned by the rewritten subroutines"
+
+
+def check_memory_map():
+    """
+        Builds the machine of emulator.py from a memory map with the VIA, the
+        ACIA and the block device in io regions, the way --memory-map does, and
+        checks that their registers answer on the bus.
+
+        Returns
+        -------
+        mismatch : str or None
+            the first device not answering, None if all of them do.
+    """
+    import json
+    import emulator
+
+    with tempfile.TemporaryDirectory() as folder:
+        rom, disk, path = (os.path.join(folder, name) for name in ("rom.bin", "disk.img", "map.json"))
+        with open(rom, "wb") as file:
+            file.write(LOOP)
+        with open(disk, "wb") as file:
+            file.write(bytes(2 * 512))
+        with open(path, "w") as file:
+            json.dump({"regions": [
+                {"type": "ram", "org": "$0000", "bits": 14},
+                {"type": "io", "org": "$6000", "size": 16, "device": "via"},
+                {"type": "io", "org": "$6010", "size": 4, "device": "acia"},
+                {"type": "io", "org": "$6020", "size": 8, "device": "disk"},
+                {"type": "rom", "org": "$8000", "file": rom}]}, file)
+        circuit = emulator.build(emulator.arguments().parse_args(["--memory-map", path, "--disk", disk]))
+        m = circuit.memory
+        mismatch = None
+        # a register of each device written and read back: DDRA, COMMAND and the DMA address.
+        for name, addr in (("via", 0x6003), ("acia", 0x6012), ("disk", 0x6024)):
+            m[addr] = 0x5A
+            if m[addr] != 0x5A:
+                mismatch = f"{name} not answering at ${addr:04x}"
+                break
+        for device in circuit.devices:
+            if hasattr(device, "close"):
+                device.close()
+    return mismatch
+
+
+def _machines(image, machines, rng):
+    """ the circuits of a batch check, with random RAM below the ROM image, or 64K of random RAM. """
+    circuits = []
+    for _ in range(machines):
+        if image is None:
+            ram = RAM(bits=16)
+            ram._bytes[:] = rng.randbytes(0x10000).translate(_NO_WAIT)
+            cpu = M65C02()
+            circuit = Circuit(M65C02_VCC|M65C02_RDY|M65C02_IRQB|M65C02_NMIB|M65C02_BE|M65C02_RESB, cpu, Memory64(ram))
+            cpu.attach_circuit(circuit)
+        else:
+            circuit = make_circuit(image)
+            circuit.ram._bytes[:] = rng.randbytes(len(circuit.ram._bytes))
+        circuit.cpu.lazy_flags = False
+        circuit.cpu.reset()
+        circuits.append(circuit)
+    return circuits
+
+
+def check_batch(image, instructions, seed=0, machines=32):
+    """
+        Runs a batch of machines and as many instruction-level engines with
+        eager flags side by side, one instruction each at a time, and checks
+        that the registers of every machine and its memory are identical after
+        each step.
+
+        Args
+        ----
+        image : bytearray or None
+            the 32K ROM image above random RAM, None for 64K of random RAM,
+            WAI and STP excluded, run from random registers.
+        instructions : int
+            the number of instructions to compare, on each machine.
+        seed : int, optional
+            the seed of the random RAM and registers.
+        machines : int, optional
+            the number of machines of the batch.
+
+        Returns
+        -------
+        mismatch : tuple or None
+            the first mismatching (scalar, batch) states, None if there is none.
+    """
+    from chips.batch import BatchM65C02
+
+    rng = random.Random(seed)
+    circuits = _machines(image, machines, rng)
+    batch = BatchM65C02(machines)
+    for i, circuit in enumerate(circuits):
+        cpu = circuit.cpu
+        if image is None:
+            cpu._A, cpu._X, cpu._Y, cpu._S, cpu._P = (rng.getrandbits(8) for _ in range(5))
+            cpu._PC = rng.getrandbits(16)
+        batch.memory[i] = list(circuit.ram._bytes) + ([] if image is None else list(image))
+        for reg in ("A", "X", "Y", "S", "P", "PC", "cycles"):
+            getattr(batch, reg)[i] = getattr(cpu, "_" + reg)
+
+    for _ in range(instructions):
+        batch.step()
+        for i, circuit in enumerate(circuits):
+            cpu = circuit.cpu
+            cpu.step_instruction()
+            scalar = (cpu._PC, cpu._A, cpu._X, cpu._Y, cpu._S, cpu._P, cpu._cycles)
+            state = tuple(int(getattr(batch, reg)[i]) for reg in ("PC", "A", "X", "Y", "S", "P", "cycles"))
+            if (scalar != state
+                    or bytes(circuit.ram._bytes) != batch.memory[i, :len(circuit.ram._bytes)].tobytes()):
+                return scalar, state
+    return None
+
+
+def bench_batch(image, machines, steps):
+    """ runs a batch of machines on a ROM image for a number of steps, returns instructions per second, all machines included. """
+    from chips.batch import BatchM65C02
+
+    batch = BatchM65C02(machines)
+    batch.load(image, 0x8000)
+    batch.reset()
+
+    start = time.perf_counter()
+    instructions = batch.run(steps)
+    return instructions / (time.perf_counter() - start)
+
+
+# the modules imported by a headless run, from the core to the entry point.
+IMPORTS = ["chips.mos65c02", "chips.memory", "chips.Circuit", "emulator"]
+
+
+def bench_import(module):
+    """ imports a module in a fresh interpreter, returns the seconds it took, interpreter start included. """
+    start = time.perf_counter()
+    subprocess.run([sys.executable, "-c", f"import {module}"],
+                   cwd=os.path.dirname(os.path.realpath(__file__)), check=True)
+    return time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser("benchmarks of the 6502 emulator.")
+
+    parser.add_argument("--rom", "-r", default=list(ROMS), nargs='+', choices=list(ROMS),
+                        help="the ROM images to run (defaults to all of them).")
+    parser.add_argument("--mode", "-m", default=list(BENCHES), nargs='+', choices=list(BENCHES),
+                        help="the execution engines to measure (defaults to all of them).")
+    parser.add_argument("--cycles", "-c", type=int, default=100000,
+                        help="the number of clock cycles per run (defaults to 100000).")
+    parser.add_argument("--repeat", "-n", type=int, default=3,
+                        help="the number of runs, the best one is kept (defaults to 3).")
+    parser.add_argument("--sd", action="store_true",
+                        help="measure the SD card reads bit-banged on a VIA instead, on each engine.")
+    parser.add_argument("--imports", "-i", action="store_true",
+                        help="measure the import time of the emulator modules instead.")
+    parser.add_argument("--check-flags", action="store_true",
+                        help="check the lazy flags against the eager ones instead, on the ROMs and random memory.")
+    parser.add_argument("--check-translator", action="store_true",
+                        help="check the translated blocks against the interpreter instead, on the ROMs and random memory.")
+    parser.add_argument("--check-opcodes", action="store_true",
+                        help="check the cycles of the interpreter and the README table against the opcode table instead.")
+    parser.add_argument("--check-mirror", action="store_true",
+                        help="check that code rewritten through a mirror is not run stale instead.")
+    parser.add_argument("--check-memory-map", action="store_true",
+                        help="check that the devices of a memory map answer on the bus instead.")
+    parser.add_argument("--check-cycle", action="store_true",
+                        help="check the cycle-stepped core against the interpreter instead, on the ROMs and random memory.")
+    parser.add_argument("--batch", "-b", type=int, default=None,
+                        help="measure the NumPy batch engine instead, running this many machines for --cycles steps.")
+    parser.add_argument("--check-batch", action="store_true",
+                        help="check the NumPy batch engine against the interpreter instead, on the ROMs and random memory.")
+
+    args = parser.parse_args()
+
+    if args.check_flags:
+        for name, image in [*((name, ROMS[name]) for name in args.rom), ("random", None)]:
+            for seed in range(args.repeat):
+                mismatch = check_lazy_flags(image, args.cycles, seed)
+                print(f"{name:>8} seed {seed}: {'ok' if mismatch is None else mismatch}")
+        return
+
+    if args.check_translator:
+        for name, image in [*((name, ROMS[name]) for name in args.rom), ("random", None)]:
+            for seed in range(args.repeat):
+                mismatch = check_translator(image, args.cycles, seed)
+                print(f"{name:>8} seed {seed}: {'ok' if mismatch is None else mismatch}")
+        return
+
+    if args.check_opcodes:
+        mismatches = check_opcodes()
+        print("\n".join(mismatches) or "ok")
+        return
+
+    if args.check_mirror:
+        for mode in ("cached", "translated"):
+            mismatch = check_mirror(mode)
+            print(f"{mode:>12} mirror: {'ok' if mismatch is None else mismatch}")
+        return
+
+    if args.check_memory_map:
+        mismatch = check_memory_map()
+        print(f"memory map: {'ok' if mismatch is None else mismatch}")
+        return
+
+    if args.check_cycle:
+        for name, image in [*((name, ROMS[name]) for name in args.rom), ("random", None)]:
+            for seed in range(args.repeat):
+                mismatch = check_cycle(image, args.cycles, seed)
+                print(f"{name:>8} seed {seed}: {'ok' if mismatch is None else mismatch}")
+        return
+
+    if args.check_batch:
+        for name, image in [*((name, ROMS[name]) for name in args.rom), ("random", None)]:
+            for seed in range(args.repeat):
+                mismatch = check_batch(image, args.cycles, seed)
+                print(f"{name:>8} seed {seed}: {'ok' if mismatch is None else mismatch}")
+        return
+
+    if args.batch is not None:
+        for name in args.rom:
+            best = max(bench_batch(ROMS[name], args.batch, args.cycles) for _ in range(args.repeat))
+            print(f"{'batch':>12} {name:>8}: {best:12,.0f} instructions/s")
+        return
+
+    if args.sd:
+        for mode in args.mode:
+            transfers, cycles = max(bench_sd(mode, args.cycles) for _ in range(args.repeat))
+            print(f"{mode:>12} {'sd':>8}: {transfers:12,.0f} bytes/s {cycles:12,.0f} cycles/s")
+        return
+
+    if args.imports:
+        for module in IMPORTS:
+            best = min(bench_import(module) for _ in range(args.repeat))
+            print(f"{module:>16}: {best * 1000:8.1f} ms")
+        return
+
+    for mode in args.mode:
+        for name in args.rom:
+            best = max(BENCHES[mode](ROMS[name], args.cycles) for _ in range(args.repeat))
+            print(f"{mode:>12} {name:>8}: {best:12,.0f} cycles/s")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,47 +1,405 @@
+import heapq
+import itertools
+
 from utils import to_hex
 from utils import to_bin
 
-from chips.memory import Memory64
+from chips.memory import RAM
+from chips.memory import ROM
+from chips.trace import BusTrace
+from chips.trace import TraceWriter
+from chips.trace import TRACE_RWB_SHIFT
+from chips.trace import TRACE_SYNC_SHIFT
+from chips.trace import TRACE_DATA_SHIFT
+from chips.trace import TRACE_CYCLE_SHIFT
 from chips.pins import M65C02_RWB
 from chips.pins import M65C02_PHI2
+from chips.pins import M65C02_SYNC
+from chips.pins import M65C02_IRQB
+from chips.pins import M65C02_NMIB
+from chips.pins import M65C02_RESB
+
+
+class _BusAccess(Exception):
+    """ raised by a watched memory view when the fast engine touches a watched address. """
+
+
+class _Watched:
+    """ a view of the memory that stops the fast engine before it touches a watched address. """
+    def __init__(self, memory, flags):
+        self._memory = memory
+        self._flags = flags
+
+    def __getitem__(self, addr):
+        if self._flags[addr]:
+            raise _BusAccess(addr)
+        return self._memory[addr]
+
+    def __setitem__(self, addr, byte):
+        if self._flags[addr]:
+            raise _BusAccess(addr)
+        self._memory[addr] = byte
 
 
 class Circuit:
-    def __init__(self, pins, cpu, ram, rom):
+    def __init__(self, pins, cpu, memory):
+        self.cpu = cpu
         self.pins = pins
         self.prev_pins = 0
-        self.cpu = cpu
-        self.ram = ram
-        self.rom = rom
-        self.memory = Memory64(ram, rom)
+        self.memory = memory
+
+        # the first RAM and ROM of the map are shown in the TUI.
+        self.ram = next((region for region in memory.regions if isinstance(region, RAM)), None)
+        self.rom = next((region for region in memory.regions if isinstance(region, ROM)), None)
+
+        # the pin-level view: both PHI2 edges of a clock cycle go through update, and the
+        # bus, otherwise a clock cycle is a single bus transaction.
+        self.half_cycles = False
+
+        # the last bus cycles, packed, formatted only when shown.
+        self.trace = BusTrace()
+        # every bus cycle streamed to a trace file, when one is open.
+        self.writer = None
+
+        # hybrid execution: the fast engine runs until one of these needs the bus.
+        self.fast = False
+        self.breakpoints = set()
+        self._watched = bytearray(65536)
+        # scheduled device events, a heap of [cycle, sequence, callback, args].
+        self._events = []
+        self._sequence = itertools.count()
+        # the devices in the circuit, and those pulling the wired-OR IRQB low.
+        self.devices = []
+        self._irqs = set()
+
+    @property
+    def pins(self):
+        """ the packed 40-bit pin mask of the CPU, the buses live in separate fields. """
+        return self.cpu.pins
+
+    @pins.setter
+    def pins(self, pins):
+        self.cpu.pins = pins
+
+    def drive(self, pin, low):
+        """ pulls an interrupt line, IRQB, NMIB or RESB, low or releases it, from any thread. """
+        cpu = self.cpu
+        if low:
+            if pin&M65C02_NMIB and cpu._CTRL&M65C02_NMIB:
+                cpu._nmi_edge = True
+            cpu._CTRL &= ~pin
+        else:
+            cpu._CTRL |= pin
+        # the run loops look at the lines before the next instruction.
+        cpu._until = 0
+
+    def attach(self, device):
+        """ puts a device in the circuit, it schedules its events and drives IRQB through it. """
+        self.devices.append(device)
+        device.attach_circuit(self)
+
+    def irq(self, device, low):
+        """ a device pulls the wired-OR IRQB low or releases it, the line is high once all release it. """
+        asserted = bool(self._irqs)
+        if low:
+            self._irqs.add(device)
+        else:
+            self._irqs.discard(device)
+        if bool(self._irqs) != asserted:
+            self.drive(M65C02_IRQB, not asserted)
+
+    def schedule(self, cycle, callback, *args):
+        """
+            Calls callback(*args) once the CPU reaches a cycle, typically a
+            device driving an interrupt line at the end of a timer. Events of
+            the same cycle are called in the order they were scheduled.
+
+            Args
+            ----
+            cycle : int
+                the CPU cycle the event is due at.
+            callback : callable
+                called with args when the event is dispatched.
+
+            Returns
+            -------
+            event : list
+                the scheduled event, to cancel it.
+        """
+        event = [cycle, next(self._sequence), callback, args]
+        heapq.heappush(self._events, event)
+        if cycle < self.cpu._until:
+            self.cpu._until = cycle
+        return event
+
+    def cancel(self, event):
+        """ drops a scheduled event, left in the heap until its cycle comes. """
+        event[2] = None
 
-        self.lines = []
+    def next_event(self):
+        """ the cycle of the next scheduled event, None if there is none. """
+        events = self._events
+        while events and events[0][2] is None:
+            heapq.heappop(events)
+        return events[0][0] if events else None
 
-    def update(self, stdscr):
-        addr = self.cpu._GA()
-        data = self.cpu._GD()
-        RWB = self.pins&M65C02_RWB
+    def dispatch(self):
+        """ calls the events due at the current cycle of the CPU, in order. """
+        events = self._events
+        while events and events[0][0] <= self.cpu._cycles:
+            _, _, callback, args = heapq.heappop(events)
+            if callback is not None:
+                callback(*args)
+
+    def watch(self, lo, hi=None):
+        """ accesses to [lo, hi] drop the fast engine into the cycle-stepped core. """
+        for addr in range(lo, (lo if hi is None else hi) + 1):
+            self._watched[addr] = 1
+
+    def unwatch(self, lo, hi=None):
+        """ accesses to [lo, hi] no longer stop the fast engine. """
+        for addr in range(lo, (lo if hi is None else hi) + 1):
+            self._watched[addr] = 0
+
+    @property
+    def lines(self):
+        """ the traced bus cycles, formatted. """
+        return self.trace.lines()
+
+    def update(self, stdscr=None):
+        """ a half clock cycle of the pin-level view, the bus is read or written on both PHI2 edges. """
+        cpu = self.cpu
+        addr = cpu._ADDR
+        pins = cpu._CTRL
+        RWB = pins&M65C02_RWB
+
+        if RWB:
+            data = self.memory[addr]
+            cpu._DATA = data
+        else:
+            data = cpu._DATA
+            self.memory[addr] = data
+
+        cycle = cpu._cycles
+        cpu.tick()
+
+        if (self.trace is not None or self.writer is not None) and (not (self.prev_pins&M65C02_PHI2) and (cpu._CTRL&M65C02_PHI2)):
+            record = ((cycle<<TRACE_CYCLE_SHIFT)
+                      | (((pins&M65C02_SYNC) != 0)<<TRACE_SYNC_SHIFT)
+                      | ((RWB != 0)<<TRACE_RWB_SHIFT)
+                      | (data<<TRACE_DATA_SHIFT)
+                      | addr)
+            if self.trace is not None:
+                self.trace.append(record)
+            if self.writer is not None:
+                self.writer.append(record)
+
+    def cycle(self, stdscr=None):
+        """ a full clock cycle: exactly one bus transaction, then the core steps on its data. """
+        cpu = self.cpu
+        addr = cpu._ADDR
+        pins = cpu._CTRL
+        RWB = pins&M65C02_RWB
 
         if RWB:
             data = self.memory[addr]
-            self.cpu._SD(data)
+            cpu._DATA = data
         else:
+            data = cpu._DATA
             self.memory[addr] = data
 
-        self.pins = self.cpu.tick(self.pins)
+        cycle = cpu._cycles
+        cpu.cycle()
+
+        if self.trace is not None or self.writer is not None:
+            record = ((cycle<<TRACE_CYCLE_SHIFT)
+                      | (((pins&M65C02_SYNC) != 0)<<TRACE_SYNC_SHIFT)
+                      | ((RWB != 0)<<TRACE_RWB_SHIFT)
+                      | (data<<TRACE_DATA_SHIFT)
+                      | addr)
+            if self.trace is not None:
+                self.trace.append(record)
+            if self.writer is not None:
+                self.writer.append(record)
+
+    def stream(self, path=None):
+        """ streams every following bus cycle to a trace file, closes the current one first, or only, if no path. """
+        if self.writer is not None:
+            self.writer.close()
+            self.writer = None
+        if path is not None:
+            self.writer = TraceWriter(path)
+        return self.writer
+
+    def clock(self, stdscr=None):
+        """ one full clock cycle of the cycle-stepped core, as two half cycles in the pin-level view. """
+        if self._events and self._events[0][0] <= self.cpu._cycles:
+            self.dispatch()
+        if not self.half_cycles:
+            self.cycle(stdscr)
+            return
+        self.cpu._CTRL |= M65C02_PHI2
+        self.update(stdscr)
+        self.cpu._CTRL &= ~M65C02_PHI2
+        self.update(stdscr)
+
+    def reset(self):
+        """ holds RESB low for a clock cycle, the cycle-stepped core then runs the reset sequence. """
+        for device in self.devices:
+            device.reset()
+        self.cpu._CTRL &= ~M65C02_RESB
+        self.clock()
+        self.cpu._CTRL |= M65C02_RESB
+
+    def run(self, cycles):
+        """
+            Runs the cycle-stepped core headless: no screen, no trace, no
+            keyboard, just the CPU and the memory in a tight loop of full
+            cycles, one bus transaction each. Only when streaming to a trace
+            file are the cycles recorded. A CPU halted by
+            WAI or STP skips the cycles left, up to the next event.
+
+            Args
+            ----
+            cycles : int
+                the number of clock cycles to run for.
+
+            Returns
+            -------
+            cycles : int
+                the number of elapsed clock cycles.
+        """
+        cpu = self.cpu
+        start = cpu._cycles
+        if self.writer is not None:
+            # streamed to a trace file, cycle by cycle.
+            for _ in range(cycles):
+                self.clock()
+            return cpu._cycles - start
+
+        memory = self.memory
+        cycle = cpu.cycle
+        end = start + cycles
+        while cpu._cycles < end:
+            # the events are only looked at when the next one is due.
+            self.dispatch()
+            event = self.next_event()
+            stop = end if event is None else min(end, event)
+            # a halted CPU is looked for every few cycles, not to slow down the loop.
+            if cpu.halted is not None and cpu.idle_skip and not cpu._woken():
+                if cpu._cycles < stop:
+                    cpu._cycles = stop
+                    continue
+            for _ in range(min(stop - cpu._cycles, 64)):
+                if cpu._CTRL&M65C02_RWB:
+                    cpu._DATA = memory[cpu._ADDR]
+                else:
+                    memory[cpu._ADDR] = cpu._DATA
+                cycle()
+        return cpu._cycles - start
+
+    def to_cycle(self):
+        """ hands the CPU over to the cycle-stepped core, about to fetch the opcode at PC. """
+        cpu = self.cpu
+        self.fast = False
+        cpu._CTRL &= ~M65C02_PHI2
+        cpu._SA(cpu._PC)
+        cpu._ON(M65C02_SYNC)
+        cpu._RD()
+        cpu._PINS = cpu._CTRL
+
+    def to_fast(self, stdscr=None):
+        """ completes the current instruction, at least one, cycle by cycle and hands the CPU over to the fast engine. """
+        self.clock(stdscr)
+        while not (self.cpu._CTRL&M65C02_SYNC):
+            if self.cpu.halted is not None:
+                # parked by WAI or STP, the fast engine resumes on the opcode.
+                self.cpu._PC = (self.cpu._PC-1)&0xFFFF
+                break
+            self.clock(stdscr)
+        self.fast = True
+
+    def run_fast(self, cycles):
+        """
+            Runs the fast engine until a breakpoint, a watched address, an
+            interrupt, or for a number of cycles, idle loops being fast-forwarded.
+            The CPU is always handed back to the cycle-stepped core, about to
+            fetch the opcode at PC: the instruction that caused a stop, or the
+            next one when the cycles ran out.
+
+            Args
+            ----
+            cycles : int
+                the maximum number of clock cycles to run for.
 
-        if (not (self.prev_pins&M65C02_PHI2) and (self.pins&M65C02_PHI2)):
-            line = ' '.join([to_hex(addr, 4), ('r' if RWB else 'W'), to_hex(data, 2)])
-            self.lines.append(line)
-            if len(self.lines) > stdscr.getmaxyx()[0]:
-                self.lines.pop(0)
+            Returns
+            -------
+            reason : str or None
+                'breakpoint', 'watchpoint', 'interrupt', or 'wait' and 'stop' when
+                halted, None if the cycles ran out.
+        """
+        cpu = self.cpu
+        ops = cpu._EXEC_LAZY if cpu.lazy_flags else cpu._EXEC
+        idle = cpu.idle_skip
+        memory = _Watched(self.memory, self._watched) if 1 in self._watched else self.memory
+        breakpoints = self.breakpoints
+        end = cpu._cycles + cycles
+        reason = None
+        cpu._lazy()
+        cpu._until = 0
+        while cpu._cycles < end:
+            if cpu._PC in breakpoints:
+                reason = "breakpoint"
+                break
+            if cpu._cycles >= cpu._until:
+                # an event due or an interrupt line driven.
+                self.dispatch()
+                if cpu._pending() is not None:
+                    reason = "interrupt"
+                    break
+                event = self.next_event()
+                cpu._until = end if event is None or event > end else event
+            state = (cpu._A, cpu._X, cpu._Y, cpu._S, cpu._P, cpu._PC, cpu._cycles, cpu._nz)
+            try:
+                pc = cpu._PC
+                op = memory[pc]
+                cpu._PC = (pc+1)&0xFFFF
+                c = ops[op](cpu, memory)
+                cpu._cycles += c
+            except _BusAccess:
+                # roll back, the cycle-stepped core replays the whole instruction.
+                cpu._A, cpu._X, cpu._Y, cpu._S, cpu._P, cpu._PC, cpu._cycles, cpu._nz = state
+                reason = "watchpoint"
+                break
+            if cpu._PC <= pc:
+                if cpu.halted is not None:
+                    if cpu._until < end:
+                        cpu._spin(pc)
+                    else:
+                        reason = cpu.halted
+                        break
+                elif idle:
+                    cpu._spin(pc)
+        if cpu.lazy_flags:
+            cpu._P = cpu._flags()
+        self.to_cycle()
+        return reason
 
     def flip(self, stdscr):
         stdscr.erase()
-        for row, line in enumerate(self.lines):
+        lines = [] if self.trace is None else self.trace.lines(stdscr.getmaxyx()[0])
+        for row, line in enumerate(lines):
             stdscr.addstr(row, 0, line)
 
         self.cpu.flip(stdscr, 0, 10)
-        self.ram.flip(stdscr, 0, 46)
-        self.rom.flip(stdscr, 0, 125)
+        if self.ram is not None:
+            self.ram.flip(stdscr, 0, 46)
+        if self.rom is not None:
+            self.rom.flip(stdscr, 0, 125)
+        # the devices with something to show, an LCD, under the CPU.
+        y = 35
+        for device in self.devices:
+            if hasattr(device, "flip"):
+                device.flip(stdscr, y, 15)
+                y += len(str(device).split('\n')) + 3
         stdscr.refresh()
@@ -0,0 +1,421 @@
+import numpy as np
+
+from chips.pins import M65C02_CF
+from chips.pins import M65C02_ZF
+from chips.pins import M65C02_IF
+from chips.pins import M65C02_DF
+from chips.pins import M65C02_BF
+from chips.pins import M65C02_XF
+from chips.pins import M65C02_VF
+from chips.pins import M65C02_NF
+from chips.opcodes import MNEMONICS
+from chips.opcodes import MODE
+from chips.opcodes import MODES
+from chips.opcodes import LENGTH
+from chips.opcodes import CYCLES
+from chips.mos65c02 import M65C02
+from chips.mos65c02 import _bcd_adc
+from chips.mos65c02 import _bcd_sbc
+from chips.mos65c02 import _bcd_table
+
+
+# indexed reads taking one more cycle on a page crossing.
+_PENALTY = {"a,x", "a,y", "(zp),y"}
+_NO_PENALTY = {"STA", "STZ", "INC", "DEC", "JMP"}
+
+# the flag tested by each branch, and whether it is taken when the flag is set.
+_BRANCHES = {"BPL": (M65C02_NF, False), "BMI": (M65C02_NF, True), "BVC": (M65C02_VF, False),
+             "BVS": (M65C02_VF, True), "BCC": (M65C02_CF, False), "BCS": (M65C02_CF, True),
+             "BNE": (M65C02_ZF, False), "BEQ": (M65C02_ZF, True), "BRA": (0, False)}
+_FLAGS = {"CLC": (M65C02_CF, False), "SEC": (M65C02_CF, True), "CLI": (M65C02_IF, False),
+          "SEI": (M65C02_IF, True), "CLD": (M65C02_DF, False), "SED": (M65C02_DF, True),
+          "CLV": (M65C02_VF, False)}
+_TRANSFERS = {"TAX": ("A", "X"), "TAY": ("A", "Y"), "TXA": ("X", "A"), "TYA": ("Y", "A"),
+              "TSX": ("S", "X"), "TXS": ("X", "S")}
+_STEPS = {"INX": ("X", 1), "INY": ("Y", 1), "DEX": ("X", -1), "DEY": ("Y", -1)}
+
+
+def _nz(p, v):
+    """ P with the N and Z flags of a result, as the NZ_ of the scalar core. """
+    return (p&~(M65C02_NF|M65C02_ZF)) | np.where(v&0xFF, v&M65C02_NF, M65C02_ZF)
+
+
+def _bcd(name, op):
+    """ a decimal mode table of the scalar core, built once and shared with it. """
+    table = getattr(M65C02, name)
+    if table is None:
+        table = _bcd_table(op)
+        setattr(M65C02, name, table)
+    return np.frombuffer(table, dtype=np.uint16).astype(np.int64)
+
+
+class BatchM65C02:
+    """
+        Runs N independent 65C02 machines side by side, for fuzzing and
+        exhaustive tests: the registers of the machines are NumPy arrays, their
+        memories the rows of an (N, 65536) array of flat RAM, without devices
+        nor interrupts. Each step executes one instruction on every machine,
+        the machines being grouped by opcode and each group updated at once,
+        with the semantics and the cycle counts of the fast engine of M65C02.
+        A machine reaching WAI or STP halts, PC on the opcode, and is left out
+        of the following steps.
+    """
+    def __init__(self, n):
+        self.n = n
+        self.memory = np.zeros((n, 0x10000), dtype=np.uint8)
+        self._flat = self.memory.reshape(-1)
+        self._base = np.arange(n, dtype=np.int64) << 16
+        self.A = np.zeros(n, dtype=np.int64)
+        self.X = np.zeros(n, dtype=np.int64)
+        self.Y = np.zeros(n, dtype=np.int64)
+        self.S = np.zeros(n, dtype=np.int64)
+        self.P = np.full(n, M65C02_ZF, dtype=np.int64)
+        self.PC = np.zeros(n, dtype=np.int64)
+        self.cycles = np.zeros(n, dtype=np.int64)
+        self.halted = np.zeros(n, dtype=bool)
+        self.instructions = 0
+
+    def load(self, image, org):
+        """ copies the same image at org into the memory of every machine. """
+        self.memory[:, org:org + len(image)] = np.frombuffer(bytes(image), dtype=np.uint8)
+
+    def reset(self):
+        """ the reset sequence of every machine at instruction level, as M65C02.reset. """
+        self.S = (self.S-3)&0xFF
+        self.P = (self.P|M65C02_IF|M65C02_BF)&~M65C02_DF
+        self.PC = self.memory[:, 0xFFFC].astype(np.int64) | (self.memory[:, 0xFFFD].astype(np.int64)<<8)
+        self.halted[:] = False
+        self.cycles += 7
+
+    def run(self, steps):
+        """
+            Executes a number of steps, one instruction on each running machine
+            per step.
+
+            Args
+            ----
+            steps : int
+                the number of steps.
+
+            Returns
+            -------
+            instructions : int
+                the number of instructions executed by all the machines.
+        """
+        start = self.instructions
+        for _ in range(steps):
+            if not self.step():
+                break
+        return self.instructions - start
+
+    def step(self):
+        """ executes one instruction on each running machine, returns the number of them. """
+        running = np.flatnonzero(~self.halted)
+        ops = self._flat[self._base[running] + self.PC[running]]
+        order = np.argsort(ops, kind="stable")
+        ops = ops[order]
+        starts = np.flatnonzero(np.r_[True, ops[1:] != ops[:-1]])
+        ends = np.append(starts[1:], len(ops))
+        for start, end in zip(starts.tolist(), ends.tolist()):
+            self._execute(int(ops[start]), running[order[start:end]])
+        self.instructions += len(running)
+        return len(running)
+
+    def _execute(self, op, sel):
+        """ one instruction of the given opcode on the selected machines. """
+        handler, mode, length, cycles, penalty, arg = _DECODED[op]
+        pc = self.PC[sel]
+        ea, crossed = self._address(sel, mode, pc)
+        self.PC[sel] = (pc+length)&0xFFFF
+        c = handler(self, sel, ea, arg)
+        self.cycles[sel] += cycles + c + (crossed if penalty else 0)
+
+    def _read(self, sel, addr):
+        return self._flat[self._base[sel] + addr].astype(np.int64)
+
+    def _write(self, sel, addr, v):
+        self._flat[self._base[sel] + addr] = v
+
+    def _word(self, sel, addr, wrap=0xFFFF):
+        """ a little-endian word, the high byte read from (addr+1)&wrap. """
+        return self._read(sel, addr) | (self._read(sel, (addr+1)&wrap)<<8)
+
+    def _address(self, sel, mode, pc):
+        """ the effective address of an addressing mode and whether a page was crossed, the operand address for # and r. """
+        if mode in ("i", "A", "s"):
+            return None, 0
+        if mode in ("#", "r"):
+            return (pc+1)&0xFFFF, 0
+        if mode in ("zp", "zp,r"):
+            return self._read(sel, (pc+1)&0xFFFF), 0
+        if mode == "zp,x":
+            return (self._read(sel, (pc+1)&0xFFFF)+self.X[sel])&0xFF, 0
+        if mode == "zp,y":
+            return (self._read(sel, (pc+1)&0xFFFF)+self.Y[sel])&0xFF, 0
+        if mode == "(zp,x)":
+            return self._word(sel, (self._read(sel, (pc+1)&0xFFFF)+self.X[sel])&0xFF, 0xFF), 0
+        if mode == "(zp)":
+            return self._word(sel, self._read(sel, (pc+1)&0xFFFF), 0xFF), 0
+        if mode == "(zp),y":
+            b = self._word(sel, self._read(sel, (pc+1)&0xFFFF), 0xFF)
+            a = (b+self.Y[sel])&0xFFFF
+            return a, (a^b)>>8 != 0
+        b = self._word(sel, (pc+1)&0xFFFF)
+        if mode in ("a", "(a)"):
+            return b, 0
+        a = (b+(self.Y[sel] if mode == "a,y" else self.X[sel]))&0xFFFF
+        return a, (a^b)>>8 != 0
+
+    def _push(self, sel, v):
+        s = self.S[sel]
+        self._write(sel, 0x0100|s, v)
+        self.S[sel] = (s-1)&0xFF
+
+    def _pull(self, sel):
+        s = (self.S[sel]+1)&0xFF
+        self.S[sel] = s
+        return self._read(sel, 0x0100|s)
+
+    def _branch(self, sel, taken, nxt):
+        """ jumps the machines taking a branch, by the offset at nxt-1, returns the extra cycles. """
+        o = self._read(sel, (nxt-1)&0xFFFF)
+        a = (nxt+o-((o&0x80)<<1))&0xFFFF
+        self.PC[sel] = np.where(taken, a, nxt)
+        return np.where(taken, np.where((a^nxt)&0xFF00, 2, 1), 0)
+
+    # the handlers: the effective address, or operand address, of the selected
+    # machines and the argument of the opcode, return the extra cycles.
+    def _ld(self, sel, ea, reg):
+        v = self._read(sel, ea)
+        getattr(self, reg)[sel] = v
+        self.P[sel] = _nz(self.P[sel], v)
+        return 0
+
+    def _st(self, sel, ea, reg):
+        self._write(sel, ea, 0 if reg is None else getattr(self, reg)[sel])
+        return 0
+
+    def _logic(self, sel, ea, op):
+        a = op(self.A[sel], self._read(sel, ea))
+        self.A[sel] = a
+        self.P[sel] = _nz(self.P[sel], a)
+        return 0
+
+    def _adc(self, sel, ea, sub):
+        v = self._read(sel, ea)
+        a, p = self.A[sel], self.P[sel]
+        c = p&M65C02_CF
+        if sub:
+            s = a-v-(1-c)
+            flags = (np.where((a^v)&(a^s)&0x80, M65C02_VF, 0)
+                     | np.where(s&0xFF00, 0, M65C02_CF))
+        else:
+            s = a+v+c
+            flags = (np.where(~(a^v)&(a^s)&0x80, M65C02_VF, 0)
+                     | np.where(s&0xFF00, M65C02_CF, 0))
+        r = _nz(p&~(M65C02_VF|M65C02_CF), s) | flags
+        decimal = (p&M65C02_DF) != 0
+        if decimal.any():
+            table = _bcd("_BCD_SBC", _bcd_sbc) if sub else _bcd("_BCD_ADC", _bcd_adc)
+            t = table[c<<16|a<<8|v]
+            s = np.where(decimal, t, s)
+            r = np.where(decimal, (p&~(M65C02_NF|M65C02_VF|M65C02_ZF|M65C02_CF)) | (t>>8), r)
+        self.A[sel] = s&0xFF
+        self.P[sel] = r
+        return decimal
+
+    def _cmp(self, sel, ea, reg):
+        t = getattr(self, reg)[sel]-self._read(sel, ea)
+        self.P[sel] = (_nz(self.P[sel], t)&~M65C02_CF) | np.where(t&0xFF00, 0, M65C02_CF)
+        return 0
+
+    def _bit(self, sel, ea, immediate):
+        v = self._read(sel, ea)
+        p = self.P[sel]
+        z = np.where(self.A[sel]&v, 0, M65C02_ZF)
+        if immediate:
+            self.P[sel] = (p&~M65C02_ZF) | z
+        else:
+            self.P[sel] = (p&~(M65C02_NF|M65C02_VF|M65C02_ZF)) | z | (v&(M65C02_NF|M65C02_VF))
+        return 0
+
+    def _rmw(self, sel, ea, op):
+        """ a read-modify-write of memory, or of A without an address, op returning the result and the carry. """
+        v = self.A[sel] if ea is None else self._read(sel, ea)
+        p = self.P[sel]
+        r, c = op(v, p&M65C02_CF)
+        if c is None:
+            p = _nz(p, r)
+        else:
+            p = (_nz(p, r)&~M65C02_CF) | np.where(c, M65C02_CF, 0)
+        self.P[sel] = p
+        if ea is None:
+            self.A[sel] = r&0xFF
+        else:
+            self._write(sel, ea, r&0xFF)
+        return 0
+
+    def _step(self, sel, ea, arg):
+        reg, delta = arg
+        v = (getattr(self, reg)[sel]+delta)&0xFF
+        getattr(self, reg)[sel] = v
+        self.P[sel] = _nz(self.P[sel], v)
+        return 0
+
+    def _tsb(self, sel, ea, reset):
+        v = self._read(sel, ea)
+        a = self.A[sel]
+        self.P[sel] = (self.P[sel]&~M65C02_ZF) | np.where(v&a, 0, M65C02_ZF)
+        self._write(sel, ea, v&~a if reset else v|a)
+        return 0
+
+    def _rmb(self, sel, ea, arg):
+        bit, value = arg
+        v = self._read(sel, ea)
+        self._write(sel, ea, v|bit if value else v&~bit)
+        return 0
+
+    def _bbr(self, sel, ea, arg):
+        bit, value = arg
+        taken = (self._read(sel, ea)&bit) != 0
+        return self._branch(sel, taken if value else ~taken, self.PC[sel])
+
+    def _bxx(self, sel, ea, arg):
+        flag, value = arg
+        if not flag:
+            taken = np.ones(len(sel), dtype=bool)
+        else:
+            taken = (self.P[sel]&flag) != 0
+            if not value:
+                taken = ~taken
+        return self._branch(sel, taken, self.PC[sel])
+
+    def _jmp(self, sel, ea, indirect):
+        self.PC[sel] = self._word(sel, ea) if indirect else ea
+        return 0
+
+    def _jsr(self, sel, ea, arg):
+        r = (self.PC[sel]-1)&0xFFFF
+        self._push(sel, r>>8)
+        self._push(sel, r&0xFF)
+        self.PC[sel] = ea
+        return 0
+
+    def _rts(self, sel, ea, arg):
+        lo = self._pull(sel)
+        self.PC[sel] = ((self._pull(sel)<<8|lo)+1)&0xFFFF
+        return 0
+
+    def _rti(self, sel, ea, arg):
+        self.P[sel] = (self._pull(sel)|M65C02_BF)&~M65C02_XF
+        lo = self._pull(sel)
+        self.PC[sel] = self._pull(sel)<<8|lo
+        return 0
+
+    def _brk(self, sel, ea, arg):
+        pc = self.PC[sel]
+        self._push(sel, pc>>8)
+        self._push(sel, pc&0xFF)
+        p = self.P[sel]
+        self._push(sel, p|M65C02_XF|M65C02_BF)
+        self.P[sel] = (p|M65C02_IF|M65C02_BF)&~M65C02_DF
+        self.PC[sel] = self.memory[sel, 0xFFFE].astype(np.int64) | (self.memory[sel, 0xFFFF].astype(np.int64)<<8)
+        return 0
+
+    def _ph(self, sel, ea, reg):
+        self._push(sel, self.P[sel]|M65C02_XF|M65C02_BF if reg == "P" else getattr(self, reg)[sel])
+        return 0
+
+    def _pl(self, sel, ea, reg):
+        v = self._pull(sel)
+        if reg == "P":
+            self.P[sel] = (v|M65C02_BF)&~M65C02_XF
+        else:
+            getattr(self, reg)[sel] = v
+            self.P[sel] = _nz(self.P[sel], v)
+        return 0
+
+    def _flag(self, sel, ea, arg):
+        flag, value = arg
+        self.P[sel] = self.P[sel]|flag if value else self.P[sel]&~flag
+        return 0
+
+    def _transfer(self, sel, ea, arg):
+        src, dst = arg
+        v = getattr(self, src)[sel]
+        getattr(self, dst)[sel] = v
+        if dst != "S":
+            self.P[sel] = _nz(self.P[sel], v)
+        return 0
+
+    def _nop(self, sel, ea, arg):
+        return 0
+
+    def _halt(self, sel, ea, arg):
+        self.PC[sel] = (self.PC[sel]-1)&0xFFFF
+        self.halted[sel] = True
+        return 0
+
+
+# read-modify-write operations: the result and the carry out, None for INC and DEC.
+_RMW = {"ASL": lambda v, c: (v<<1, v&0x80),
+        "LSR": lambda v, c: (v>>1, v&0x01),
+        "ROL": lambda v, c: (v<<1|c, v&0x80),
+        "ROR": lambda v, c: (v>>1|c<<7, v&0x01),
+        "INC": lambda v, c: ((v+1)&0xFF, None),
+        "DEC": lambda v, c: ((v-1)&0xFF, None)}
+
+
+def _decode(op):
+    """ the handler of an opcode, its argument, and the addressing, length and cycles it runs with. """
+    mnemonic, mode = MNEMONICS[op], MODES[MODE[op]]
+    name = mnemonic[:3]
+    B = BatchM65C02
+    if mnemonic in ("LDA", "LDX", "LDY"):
+        handler, arg = B._ld, mnemonic[2]
+    elif mnemonic in ("STA", "STX", "STY", "STZ"):
+        handler, arg = B._st, None if mnemonic == "STZ" else mnemonic[2]
+    elif mnemonic in ("ORA", "AND", "EOR"):
+        handler, arg = B._logic, {"ORA": np.bitwise_or, "AND": np.bitwise_and, "EOR": np.bitwise_xor}[mnemonic]
+    elif mnemonic in ("ADC", "SBC"):
+        handler, arg = B._adc, mnemonic == "SBC"
+    elif mnemonic in ("CMP", "CPX", "CPY"):
+        handler, arg = B._cmp, "A" if mnemonic == "CMP" else mnemonic[2]
+    elif mnemonic == "BIT":
+        handler, arg = B._bit, mode == "#"
+    elif mnemonic in _RMW:
+        handler, arg = B._rmw, _RMW[mnemonic]
+    elif mnemonic in _STEPS:
+        handler, arg = B._step, _STEPS[mnemonic]
+    elif mnemonic in ("TSB", "TRB"):
+        handler, arg = B._tsb, mnemonic == "TRB"
+    elif name in ("RMB", "SMB"):
+        handler, arg = B._rmb, (1 << int(mnemonic[3]), name == "SMB")
+    elif name in ("BBR", "BBS"):
+        handler, arg = B._bbr, (1 << int(mnemonic[3]), name == "BBS")
+    elif mnemonic in _BRANCHES:
+        handler, arg = B._bxx, _BRANCHES[mnemonic]
+    elif mnemonic == "JMP":
+        handler, arg = B._jmp, mode != "a"
+    elif mnemonic in ("JSR", "RTS", "RTI", "BRK"):
+        handler, arg = getattr(B, "_" + mnemonic.lower()), None
+    elif mnemonic in ("PHA", "PHX", "PHY", "PHP"):
+        handler, arg = B._ph, mnemonic[2]
+    elif mnemonic in ("PLA", "PLX", "PLY", "PLP"):
+        handler, arg = B._pl, mnemonic[2]
+    elif mnemonic in _FLAGS:
+        handler, arg = B._flag, _FLAGS[mnemonic]
+    elif mnemonic in _TRANSFERS:
+        handler, arg = B._transfer, _TRANSFERS[mnemonic]
+    elif mnemonic in ("WAI", "STP"):
+        handler, arg = B._halt, None
+    else:
+        handler, arg = B._nop, None
+    if mode == "(a,x)":
+        # JMP (a,x) reads its vector at the indexed address.
+        mode = "a,x"
+    penalty = mode in _PENALTY and mnemonic not in _NO_PENALTY
+    return handler, mode, LENGTH[op], CYCLES[op], penalty, arg
+
+
+_DECODED = tuple(_decode(op) for op in range(256))
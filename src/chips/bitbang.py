@@ -0,0 +1,210 @@
+class _PortAdapter:
+    """
+        Listens to the pins of a VIA port, chained with the peripherals
+        already wired to it: the levels driven go to all, and the levels
+        read are the wired-AND of their outputs.
+    """
+    def __init__(self, via, port):
+        self.via = via
+        self.port = port
+        self._level = 0xFF
+        self._previous_output = via.output[port]
+        self._previous_input = via.input[port]
+        via.output[port] = self._drive
+        via.input[port] = self._input
+
+    def _drive(self, levels):
+        if self._previous_output is not None:
+            self._previous_output(levels)
+        self.drive(levels)
+
+    def _input(self):
+        if self._previous_input is not None:
+            return self._previous_input() & self._level
+        return self._level
+
+
+class SPIAdapter(_PortAdapter):
+    """
+        Decodes SPI mode 0 bit-banged on VIA port pins into byte transfers
+        with a device: MOSI is sampled on the rising edges of SCK, MISO
+        shifts on the falling ones, and each byte completed is passed to
+        device.exchange(byte), which returns the byte to shift out during
+        the next transfer. The device is selected while CS is low, and
+        told by device.select(selected) when CS changes. transfers counts
+        the bytes exchanged.
+
+        Args
+        ----
+        via : W65C22
+            the VIA whose port drives the bus.
+        device : object
+            the device at the other end.
+        port : int, optional
+            0 for port A, 1 for port B (the default).
+        sck, mosi, cs, miso : int, optional
+            the masks of the pins on the port, PB0, PB1, PB2 and PB6.
+    """
+    def __init__(self, via, device, port=1, sck=0x01, mosi=0x02, cs=0x04, miso=0x40):
+        self.device = device
+        self.sck = sck
+        self.mosi = mosi
+        self.cs = cs
+        self.miso = miso
+        self.selected = False
+        self.transfers = 0
+        self._pins = 0xFF
+        self._shift = 0
+        self._bits = 0
+        self._out = 0xFF
+        super().__init__(via, port)
+
+    def drive(self, levels):
+        changed = levels ^ self._pins
+        self._pins = levels
+        if changed&self.cs:
+            self.selected = not levels&self.cs
+            self._bits = 0
+            self._out = 0xFF
+            self._level = 0xFF
+            self.device.select(self.selected)
+        if not (changed&self.sck and self.selected):
+            return
+        if levels&self.sck:
+            self._shift = ((self._shift<<1) | (1 if levels&self.mosi else 0))&0xFF
+            self._bits += 1
+            if self._bits == 8:
+                self._bits = 0
+                self.transfers += 1
+                self._out = self.device.exchange(self._shift)
+            return
+        # the falling edge puts the next bit on MISO, the first of the next byte after the eighth.
+        bit = (self._out<<self._bits)&0x80
+        self._level = 0xFF if bit else 0xFF&~self.miso
+
+
+class I2CAdapter(_PortAdapter):
+    """
+        Decodes I2C bit-banged on open-drain VIA port pins, pulled low by
+        setting their DDR bit with the output bit at 0, into byte transfers
+        with the devices of the bus, by 7-bit address. A device answers
+        start(read) after its address, with True to acknowledge it, then
+        write(byte) with True to acknowledge each byte written, read()
+        for each byte read, and stop() at the end of the transfer.
+
+        Args
+        ----
+        via : W65C22
+            the VIA whose port drives the bus.
+        devices : dict
+            the devices by address.
+        port : int, optional
+            0 for port A, 1 for port B (the default).
+        scl, sda : int, optional
+            the masks of the pins on the port, PB0 and PB1.
+    """
+    def __init__(self, via, devices, port=1, scl=0x01, sda=0x02):
+        self.devices = devices
+        self.scl = scl
+        self.sda = sda
+        self._pins = scl|sda
+        self._device = None
+        self._active = False
+        self._address = True      # the next byte is the address of a device.
+        self._reading = False
+        self._bits = 0
+        self._shift = 0
+        self._byte = 0xFF
+        super().__init__(via, port)
+
+    def _sda(self, level):
+        self._level = 0xFF if level else 0xFF&~self.sda
+
+    def drive(self, levels):
+        changed = levels ^ self._pins
+        self._pins = levels
+        if changed&self.sda and levels&self.scl and not changed&self.scl:
+            # SDA moving while SCL is high: a start, or a stop.
+            if levels&self.sda:
+                self._stop()
+            else:
+                self._active, self._address, self._bits = True, True, 0
+            return
+        if not (changed&self.scl and self._active):
+            return
+        if levels&self.scl:
+            if self._bits < 8:
+                self._shift = ((self._shift<<1) | (1 if levels&self.sda else 0))&0xFF
+            elif self._reading and levels&self.sda:
+                # the master does not acknowledge the last byte it reads.
+                self._reading = False
+            self._bits += 1
+            return
+        if self._bits == 8:
+            self._sda(not self._acknowledge())
+        elif self._bits == 9:
+            self._bits = 0
+            if self._reading:
+                self._byte = self._device.read()
+                self._sda(self._byte&0x80)
+            else:
+                self._sda(1)
+        elif self._reading:
+            self._sda((self._byte<<self._bits)&0x80)
+
+    def _acknowledge(self):
+        """ the byte shifted in is complete, whether the device acknowledges it. """
+        if self._reading:
+            return False
+        if self._address:
+            self._address = False
+            self._device = self.devices.get(self._shift>>1)
+            read = bool(self._shift&1)
+            if self._device is None or not self._device.start(read):
+                self._device = None
+                self._active = False
+                return False
+            self._reading = read
+            return True
+        return self._device is not None and self._device.write(self._shift)
+
+    def _stop(self):
+        if self._device is not None:
+            self._device.stop()
+        self._device = None
+        self._active = False
+        self._reading = False
+        self._sda(1)
+
+
+class I2CRegisters:
+    """
+        An I2C device made of registers, as most sensors: the first byte
+        written sets the register pointer, the next ones are written from it,
+        and reads go on from it, the pointer moving after each byte.
+    """
+    def __init__(self, size=256):
+        self.registers = bytearray(size)
+        self._pointer = 0
+        self._first = False
+
+    def start(self, read):
+        self._first = not read
+        return True
+
+    def write(self, byte):
+        if self._first:
+            self._first = False
+            self._pointer = byte % len(self.registers)
+        else:
+            self.registers[self._pointer] = byte
+            self._pointer = (self._pointer+1) % len(self.registers)
+        return True
+
+    def read(self):
+        byte = self.registers[self._pointer]
+        self._pointer = (self._pointer+1) % len(self.registers)
+        return byte
+
+    def stop(self):
+        pass
@@ -0,0 +1,149 @@
+import mmap
+import os
+
+# the registers of the block device, by offset.
+BLOCK_LBA     = 0x0   # 4 bytes, little-endian.
+BLOCK_DMA     = 0x4   # 2 bytes, little-endian.
+BLOCK_COUNT   = 0x6
+BLOCK_COMMAND = 0x7   # written, the status is read at the same offset.
+
+# commands.
+BLOCK_READ  = 0x01
+BLOCK_WRITE = 0x02
+
+# status bits.
+BLOCK_ERROR = (1<<7)
+
+BLOCK_SIZE = 512
+
+
+def open_image(path, writable=True):
+    """
+        Maps a disk image file in memory, its pages are only read from the
+        file when touched and written back by the host.
+
+        Args
+        ----
+        path : str
+            the image file, a multiple of 512 bytes.
+        writable : bool, optional
+            whether the writes of the machine go to the file.
+
+        Returns
+        -------
+        image : mmap.mmap
+            the bytes of the image, sliced without copy.
+    """
+    with open(path, "r+b" if writable else "rb") as file:
+        if os.fstat(file.fileno()).st_size == 0:
+            raise ValueError(f"empty disk image: {path}.")
+        return mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_WRITE if writable else mmap.ACCESS_READ)
+
+
+class _Window:
+    """ the sector selected by the LBA registers, mapped in the address space by an IO region of 512 bytes. """
+    def __init__(self, device):
+        self.device = device
+
+    def read(self, offset):
+        device = self.device
+        index = device._lba*BLOCK_SIZE + offset
+        return device.image[index] if index < device.size else 0xFF
+
+    def write(self, offset, byte):
+        device = self.device
+        index = device._lba*BLOCK_SIZE + offset
+        if device.writable and index < device.size:
+            device.image[index] = byte
+
+
+class BlockDevice:
+    """
+        A block device over a disk image, a mmap of a host file or any
+        bytes-like object, written only when writable. The LBA registers
+        select a sector, seen through the window of 512 bytes, and the READ
+        and WRITE commands copy COUNT sectors between the image and the
+        memory at the DMA address, a slice at a time into the RAM pages.
+        The copies complete at once, the status tells an error when a
+        sector is past the end.
+    """
+    def __init__(self, image, writable=True):
+        self.image = image
+        self.size = len(image)
+        self.blocks = self.size // BLOCK_SIZE
+        self.writable = writable
+        self.window = _Window(self)
+        self.circuit = None
+        self.reset()
+
+    def attach_circuit(self, circuit):
+        self.circuit = circuit
+
+    def reset(self):
+        self._lba = 0
+        self._dma = 0x0000
+        self._count = 1
+        self._status = 0x00
+
+    def close(self):
+        if isinstance(self.image, mmap.mmap):
+            self.image.flush()
+            self.image.close()
+
+    def read(self, offset):
+        offset &= 0x07
+        if offset < BLOCK_DMA:
+            return (self._lba>>(8*offset))&0xFF
+        if offset < BLOCK_COUNT:
+            return (self._dma>>(8*(offset-BLOCK_DMA)))&0xFF
+        if offset == BLOCK_COUNT:
+            return self._count
+        return self._status
+
+    def write(self, offset, byte):
+        offset &= 0x07
+        if offset < BLOCK_DMA:
+            shift = 8*offset
+            self._lba = (self._lba&~(0xFF<<shift)) | (byte<<shift)
+        elif offset < BLOCK_COUNT:
+            shift = 8*(offset-BLOCK_DMA)
+            self._dma = (self._dma&~(0xFF<<shift)) | (byte<<shift)
+        elif offset == BLOCK_COUNT:
+            self._count = byte
+        elif byte == BLOCK_READ:
+            self._status = self._transfer(True)
+        elif byte == BLOCK_WRITE:
+            self._status = self._transfer(False) if self.writable else BLOCK_ERROR
+        else:
+            self._status = BLOCK_ERROR
+
+    def _transfer(self, reading):
+        """ copies COUNT sectors, page by page, between the image and the memory. """
+        if self._lba + self._count > self.blocks:
+            return BLOCK_ERROR
+        m = self.circuit.memory
+        start = self._lba*BLOCK_SIZE
+        addr = self._dma
+        left = self._count*BLOCK_SIZE
+        while left:
+            # the run inside of the current page, up to its end.
+            page, low = addr>>8, addr&0xFF
+            n = min(left, 256-low)
+            view = m._write_pages[page] if reading else m._read_pages[page]
+            if view is not None and not (reading and any(m._code[alias] for alias in m._aliases[page])):
+                if reading:
+                    view[low:low+n] = self.image[start:start+n]
+                else:
+                    self.image[start:start+n] = view[low:low+n]
+            else:
+                # devices, ROM and pages of decoded code, at any of their aliases, go through the bus.
+                for i in range(n):
+                    if reading:
+                        m[(addr+i)&0xFFFF] = self.image[start+i]
+                    else:
+                        self.image[start+i] = m[(addr+i)&0xFFFF]
+            start += n
+            addr = (addr+n)&0xFFFF
+            left -= n
+        return 0x00
+
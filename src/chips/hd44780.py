@@ -0,0 +1,283 @@
+# instructions of the HD44780, by their highest set bit.
+HD44780_CLEAR   = (1<<0)
+HD44780_HOME    = (1<<1)
+HD44780_ENTRY   = (1<<2)
+HD44780_DISPLAY = (1<<3)
+HD44780_SHIFT   = (1<<4)
+HD44780_FUNCTION = (1<<5)
+HD44780_CGRAM   = (1<<6)
+HD44780_DDRAM   = (1<<7)
+
+# the busy flag, read with the address counter.
+HD44780_BUSY = (1<<7)
+
+# execution times, in microseconds.
+HD44780_SLOW_US = 1520
+HD44780_FAST_US = 37
+
+
+def _glyph(code):
+    """ the character of the A00 ROM at a code, CGRAM characters and symbols without a match as blocks. """
+    if code < 0x10:
+        return "▒"
+    if code == 0x5C:
+        return "¥"
+    if code == 0x7E:
+        return "→"
+    if code == 0x7F:
+        return "←"
+    if 0x20 <= code < 0x7E:
+        return chr(code)
+    if 0xA1 <= code < 0xE0:
+        # the katakana of the ROM are those of JIS X 0201.
+        return chr(0xFF61 + code - 0xA1)
+    return "▒" if code != 0xA0 else " "
+
+
+class HD44780:
+    """
+        The HD44780 character LCD controller: 80 bytes of DDRAM, 64 bytes of
+        CGRAM, the address counter and the busy flag, on a bus of 8 or 4 bits
+        driven by RS, RW and E, typically from the ports of a VIA.
+
+        Writes are latched on the falling edge of E, reads are driven while
+        E is high, a nibble at a time in 4-bit mode. The instructions keep
+        the controller busy for their execution time, counted in cycles of
+        the CPU clocked at hz. The text shown is only recomputed after an
+        instruction or a write that changes it, version counts the changes.
+    """
+    def __init__(self, rows=2, columns=16, hz=1000000):
+        self.rows = rows
+        self.columns = columns
+        self.hz = hz
+        self.circuit = None
+        self.version = 0
+        self.reset()
+
+    def attach_circuit(self, circuit):
+        self.circuit = circuit
+
+    def reset(self):
+        """ the internal reset at power on: 8-bit bus, one line, display off. """
+        self._ddram = bytearray(b" "*80)
+        self._cgram = bytearray(64)
+        self._ac = 0
+        self._cg = False          # the address counter points in CGRAM.
+        self._increment = True
+        self._shift = False       # the display shifts with each write.
+        self._display = False
+        self.cursor = False
+        self.blink = False
+        self._eight_bits = True
+        self._two_lines = False
+        self._offset = 0          # the display shift, in characters.
+        self._busy_until = 0
+        self._nibble = None       # the high nibble written first in 4-bit mode.
+        self._read_low = False    # the next nibble read in 4-bit mode is the low one.
+        self._rs = self._rw = self._e = 0
+        self._data = 0xFF
+        self._out = 0xFF
+        self._changed()
+
+    def _now(self):
+        return self.circuit.cpu._cycles if self.circuit is not None else 0
+
+    def _changed(self):
+        self._lines = None
+        self.version += 1
+
+    # the bus.
+    def bus(self, rs, rw, e, data):
+        """
+            The levels of the pins driven by the CPU side.
+
+            Args
+            ----
+            rs : int
+                1 for data, 0 for an instruction or the busy flag.
+            rw : int
+                1 to read, 0 to write.
+            e : int
+                the enable strobe.
+            data : int
+                the levels of D0-D7, D4-D7 in 4-bit mode.
+        """
+        rise = e and not self._e
+        fall = self._e and not e
+        if fall and not self._rw:
+            self._latch(self._rs, self._data)
+        self._rs, self._rw, self._e, self._data = rs, rw, e, data
+        if rise and rw:
+            self._out = self._read_bus(rs)
+        elif not (e and rw):
+            self._out = 0xFF
+
+    def output(self):
+        """ the levels the controller drives on D0-D7, pulled up when it does not drive them. """
+        return self._out
+
+    def _latch(self, rs, data):
+        if self._eight_bits:
+            self._execute(rs, data)
+        elif self._nibble is None:
+            self._nibble = data&0xF0
+        else:
+            byte, self._nibble = self._nibble | (data>>4), None
+            self._execute(rs, byte)
+
+    def _read_bus(self, rs):
+        if self._eight_bits:
+            return self._read(rs)
+        if not self._read_low:
+            self._byte = self._read(rs)
+            self._read_low = True
+            return self._byte&0xF0
+        self._read_low = False
+        return (self._byte<<4)&0xF0
+
+    # the controller.
+    def _busy(self, us):
+        self._busy_until = self._now() + us*self.hz//1000000
+
+    def _address(self, ac):
+        """ the index in DDRAM of an address, two lines of 40 characters at $00 and $40. """
+        if self._two_lines:
+            return (ac>>6)*40 + (ac&0x3F)%40
+        return ac%80
+
+    def _step(self, delta):
+        """ moves the address counter, across the two lines of DDRAM in 2-line mode. """
+        if self._cg:
+            self._ac = (self._ac+delta)&0x3F
+        elif self._two_lines:
+            index = (self._address(self._ac)+delta) % 80
+            self._ac = (index//40)*0x40 + index%40
+        else:
+            self._ac = (self._ac+delta) % 80
+
+    def _execute(self, rs, byte):
+        if rs:
+            if self._cg:
+                self._cgram[self._ac] = byte
+            else:
+                self._ddram[self._address(self._ac)] = byte
+                if self._shift:
+                    self._offset = (self._offset + (1 if self._increment else -1)) % 40
+            self._step(1 if self._increment else -1)
+            self._busy(HD44780_FAST_US)
+            self._changed()
+            return
+        if byte&HD44780_DDRAM:
+            self._cg = False
+            self._ac = byte&0x7F
+        elif byte&HD44780_CGRAM:
+            self._cg = True
+            self._ac = byte&0x3F
+        elif byte&HD44780_FUNCTION:
+            self._eight_bits = bool(byte&0x10)
+            self._two_lines = bool(byte&0x08)
+            self._nibble = None
+            self._read_low = False
+            self._changed()
+        elif byte&HD44780_SHIFT:
+            delta = 1 if byte&0x04 else -1
+            if byte&0x08:
+                self._offset = (self._offset - delta) % 40
+                self._changed()
+            else:
+                self._step(delta)
+        elif byte&HD44780_DISPLAY:
+            self._display = bool(byte&0x04)
+            self.cursor = bool(byte&0x02)
+            self.blink = bool(byte&0x01)
+            self._changed()
+        elif byte&HD44780_ENTRY:
+            self._increment = bool(byte&0x02)
+            self._shift = bool(byte&0x01)
+        elif byte&HD44780_HOME:
+            self._cg = False
+            self._ac = 0
+            self._offset = 0
+            self._busy(HD44780_SLOW_US)
+            self._changed()
+            return
+        elif byte&HD44780_CLEAR:
+            self._ddram[:] = b" "*80
+            self._cg = False
+            self._ac = 0
+            self._offset = 0
+            self._increment = True
+            self._busy(HD44780_SLOW_US)
+            self._changed()
+            return
+        self._busy(HD44780_FAST_US)
+
+    def _read(self, rs):
+        if not rs:
+            busy = HD44780_BUSY if self._now() < self._busy_until else 0
+            return busy | self._ac
+        byte = self._cgram[self._ac] if self._cg else self._ddram[self._address(self._ac)]
+        self._step(1 if self._increment else -1)
+        return byte
+
+    # the text.
+    @property
+    def lines(self):
+        """ the text shown on each row, recomputed only after a change. """
+        if self._lines is None:
+            self._lines = [self._row(row) for row in range(self.rows)]
+        return self._lines
+
+    def _row(self, row):
+        if not self._display:
+            return " "*self.columns
+        if self._two_lines:
+            # rows 3 and 4 continue rows 1 and 2 in DDRAM.
+            line, start = row&1, (row>>1)*self.columns
+            base = line*40
+            return "".join(_glyph(self._ddram[base + (start+col+self._offset) % 40]) for col in range(self.columns))
+        start = row*self.columns
+        return "".join(_glyph(self._ddram[(start+col+self._offset) % 80]) for col in range(self.columns))
+
+    def __str__(self):
+        return "\n".join(self.lines)
+
+    def flip(self, stdscr, y, x):
+        border = "+" + "-"*self.columns + "+"
+        stdscr.addstr(y, x, "LCD")
+        stdscr.addstr(y+1, x, border)
+        for row, line in enumerate(self.lines):
+            stdscr.addstr(y+2 + row, x, f"|{line}|")
+        stdscr.addstr(y+2 + self.rows, x, border)
+
+
+def connect_via(lcd, via, data_port=1, control_port=0, e=0x80, rw=0x40, rs=0x20):
+    """
+        Wires an LCD to the ports of a VIA, the data bus on one port and RS,
+        RW and E on bits of the other, the wiring of most 6502 breadboards.
+
+        Args
+        ----
+        lcd : HD44780
+            the controller.
+        via : W65C22
+            the VIA driving it.
+        data_port : int, optional
+            0 for port A, 1 for port B (the default), to D0-D7.
+        control_port : int, optional
+            the port of RS, RW and E, port A by default.
+        e, rw, rs : int, optional
+            the masks of their bits on the control port.
+    """
+    levels = [0xFF, 0xFF]
+
+    def output(port):
+        def drive(pins):
+            levels[port] = pins
+            control = levels[control_port]
+            lcd.bus(int(bool(control&rs)), int(bool(control&rw)), int(bool(control&e)), levels[data_port])
+        return drive
+
+    via.output[data_port] = output(data_port)
+    via.output[control_port] = output(control_port)
+    via.input[data_port] = lcd.output
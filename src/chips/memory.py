@@ -1,5 +1,8 @@
 from utils import to_hex
 
+from chips.opcodes import LENGTH
+from chips.opcodes import UNUSED
+
 
 class Memory:
     def __len__(self):
@@ -35,19 +38,38 @@ class Memory:
     def set_org(self, org):
         self._org = org
 
+    def read(self, offset):
+        """ read the byte at an offset from the origin of the memory. """
+        return self._bytes[offset]
+
+    def write(self, offset, byte):
+        """ write a byte at an offset from the origin of the memory. """
+        pass
+
     def flip(self, stdscr, y, x):
         for row, line in enumerate(self.__str__().split('\n')):
             stdscr.addstr(y + row, x, line)
 
 
 class RAM(Memory):
-    def __init__(self, bits):
-        self._bytes = bytearray([0] * 2 ** bits)
+    def __init__(self, bits=None, size=None, banks=1):
+        size = 2 ** bits if size is None else size
+        self._banks = [bytearray(size) for _ in range(banks)]
+        self._bytes = self._banks[0]
         self._org = 0x0000
+        self.bank = 0
 
     def __setitem__(self, index, byte):
         self._bytes[index - self._org] = byte % 256
 
+    def write(self, offset, byte):
+        self._bytes[offset] = byte
+
+    def select(self, bank):
+        """ switch the bank seen through the address space. """
+        self._bytes = self._banks[bank]
+        self.bank = bank
+
     def flip(self, stdscr, y, x):
         stdscr.addstr(y, x, "RAM")
         super().flip(stdscr, y+1, x)
@@ -67,25 +89,272 @@ class ROM(Memory):
         super().flip(stdscr, y+1, x)
 
 
+class IO:
+    """
+        A window of registers of a device in the address space, accesses are
+        forwarded to the read(offset) and write(offset, byte) methods of the device.
+    """
+    def __init__(self, device, size):
+        self.device = device
+        self._size = size
+        self._org = 0x0000
+
+    def __len__(self):
+        return self._size
+
+    def set_org(self, org):
+        self._org = org
+
+    def read(self, offset):
+        return self.device.read(offset)
+
+    def write(self, offset, byte):
+        self.device.write(offset, byte)
+
+
+class Mirror:
+    """ another view, at its own origin, of the addresses [target, target + size) of the map. """
+    def __init__(self, target, size):
+        self.target = target
+        self._size = size
+        self._org = 0x0000
+
+    def __len__(self):
+        return self._size
+
+    def set_org(self, org):
+        self._org = org
+
+
 class Memory64(Memory):
-    def __init__(self, ram, rom):
-        self._orgs = [(ram._org, ram._org + len(ram) - 1, ram),
-                      (rom._org, rom._org + len(rom) - 1, rom)]
-        self._orgs.sort()
-        for i in range(len(self._orgs) - 1):
-            if self._orgs[i][1] >= self._orgs[i + 1][0]:
+    # value read from an unmapped address.
+    OPEN_BUS = 0xFF
+
+    def __init__(self, *regions):
+        self.regions = sorted(regions, key=lambda region: region._org)
+        bounds = [(region._org, region._org + len(region) - 1) for region in self.regions]
+        for i in range(len(bounds) - 1):
+            if bounds[i][1] >= bounds[i + 1][0]:
                 raise ValueError("wrong value encountered for memory map.")
-        if self._orgs[-1][1] >= 65536:
+        if bounds[-1][1] >= 65536:
             raise ValueError("memory map too big for 64k.")
 
+        # contiguous RAM from $0000 is read and written without a page lookup.
+        self._ram = None
+        self._ram_top = 0
+        first = self.regions[0]
+        if isinstance(first, RAM) and first._org == 0 and len(first._banks) == 1:
+            self._ram = first._bytes
+            self._ram_top = len(first)
+
+        # page map: a view on the backing bytes of each fully mapped 256-byte page,
+        # None sends the access to the few regions sharing the page (devices, ROM
+        # writes, partial pages), and to the open bus if none of them matches.
+        self._read_pages = [None] * 256
+        self._write_pages = [None] * 256
+        self._slow = [[] for _ in range(256)]
+        self._views = []  # (page, region, offset) of every view, for bank switches.
+
+        # pages holding instructions decoded by the instruction cache, or translated
+        # by the block translator, a write into one of them is reported to it.
+        self._code = bytearray(256)
+        self.icache = None
+        for region in self.regions:
+            if isinstance(region, Mirror):
+                lo = region.target
+                hi = lo + len(region) - 1
+                target = [r for r in self.regions if r._org <= lo and hi < r._org + len(r)]
+                if not target or isinstance(target[0], Mirror):
+                    raise ValueError(f"mirror at ${region._org:04x} does not fit in a region.")
+                self._map(region._org, len(region), target[0], lo - target[0]._org)
+            else:
+                self._map(region._org, len(region), region, 0)
+
+        # the pages showing the same bytes as others through a mirror, a write into
+        # one of them is reported to the cache at each of its aliases.
+        self._aliases = [(page,) for page in range(256)]
+        self._mirrored = bytearray(256)
+        shared = {}
+        for page, region, offset in self._views:
+            shared.setdefault((id(region), offset), []).append(page)
+        for pages in shared.values():
+            if len(pages) > 1:
+                for page in pages:
+                    self._aliases[page] = tuple(pages)
+                    self._mirrored[page] = 1
+
+    def _map(self, org, size, region, offset):
+        """ map [org, org + size) onto the region, starting at the given offset inside of it. """
+        hi = org + size - 1
+        base = org - offset
+        for page in range(org >> 8, (hi >> 8) + 1):
+            self._slow[page].append((max(org, page << 8), min(hi, (page << 8) + 255), region, base))
+        if isinstance(region, (RAM, ROM)):
+            for page in range((org + 255) >> 8, (hi + 1) >> 8):
+                self._views.append((page, region, (page << 8) - base))
+                self._point(page, region, (page << 8) - base)
+
+    def _point(self, page, region, offset):
+        view = memoryview(region._bytes)[offset:offset + 256]
+        self._read_pages[page] = view
+        if isinstance(region, RAM):
+            self._write_pages[page] = view
+
+    def select(self, region, bank):
+        """ switch the bank of a banked RAM region, re-pointing its pages. """
+        region.select(bank)
+        for page, r, offset in self._views:
+            if r is region:
+                self._point(page, region, offset)
+                if self._code[page]:
+                    self.icache.remap(page)
+
     def __getitem__(self, index):
-        for i in range(len(self._orgs)):
-            if self._orgs[i][0] <= index <= self._orgs[i][1]:
-                return self._orgs[i][-1][index]
+        if index < self._ram_top:
+            return self._ram[index]
+        page = self._read_pages[index >> 8]
+        if page is not None:
+            return page[index & 0xFF]
+        for lo, hi, region, base in self._slow[index >> 8]:
+            if lo <= index <= hi:
+                return region.read(index - base)
+        return self.OPEN_BUS
 
     def __setitem__(self, index, byte):
-        for i in range(len(self._orgs)):
-            if self._orgs[i][0] <= index <= self._orgs[i][1]:
-                self._orgs[i][-1][index] = byte % 256
+        if self._code[index >> 8] or self._mirrored[index >> 8]:
+            self._written(index)
+        if index < self._ram_top:
+            self._ram[index] = byte & 0xFF
+            return
+        page = self._write_pages[index >> 8]
+        if page is not None:
+            page[index & 0xFF] = byte & 0xFF
+            return
+        for lo, hi, region, base in self._slow[index >> 8]:
+            if lo <= index <= hi:
+                region.write(index - base, byte & 0xFF)
                 break
 
+    def _written(self, index):
+        """ reports a write to the cache, at every address showing the byte written. """
+        low = index & 0xFF
+        for page in self._aliases[index >> 8]:
+            if self._code[page]:
+                self.icache.written((page << 8) | low)
+
+
+class InstructionCache:
+    """
+        Decoded instructions of a Memory64, by address: the opcode, the operand
+        bytes packed little-endian and the address of the next instruction.
+        Only RAM and ROM pages are cached, a write into a page, or a bank switch
+        under it, drops the instructions overlapping the page.
+    """
+    def __init__(self, memory):
+        self.memory = memory
+        self.entries = [None] * 65536
+        self._pages = [[] for _ in range(256)]
+        memory.icache = self
+
+    def decode(self, addr):
+        """ decodes and caches the instruction at an address. """
+        m = self.memory
+        op = m[addr]
+        # BRK and the unused opcodes step over their operand bytes themselves.
+        length = 1 if op == 0x00 or UNUSED[op] else LENGTH[op]
+        operand = 0
+        for i in range(1, length):
+            operand |= m[(addr + i) & 0xFFFF] << (8 * (i - 1))
+        entry = (op, operand, (addr + length) & 0xFFFF)
+
+        first, last = addr >> 8, ((addr + length - 1) & 0xFFFF) >> 8
+        for page in {first, last}:
+            if m._read_pages[page] is None:
+                return entry  # devices may answer differently next time.
+        for page in {first, last}:
+            self._pages[page].append(addr)
+            m._code[page] = 1
+        self.entries[addr] = entry
+        return entry
+
+    def invalidate(self, page):
+        """ drops the decoded instructions overlapping a page. """
+        for addr in self._pages[page]:
+            self.entries[addr] = None
+        self._pages[page] = []
+        self.memory._code[page] = 0
+
+    def written(self, addr):
+        """ an address of a page holding decoded instructions was written. """
+        self.invalidate(addr >> 8)
+
+    def remap(self, page):
+        """ another bank was switched in under a page holding decoded instructions. """
+        self.invalidate(page)
+
+    def clear(self):
+        for page in range(256):
+            self.invalidate(page)
+
+
+def _number(value):
+    """ an int, or a string in decimal, '0x' or '$' hexadecimal. """
+    if isinstance(value, str):
+        return int(value.replace('$', "0x"), 0)
+    return value
+
+
+def load_memory_map(path, devices=None):
+    """
+        Builds the memory of a board from a JSON or TOML memory-map file.
+
+        The file holds a list of 'regions', each with a 'type' and an 'org':
+            - ram: 'size' or 'bits', and optional 'banks'.
+            - rom: the 'file' holding its content.
+            - mirror: 'size' and the 'target' address it mirrors.
+            - io: 'size' and the name of the 'device' answering accesses.
+
+        Args
+        ----
+        path : str
+            the memory-map file, TOML when it ends with '.toml', JSON otherwise.
+        devices : dict, optional
+            the devices of io regions, by name.
+
+        Returns
+        -------
+        memory : Memory64
+            the memory compiled from the map.
+    """
+    if devices is None:
+        devices = {}
+    if path.endswith(".toml"):
+        import tomllib
+        with open(path, "rb") as file:
+            spec = tomllib.load(file)
+    else:
+        import json
+        with open(path) as file:
+            spec = json.load(file)
+
+    regions = []
+    for entry in spec["regions"]:
+        kind = entry["type"]
+        if kind == "ram":
+            if "bits" in entry:
+                region = RAM(bits=_number(entry["bits"]), banks=_number(entry.get("banks", 1)))
+            else:
+                region = RAM(size=_number(entry["size"]), banks=_number(entry.get("banks", 1)))
+        elif kind == "rom":
+            region = ROM(entry["file"])
+        elif kind == "mirror":
+            region = Mirror(_number(entry["target"]), _number(entry["size"]))
+        elif kind == "io":
+            if entry["device"] not in devices:
+                raise ValueError(f"unknown device '{entry['device']}' in memory map.")
+            region = IO(devices[entry["device"]], _number(entry["size"]))
+        else:
+            raise ValueError(f"unknown region type '{kind}' in memory map.")
+        region.set_org(_number(entry["org"]))
+        regions.append(region)
+    return Memory64(*regions)
@@ -2,10 +2,49 @@ from utils import to_bin
 from utils import to_hex
 from utils import print_pins
 
-from chips.pins import *
+from array import array
 
-import numpy as np
-_RD = lambda bits: np.random.randint(1<<bits)
+from chips.pins import *
+from chips.opcodes import MNEMONICS
+from chips.opcodes import MODE
+from chips.opcodes import MODES
+from chips.opcodes import LENGTH
+from chips.opcodes import CYCLES
+
+
+def _bcd_adc(a, b, c):
+    """ the 65C02 decimal ADC: the adjusted result and its N, V, Z and C flags. """
+    al = (a&0x0F) + (b&0x0F) + c
+    if al >= 0x0A:
+        al = ((al+0x06)&0x0F) + 0x10
+    s = (a&0xF0) + (b&0xF0) + al
+    # V comes from the signed sum before the high nibble adjustment.
+    v = (a&0xF0) - ((a&0x80)<<1) + (b&0xF0) - ((b&0x80)<<1) + al
+    if s >= 0xA0:
+        s += 0x60
+    r = s&0xFF
+    return r, ((r&M65C02_NF) | (M65C02_VF if not -128 <= v <= 127 else 0)
+               | (0 if r else M65C02_ZF) | (M65C02_CF if s >= 0x100 else 0))
+
+
+def _bcd_sbc(a, b, c):
+    """ the 65C02 decimal SBC: the adjusted result and its N, V, Z and C flags. """
+    al = (a&0x0F) - (b&0x0F) + c - 1
+    d = a - b + c - 1
+    s = d
+    if s < 0:
+        s -= 0x60
+    if al < 0:
+        s -= 0x06
+    r = s&0xFF
+    # C and V are those of the binary subtraction.
+    return r, ((r&M65C02_NF) | (M65C02_VF if (a^b) & (a^d) & 0x80 else 0)
+               | (0 if r else M65C02_ZF) | (0 if d & 0xFF00 else M65C02_CF))
+
+
+def _bcd_table(op):
+    """ a table of op results, the flags in the high byte, indexed by carry<<16|A<<8|operand. """
+    return array('H', [r | f<<8 for r, f in (op(a, b, c) for c in (0, 1) for a in range(256) for b in range(256))])
 
 
 class M65C02:
@@ -19,60 +58,98 @@ class M65C02:
         self._Y    = 0x00      # Y register.
         self._S    = 0x00      # stack pointer.
         self._P    = M65C02_ZF # status register.
-        self._PINS = 0         # last pins.
+        self._PINS = 0         # last control pins.
+        self._ADDR = 0x0000    # address bus.
+        self._DATA = 0x00      # data bus.
+        self._CTRL = 0         # control pins, address and data lines cleared.
+        self._cycles = 0       # elapsed clock cycles.
+        self._nz   = 0x01      # last N and Z source of the lazy flags.
+
+        # the fast engine defers the N and Z flags until P is observed.
+        self.lazy_flags = True
+        # decoded instructions of the fast engine, a memory.InstructionCache.
+        self.icache = None
+        self._o = 0            # pre-decoded operand bytes.
+        # idle loops are fast-forwarded to the end of the run, or the next event.
+        self.idle_skip = True
+        self._spun = None      # the last backward jump and the registers it found.
+        self._spun_at = 0      # the cycle it happened at.
+        self._loops = {}       # the period of the loops known to be idle or not, by (start, jump).
 
-        self._irq_pip   = 0
-        self._nmi_pip   = 0
         self._brk_flags = 0b000
+        self._nmi_edge  = False         # an NMIB falling edge not serviced yet.
+        self._nmib      = M65C02_NMIB   # the NMIB level last sampled.
+        # the cycle the run loops next dispatch the events and look at the interrupt lines.
+        self._until     = 0
 
         self._bcd_enabled = None
 
+        # "wait" after a WAI, "stop" after a STP, until an interrupt line wakes the CPU up.
+        self.halted = None
+
         self.circuit = None
 
     def attach_circuit(self, circuit):
         self.circuit = circuit
 
+    @property
+    def pins(self):
+        """ the packed 40-bit pin mask, only built for the pin diagram and tracers. """
+        return self._CTRL|(self._ADDR<<7)|(self._DATA<<23)
+
+    @pins.setter
+    def pins(self, pins):
+        self._CTRL = pins&M65C02_CTRL_MASK
+        self._ADDR = (pins&M65C02_ADDR_MASK)>>7
+        self._DATA = (pins&M65C02_DATA_MASK)>>23
+
     def _SA(self, addr):
-        """ set 16-bit address in 64-bit pin mask. """
-        self.circuit.pins=(self.circuit.pins&(((1<<40)-1)&((((1<<16)-1)<<7)^((1<<40)-1))))|(addr<<7)
+        """ set 16-bit address on the address bus. """
+        self._ADDR=addr&0xFFFF
 
     def _GA(self):
-        """ extract 16-bit addess from pin mask. """
-        return (self.circuit.pins&(((1<<16)-1)<<7))>>7
+        """ get 16-bit address from the address bus. """
+        return self._ADDR
 
     def _SAD(self, addr, data):
-        """ set 16-bit address and 8-bit data in 64-bit pin mask. """
-        self._SA(addr)
-        self._SD(data)
+        """ set 16-bit address and 8-bit data on the buses. """
+        self._ADDR=addr&0xFFFF
+        self._DATA=data&0xFF
 
     def _FETCH(self):
         """ fetch next opcode byte. """
-        self._SA(self._PC)
-        self._ON(M65C02_SYNC)
+        self._ADDR=self._PC
+        self._CTRL|=M65C02_SYNC
+
+    def _FETCH_DF(self):
+        """ fetch next opcode byte, a cycle later in decimal mode. """
+        self._ADDR=self._PC
+        if not (self._P&M65C02_DF):
+            self._CTRL|=M65C02_SYNC
 
     def _SD(self, data):
-        """ set 8-bit data in 64-bit pin mask. """
-        self.circuit.pins=(self.circuit.pins&(((1<<40)-1)&((((1<<8)-1)<<23)^((1<<40)-1))))|(data<<23)
+        """ set 8-bit data on the data bus. """
+        self._DATA=data&0xFF
 
     def _GD(self):
-        """ extract 8-bit data from 64-bit pin mask. """
-        return (self.circuit.pins&(((1<<8)-1)<<23))>>23
+        """ get 8-bit data from the data bus. """
+        return self._DATA
 
     def _ON(self, m):
         """ enable control pins. """
-        self.circuit.pins=self.circuit.pins|m
+        self._CTRL|=m
 
     def _OFF(self, m):
         """ disable control pins. """
-        self.circuit.pins=self.circuit.pins&(m^((1<<40)-1))
+        self._CTRL&=~m
 
     def _RD(self):
         """ a memory read tick. """
-        self._ON(M65C02_RWB)
+        self._CTRL|=M65C02_RWB
 
     def _WR(self):
         """ a memory write tick. """
-        self._OFF(M65C02_RWB)
+        self._CTRL&=~M65C02_RWB
 
     def _NZ(self, v):
         """ set N and Z flags depending on value, change the value of the status register. """
@@ -132,20 +209,29 @@ class M65C02:
 
     def _asl(self, v):
         self._P = (self._NZ_(self._P, v<<1) & ~M65C02_CF) | (M65C02_CF if (v & 0x80) else 0)
-        return v<<1
+        return (v<<1)&0xFF
 
     def _cmp(self, r, v):
         t = r - v
         self._P = (self._NZ_(self._P, t) & ~M65C02_CF) | (0 if (t & 0xFF00) else M65C02_CF)
 
+    # decimal ADC and SBC tables, built on the first decimal operation.
+    _BCD_ADC = None
+    _BCD_SBC = None
+
     def _adc(self, val):
         if self._P&M65C02_DF:
-            assert(False), "Decimal mode not implemented"
+            table = self._BCD_ADC
+            if table is None:
+                table = M65C02._BCD_ADC = _bcd_table(_bcd_adc)
+            r = table[(self._P&M65C02_CF)<<16|self._A<<8|val]
+            self._P = (self._P&~(M65C02_NF|M65C02_VF|M65C02_ZF|M65C02_CF)) | (r>>8)
+            self._A = r&0xFF
         else:
             # normal mode.
             s = self._A + val + (1 if self._P&M65C02_CF else 0)
             self._P &= ~(M65C02_VF|M65C02_CF)
-            self._P = self._NZ_(self.P, s)
+            self._P = self._NZ_(self._P, s)
             if (~(self._A^val) & (self._A^s) & 0x80):
                 self._P |= M65C02_VF
             if (s & 0xFF00):
@@ -154,12 +240,17 @@ class M65C02:
 
     def _sbc(self, val):
         if self._P&M65C02_DF:
-            assert(False), "Decimal mode not implemented"
+            table = self._BCD_SBC
+            if table is None:
+                table = M65C02._BCD_SBC = _bcd_table(_bcd_sbc)
+            r = table[(self._P&M65C02_CF)<<16|self._A<<8|val]
+            self._P = (self._P&~(M65C02_NF|M65C02_VF|M65C02_ZF|M65C02_CF)) | (r>>8)
+            self._A = r&0xFF
         else:
             # normal mode.
             d = self._A - val - (0 if self._P&M65C02_CF else 1)
             self._P &= ~(M65C02_VF|M65C02_CF)
-            self._p = self._NZ_(self._P, d)
+            self._P = self._NZ_(self._P, d)
             if ((self._A^val) & (self._A^d) & 0x80):
                 self._P |= M65C02_VF
             if (not(d & 0xFF00)):
@@ -186,7 +277,7 @@ class M65C02:
         if (carry):
             v |= 1
         self._P = self._NZ_(self._P, v)
-        return v
+        return v&0xFF
 
     def _ror(self, v):
         carry = self._P & M65C02_CF
@@ -199,2746 +290,2697 @@ class M65C02:
         self._P = self._NZ_(self._P, v)
         return v
 
-    def tick(self, pins):
+    def tick(self):
+        """ a half clock cycle of the pin-level view: the core only moves on the PHI2 rising edge. """
+        pins = self._CTRL
         if (not (self._PINS & M65C02_PHI2) and (pins & M65C02_PHI2)):  # ((pins & M65C02_PHI2) & ((M65C02_PHI2 & self._PINS) ^ ((1<< 40) - 1))):
-            if ((pins & M65C02_SYNC) or not (pins & M65C02_IRQB) or not (pins & M65C02_NMIB) or (pins & M65C02_RDY) or not (pins & M65C02_RESB)):  # (pins & (M65C02_SYNC|M65C02_IRQB|M65C02_NMIB|M65C02_RDY|M65C02_RESB)):
-                # NMIB: low-edge-transition triggered.
-                if ((self._PINS & M65C02_NMIB) and not (pins & M65C02_NMIB)):  # (pins & ((pins ^ self._PINS) & M65C02_NMIB)):
-                    print("NMIB")
-
-                # IRQB: low-level triggered.
-                if (not (pins & M65C02_IRQB) and not (self._P & M65C02_IF)):  # ((pins & M65C02_IRQB) and (not (self._P & M65C02_IF))):
-                    print("IRQB")
-
-                # check RDY during read cycles.
-                if ((pins & (M65C02_RWB|M65C02_RDY)) == (M65C02_RWB|M65C02_RDY)):
-                    pass
-                    #print("RDY")
-
-                if not (pins & M65C02_RESB):
-                    self._brk_flags |= M65C02_BRK_RESET
+            self.cycle()
+        self._PINS = self._CTRL
+
+    def cycle(self):
+        """ a full clock cycle, on the data of the bus transaction of the cycle. """
+        pins = self._CTRL
+        self._cycles += 1
+        # the interrupt lines are only looked at on the opcode fetch, and RESB on every cycle.
+        if ((pins & M65C02_SYNC) or not (pins & M65C02_RESB)):
+            if not (pins & M65C02_RESB):
+                self.halted = None
+                self._brk_flags |= M65C02_BRK_RESET
+                self._IR  = 0
+                self._P  &= (M65C02_BF^((1<<8)-1))
+                return
+
+            self._IR = self._DATA<<3
+            self._OFF(M65C02_SYNC)
+
+            # IRQB: low-level triggered, NMIB: low-edge-transition triggered.
+            if (self._nmi_edge or (pins & (M65C02_IRQB|M65C02_NMIB)) != (M65C02_IRQB|self._nmib)):
+                interrupt = self._pending()
+                if interrupt == "nmi":
+                    self._nmi_edge = False
+                    self._brk_flags |= M65C02_BRK_NMI
+                elif interrupt == "irq":
+                    self._brk_flags |= M65C02_BRK_IRQ
+                if interrupt is not None:
                     self._IR  = 0
                     self._P  &= (M65C02_BF^((1<<8)-1))
-                    self._PINS = pins
-                    return pins
-
-                if (pins & M65C02_SYNC):
-                    self._IR = self._GD()<<3
-                    self._OFF(M65C02_SYNC)
-
-                    if (0 != (self._irq_pip & 4)):
-                        print("IRQ")
-                        self._brk_flags |= M65C02_BRK_IRQ
-                        self._IR  = 0
-                        self._P  &= (M65C02_BF^((1<<8)-1))
-
-                    if (0 != (self._nmi_pip & 0xfffc)):
-                        print("NMI")
-                        self._brk_flags |= M65C02_BRK_NMI
-                        self._IR  = 0
-                        self._P  &= (M65C02_BF^((1<<8)-1))
-
-                    self._irq_pip &= 3
-                    self._nmi_pip &= 3
-
-                    if not (self._brk_flags):
-                        self._INCPC()
-
-            self._RD()
-            # BRK s
-            if   (self._IR == (0x00<<3|0)):self._SA(self._PC); # put PC on addr bus.
-            elif (self._IR == (0x00<<3|1)):
-                if (0==(self._brk_flags&(M65C02_BRK_IRQ|M65C02_BRK_NMI))): self._PC+=1;
-                else:self._DES();self._SAD(0x0100|self._S,self._PC>>8);  # push MSB of PC onto stack.
-                if(0==(self._brk_flags&M65C02_BRK_RESET)):self._WR(); # write to stack.
-            elif (self._IR == (0x00<<3|2)):
-                if (self._brk_flags&(M65C02_BRK_IRQ|M65C02_BRK_NMI)):self._DES();self._SAD(0x0100|self._S,self._PC);
-                if(0==(self._brk_flags&M65C02_BRK_RESET)):self._WR();
-            elif (self._IR == (0x00<<3|3)):
-                if (self._brk_flags&(M65C02_BRK_IRQ|M65C02_BRK_NMI)):self._DES();self._SAD(0x0100|self._S,self._P|M65C02_XF);
-                if(self._brk_flags&M65C02_BRK_RESET):self._AD=0xFFFC;
-                else:
-                    self._WR();
-                    if(self._brk_flags&M65C02_BRK_NMI):self._AD=0xFFFA;
-                    else:self._AD=0xFFFE;
-            elif (self._IR == (0x00<<3|4)): self._SA(self._AD);self._INCAD();self._P|=(M65C02_IF|M65C02_BF);self._brk_flags=0; # RES/NMI hijacking.
-            elif (self._IR == (0x00<<3|5)): self._SA(self._AD);self._AD=self._GD(); # NMI "half-hijacking" not possible.
-            elif (self._IR == (0x00<<3|6)): self._PC=(self._GD()<<8)|self._AD;self._FETCH();
-            elif (self._IR == (0x00<<3|7)): assert(False)
-
-            # ORA (zp,x)
-            elif (self._IR == (0x01<<3|0)): self._SA(self._PC);self._INCPC();
-            elif (self._IR == (0x01<<3|1)): self._AD=self._GD();self._SA(self._AD);
-            elif (self._IR == (0x01<<3|2)): self._AD=(self._AD+self._X)&0xFF;self._SA(self._AD);
-            elif (self._IR == (0x01<<3|3)): self._SA((self._AD+1)&0xFF);self._AD=self._GD();
-            elif (self._IR == (0x01<<3|4)): self._SA((self._GD()<<8)|self._AD);
-            elif (self._IR == (0x01<<3|5)): self._A|=self._GD();self._NZ(self._A);self._FETCH();
-            elif (self._IR == (0x01<<3|6)): assert(False);
-            elif (self._IR == (0x01<<3|7)): assert(False);
-
-            # None
-            elif (self._IR == (0x02<<3|0)): assert(False);
-            elif (self._IR == (0x02<<3|1)): assert(False);
-            elif (self._IR == (0x02<<3|2)): assert(False);
-            elif (self._IR == (0x02<<3|3)): assert(False);
-            elif (self._IR == (0x02<<3|4)): assert(False);
-            elif (self._IR == (0x02<<3|5)): assert(False);
-            elif (self._IR == (0x02<<3|6)): assert(False);
-            elif (self._IR == (0x02<<3|7)): assert(False);
-
-            # None
-            elif (self._IR == (0x03<<3|0)): assert(False);
-            elif (self._IR == (0x03<<3|1)): assert(False);
-            elif (self._IR == (0x03<<3|2)): assert(False);
-            elif (self._IR == (0x03<<3|3)): assert(False);
-            elif (self._IR == (0x03<<3|4)): assert(False);
-            elif (self._IR == (0x03<<3|5)): assert(False);
-            elif (self._IR == (0x03<<3|6)): assert(False);
-            elif (self._IR == (0x03<<3|7)): assert(False);
-
-            # TSB zp
-            elif (self._IR == (0x04<<3|0)): self._SA(self._PC);self._INCPC();
-            elif (self._IR == (0x04<<3|1)): self._SA(0x00&self._GD());self._AD=self._GD();
-            elif (self._IR == (0x04<<3|2)): self._SA(0x00&self._AD);self._SD(self._A|self._GD());self._WR();
-            elif (self._IR == (0x04<<3|3)): self._P=(self._P|M65C02_ZF if self._A&self.GD() else self._P&~M65C02_ZF)
-            elif (self._IR == (0x04<<3|4)): self._FETCH();
-            elif (self._IR == (0x04<<3|5)): assert(False);
-            elif (self._IR == (0x04<<3|6)): assert(False);
-            elif (self._IR == (0x04<<3|7)): assert(False);
-
-            # ORA zp
-            elif (self._IR == (0x05<<3|0)): self._SA(self._PC);self._INCPC();
-            elif (self._IR == (0x05<<3|1)): self._SA(self._GD());
-            elif (self._IR == (0x05<<3|2)): self._A|=self._GD();self._NZ(self._A);self._FETCH();
-            elif (self._IR == (0x05<<3|3)): assert(False);
-            elif (self._IR == (0x05<<3|4)): assert(False);
-            elif (self._IR == (0x05<<3|5)): assert(False);
-            elif (self._IR == (0x05<<3|6)): assert(False);
-            elif (self._IR == (0x05<<3|7)): assert(False);
-
-            # ASL zp
-            elif (self._IR == (0x06<<3|0)): self._SA(self._PC);self._INCPC();
-            elif (self._IR == (0x06<<3|1)): self._SA(self._GD());
-            elif (self._IR == (0x06<<3|2)): self._AD=self._GD();self._WR();
-            elif (self._IR == (0x06<<3|3)): self._SD(self._asl(self._AD));self._WR();
-            elif (self._IR == (0x06<<3|4)): self._FETCH();
-            elif (self._IR == (0x06<<3|5)): assert(False);
-            elif (self._IR == (0x06<<3|6)): assert(False);
-            elif (self._IR == (0x06<<3|7)): assert(False);
-
-            # RMB0 zp
-            elif (self._IR == (0x07<<3|0)): self._SA(self._PC);self._INCPC();
-            elif (self._IR == (0x07<<3|1)): self._SA(0x00&self._GD());self._AD=self._GD();
-            elif (self._IR == (0x07<<3|2)): self._SA(0x00&self._AD);self._SD(self._GD()&~(1<<0));self._WR();
-            elif (self._IR == (0x07<<3|3)): self._FETCH();
-            elif (self._IR == (0x07<<3|4)): assert(False);
-            elif (self._IR == (0x07<<3|5)): assert(False);
-            elif (self._IR == (0x07<<3|6)): assert(False);
-            elif (self._IR == (0x07<<3|7)): assert(False);
-
-            # PHP s
-            elif (self._IR == (0x08<<3|0)): self._SA(self._PC);
-            elif (self._IR == (0x08<<3|1)): self._SAD(0x0100|self._S,self._P|M65C02_XF);self._DES();self._WR();
-            elif (self._IR == (0x08<<3|2)): self._FETCH();
-            elif (self._IR == (0x08<<3|3)): assert(False);
-            elif (self._IR == (0x08<<3|4)): assert(False);
-            elif (self._IR == (0x08<<3|5)): assert(False);
-            elif (self._IR == (0x08<<3|6)): assert(False);
-            elif (self._IR == (0x08<<3|7)): assert(False);
-
-            # ORA #
-            elif (self._IR == (0x09<<3|0)): self._SA(self._PC);self._INCPC();
-            elif (self._IR == (0x09<<3|1)): self._A|=self._GD();self._NZ(self._A);self._FETCH();
-            elif (self._IR == (0x09<<3|2)): assert(False);
-            elif (self._IR == (0x09<<3|3)): assert(False);
-            elif (self._IR == (0x09<<3|4)): assert(False);
-            elif (self._IR == (0x09<<3|5)): assert(False);
-            elif (self._IR == (0x09<<3|6)): assert(False);
-            elif (self._IR == (0x09<<3|7)): assert(False);
-
-            # ASL A
-            elif (self._IR == (0x0a<<3|0)): self._SA(self._PC);
-            elif (self._IR == (0x0a<<3|1)): self._A=self._asl(self._A);self._FETCH();
-            elif (self._IR == (0x0a<<3|2)): assert(False);
-            elif (self._IR == (0x0a<<3|3)): assert(False);
-            elif (self._IR == (0x0a<<3|4)): assert(False);
-            elif (self._IR == (0x0a<<3|5)): assert(False);
-            elif (self._IR == (0x0a<<3|6)): assert(False);
-            elif (self._IR == (0x0a<<3|7)): assert(False);
-
-            # None
-            elif (self._IR == (0x0b<<3|0)): assert(False);
-            elif (self._IR == (0x0b<<3|1)): assert(False);
-            elif (self._IR == (0x0b<<3|2)): assert(False);
-            elif (self._IR == (0x0b<<3|3)): assert(False);
-            elif (self._IR == (0x0b<<3|4)): assert(False);
-            elif (self._IR == (0x0b<<3|5)): assert(False);
-            elif (self._IR == (0x0b<<3|6)): assert(False);
-            elif (self._IR == (0x0b<<3|7)): assert(False);
-
-            # TSB a
-            elif (self._IR == (0x0c<<3|0)): self._SA(self._PC);self._INCPC();
-            elif (self._IR == (0x0c<<3|1)): self._SA(self._PC);self._INCPC();self._AD=self._GD();
-            elif (self._IR == (0x0c<<3|2)): self._SA((self._GD()<<8)|self._AD);
-            elif (self._IR == (0x0c<<3|3)): self._SA((self._GD()<<8)|self._AD);self._SD(self._A|self._GD());self._WR();
-            elif (self._IR == (0x0c<<3|4)): self._P=(self._P|M65C02_ZF if self._A&self.GD() else self._P&~M65C02_ZF)
-            elif (self._IR == (0x0c<<3|5)): self._FETCH();
-            elif (self._IR == (0x0c<<3|6)): assert(False);
-            elif (self._IR == (0x0c<<3|7)): assert(False);
-
-            # ORA a
-            elif (self._IR == (0x0d<<3|0)): self._SA(self._PC);self._INCPC();
-            elif (self._IR == (0x0d<<3|1)): self._SA(self._PC);self._INCPC();self._AD=self._GD();
-            elif (self._IR == (0x0d<<3|2)): self._SA((self._GD()<<8)|self._AD);
-            elif (self._IR == (0x0d<<3|3)): self._A|=self._GD();self._NZ(self._A);self._FETCH();
-            elif (self._IR == (0x0d<<3|4)): assert(False);
-            elif (self._IR == (0x0d<<3|5)): assert(False);
-            elif (self._IR == (0x0d<<3|6)): assert(False);
-            elif (self._IR == (0x0d<<3|7)): assert(False);
-
-            # ASL a
-            elif (self._IR == (0x0e<<3|0)): self._SA(self._PC);self._INCPC();
-            elif (self._IR == (0x0e<<3|1)): self._SA(self._PC);self._INCPC();self._AD=self._GD();
-            elif (self._IR == (0x0e<<3|2)): self._SA((self._GD()<<8)|self._AD);
-            elif (self._IR == (0x0e<<3|3)): self._AD=self._GD();self._WR();
-            elif (self._IR == (0x0e<<3|4)): self._SD(self._asl(self._AD));self._WR();
-            elif (self._IR == (0x0e<<3|5)): self._FETCH();
-            elif (self._IR == (0x0e<<3|6)): assert(False);
-            elif (self._IR == (0x0e<<3|7)): assert(False);
-
-            # BBR0 r
-            elif (self._IR == (0x0f<<3|0)): self._SA(self._PC);self._INCPC();
-            elif (self._IR == (0x0f<<3|1)):
-                self._SA(self._PC);
-                if((self._GD()&0x01)==0x00):self._INCPC();self._AD=self._PC+self._GD();self._FETCH();
-                else:self._FETCH();
-            elif (self._IR == (0x0f<<3|2)): assert(False);
-            elif (self._IR == (0x0f<<3|3)): assert(False);
-            elif (self._IR == (0x0f<<3|4)): assert(False);
-            elif (self._IR == (0x0f<<3|5)): assert(False);
-            elif (self._IR == (0x0f<<3|6)): assert(False);
-            elif (self._IR == (0x0f<<3|7)): assert(False);
-
-
-
-            # BPL r
-            elif (self._IR == (0x10<<3|0)): self._SA(self._PC);self._INCPC();
-            elif (self._IR == (0x10<<3|1)):
-                self._SA(self._PC);self._AD=self._PC+self._GD();
-                if((self._P&0x80)!=0x0):self._FETCH();
-            elif (self._IR == (0x10<<3|2)):
-                self._SA((self._PC&0xFF00)|(self._AD&0x00FF));
-                if((self._AD&0xFF00)==(self._PC&0xFF00)):self._PC=self._AD;self._irq_pip>>=1;self._nmi_pip>>=1;self._FETCH();
-            elif (self._IR == (0x10<<3|3)): self._PC=self._AD;self._FETCH();
-            elif (self._IR == (0x10<<3|4)): assert(False);
-            elif (self._IR == (0x10<<3|5)): assert(False);
-            elif (self._IR == (0x10<<3|6)): assert(False);
-            elif (self._IR == (0x10<<3|7)): assert(False);
-
-            # ORA (zp),y
-            elif (self._IR == (0x11<<3|0)): self._SA(self._PC);self._INCPC();
-            elif (self._IR == (0x11<<3|1)): self._AD=self._GD();self._SA(self._AD);
-            elif (self._IR == (0x11<<3|2)): self._SA((self._AD+1)&0xFF);self._AD=self._GD();
-            elif (self._IR == (0x11<<3|3)): self._AD|=self._GD()<<8;self._SA((self._AD&0xFF00)|((self._AD+self._Y)&0xFF));self._IR+=(~((self._AD>>8)-((self._AD+self._Y)>>8)))&1;
-            elif (self._IR == (0x11<<3|4)): self._SA(self._AD+self._Y);
-            elif (self._IR == (0x11<<3|5)): self._A|=self._GD();self._NZ(self._A);self._FETCH();
-            elif (self._IR == (0x11<<3|6)): assert(False);
-            elif (self._IR == (0x11<<3|7)): assert(False);
-
-            # ORA (zp)
-            elif (self._IR == (0x12<<3|0)): self._SA(self._PC);self._INCPC();
-            elif (self._IR == (0x12<<3|1)): self._AD=self._GD();self._SA(self._AD);
-            elif (self._IR == (0x12<<3|2)): self._SA((self._AD+1)&0xFF);self._AD=self._GD();
-            elif (self._IR == (0x12<<3|3)): self._AD|=self._GD()<<8;self._SA((self._AD&0xFF00)|((self._AD)&0xFF));self._IR+=(~((self._AD>>8)-((self._AD)>>8)))&1;
-            elif (self._IR == (0x12<<3|4)): self._SA(self._AD);
-            elif (self._IR == (0x12<<3|5)): self._A|=self._GD();self._NZ(self._A);self._FETCH();
-            elif (self._IR == (0x12<<3|6)): assert(False);
-            elif (self._IR == (0x12<<3|7)): assert(False);
-
-            # None
-            elif (self._IR == (0x13<<3|0)): assert(False);
-            elif (self._IR == (0x13<<3|1)): assert(False);
-            elif (self._IR == (0x13<<3|2)): assert(False);
-            elif (self._IR == (0x13<<3|3)): assert(False);
-            elif (self._IR == (0x13<<3|4)): assert(False);
-            elif (self._IR == (0x13<<3|5)): assert(False);
-            elif (self._IR == (0x13<<3|6)): assert(False);
-            elif (self._IR == (0x13<<3|7)): assert(False);
-
-            # TRB zp
-            elif (self._IR == (0x14<<3|0)): self._SA(self._PC);self._INCPC();
-            elif (self._IR == (0x14<<3|1)): self._SA(0x00&self._GD());self._AD=self._GD();
-            elif (self._IR == (0x14<<3|2)): self._SA(0x00&self._AD);self._SD(self._GD()&~self._A);self._WR();
-            elif (self._IR == (0x14<<3|3)): self._P=(self._P|M65C02_ZF if self._A&self.GD() else self._P&~M65C02_ZF)
-            elif (self._IR == (0x14<<3|4)): self._FETCH();
-            elif (self._IR == (0x14<<3|5)): assert(False);
-            elif (self._IR == (0x14<<3|6)): assert(False);
-            elif (self._IR == (0x14<<3|7)): assert(False);
-
-            # ORA zp,x
-            elif (self._IR == (0x15<<3|0)): self._SA(self._PC);self._INCPC();
-            elif (self._IR == (0x15<<3|1)): self._AD=self._GD();self._SA(self._AD);
-            elif (self._IR == (0x15<<3|2)): self._SA((self._AD+self._X)&0x00FF);
-            elif (self._IR == (0x15<<3|3)): self._A|=self._GD();self._NZ(self._A);self._FETCH();
-            elif (self._IR == (0x15<<3|4)): assert(False);
-            elif (self._IR == (0x15<<3|5)): assert(False);
-            elif (self._IR == (0x15<<3|6)): assert(False);
-            elif (self._IR == (0x15<<3|7)): assert(False);
-
-            # ASL zp,x
-            elif (self._IR == (0x16<<3|0)): self._SA(self._PC);self._INCPC();
-            elif (self._IR == (0x16<<3|1)): self._AD=self._GD();self._SA(self._AD);
-            elif (self._IR == (0x16<<3|2)): self._SA((self._AD+self._X)&0x00FF);
-            elif (self._IR == (0x16<<3|3)): self._AD=self._GD();self._WR();
-            elif (self._IR == (0x16<<3|4)): self._SD(_m6502_asl(c,self._AD));self._WR();
-            elif (self._IR == (0x16<<3|5)): self._FETCH();
-            elif (self._IR == (0x16<<3|6)): assert(False);
-            elif (self._IR == (0x16<<3|7)): assert(False);
-
-            # RMB1 zp
-            elif (self._IR == (0x17<<3|0)): self._SA(self._PC);self._INCPC();
-            elif (self._IR == (0x17<<3|1)): self._SA(0x00&self._GD());self._AD=self._GD();
-            elif (self._IR == (0x17<<3|2)): self._SA(0x00&self._AD);self._SD(self._GD()&~(1<<1));self._WR();
-            elif (self._IR == (0x17<<3|3)): self._FETCH();
-            elif (self._IR == (0x17<<3|4)): assert(False);
-            elif (self._IR == (0x17<<3|5)): assert(False);
-            elif (self._IR == (0x17<<3|6)): assert(False);
-            elif (self._IR == (0x17<<3|7)): assert(False);
-
-            # CLC i
-            elif (self._IR == (0x18<<3|0)): self._SA(self._PC);
-            elif (self._IR == (0x18<<3|1)): self._P&=~M65C02_CF;self._FETCH();
-            elif (self._IR == (0x18<<3|2)): assert(False);
-            elif (self._IR == (0x18<<3|3)): assert(False);
-            elif (self._IR == (0x18<<3|4)): assert(False);
-            elif (self._IR == (0x18<<3|5)): assert(False);
-            elif (self._IR == (0x18<<3|6)): assert(False);
-            elif (self._IR == (0x18<<3|7)): assert(False);
-
-            # ORA a,y
-            elif (self._IR == (0x19<<3|0)): self._SA(self._PC);self._INCPC();
-            elif (self._IR == (0x19<<3|1)): self._SA(self._PC);self._INCPC();self._AD=self._GD();
-            elif (self._IR == (0x19<<3|2)): self._AD|=self._GD()<<8;self._SA((self._AD&0xFF00)|((self._AD+self._Y)&0xFF));self._IR+=(~((self._AD>>8)-((self._AD+self._Y)>>8)))&1;
-            elif (self._IR == (0x19<<3|3)): self._SA(self._AD+self._Y);
-            elif (self._IR == (0x19<<3|4)): self._A|=self._GD();self._NZ(self._A);self._FETCH();
-            elif (self._IR == (0x19<<3|5)): assert(False);
-            elif (self._IR == (0x19<<3|6)): assert(False);
-            elif (self._IR == (0x19<<3|7)): assert(False);
-
-            # INC A
-            elif (self._IR == (0x1a<<3|0)): self._SA(self._PC);
-            elif (self._IR == (0x1a<<3|1)): self._INA();self._FETCH();
-            elif (self._IR == (0x1a<<3|2)): assert(False);
-            elif (self._IR == (0x1a<<3|3)): assert(False);
-            elif (self._IR == (0x1a<<3|4)): assert(False);
-            elif (self._IR == (0x1a<<3|5)): assert(False);
-            elif (self._IR == (0x1a<<3|6)): assert(False);
-            elif (self._IR == (0x1a<<3|7)): assert(False);
-
-            # None
-            elif (self._IR == (0x1b<<3|0)): assert(False);
-            elif (self._IR == (0x1b<<3|1)): assert(False);
-            elif (self._IR == (0x1b<<3|2)): assert(False);
-            elif (self._IR == (0x1b<<3|3)): assert(False);
-            elif (self._IR == (0x1b<<3|4)): assert(False);
-            elif (self._IR == (0x1b<<3|5)): assert(False);
-            elif (self._IR == (0x1b<<3|6)): assert(False);
-            elif (self._IR == (0x1b<<3|7)): assert(False);
-
-            # TRB a
-            elif (self._IR == (0x1c<<3|0)): self._SA(self._PC);self._INCPC();
-            elif (self._IR == (0x1c<<3|1)): self._SA(self._PC);self._INCPC();self._AD=self._GD();
-            elif (self._IR == (0x1c<<3|2)): self._SA((self._GD()<<8)|self._AD);
-            elif (self._IR == (0x1c<<3|3)): self._SA((self._GD()<<8)|self._AD);self._SD(self._GD()&~self._A);self._WR();
-            elif (self._IR == (0x1c<<3|4)): self._P=(self._P|M65C02_ZF if self._A&self.GD() else self._P&~M65C02_ZF)
-            elif (self._IR == (0x1c<<3|5)): self._FETCH();
-            elif (self._IR == (0x1c<<3|6)): assert(False);
-            elif (self._IR == (0x1c<<3|7)): assert(False);
-
-            # ORA a,x
-            elif (self._IR == (0x1d<<3|0)): self._SA(self._PC);self._INCPC();
-            elif (self._IR == (0x1d<<3|1)): self._SA(self._PC);self._INCPC();self._AD=self._GD();
-            elif (self._IR == (0x1d<<3|2)): self._AD|=self._GD()<<8;self._SA((self._AD&0xFF00)|((self._AD+self._X)&0xFF));self._IR+=(~((self._AD>>8)-((self._AD+self._X)>>8)))&1;
-            elif (self._IR == (0x1d<<3|3)): self._SA(self._AD+self._X);
-            elif (self._IR == (0x1d<<3|4)): self._A|=self._GD();self._NZ(self._A);self._FETCH();
-            elif (self._IR == (0x1d<<3|5)): assert(False);
-            elif (self._IR == (0x1d<<3|6)): assert(False);
-            elif (self._IR == (0x1d<<3|7)): assert(False);
-
-            # ASL a,x
-            elif (self._IR == (0x1e<<3|0)): self._SA(self._PC);self._INCPC();
-            elif (self._IR == (0x1e<<3|1)): self._SA(self._PC);self._INCPC();self._AD=self._GD();
-            elif (self._IR == (0x1e<<3|2)): self._AD|=self._GD()<<8;self._SA((self._AD&0xFF00)|((self._AD+self._X)&0xFF));
-            elif (self._IR == (0x1e<<3|3)): self._SA(self._AD+self._X);
-            elif (self._IR == (0x1e<<3|4)): self._AD=self._GD();self._WR();
-            elif (self._IR == (0x1e<<3|5)): self._SD(self._asl(self._AD));self._WR();
-            elif (self._IR == (0x1e<<3|6)): self._FETCH();
-            elif (self._IR == (0x1e<<3|7)): assert(False);
-
-            # BBR1 r
-            elif (self._IR == (0x1f<<3|0)): self._SA(self._PC);self._INCPC();
-            elif (self._IR == (0x1f<<3|1)):
-                self._SA(self._PC);
-                if((self._GD()&0x02)==0x00):self._INCPC();self._AD=self._PC+self._GD();self._FETCH();
-                else:self._FETCH();
-            elif (self._IR == (0x1f<<3|1)): assert(False);
-            elif (self._IR == (0x1f<<3|2)): assert(False);
-            elif (self._IR == (0x1f<<3|3)): assert(False);
-            elif (self._IR == (0x1f<<3|4)): assert(False);
-            elif (self._IR == (0x1f<<3|5)): assert(False);
-            elif (self._IR == (0x1f<<3|6)): assert(False);
-            elif (self._IR == (0x1f<<3|7)): assert(False);
-
-
-
-            # JSR a
-            elif (self._IR == (0x20<<3|0)): self._SA(self._PC);self._INCPC();
-            elif (self._IR == (0x20<<3|1)): self._SA(0x0100|self._S);self._AD=self._GD();
-            elif (self._IR == (0x20<<3|2)): self._SAD(0x0100|self._S,self._PC>>8);self._DES();self._WR();
-            elif (self._IR == (0x20<<3|3)): self._SAD(0x0100|self._S,self._PC);self._DES();self._WR();
-            elif (self._IR == (0x20<<3|4)): self._SA(self._PC);
-            elif (self._IR == (0x20<<3|5)): self._PC=(self._GD()<<8)|self._AD;self._FETCH();
-            elif (self._IR == (0x20<<3|6)): assert(False);
-            elif (self._IR == (0x20<<3|7)): assert(False);
-
-            # AND (zp,x)
-            elif (self._IR == (0x21<<3|0)): self._SA(self._PC);self._INCPC();
-            elif (self._IR == (0x21<<3|1)): self._AD=self._GD();self._SA(self._AD);
-            elif (self._IR == (0x21<<3|2)): self._AD=(self._AD+self._X)&0xFF;self._SA(self._AD);
-            elif (self._IR == (0x21<<3|3)): self._SA((self._AD+1)&0xFF);self._AD=self._GD();
-            elif (self._IR == (0x21<<3|4)): self._SA((self._GD()<<8)|self._AD);
-            elif (self._IR == (0x21<<3|5)): self._A&=self._GD();self._NZ(self._A);self._FETCH();
-            elif (self._IR == (0x21<<3|6)): assert(False);
-            elif (self._IR == (0x21<<3|7)): assert(False);
-
-            # None
-            elif (self._IR == (0x22<<3|0)): assert(False);
-            elif (self._IR == (0x22<<3|1)): assert(False);
-            elif (self._IR == (0x22<<3|2)): assert(False);
-            elif (self._IR == (0x22<<3|3)): assert(False);
-            elif (self._IR == (0x22<<3|4)): assert(False);
-            elif (self._IR == (0x22<<3|5)): assert(False);
-            elif (self._IR == (0x22<<3|6)): assert(False);
-            elif (self._IR == (0x22<<3|7)): assert(False);
-
-            # None
-            elif (self._IR == (0x23<<3|0)): assert(False);
-            elif (self._IR == (0x23<<3|1)): assert(False);
-            elif (self._IR == (0x23<<3|2)): assert(False);
-            elif (self._IR == (0x23<<3|3)): assert(False);
-            elif (self._IR == (0x23<<3|4)): assert(False);
-            elif (self._IR == (0x23<<3|5)): assert(False);
-            elif (self._IR == (0x23<<3|6)): assert(False);
-            elif (self._IR == (0x23<<3|7)): assert(False);
-
-            # BIT zp
-            elif (self._IR == (0x24<<3|0)): self._SA(self._PC);self._INCPC();
-            elif (self._IR == (0x24<<3|1)): self._SA(self._GD());
-            elif (self._IR == (0x24<<3|2)): self._bit(self._GD());self._FETCH();
-            elif (self._IR == (0x24<<3|3)): assert(False);
-            elif (self._IR == (0x24<<3|4)): assert(False);
-            elif (self._IR == (0x24<<3|5)): assert(False);
-            elif (self._IR == (0x24<<3|6)): assert(False);
-            elif (self._IR == (0x24<<3|7)): assert(False);
-
-            # AND zp
-            elif (self._IR == (0x25<<3|0)): self._SA(self._PC);self._INCPC();
-            elif (self._IR == (0x25<<3|1)): self._SA(self._GD());
-            elif (self._IR == (0x25<<3|2)): self._A&=self._GD();self._NZ(self._A);self._FETCH();
-            elif (self._IR == (0x25<<3|3)): assert(False);
-            elif (self._IR == (0x25<<3|4)): assert(False);
-            elif (self._IR == (0x25<<3|5)): assert(False);
-            elif (self._IR == (0x25<<3|6)): assert(False);
-            elif (self._IR == (0x25<<3|7)): assert(False);
-
-            # ROL zp
-            elif (self._IR == (0x26<<3|0)): self._SA(self._PC);self._INCPC();
-            elif (self._IR == (0x26<<3|1)): self._SA(self._GD());
-            elif (self._IR == (0x26<<3|2)): self._AD=self._GD();self._WR();
-            elif (self._IR == (0x26<<3|3)): self._SD(self._rol(self._AD));self._WR();
-            elif (self._IR == (0x26<<3|4)): self._FETCH();
-            elif (self._IR == (0x26<<3|5)): assert(False);
-            elif (self._IR == (0x26<<3|6)): assert(False);
-            elif (self._IR == (0x26<<3|7)): assert(False);
-
-            # RMB2 zp
-            elif (self._IR == (0x27<<3|0)): self._SA(self._PC);self._INCPC();
-            elif (self._IR == (0x27<<3|1)): self._SA(0x00&self._GD());self._AD=self._GD();
-            elif (self._IR == (0x27<<3|2)): self._SA(0x00&self._AD);self._SD(self._GD()&~(1<<2));self._WR();
-            elif (self._IR == (0x27<<3|3)): self._FETCH();
-            elif (self._IR == (0x27<<3|4)): assert(False);
-            elif (self._IR == (0x27<<3|5)): assert(False);
-            elif (self._IR == (0x27<<3|6)): assert(False);
-            elif (self._IR == (0x27<<3|7)): assert(False);
-
-            # PLP s
-            elif (self._IR == (0x28<<3|0)): self._SA(self._PC);
-            elif (self._IR == (0x28<<3|1)): self._SA(0x0100|self._S);self._INS();
-            elif (self._IR == (0x28<<3|2)): self._SA(0x0100|self._S);
-            elif (self._IR == (0x28<<3|3)): self._P=(self._GD()|M65C02_BF)&~M65C02_XF;self._FETCH();
-            elif (self._IR == (0x28<<3|4)): assert(False);
-            elif (self._IR == (0x28<<3|5)): assert(False);
-            elif (self._IR == (0x28<<3|6)): assert(False);
-            elif (self._IR == (0x28<<3|7)): assert(False);
-
-            # AND #
-            elif (self._IR == (0x29<<3|0)): self._SA(self._PC);self._INCPC();
-            elif (self._IR == (0x29<<3|1)): self._A&=self._GD();self._NZ(self._A);self._FETCH();
-            elif (self._IR == (0x29<<3|2)): assert(False);
-            elif (self._IR == (0x29<<3|3)): assert(False);
-            elif (self._IR == (0x29<<3|4)): assert(False);
-            elif (self._IR == (0x29<<3|5)): assert(False);
-            elif (self._IR == (0x29<<3|6)): assert(False);
-            elif (self._IR == (0x29<<3|7)): assert(False);
-
-            # ROL A
-            elif (self._IR == (0x2a<<3|0)): self._SA(self._PC);
-            elif (self._IR == (0x2a<<3|1)): self._A=self._rol(self._A);self._FETCH();
-            elif (self._IR == (0x2a<<3|2)): assert(False);
-            elif (self._IR == (0x2a<<3|3)): assert(False);
-            elif (self._IR == (0x2a<<3|4)): assert(False);
-            elif (self._IR == (0x2a<<3|5)): assert(False);
-            elif (self._IR == (0x2a<<3|6)): assert(False);
-            elif (self._IR == (0x2a<<3|7)): assert(False);
-
-            # None
-            elif (self._IR == (0x2b<<3|0)): assert(False);
-            elif (self._IR == (0x2b<<3|1)): assert(False);
-            elif (self._IR == (0x2b<<3|2)): assert(False);
-            elif (self._IR == (0x2b<<3|3)): assert(False);
-            elif (self._IR == (0x2b<<3|4)): assert(False);
-            elif (self._IR == (0x2b<<3|5)): assert(False);
-            elif (self._IR == (0x2b<<3|6)): assert(False);
-            elif (self._IR == (0x2b<<3|7)): assert(False);
-
-            # BIT a
-            elif (self._IR == (0x2c<<3|0)): self._SA(self._PC);self._INCPC();
-            elif (self._IR == (0x2c<<3|1)): self._SA(self._PC);self._INCPC();self._AD=self._GD();
-            elif (self._IR == (0x2c<<3|2)): self._SA((self._GD()<<8)|self._AD);
-            elif (self._IR == (0x2c<<3|3)): self._bit(self._GD());self._FETCH();
-            elif (self._IR == (0x2c<<3|4)): assert(False);
-            elif (self._IR == (0x2c<<3|5)): assert(False);
-            elif (self._IR == (0x2c<<3|6)): assert(False);
-            elif (self._IR == (0x2c<<3|7)): assert(False);
-
-            # AND a
-            elif (self._IR == (0x2d<<3|0)): self._SA(self._PC);self._INCPC();
-            elif (self._IR == (0x2d<<3|1)): self._SA(self._PC);self._INCPC();self._AD=self._GD();
-            elif (self._IR == (0x2d<<3|2)): self._SA((self._GD()<<8)|self._AD);
-            elif (self._IR == (0x2d<<3|3)): self._A&=self._GD();self._NZ(self._A);self._FETCH();
-            elif (self._IR == (0x2d<<3|4)): assert(False);
-            elif (self._IR == (0x2d<<3|5)): assert(False);
-            elif (self._IR == (0x2d<<3|6)): assert(False);
-            elif (self._IR == (0x2d<<3|7)): assert(False);
-
-            # ROL a
-            elif (self._IR == (0x2e<<3|0)): self._SA(self._PC);self._INCPC();
-            elif (self._IR == (0x2e<<3|1)): self._SA(self._PC);self._INCPC();self._AD=self._GD();
-            elif (self._IR == (0x2e<<3|2)): self._SA((self._GD()<<8)|self._AD);
-            elif (self._IR == (0x2e<<3|3)): self._AD=self._GD();self._WR();
-            elif (self._IR == (0x2e<<3|4)): self._SD(self._rol(self._AD));self._WR();
-            elif (self._IR == (0x2e<<3|5)): self._FETCH();
-            elif (self._IR == (0x2e<<3|6)): assert(False);
-            elif (self._IR == (0x2e<<3|7)): assert(False);
-
-            # BBR2 r
-            elif (self._IR == (0x2f<<3|0)): self._SA(self._PC);self._INCPC();
-            elif (self._IR == (0x2f<<3|1)):
-                self._SA(self._PC);
-                if((self._GD()&0x04)==0x00):self._INCPC();self._AD=self._PC+self._GD();self._FETCH();
-                else:self._FETCH();
-            elif (self._IR == (0x2f<<3|2)): assert(False);
-            elif (self._IR == (0x2f<<3|3)): assert(False);
-            elif (self._IR == (0x2f<<3|4)): assert(False);
-            elif (self._IR == (0x2f<<3|5)): assert(False);
-            elif (self._IR == (0x2f<<3|6)): assert(False);
-            elif (self._IR == (0x2f<<3|7)): assert(False);
-
-
-
-            # BMI r
-            elif (self._IR == (0x30<<3|0)): self._SA(self._PC);self._INCPC();
-            elif (self._IR == (0x30<<3|1)):
-                self._SA(self._PC);self._AD=self._PC+self._GD();
-                if((self._P&0x80)!=0x80):self._FETCH();
-            elif (self._IR == (0x30<<3|2)):
-                self._SA((self._PC&0xFF00)|(self._AD&0x00FF));
-                if((self._AD&0xFF00)==(self._PC&0xFF00)):self._PC=self._AD;self._irq_pip>>=1;self._nmi_pip>>=1;self._FETCH();
-            elif (self._IR == (0x30<<3|3)): self._PC=self._AD;self._FETCH();
-            elif (self._IR == (0x30<<3|4)): assert(False);
-            elif (self._IR == (0x30<<3|5)): assert(False);
-            elif (self._IR == (0x30<<3|6)): assert(False);
-            elif (self._IR == (0x30<<3|7)): assert(False);
-
-            # AND (zp),y
-            elif (self._IR == (0x31<<3|0)): self._SA(self._PC);self._INCPC();
-            elif (self._IR == (0x31<<3|1)): self._AD=self._GD();self._SA(self._AD);
-            elif (self._IR == (0x31<<3|2)): self._SA((self._AD+1)&0xFF);self._AD=self._GD();
-            elif (self._IR == (0x31<<3|3)): self._AD|=self._GD()<<8;self._SA((self._AD&0xFF00)|((self._AD+self._Y)&0xFF));self._IR+=(~((self._AD>>8)-((self._AD+self._Y)>>8)))&1;
-            elif (self._IR == (0x31<<3|4)): self._SA(self._AD+self._Y);
-            elif (self._IR == (0x31<<3|5)): self._A&=self._GD();self._NZ(self._A);self._FETCH();
-            elif (self._IR == (0x31<<3|6)): assert(False);
-            elif (self._IR == (0x31<<3|7)): assert(False);
-
-            # AND (zp)
-            elif (self._IR == (0x32<<3|0)): self._SA(self._PC);self._INCPC();
-            elif (self._IR == (0x32<<3|1)): self._AD=self._GD();self._SA(self._AD);
-            elif (self._IR == (0x32<<3|2)): self._SA((self._AD+1)&0xFF);self._AD=self._GD();
-            elif (self._IR == (0x32<<3|3)): self._AD|=self._GD()<<8;self._SA((self._AD&0xFF00)|((self._AD)&0xFF));self._IR+=(~((self._AD>>8)-((self._AD)>>8)))&1;
-            elif (self._IR == (0x32<<3|4)): self._SA(self._AD);
-            elif (self._IR == (0x32<<3|5)): self._A&=self._GD();self._NZ(self._A);self._FETCH();
-            elif (self._IR == (0x32<<3|6)): assert(False);
-            elif (self._IR == (0x32<<3|7)): assert(False);
-
-            # None
-            elif (self._IR == (0x33<<3|0)): assert(False);
-            elif (self._IR == (0x33<<3|1)): assert(False);
-            elif (self._IR == (0x33<<3|2)): assert(False);
-            elif (self._IR == (0x33<<3|3)): assert(False);
-            elif (self._IR == (0x33<<3|4)): assert(False);
-            elif (self._IR == (0x33<<3|5)): assert(False);
-            elif (self._IR == (0x33<<3|6)): assert(False);
-            elif (self._IR == (0x33<<3|7)): assert(False);
-
-            # BIT zp,x
-            elif (self._IR == (0x34<<3|0)): self._SA(self._PC);self._INCPC();
-            elif (self._IR == (0x34<<3|1)): self._SA((self._GD()+self._X)&0x00FF);
-            elif (self._IR == (0x34<<3|2)): self._bit(self._GD());self._FETCH();
-            elif (self._IR == (0x34<<3|3)): assert(False);
-            elif (self._IR == (0x34<<3|4)): assert(False);
-            elif (self._IR == (0x34<<3|5)): assert(False);
-            elif (self._IR == (0x34<<3|6)): assert(False);
-            elif (self._IR == (0x34<<3|7)): assert(False);
-
-            # AND zp,x
-            elif (self._IR == (0x35<<3|0)): self._SA(self._PC);self._INCPC();
-            elif (self._IR == (0x35<<3|1)): self._AD=self._GD();self._SA(self._AD);
-            elif (self._IR == (0x35<<3|2)): self._SA((self._AD+self._X)&0x00FF);
-            elif (self._IR == (0x35<<3|3)): self._A&=self._GD();self._NZ(self._A);self._FETCH();
-            elif (self._IR == (0x35<<3|4)): assert(False);
-            elif (self._IR == (0x35<<3|5)): assert(False);
-            elif (self._IR == (0x35<<3|6)): assert(False);
-            elif (self._IR == (0x35<<3|7)): assert(False);
-
-            # ROL zp,x
-            elif (self._IR == (0x36<<3|0)): self._SA(self._PC);self._INCPC();
-            elif (self._IR == (0x36<<3|1)): self._AD=self._GD();self._SA(self._AD);
-            elif (self._IR == (0x36<<3|2)): self._SA((self._AD+self._X)&0x00FF);
-            elif (self._IR == (0x36<<3|3)): self._AD=self._GD();self._WR();
-            elif (self._IR == (0x36<<3|4)): self._SD(self._rol(self._AD));self._WR();
-            elif (self._IR == (0x36<<3|5)): self._FETCH();
-            elif (self._IR == (0x36<<3|6)): assert(False);
-            elif (self._IR == (0x36<<3|7)): assert(False);
-
-            # RMB3 zp
-            elif (self._IR == (0x37<<3|0)): self._SA(self._PC);self._INCPC();
-            elif (self._IR == (0x37<<3|1)): self._SA(0x00&self._GD());self._AD=self._GD();
-            elif (self._IR == (0x37<<3|2)): self._SA(0x00&self._AD);self._SD(self._GD()&~(1<<3));self._WR();
-            elif (self._IR == (0x37<<3|3)): self._FETCH();
-            elif (self._IR == (0x37<<3|4)): assert(False);
-            elif (self._IR == (0x37<<3|5)): assert(False);
-            elif (self._IR == (0x37<<3|6)): assert(False);
-            elif (self._IR == (0x37<<3|7)): assert(False);
-
-            # SEC I
-            elif (self._IR == (0x38<<3|0)): self._SA(self._PC);
-            elif (self._IR == (0x38<<3|1)): self._P|=M65C02_CF;self._FETCH();
-            elif (self._IR == (0x38<<3|2)): assert(False);
-            elif (self._IR == (0x38<<3|3)): assert(False);
-            elif (self._IR == (0x38<<3|4)): assert(False);
-            elif (self._IR == (0x38<<3|5)): assert(False);
-            elif (self._IR == (0x38<<3|6)): assert(False);
-            elif (self._IR == (0x38<<3|7)): assert(False);
-
-            # AND a,y
-            elif (self._IR == (0x39<<3|0)): self._SA(self._PC);self._INCPC();
-            elif (self._IR == (0x39<<3|1)): self._SA(self._PC);self._INCPC();self._AD=self._GD();
-            elif (self._IR == (0x39<<3|2)): self._AD|=self._GD()<<8;self._SA((self._AD&0xFF00)|((self._AD+self._Y)&0xFF));self._IR+=(~((self._AD>>8)-((self._AD+self._Y)>>8)))&1;
-            elif (self._IR == (0x39<<3|3)): self._SA(self._AD+self._Y);
-            elif (self._IR == (0x39<<3|4)): self._A&=self._GD();self._NZ(self._A);self._FETCH();
-            elif (self._IR == (0x39<<3|5)): assert(False);
-            elif (self._IR == (0x39<<3|6)): assert(False);
-            elif (self._IR == (0x39<<3|7)): assert(False);
-
-            # DEC A
-            elif (self._IR == (0x3a<<3|0)): self._SA(self._PC);
-            elif (self._IR == (0x3a<<3|1)): self._DEA();self._FETCH();
-            elif (self._IR == (0x3a<<3|2)): assert(False);
-            elif (self._IR == (0x3a<<3|3)): assert(False);
-            elif (self._IR == (0x3a<<3|4)): assert(False);
-            elif (self._IR == (0x3a<<3|5)): assert(False);
-            elif (self._IR == (0x3a<<3|6)): assert(False);
-            elif (self._IR == (0x3a<<3|7)): assert(False);
-
-            # None
-            elif (self._IR == (0x3b<<3|0)): assert(False);
-            elif (self._IR == (0x3b<<3|1)): assert(False);
-            elif (self._IR == (0x3b<<3|2)): assert(False);
-            elif (self._IR == (0x3b<<3|3)): assert(False);
-            elif (self._IR == (0x3b<<3|4)): assert(False);
-            elif (self._IR == (0x3b<<3|5)): assert(False);
-            elif (self._IR == (0x3b<<3|6)): assert(False);
-            elif (self._IR == (0x3b<<3|7)): assert(False);
-
-            # BIT a,x
-            elif (self._IR == (0x3c<<3|0)): self._SA(self._PC);self._INCPC();
-            elif (self._IR == (0x3c<<3|1)): self._SA(self._PC);self._INCPC();self._AD=self._GD();
-            elif (self._IR == (0x3c<<3|2)): self._SA(((self._GD()<<8)|self._AD)+self._X);
-            elif (self._IR == (0x3c<<3|3)): self._bit(self._GD());self._FETCH();
-            elif (self._IR == (0x3c<<3|4)): assert(False);
-            elif (self._IR == (0x3c<<3|5)): assert(False);
-            elif (self._IR == (0x3c<<3|6)): assert(False);
-            elif (self._IR == (0x3c<<3|7)): assert(False);
-
-            # AND a,x
-            elif (self._IR == (0x3d<<3|0)): self._SA(self._PC);self._INCPC();
-            elif (self._IR == (0x3d<<3|1)): self._SA(self._PC);self._INCPC();self._AD=self._GD();
-            elif (self._IR == (0x3d<<3|2)): self._AD|=self._GD()<<8;self._SA((self._AD&0xFF00)|((self._AD+self._X)&0xFF));self._IR+=(~((self._AD>>8)-((self._AD+self._X)>>8)))&1;
-            elif (self._IR == (0x3d<<3|3)): self._SA(self._AD+self._X);
-            elif (self._IR == (0x3d<<3|4)): self._A&=self._GD();self._NZ(self._A);self._FETCH();
-            elif (self._IR == (0x3d<<3|5)): assert(False);
-            elif (self._IR == (0x3d<<3|6)): assert(False);
-            elif (self._IR == (0x3d<<3|7)): assert(False);
-
-            # ROL a,x
-            elif (self._IR == (0x3e<<3|0)): self._SA(self._PC);self._INCPC();
-            elif (self._IR == (0x3e<<3|1)): self._SA(self._PC);self._INCPC();self._AD=self._GD();
-            elif (self._IR == (0x3e<<3|2)): self._AD|=self._GD()<<8;self._SA((self._AD&0xFF00)|((self._AD+self._X)&0xFF));
-            elif (self._IR == (0x3e<<3|3)): self._SA(self._AD+self._X);
-            elif (self._IR == (0x3e<<3|4)): self._AD=self._GD();self._WR();
-            elif (self._IR == (0x3e<<3|5)): self._SD(self._rol(self._AD));self._WR();
-            elif (self._IR == (0x3e<<3|6)): self._FETCH();
-            elif (self._IR == (0x3e<<3|7)): assert(False);
-
-            # BBR3 r
-            elif (self._IR == (0x3f<<3|0)): self._SA(self._PC);self._INCPC();
-            elif (self._IR == (0x3f<<3|1)):
-                self._SA(self._PC);
-                if((self._GD()&0x08)==0x00):self._INCPC();self._AD=self._PC+self._GD();self._FETCH();
-                else:self._FETCH();
-            elif (self._IR == (0x3f<<3|0)): assert(False);
-            elif (self._IR == (0x3f<<3|1)): assert(False);
-            elif (self._IR == (0x3f<<3|2)): assert(False);
-            elif (self._IR == (0x3f<<3|3)): assert(False);
-            elif (self._IR == (0x3f<<3|4)): assert(False);
-            elif (self._IR == (0x3f<<3|5)): assert(False);
-            elif (self._IR == (0x3f<<3|6)): assert(False);
-            elif (self._IR == (0x3f<<3|7)): assert(False);
-
-
-
-            # RTI s
-            elif (self._IR == (0x40<<3|0)): self._SA(self._PC);
-            elif (self._IR == (0x40<<3|1)): self._SA(0x0100|self._S);self._INS();
-            elif (self._IR == (0x40<<3|2)): self._SA(0x0100|self._S);self._INS();
-            elif (self._IR == (0x40<<3|3)): self._SA(0x0100|self._S);self._INS();self._P=(self._GD()|M65C02_BF)&~M65C02_XF;
-            elif (self._IR == (0x40<<3|4)): self._SA(0x0100|self._S);self._AD=self._GD();
-            elif (self._IR == (0x40<<3|5)): self._PC=(self._GD()<<8)|self._AD;self._FETCH();
-            elif (self._IR == (0x40<<3|6)): assert(False);
-            elif (self._IR == (0x40<<3|7)): assert(False);
-
-            # EOR (zp,x)
-            elif (self._IR == (0x41<<3|0)): self._SA(self._PC);self._INCPC();
-            elif (self._IR == (0x41<<3|1)): self._AD=self._GD();self._SA(self._AD);
-            elif (self._IR == (0x41<<3|2)): self._AD=(self._AD+self._X)&0xFF;self._SA(self._AD);
-            elif (self._IR == (0x41<<3|3)): self._SA((self._AD+1)&0xFF);self._AD=self._GD();
-            elif (self._IR == (0x41<<3|4)): self._SA((self._GD()<<8)|self._AD);
-            elif (self._IR == (0x41<<3|5)): self._A^=self._GD();self._NZ(self._A);self._FETCH();
-            elif (self._IR == (0x41<<3|6)): assert(False);
-            elif (self._IR == (0x41<<3|7)): assert(False);
-
-            # None
-            elif (self._IR == (0x42<<3|0)): assert(False);
-            elif (self._IR == (0x42<<3|1)): assert(False);
-            elif (self._IR == (0x42<<3|2)): assert(False);
-            elif (self._IR == (0x42<<3|3)): assert(False);
-            elif (self._IR == (0x42<<3|4)): assert(False);
-            elif (self._IR == (0x42<<3|5)): assert(False);
-            elif (self._IR == (0x42<<3|6)): assert(False);
-            elif (self._IR == (0x42<<3|7)): assert(False);
-
-            # None
-            elif (self._IR == (0x43<<3|0)): assert(False);
-            elif (self._IR == (0x43<<3|1)): assert(False);
-            elif (self._IR == (0x43<<3|2)): assert(False);
-            elif (self._IR == (0x43<<3|3)): assert(False);
-            elif (self._IR == (0x43<<3|4)): assert(False);
-            elif (self._IR == (0x43<<3|5)): assert(False);
-            elif (self._IR == (0x43<<3|6)): assert(False);
-            elif (self._IR == (0x43<<3|7)): assert(False);
-
-            # None
-            elif (self._IR == (0x44<<3|0)): assert(False);
-            elif (self._IR == (0x44<<3|1)): assert(False);
-            elif (self._IR == (0x44<<3|2)): assert(False);
-            elif (self._IR == (0x44<<3|3)): assert(False);
-            elif (self._IR == (0x44<<3|4)): assert(False);
-            elif (self._IR == (0x44<<3|5)): assert(False);
-            elif (self._IR == (0x44<<3|6)): assert(False);
-            elif (self._IR == (0x44<<3|7)): assert(False);
-
-            # EOR zp
-            elif (self._IR == (0x45<<3|0)): self._SA(self._PC);self._INCPC();
-            elif (self._IR == (0x45<<3|1)): self._SA(self._GD());
-            elif (self._IR == (0x45<<3|2)): self._A^=self._GD();self._NZ(self._A);self._FETCH();
-            elif (self._IR == (0x45<<3|3)): assert(False);
-            elif (self._IR == (0x45<<3|4)): assert(False);
-            elif (self._IR == (0x45<<3|5)): assert(False);
-            elif (self._IR == (0x45<<3|6)): assert(False);
-            elif (self._IR == (0x45<<3|7)): assert(False);
-
-            # LSR zp
-            elif (self._IR == (0x46<<3|0)): self._SA(self._PC);self._INCPC();
-            elif (self._IR == (0x46<<3|1)): self._SA(self._GD());
-            elif (self._IR == (0x46<<3|2)): self._AD=self._GD();self._WR();
-            elif (self._IR == (0x46<<3|3)): self._SD(self._lsr(self._AD));self._WR();
-            elif (self._IR == (0x46<<3|4)): self._FETCH();
-            elif (self._IR == (0x46<<3|5)): assert(False);
-            elif (self._IR == (0x46<<3|6)): assert(False);
-            elif (self._IR == (0x46<<3|7)): assert(False);
-
-            # RMB4 zp
-            elif (self._IR == (0x47<<3|0)): self._SA(self._PC);self._INCPC();
-            elif (self._IR == (0x47<<3|1)): self._SA(0x00&self._GD());self._AD=self._GD();
-            elif (self._IR == (0x47<<3|2)): self._SA(0x00&self._AD);self._SD(self._GD()&~(1<<4));self._WR();
-            elif (self._IR == (0x47<<3|3)): self._FETCH();
-            elif (self._IR == (0x47<<3|4)): assert(False);
-            elif (self._IR == (0x47<<3|5)): assert(False);
-            elif (self._IR == (0x47<<3|6)): assert(False);
-            elif (self._IR == (0x47<<3|7)): assert(False);
-
-            # PHA s
-            elif (self._IR == (0x48<<3|0)): self._SA(self._PC);
-            elif (self._IR == (0x48<<3|1)): self._SAD(0x0100|self._S,self._A);self._DES();self._WR();
-            elif (self._IR == (0x48<<3|2)): self._FETCH();
-            elif (self._IR == (0x48<<3|3)): assert(False);
-            elif (self._IR == (0x48<<3|4)): assert(False);
-            elif (self._IR == (0x48<<3|5)): assert(False);
-            elif (self._IR == (0x48<<3|6)): assert(False);
-            elif (self._IR == (0x48<<3|7)): assert(False);
-
-            # EOR #
-            elif (self._IR == (0x49<<3|0)): self._SA(self._PC);self._INCPC();
-            elif (self._IR == (0x49<<3|1)): self._A^=self._GD();self._NZ(self._A);self._FETCH();
-            elif (self._IR == (0x49<<3|2)): assert(False);
-            elif (self._IR == (0x49<<3|3)): assert(False);
-            elif (self._IR == (0x49<<3|4)): assert(False);
-            elif (self._IR == (0x49<<3|5)): assert(False);
-            elif (self._IR == (0x49<<3|6)): assert(False);
-            elif (self._IR == (0x49<<3|7)): assert(False);
-
-            # LSR A
-            elif (self._IR == (0x4a<<3|0)): self._SA(self._PC);
-            elif (self._IR == (0x4a<<3|1)): self._A=self._lsr(self._A);self._FETCH();
-            elif (self._IR == (0x4a<<3|2)): assert(False);
-            elif (self._IR == (0x4a<<3|3)): assert(False);
-            elif (self._IR == (0x4a<<3|4)): assert(False);
-            elif (self._IR == (0x4a<<3|5)): assert(False);
-            elif (self._IR == (0x4a<<3|6)): assert(False);
-            elif (self._IR == (0x4a<<3|7)): assert(False);
-
-            # None
-            elif (self._IR == (0x4b<<3|0)): assert(False);
-            elif (self._IR == (0x4b<<3|1)): assert(False);
-            elif (self._IR == (0x4b<<3|2)): assert(False);
-            elif (self._IR == (0x4b<<3|3)): assert(False);
-            elif (self._IR == (0x4b<<3|4)): assert(False);
-            elif (self._IR == (0x4b<<3|5)): assert(False);
-            elif (self._IR == (0x4b<<3|6)): assert(False);
-            elif (self._IR == (0x4b<<3|7)): assert(False);
-
-            # JMP a
-            elif (self._IR == (0x4c<<3|0)): self._SA(self._PC);self._INCPC();
-            elif (self._IR == (0x4c<<3|1)): self._SA(self._PC);self._INCPC();self._AD=self._GD();
-            elif (self._IR == (0x4c<<3|2)): self._PC=(self._GD()<<8)|self._AD;self._FETCH();
-            elif (self._IR == (0x4c<<3|3)): assert(False);
-            elif (self._IR == (0x4c<<3|4)): assert(False);
-            elif (self._IR == (0x4c<<3|5)): assert(False);
-            elif (self._IR == (0x4c<<3|6)): assert(False);
-            elif (self._IR == (0x4c<<3|7)): assert(False);
-
-            # EOR a
-            elif (self._IR == (0x4d<<3|0)): self._SA(self._PC);self._INCPC();
-            elif (self._IR == (0x4d<<3|1)): self._SA(self._PC);self._INCPC();self._AD=self._GD();
-            elif (self._IR == (0x4d<<3|2)): self._SA((self._GD()<<8)|self._AD);
-            elif (self._IR == (0x4d<<3|3)): self._A^=self._GD();self._NZ(self._A);self._FETCH();
-            elif (self._IR == (0x4d<<3|4)): assert(False);
-            elif (self._IR == (0x4d<<3|5)): assert(False);
-            elif (self._IR == (0x4d<<3|6)): assert(False);
-            elif (self._IR == (0x4d<<3|7)): assert(False);
-
-            # LSR a
-            elif (self._IR == (0x4e<<3|0)): self._SA(self._PC);self._INCPC();
-            elif (self._IR == (0x4e<<3|1)): self._SA(self._PC);self._INCPC();self._AD=self._GD();
-            elif (self._IR == (0x4e<<3|2)): self._SA((self._GD()<<8)|self._AD);
-            elif (self._IR == (0x4e<<3|3)): self._AD=self._GD();self._WR();
-            elif (self._IR == (0x4e<<3|4)): self._SD(self._lsr(self._AD));self._WR();
-            elif (self._IR == (0x4e<<3|5)): self._FETCH();
-            elif (self._IR == (0x4e<<3|6)): assert(False);
-            elif (self._IR == (0x4e<<3|7)): assert(False);
-
-            # BBR4 r
-            elif (self._IR == (0x4f<<3|0)): self._SA(self._PC);self._INCPC();
-            elif (self._IR == (0x4f<<3|1)):
-                self._SA(self._PC);
-                if((self._GD()&0x10)==0x00):self._INCPC();self._AD=self._PC+self._GD();self._FETCH();
-                else:self._FETCH();
-            elif (self._IR == (0x4f<<3|0)): assert(False);
-            elif (self._IR == (0x4f<<3|1)): assert(False);
-            elif (self._IR == (0x4f<<3|2)): assert(False);
-            elif (self._IR == (0x4f<<3|3)): assert(False);
-            elif (self._IR == (0x4f<<3|4)): assert(False);
-            elif (self._IR == (0x4f<<3|5)): assert(False);
-            elif (self._IR == (0x4f<<3|6)): assert(False);
-            elif (self._IR == (0x4f<<3|7)): assert(False);
-
-
-
-            # BVC r
-            elif (self._IR == (0x50<<3|0)): self._SA(self._PC);self._INCPC();
-            elif (self._IR == (0x50<<3|1)):
-                self._SA(self._PC);self._AD=self._PC+self._GD();
-                if((self._P&0x40)!=0x0):self._FETCH();
-            elif (self._IR == (0x50<<3|2)):
-                self._SA((self._PC&0xFF00)|(self._AD&0x00FF));
-                if((self._AD&0xFF00)==(self._PC&0xFF00)):self._PC=self._AD;self._irq_pip>>=1;self._nmi_pip>>=1;self._FETCH();
-            elif (self._IR == (0x50<<3|3)): self._PC=self._AD;self._FETCH();
-            elif (self._IR == (0x50<<3|4)): assert(False);
-            elif (self._IR == (0x50<<3|5)): assert(False);
-            elif (self._IR == (0x50<<3|6)): assert(False);
-            elif (self._IR == (0x50<<3|7)): assert(False);
-
-            # EOR (zp),y
-            elif (self._IR == (0x51<<3|0)): self._SA(self._PC);self._INCPC();
-            elif (self._IR == (0x51<<3|1)): self._AD=self._GD();self._SA(self._AD);
-            elif (self._IR == (0x51<<3|2)): self._SA((self._AD+1)&0xFF);self._AD=self._GD();
-            elif (self._IR == (0x51<<3|3)): self._AD|=self._GD()<<8;self._SA((self._AD&0xFF00)|((self._AD+self._Y)&0xFF));self._IR+=(~((self._AD>>8)-((self._AD+self._Y)>>8)))&1;
-            elif (self._IR == (0x51<<3|4)): self._SA(self._AD+self._Y);
-            elif (self._IR == (0x51<<3|5)): self._A^=self._GD();self._NZ(self._A);self._FETCH();
-            elif (self._IR == (0x51<<3|6)): assert(False);
-            elif (self._IR == (0x51<<3|7)): assert(False);
-
-            # EOR (zp)
-            elif (self._IR == (0x52<<3|0)): self._SA(self._PC);self._INCPC();
-            elif (self._IR == (0x52<<3|1)): self._AD=self._GD();self._SA(self._AD);
-            elif (self._IR == (0x52<<3|2)): self._SA((self._AD+1)&0xFF);self._AD=self._GD();
-            elif (self._IR == (0x52<<3|3)): self._AD|=self._GD()<<8;self._SA((self._AD&0xFF00)|((self._AD)&0xFF));self._IR+=(~((self._AD>>8)-((self._AD)>>8)))&1;
-            elif (self._IR == (0x52<<3|4)): self._SA(self._AD);
-            elif (self._IR == (0x52<<3|5)): self._A^=self._GD();self._NZ(self._A);self._FETCH();
-            elif (self._IR == (0x52<<3|6)): assert(False);
-            elif (self._IR == (0x52<<3|7)): assert(False);
-
-            # None
-            elif (self._IR == (0x53<<3|0)): assert(False);
-            elif (self._IR == (0x53<<3|1)): assert(False);
-            elif (self._IR == (0x53<<3|2)): assert(False);
-            elif (self._IR == (0x53<<3|3)): assert(False);
-            elif (self._IR == (0x53<<3|4)): assert(False);
-            elif (self._IR == (0x53<<3|5)): assert(False);
-            elif (self._IR == (0x53<<3|6)): assert(False);
-            elif (self._IR == (0x53<<3|7)): assert(False);
-
-            # None
-            elif (self._IR == (0x54<<3|0)): assert(False);
-            elif (self._IR == (0x54<<3|1)): assert(False);
-            elif (self._IR == (0x54<<3|2)): assert(False);
-            elif (self._IR == (0x54<<3|3)): assert(False);
-            elif (self._IR == (0x54<<3|4)): assert(False);
-            elif (self._IR == (0x54<<3|5)): assert(False);
-            elif (self._IR == (0x54<<3|6)): assert(False);
-            elif (self._IR == (0x54<<3|7)): assert(False);
-
-            # EOR zp,x
-            elif (self._IR == (0x55<<3|0)): self._SA(self._PC);self._INCPC();
-            elif (self._IR == (0x55<<3|1)): self._AD=self._GD();self._SA(self._AD);
-            elif (self._IR == (0x55<<3|2)): self._SA((self._AD+self._X)&0x00FF);
-            elif (self._IR == (0x55<<3|3)): self._A^=self._GD();self._NZ(self._A);self._FETCH();
-            elif (self._IR == (0x55<<3|4)): assert(False);
-            elif (self._IR == (0x55<<3|5)): assert(False);
-            elif (self._IR == (0x55<<3|6)): assert(False);
-            elif (self._IR == (0x55<<3|7)): assert(False);
-
-            # LSR zp,x
-            elif (self._IR == (0x56<<3|0)): self._SA(self._PC);self._INCPC();
-            elif (self._IR == (0x56<<3|1)): self._AD=self._GD();self._SA(self._AD);
-            elif (self._IR == (0x56<<3|2)): self._SA((self._AD+self._X)&0x00FF);
-            elif (self._IR == (0x56<<3|3)): self._AD=self._GD();self._WR();
-            elif (self._IR == (0x56<<3|4)): self._SD(self._lsr(self._AD));self._WR();
-            elif (self._IR == (0x56<<3|5)): self._FETCH();
-            elif (self._IR == (0x56<<3|6)): assert(False);
-            elif (self._IR == (0x56<<3|7)): assert(False);
-
-            # RMB5 zp
-            elif (self._IR == (0x57<<3|0)): self._SA(self._PC);self._INCPC();
-            elif (self._IR == (0x57<<3|1)): self._SA(0x00&self._GD());self._AD=self._GD();
-            elif (self._IR == (0x57<<3|2)): self._SA(0x00&self._AD);self._SD(self._GD()&~(1<<5));self._WR();
-            elif (self._IR == (0x57<<3|3)): self._FETCH();
-            elif (self._IR == (0x57<<3|4)): assert(False);
-            elif (self._IR == (0x57<<3|5)): assert(False);
-            elif (self._IR == (0x57<<3|6)): assert(False);
-            elif (self._IR == (0x57<<3|7)): assert(False);
-
-            # CLI i
-            elif (self._IR == (0x58<<3|0)): self._SA(self._PC);
-            elif (self._IR == (0x58<<3|1)): self._P&=~M65C02_IF;self._FETCH();
-            elif (self._IR == (0x58<<3|2)): assert(False);
-            elif (self._IR == (0x58<<3|3)): assert(False);
-            elif (self._IR == (0x58<<3|4)): assert(False);
-            elif (self._IR == (0x58<<3|5)): assert(False);
-            elif (self._IR == (0x58<<3|6)): assert(False);
-            elif (self._IR == (0x58<<3|7)): assert(False);
-
-            # EOR a,y
-            elif (self._IR == (0x59<<3|0)): self._SA(self._PC);self._INCPC();
-            elif (self._IR == (0x59<<3|1)): self._SA(self._PC);self._INCPC();self._AD=self._GD();
-            elif (self._IR == (0x59<<3|2)): self._AD|=self._GD()<<8;self._SA((self._AD&0xFF00)|((self._AD+self._Y)&0xFF));self._IR+=(~((self._AD>>8)-((self._AD+self._Y)>>8)))&1;
-            elif (self._IR == (0x59<<3|3)): self._SA(self._AD+self._Y);
-            elif (self._IR == (0x59<<3|4)): self._A^=self._GD();self._NZ(self._A);self._FETCH();
-            elif (self._IR == (0x59<<3|5)): assert(False);
-            elif (self._IR == (0x59<<3|6)): assert(False);
-            elif (self._IR == (0x59<<3|7)): assert(False);
-
-            # PHY s
-            elif (self._IR == (0x5a<<3|0)): self._SA(self._PC);
-            elif (self._IR == (0x5a<<3|1)): self._SAD(0x0100|self._S,self._Y);self._DES();self._WR();
-            elif (self._IR == (0x5a<<3|2)): self._FETCH();
-            elif (self._IR == (0x5a<<3|3)): assert(False);
-            elif (self._IR == (0x5a<<3|4)): assert(False);
-            elif (self._IR == (0x5a<<3|5)): assert(False);
-            elif (self._IR == (0x5a<<3|6)): assert(False);
-            elif (self._IR == (0x5a<<3|7)): assert(False);
-
-            # None
-            elif (self._IR == (0x5b<<3|0)): assert(False);
-            elif (self._IR == (0x5b<<3|1)): assert(False);
-            elif (self._IR == (0x5b<<3|2)): assert(False);
-            elif (self._IR == (0x5b<<3|3)): assert(False);
-            elif (self._IR == (0x5b<<3|4)): assert(False);
-            elif (self._IR == (0x5b<<3|5)): assert(False);
-            elif (self._IR == (0x5b<<3|6)): assert(False);
-            elif (self._IR == (0x5b<<3|7)): assert(False);
-
-            # None
-            elif (self._IR == (0x5c<<3|0)): assert(False);
-            elif (self._IR == (0x5c<<3|1)): assert(False);
-            elif (self._IR == (0x5c<<3|2)): assert(False);
-            elif (self._IR == (0x5c<<3|3)): assert(False);
-            elif (self._IR == (0x5c<<3|4)): assert(False);
-            elif (self._IR == (0x5c<<3|5)): assert(False);
-            elif (self._IR == (0x5c<<3|6)): assert(False);
-            elif (self._IR == (0x5c<<3|7)): assert(False);
-
-            # EOR a,x
-            elif (self._IR == (0x5d<<3|0)): self._SA(self._PC);self._INCPC();
-            elif (self._IR == (0x5d<<3|1)): self._SA(self._PC);self._INCPC();self._AD=self._GD();
-            elif (self._IR == (0x5d<<3|2)): self._AD|=self._GD()<<8;self._SA((self._AD&0xFF00)|((self._AD+self._X)&0xFF));self._IR+=(~((self._AD>>8)-((self._AD+self._X)>>8)))&1;
-            elif (self._IR == (0x5d<<3|3)): self._SA(self._AD+self._X);
-            elif (self._IR == (0x5d<<3|4)): self._A^=self._GD();self._NZ(self._A);self._FETCH();
-            elif (self._IR == (0x5d<<3|5)): assert(False);
-            elif (self._IR == (0x5d<<3|6)): assert(False);
-            elif (self._IR == (0x5d<<3|7)): assert(False);
-
-            # LSR a,x
-            elif (self._IR == (0x5e<<3|0)): self._SA(self._PC);self._INCPC();
-            elif (self._IR == (0x5e<<3|1)): self._SA(self._PC);self._INCPC();self._AD=self._GD();
-            elif (self._IR == (0x5e<<3|2)): self._AD|=self._GD()<<8;self._SA((self._AD&0xFF00)|((self._AD+self._X)&0xFF));
-            elif (self._IR == (0x5e<<3|3)): self._SA(self._AD+self._X);
-            elif (self._IR == (0x5e<<3|4)): self._AD=self._GD();self._WR();
-            elif (self._IR == (0x5e<<3|5)): self._SD(self._lsr(self._AD));self._WR();
-            elif (self._IR == (0x5e<<3|6)): self._FETCH();
-            elif (self._IR == (0x5e<<3|7)): assert(False);
-
-            # BBR5 r
-            elif (self._IR == (0x5f<<3|0)): self._SA(self._PC);self._INCPC();
-            elif (self._IR == (0x5f<<3|1)):
-                self._SA(self._PC);
-                if((self._GD()&0x20)==0x00):self._INCPC();self._AD=self._PC+self._GD();self._FETCH();
-                else:self._FETCH();
-            elif (self._IR == (0x5f<<3|0)): assert(False);
-            elif (self._IR == (0x5f<<3|1)): assert(False);
-            elif (self._IR == (0x5f<<3|2)): assert(False);
-            elif (self._IR == (0x5f<<3|3)): assert(False);
-            elif (self._IR == (0x5f<<3|4)): assert(False);
-            elif (self._IR == (0x5f<<3|5)): assert(False);
-            elif (self._IR == (0x5f<<3|6)): assert(False);
-            elif (self._IR == (0x5f<<3|7)): assert(False);
-
-
-
-            # RTS s
-            elif (self._IR == (0x60<<3|0)): self._SA(self._PC);
-            elif (self._IR == (0x60<<3|1)): self._SA(0x0100|self._S);self._INS();
-            elif (self._IR == (0x60<<3|2)): self._SA(0x0100|self._S);self._INS();
-            elif (self._IR == (0x60<<3|3)): self._SA(0x0100|self._S);self._AD=self._GD();
-            elif (self._IR == (0x60<<3|4)): self._PC=(self._GD()<<8)|self._AD;self._SA(self._PC);self._INCPC();
-            elif (self._IR == (0x60<<3|5)): self._FETCH();
-            elif (self._IR == (0x60<<3|6)): assert(False);
-            elif (self._IR == (0x60<<3|7)): assert(False);
-
-            # ADC (zp,x)
-            elif (self._IR == (0x61<<3|0)): self._SA(self._PC);self._INCPC();
-            elif (self._IR == (0x61<<3|1)): self._AD=self._GD();self._SA(self._AD);
-            elif (self._IR == (0x61<<3|2)): self._AD=(self._AD+self._X)&0xFF;self._SA(self._AD);
-            elif (self._IR == (0x61<<3|3)): self._SA((self._AD+1)&0xFF);self._AD=self._GD();
-            elif (self._IR == (0x61<<3|4)): self._SA((self._GD()<<8)|self._AD);
-            elif (self._IR == (0x61<<3|5)): self._adc(self._GD());self._FETCH();
-            elif (self._IR == (0x61<<3|6)): assert(False);
-            elif (self._IR == (0x61<<3|7)): assert(False);
-
-            # None
-            elif (self._IR == (0x62<<3|0)): assert(False);
-            elif (self._IR == (0x62<<3|1)): assert(False);
-            elif (self._IR == (0x62<<3|2)): assert(False);
-            elif (self._IR == (0x62<<3|3)): assert(False);
-            elif (self._IR == (0x62<<3|4)): assert(False);
-            elif (self._IR == (0x62<<3|5)): assert(False);
-            elif (self._IR == (0x62<<3|6)): assert(False);
-            elif (self._IR == (0x62<<3|7)): assert(False);
-
-            # None
-            elif (self._IR == (0x63<<3|0)): assert(False);
-            elif (self._IR == (0x63<<3|1)): assert(False);
-            elif (self._IR == (0x63<<3|2)): assert(False);
-            elif (self._IR == (0x63<<3|3)): assert(False);
-            elif (self._IR == (0x63<<3|4)): assert(False);
-            elif (self._IR == (0x63<<3|5)): assert(False);
-            elif (self._IR == (0x63<<3|6)): assert(False);
-            elif (self._IR == (0x63<<3|7)): assert(False);
-
-            # STZ zp
-            elif (self._IR == (0x64<<3|0)): self._SA(self._PC);self._INCPC();
-            elif (self._IR == (0x64<<3|1)): self._SA(self._GD());self._SD(0x00);self._WR();
-            elif (self._IR == (0x64<<3|2)): self._FETCH();
-            elif (self._IR == (0x64<<3|3)): assert(False);
-            elif (self._IR == (0x64<<3|4)): assert(False);
-            elif (self._IR == (0x64<<3|5)): assert(False);
-            elif (self._IR == (0x64<<3|6)): assert(False);
-            elif (self._IR == (0x64<<3|7)): assert(False);
-
-            # ADC zp
-            elif (self._IR == (0x65<<3|0)): self._SA(self._PC);self._INCPC();
-            elif (self._IR == (0x65<<3|1)): self._SA(self._GD());
-            elif (self._IR == (0x65<<3|2)): self._adc(self._GD());self._FETCH();
-            elif (self._IR == (0x65<<3|3)): assert(False);
-            elif (self._IR == (0x65<<3|4)): assert(False);
-            elif (self._IR == (0x65<<3|5)): assert(False);
-            elif (self._IR == (0x65<<3|6)): assert(False);
-            elif (self._IR == (0x65<<3|7)): assert(False);
-
-            # ROR zp
-            elif (self._IR == (0x66<<3|0)): self._SA(self._PC);self._INCPC();
-            elif (self._IR == (0x66<<3|1)): self._SA(self._GD());
-            elif (self._IR == (0x66<<3|2)): self._AD=self._GD();self._WR();
-            elif (self._IR == (0x66<<3|3)): self._SD(self._ror(self._AD));self._WR();
-            elif (self._IR == (0x66<<3|4)): self._FETCH();
-            elif (self._IR == (0x66<<3|5)): assert(False);
-            elif (self._IR == (0x66<<3|6)): assert(False);
-            elif (self._IR == (0x66<<3|7)): assert(False);
-
-            # RMB6 zp
-            elif (self._IR == (0x67<<3|0)): self._SA(self._PC);self._INCPC();
-            elif (self._IR == (0x67<<3|1)): self._SA(0x00&self._GD());self._AD=self._GD();
-            elif (self._IR == (0x67<<3|2)): self._SA(0x00&self._AD);self._SD(self._GD()&~(1<<6));self._WR();
-            elif (self._IR == (0x67<<3|3)): self._FETCH();
-            elif (self._IR == (0x67<<3|4)): assert(False);
-            elif (self._IR == (0x67<<3|5)): assert(False);
-            elif (self._IR == (0x67<<3|6)): assert(False);
-            elif (self._IR == (0x67<<3|7)): assert(False);
-
-            # PLA s
-            elif (self._IR == (0x68<<3|0)): self._SA(self._PC);
-            elif (self._IR == (0x68<<3|1)): self._SA(0x0100|self._S);self._INS();
-            elif (self._IR == (0x68<<3|2)): self._SA(0x0100|self._S);
-            elif (self._IR == (0x68<<3|3)): self._A=self._GD();self._NZ(self._A);self._FETCH();
-            elif (self._IR == (0x68<<3|4)): assert(False);
-            elif (self._IR == (0x68<<3|5)): assert(False);
-            elif (self._IR == (0x68<<3|6)): assert(False);
-            elif (self._IR == (0x68<<3|7)): assert(False);
-
-            # ADC #
-            elif (self._IR == (0x69<<3|0)): self._SA(self._PC);self._INCPC();
-            elif (self._IR == (0x69<<3|1)): self._adc(self._GD());self._FETCH();
-            elif (self._IR == (0x69<<3|2)): assert(False);
-            elif (self._IR == (0x69<<3|3)): assert(False);
-            elif (self._IR == (0x69<<3|4)): assert(False);
-            elif (self._IR == (0x69<<3|5)): assert(False);
-            elif (self._IR == (0x69<<3|6)): assert(False);
-            elif (self._IR == (0x69<<3|7)): assert(False);
-
-            # ROR A
-            elif (self._IR == (0x6a<<3|0)): self._SA(self._PC);
-            elif (self._IR == (0x6a<<3|1)): self._A=self._ror(self._A);self._FETCH();
-            elif (self._IR == (0x6a<<3|2)): assert(False);
-            elif (self._IR == (0x6a<<3|3)): assert(False);
-            elif (self._IR == (0x6a<<3|4)): assert(False);
-            elif (self._IR == (0x6a<<3|5)): assert(False);
-            elif (self._IR == (0x6a<<3|6)): assert(False);
-            elif (self._IR == (0x6a<<3|7)): assert(False);
-
-            # None
-            elif (self._IR == (0x6b<<3|0)): assert(False);
-            elif (self._IR == (0x6b<<3|1)): assert(False);
-            elif (self._IR == (0x6b<<3|2)): assert(False);
-            elif (self._IR == (0x6b<<3|3)): assert(False);
-            elif (self._IR == (0x6b<<3|4)): assert(False);
-            elif (self._IR == (0x6b<<3|5)): assert(False);
-            elif (self._IR == (0x6b<<3|6)): assert(False);
-            elif (self._IR == (0x6b<<3|7)): assert(False);
-
-            # JMP (a)
-            elif (self._IR == (0x6c<<3|0)): self._SA(self._PC);self._INCPC();
-            elif (self._IR == (0x6c<<3|1)): self._SA(self._PC);self._INCPC();self._AD=self._GD();
-            elif (self._IR == (0x6c<<3|2)): self._AD|=self._GD()<<8;self._SA(self._AD);
-            elif (self._IR == (0x6c<<3|3)): self._SA((self._AD&0xFF00)|((self._AD+1)&0x00FF));self._AD=self._GD();
-            elif (self._IR == (0x6c<<3|4)): self._PC=(self._GD()<<8)|self._AD;self._FETCH();
-            elif (self._IR == (0x6c<<3|5)): assert(False);
-            elif (self._IR == (0x6c<<3|6)): assert(False);
-            elif (self._IR == (0x6c<<3|7)): assert(False);
-
-            # ADC a
-            elif (self._IR == (0x6d<<3|0)): self._SA(self._PC);self._INCPC();
-            elif (self._IR == (0x6d<<3|1)): self._SA(self._PC);self._INCPC();self._AD=self._GD();
-            elif (self._IR == (0x6d<<3|2)): self._SA((self._GD()<<8)|self._AD);
-            elif (self._IR == (0x6d<<3|3)): self._adc(self._GD());self._FETCH();
-            elif (self._IR == (0x6d<<3|4)): assert(False);
-            elif (self._IR == (0x6d<<3|5)): assert(False);
-            elif (self._IR == (0x6d<<3|6)): assert(False);
-            elif (self._IR == (0x6d<<3|7)): assert(False);
-
-            # ROR a
-            elif (self._IR == (0x6e<<3|0)): self._SA(self._PC);self._INCPC();
-            elif (self._IR == (0x6e<<3|1)): self._SA(self._PC);self._INCPC();self._AD=self._GD();
-            elif (self._IR == (0x6e<<3|2)): self._SA((self._GD()<<8)|self._AD);
-            elif (self._IR == (0x6e<<3|3)): self._AD=self._GD();self._WR();
-            elif (self._IR == (0x6e<<3|4)): self._SD(self._ror(self._AD));self._WR();
-            elif (self._IR == (0x6e<<3|5)): self._FETCH();
-            elif (self._IR == (0x6e<<3|6)): assert(False);
-            elif (self._IR == (0x6e<<3|7)): assert(False);
-
-            # BBR6 r
-            elif (self._IR == (0x6f<<3|0)): self._SA(self._PC);self._INCPC();
-            elif (self._IR == (0x6f<<3|1)):
-                self._SA(self._PC);
-                if((self._GD()&0x40)==0x00):self._INCPC();self._AD=self._PC+self._GD();self._FETCH();
-                else:self._FETCH();
-            elif (self._IR == (0x6f<<3|2)): assert(False);
-            elif (self._IR == (0x6f<<3|3)): assert(False);
-            elif (self._IR == (0x6f<<3|4)): assert(False);
-            elif (self._IR == (0x6f<<3|5)): assert(False);
-            elif (self._IR == (0x6f<<3|6)): assert(False);
-            elif (self._IR == (0x6f<<3|7)): assert(False);
-
-
-
-            # BVS r
-            elif (self._IR == (0x70<<3|0)): self._SA(self._PC);self._INCPC();
-            elif (self._IR == (0x70<<3|1)):
-                self._SA(self._PC);self._AD=self._PC+self._GD();
-                if((self._P&0x40)!=0x40):self._FETCH();
-            elif (self._IR == (0x70<<3|2)):
-                self._SA((self._PC&0xFF00)|(self._AD&0x00FF));
-                if((self._AD&0xFF00)==(self._PC&0xFF00)):self._PC=self._AD;self._irq_pip>>=1;self._nmi_pip>>=1;self._FETCH();
-            elif (self._IR == (0x70<<3|3)): self._PC=self._AD;self._FETCH();
-            elif (self._IR == (0x70<<3|4)): assert(False);
-            elif (self._IR == (0x70<<3|5)): assert(False);
-            elif (self._IR == (0x70<<3|6)): assert(False);
-            elif (self._IR == (0x70<<3|7)): assert(False);
-
-            # ADC (zp),y
-            elif (self._IR == (0x71<<3|0)): self._SA(self._PC);self._INCPC();
-            elif (self._IR == (0x71<<3|1)): self._AD=self._GD();self._SA(self._AD);
-            elif (self._IR == (0x71<<3|2)): self._SA((self._AD+1)&0xFF);self._AD=self._GD();
-            elif (self._IR == (0x71<<3|3)): self._AD|=self._GD()<<8;self._SA((self._AD&0xFF00)|((self._AD+self._Y)&0xFF));self._IR+=(~((self._AD>>8)-((self._AD+self._Y)>>8)))&1;
-            elif (self._IR == (0x71<<3|4)): self._SA(self._AD+self._Y);
-            elif (self._IR == (0x71<<3|5)): self._adc(self._GD());self._FETCH();
-            elif (self._IR == (0x71<<3|6)): assert(False);
-            elif (self._IR == (0x71<<3|7)): assert(False);
-
-            # ADC (zp)
-            elif (self._IR == (0x72<<3|0)): self._SA(self._PC);self._INCPC();
-            elif (self._IR == (0x72<<3|1)): self._AD=self._GD();self._SA(self._AD);
-            elif (self._IR == (0x72<<3|2)): self._SA((self._AD+1)&0xFF);self._AD=self._GD();
-            elif (self._IR == (0x72<<3|3)): self._AD|=self._GD()<<8;self._SA((self._AD&0xFF00)|((self._AD)&0xFF));self._IR+=(~((self._AD>>8)-((self._AD)>>8)))&1;
-            elif (self._IR == (0x72<<3|4)): self._SA(self._AD);
-            elif (self._IR == (0x72<<3|5)): self._adc(self._GD());self._FETCH();
-            elif (self._IR == (0x72<<3|6)): assert(False);
-            elif (self._IR == (0x72<<3|7)): assert(False);
-
-            # None
-            elif (self._IR == (0x73<<3|0)): assert(False);
-            elif (self._IR == (0x73<<3|1)): assert(False);
-            elif (self._IR == (0x73<<3|2)): assert(False);
-            elif (self._IR == (0x73<<3|3)): assert(False);
-            elif (self._IR == (0x73<<3|4)): assert(False);
-            elif (self._IR == (0x73<<3|5)): assert(False);
-            elif (self._IR == (0x73<<3|6)): assert(False);
-            elif (self._IR == (0x73<<3|7)): assert(False);
-
-            # STZ zp,x
-            elif (self._IR == (0x74<<3|0)): self._SA(self._PC);self._INCPC();
-            elif (self._IR == (0x74<<3|1)): self._AD=self._GD();self._SA(self._AD);
-            elif (self._IR == (0x74<<3|2)): self._SA((self._AD+self._X)&0x00ff);self._SD(0x00);self._WR();
-            elif (self._IR == (0x74<<3|3)): self._FETCH();
-            elif (self._IR == (0x74<<3|4)): assert(False);
-            elif (self._IR == (0x74<<3|5)): assert(False);
-            elif (self._IR == (0x74<<3|6)): assert(False);
-            elif (self._IR == (0x74<<3|7)): assert(False);
-
-            # ADC zp,x
-            elif (self._IR == (0x75<<3|0)): self._SA(self._PC);self._INCPC();
-            elif (self._IR == (0x75<<3|1)): self._AD=self._GD();self._SA(self._AD);
-            elif (self._IR == (0x75<<3|2)): self._SA((self._AD+self._X)&0x00FF);
-            elif (self._IR == (0x75<<3|3)): self._adc(self._GD());self._FETCH();
-            elif (self._IR == (0x75<<3|4)): assert(False);
-            elif (self._IR == (0x75<<3|5)): assert(False);
-            elif (self._IR == (0x75<<3|6)): assert(False);
-            elif (self._IR == (0x75<<3|7)): assert(False);
-
-            # ROR zp,x
-            elif (self._IR == (0x76<<3|0)): self._SA(self._PC);self._INCPC();
-            elif (self._IR == (0x76<<3|1)): self._AD=self._GD();self._SA(self._AD);
-            elif (self._IR == (0x76<<3|2)): self._SA((self._AD+self._X)&0x00FF);
-            elif (self._IR == (0x76<<3|3)): self._AD=self._GD();self._WR();
-            elif (self._IR == (0x76<<3|4)): self._SD(self._ror(self._AD));self._WR();
-            elif (self._IR == (0x76<<3|5)): self._FETCH();
-            elif (self._IR == (0x76<<3|6)): assert(False);
-            elif (self._IR == (0x76<<3|7)): assert(False);
-
-            # RMB7 zp
-            elif (self._IR == (0x77<<3|0)): self._SA(self._PC);self._INCPC();
-            elif (self._IR == (0x77<<3|1)): self._SA(0x00&self._GD());self._AD=self._GD();
-            elif (self._IR == (0x77<<3|2)): self._SA(0x00&self._AD);self._SD(self._GD()&~(1<<7));self._WR();
-            elif (self._IR == (0x77<<3|3)): self._FETCH();
-            elif (self._IR == (0x77<<3|4)): assert(False);
-            elif (self._IR == (0x77<<3|5)): assert(False);
-            elif (self._IR == (0x77<<3|6)): assert(False);
-            elif (self._IR == (0x77<<3|7)): assert(False);
-
-            # SEI i
-            elif (self._IR == (0x78<<3|0)): self._SA(self._PC);
-            elif (self._IR == (0x78<<3|1)): self._P|=M65C02_IF;self._FETCH();
-            elif (self._IR == (0x78<<3|2)): assert(False);
-            elif (self._IR == (0x78<<3|3)): assert(False);
-            elif (self._IR == (0x78<<3|4)): assert(False);
-            elif (self._IR == (0x78<<3|5)): assert(False);
-            elif (self._IR == (0x78<<3|6)): assert(False);
-            elif (self._IR == (0x78<<3|7)): assert(False);
-
-            # ADC a,y
-            elif (self._IR == (0x79<<3|0)): self._SA(self._PC);self._INCPC();
-            elif (self._IR == (0x79<<3|1)): self._SA(self._PC);self._INCPC();self._AD=self._GD();
-            elif (self._IR == (0x79<<3|2)): self._AD|=self._GD()<<8;self._SA((self._AD&0xFF00)|((self._AD+self._Y)&0xFF));self._IR+=(~((self._AD>>8)-((self._AD+self._Y)>>8)))&1;
-            elif (self._IR == (0x79<<3|3)): self._SA(self._AD+self._Y);
-            elif (self._IR == (0x79<<3|4)): self._adc(self._GD());self._FETCH();
-            elif (self._IR == (0x79<<3|5)): assert(False);
-            elif (self._IR == (0x79<<3|6)): assert(False);
-            elif (self._IR == (0x79<<3|7)): assert(False);
-
-            # PLY s
-            elif (self._IR == (0x7a<<3|0)): self._SA(self._PC);
-            elif (self._IR == (0x7a<<3|1)): self._SA(0x0100|self._S);self._INS();
-            elif (self._IR == (0x7a<<3|2)): self._SA(0x0100|self._S);
-            elif (self._IR == (0x7a<<3|3)): self._Y=self._GD();self._NZ(self._Y);self._FETCH();
-            elif (self._IR == (0x7a<<3|4)): assert(False);
-            elif (self._IR == (0x7a<<3|5)): assert(False);
-            elif (self._IR == (0x7a<<3|6)): assert(False);
-            elif (self._IR == (0x7a<<3|7)): assert(False);
-
-            # None
-            elif (self._IR == (0x7b<<3|0)): assert(False);
-            elif (self._IR == (0x7b<<3|1)): assert(False);
-            elif (self._IR == (0x7b<<3|2)): assert(False);
-            elif (self._IR == (0x7b<<3|3)): assert(False);
-            elif (self._IR == (0x7b<<3|4)): assert(False);
-            elif (self._IR == (0x7b<<3|5)): assert(False);
-            elif (self._IR == (0x7b<<3|6)): assert(False);
-            elif (self._IR == (0x7b<<3|7)): assert(False);
-
-            # JMP (a,x)
-            elif (self._IR == (0x7c<<3|0)): self._SA(self._PC);self._INCPC();
-            elif (self._IR == (0x7c<<3|1)): self._SA(self._PC);self._INCPC();self._AD=self._GD();
-            elif (self._IR == (0x7c<<3|2)): self._AD|=self._GD()<<8;self._SA(self._AD);
-            elif (self._IR == (0x7c<<3|3)): self._AD+=self._X;
-            elif (self._IR == (0x7c<<3|4)): self._SA((self._AD&0xFF00)|((self._AD+1)&0x00FF));self._AD=self._GD();
-            elif (self._IR == (0x7c<<3|5)): self._PC=(self._GD()<<8)|self._AD;self._FETCH();
-            elif (self._IR == (0x7c<<3|6)): assert(False);
-            elif (self._IR == (0x7c<<3|7)): assert(False);
-
-            # ADC a,x
-            elif (self._IR == (0x7d<<3|0)): self._SA(self._PC);self._INCPC();
-            elif (self._IR == (0x7d<<3|1)): self._SA(self._PC);self._INCPC();self._AD=self._GD();
-            elif (self._IR == (0x7d<<3|2)): self._AD|=self._GD()<<8;self._SA((self._AD&0xFF00)|((self._AD+self._X)&0xFF));self._IR+=(~((self._AD>>8)-((self._AD+self._X)>>8)))&1;
-            elif (self._IR == (0x7d<<3|3)): self._SA(self._AD+self._X);
-            elif (self._IR == (0x7d<<3|4)): self._adc(self._GD());self._FETCH();
-            elif (self._IR == (0x7d<<3|5)): assert(False);
-            elif (self._IR == (0x7d<<3|6)): assert(False);
-            elif (self._IR == (0x7d<<3|7)): assert(False);
-
-            # ROR a,x
-            elif (self._IR == (0x7e<<3|0)): self._SA(self._PC);self._INCPC();
-            elif (self._IR == (0x7e<<3|1)): self._SA(self._PC);self._INCPC();self._AD=self._GD();
-            elif (self._IR == (0x7e<<3|2)): self._AD|=self._GD()<<8;self._SA((self._AD&0xFF00)|((self._AD+self._X)&0xFF));
-            elif (self._IR == (0x7e<<3|3)): self._SA(self._AD+self._X);
-            elif (self._IR == (0x7e<<3|4)): self._AD=self._GD();self._WR();
-            elif (self._IR == (0x7e<<3|5)): self._SD(self._ror(self._AD));self._WR();
-            elif (self._IR == (0x7e<<3|6)): self._FETCH();
-            elif (self._IR == (0x7e<<3|7)): assert(False);
-
-            # BBR7 r
-            elif (self._IR == (0x7f<<3|0)): self._SA(self._PC);self._INCPC();
-            elif (self._IR == (0x7f<<3|1)):
-                self._SA(self._PC);
-                if((self._GD()&0x80)==0x00):self._INCPC();self._AD=self._PC+self._GD();self._FETCH();
-                else:self._FETCH();
-            elif (self._IR == (0x7f<<3|2)): assert(False);
-            elif (self._IR == (0x7f<<3|3)): assert(False);
-            elif (self._IR == (0x7f<<3|4)): assert(False);
-            elif (self._IR == (0x7f<<3|5)): assert(False);
-            elif (self._IR == (0x7f<<3|6)): assert(False);
-            elif (self._IR == (0x7f<<3|7)): assert(False);
-
-
-
-            # BRA r
-            elif (self._IR == (0x80<<3|0)): self._SA(self._PC);self._INCPC();
-            elif (self._IR == (0x80<<3|1)): self._SA(self._PC);self._AD=self._PC+self._GD();
-            elif (self._IR == (0x80<<3|2)):
-                self._SA((self._PC&0xFF00)|(self._AD&0x00FF));
-                if((self._AD&0xFF00)==(self._PC&0xFF00)):self._PC=self._AD;self._irq_pip>>=1;self._nmi_pip>>=1;self._FETCH();
-            elif (self._IR == (0x80<<3|3)): self._PC=self._AD;self._FETCH();
-            elif (self._IR == (0x80<<3|4)): assert(False);
-            elif (self._IR == (0x80<<3|5)): assert(False);
-            elif (self._IR == (0x80<<3|6)): assert(False);
-            elif (self._IR == (0x80<<3|7)): assert(False);
-
-            # STA (zp,x)
-            elif (self._IR == (0x81<<3|0)): self._SA(self._PC);self._INCPC();
-            elif (self._IR == (0x81<<3|1)): self._AD=self._GD();self._SA(self._AD);
-            elif (self._IR == (0x81<<3|2)): self._AD=(self._AD+self._X)&0xFF;self._SA(self._AD);
-            elif (self._IR == (0x81<<3|3)): self._SA((self._AD+1)&0xFF);self._AD=self._GD();
-            elif (self._IR == (0x81<<3|4)): self._SA((self._GD()<<8)|self._AD);self._SD(self._A);self._WR();
-            elif (self._IR == (0x81<<3|5)): self._FETCH();
-            elif (self._IR == (0x81<<3|6)): assert(False);
-            elif (self._IR == (0x81<<3|7)): assert(False);
-
-            # None
-            elif (self._IR == (0x82<<3|0)): assert(False);
-            elif (self._IR == (0x82<<3|1)): assert(False);
-            elif (self._IR == (0x82<<3|2)): assert(False);
-            elif (self._IR == (0x82<<3|3)): assert(False);
-            elif (self._IR == (0x82<<3|4)): assert(False);
-            elif (self._IR == (0x82<<3|5)): assert(False);
-            elif (self._IR == (0x82<<3|6)): assert(False);
-            elif (self._IR == (0x82<<3|7)): assert(False);
-
-            # None
-            elif (self._IR == (0x83<<3|0)): assert(False);
-            elif (self._IR == (0x83<<3|1)): assert(False);
-            elif (self._IR == (0x83<<3|2)): assert(False);
-            elif (self._IR == (0x83<<3|3)): assert(False);
-            elif (self._IR == (0x83<<3|4)): assert(False);
-            elif (self._IR == (0x83<<3|5)): assert(False);
-            elif (self._IR == (0x83<<3|6)): assert(False);
-            elif (self._IR == (0x83<<3|7)): assert(False);
-
-            # STY zp
-            elif (self._IR == (0x84<<3|0)): self._SA(self._PC);self._INCPC();
-            elif (self._IR == (0x84<<3|1)): self._SA(self._GD());self._SD(self._Y);self._WR();
-            elif (self._IR == (0x84<<3|2)): self._FETCH();
-            elif (self._IR == (0x84<<3|3)): assert(False);
-            elif (self._IR == (0x84<<3|4)): assert(False);
-            elif (self._IR == (0x84<<3|5)): assert(False);
-            elif (self._IR == (0x84<<3|6)): assert(False);
-            elif (self._IR == (0x84<<3|7)): assert(False);
-
-            # STA zp
-            elif (self._IR == (0x85<<3|0)): self._SA(self._PC);self._INCPC();
-            elif (self._IR == (0x85<<3|1)): self._SA(self._GD());self._SD(self._A);self._WR();
-            elif (self._IR == (0x85<<3|2)): self._FETCH();
-            elif (self._IR == (0x85<<3|3)): assert(False);
-            elif (self._IR == (0x85<<3|4)): assert(False);
-            elif (self._IR == (0x85<<3|5)): assert(False);
-            elif (self._IR == (0x85<<3|6)): assert(False);
-            elif (self._IR == (0x85<<3|7)): assert(False);
-
-            # STX zp
-            elif (self._IR == (0x86<<3|0)): self._SA(self._PC);self._INCPC();
-            elif (self._IR == (0x86<<3|1)): self._SA(self._GD());self._SD(self._X);self._WR();
-            elif (self._IR == (0x86<<3|2)): self._FETCH();
-            elif (self._IR == (0x86<<3|3)): assert(False);
-            elif (self._IR == (0x86<<3|4)): assert(False);
-            elif (self._IR == (0x86<<3|5)): assert(False);
-            elif (self._IR == (0x86<<3|6)): assert(False);
-            elif (self._IR == (0x86<<3|7)): assert(False);
-
-            # SMB0 zp
-            elif (self._IR == (0x87<<3|0)): self._SA(self._PC);self._INCPC();
-            elif (self._IR == (0x87<<3|1)): self._SA(0x00&self._GD());self._AD=self._GD();
-            elif (self._IR == (0x87<<3|2)): self._SA(0x00&self._AD);self._SD(self._GD()|(1<<0));self._WR();
-            elif (self._IR == (0x87<<3|3)): self._FETCH();
-            elif (self._IR == (0x87<<3|4)): assert(False);
-            elif (self._IR == (0x87<<3|5)): assert(False);
-            elif (self._IR == (0x87<<3|6)): assert(False);
-            elif (self._IR == (0x87<<3|7)): assert(False);
-
-            # DEY i
-            elif (self._IR == (0x88<<3|0)): self._SA(self._PC);
-            elif (self._IR == (0x88<<3|1)): self._DEY();self._NZ(self._Y);self._FETCH();
-            elif (self._IR == (0x88<<3|2)): assert(False);
-            elif (self._IR == (0x88<<3|3)): assert(False);
-            elif (self._IR == (0x88<<3|4)): assert(False);
-            elif (self._IR == (0x88<<3|5)): assert(False);
-            elif (self._IR == (0x88<<3|6)): assert(False);
-            elif (self._IR == (0x88<<3|7)): assert(False);
-
-            # BIT #
-            elif (self._IR == (0x89<<3|0)): self._SA(self._PC);self._INCPC();
-            elif (self._IR == (0x89<<3|1)): self._bit(c,self._GD());
-            elif (self._IR == (0x89<<3|2)): self._FETCH();
-            elif (self._IR == (0x89<<3|3)): assert(False);
-            elif (self._IR == (0x89<<3|4)): assert(False);
-            elif (self._IR == (0x89<<3|5)): assert(False);
-            elif (self._IR == (0x89<<3|6)): assert(False);
-            elif (self._IR == (0x89<<3|7)): assert(False);
-
-            # TXA i
-            elif (self._IR == (0x8a<<3|0)): self._SA(self._PC);
-            elif (self._IR == (0x8a<<3|1)): self._A=self._X;self._NZ(self._A);self._FETCH();
-            elif (self._IR == (0x8a<<3|2)): assert(False);
-            elif (self._IR == (0x8a<<3|3)): assert(False);
-            elif (self._IR == (0x8a<<3|4)): assert(False);
-            elif (self._IR == (0x8a<<3|5)): assert(False);
-            elif (self._IR == (0x8a<<3|6)): assert(False);
-            elif (self._IR == (0x8a<<3|7)): assert(False);
-
-            # None
-            elif (self._IR == (0x8b<<3|0)): assert(False);
-            elif (self._IR == (0x8b<<3|1)): assert(False);
-            elif (self._IR == (0x8b<<3|2)): assert(False);
-            elif (self._IR == (0x8b<<3|3)): assert(False);
-            elif (self._IR == (0x8b<<3|4)): assert(False);
-            elif (self._IR == (0x8b<<3|5)): assert(False);
-            elif (self._IR == (0x8b<<3|6)): assert(False);
-            elif (self._IR == (0x8b<<3|7)): assert(False);
-
-            # STY a
-            elif (self._IR == (0x8c<<3|0)): self._SA(self._PC);self._INCPC();
-            elif (self._IR == (0x8c<<3|1)): self._SA(self._PC);self._INCPC();self._AD=self._GD();
-            elif (self._IR == (0x8c<<3|2)): self._SA((self._GD()<<8)|self._AD);self._SD(self._Y);self._WR();
-            elif (self._IR == (0x8c<<3|3)): self._FETCH();
-            elif (self._IR == (0x8c<<3|4)): assert(False);
-            elif (self._IR == (0x8c<<3|5)): assert(False);
-            elif (self._IR == (0x8c<<3|6)): assert(False);
-            elif (self._IR == (0x8c<<3|7)): assert(False);
-
-            # STA a
-            elif (self._IR == (0x8d<<3|0)): self._SA(self._PC);self._INCPC();
-            elif (self._IR == (0x8d<<3|1)): self._SA(self._PC);self._INCPC();self._AD=self._GD();
-            elif (self._IR == (0x8d<<3|2)): self._SA((self._GD()<<8)|self._AD);self._SD(self._A);self._WR();
-            elif (self._IR == (0x8d<<3|3)): self._FETCH();
-            elif (self._IR == (0x8d<<3|4)): assert(False);
-            elif (self._IR == (0x8d<<3|5)): assert(False);
-            elif (self._IR == (0x8d<<3|6)): assert(False);
-            elif (self._IR == (0x8d<<3|7)): assert(False);
-
-            # STX a
-            elif (self._IR == (0x8e<<3|0)): self._SA(self._PC);self._INCPC();
-            elif (self._IR == (0x8e<<3|1)): self._SA(self._PC);self._INCPC();self._AD=self._GD();
-            elif (self._IR == (0x8e<<3|2)): self._SA((self._GD()<<8)|self._AD);self._SD(self._X);self._WR();
-            elif (self._IR == (0x8e<<3|3)): self._FETCH();
-            elif (self._IR == (0x8e<<3|4)): assert(False);
-            elif (self._IR == (0x8e<<3|5)): assert(False);
-            elif (self._IR == (0x8e<<3|6)): assert(False);
-            elif (self._IR == (0x8e<<3|7)): assert(False);
-
-            # BBS0 r
-            elif (self._IR == (0x8f<<3|0)): self._SA(self._PC);self._INCPC();
-            elif (self._IR == (0x8f<<3|1)):
-                self._SA(self._PC);
-                if((self._GD()&0x01)==0x01):self._INCPC();self._AD=self._PC+self._GD();self._FETCH();
-                else:self._FETCH();
-            elif (self._IR == (0x8f<<3|2)): assert(False);
-            elif (self._IR == (0x8f<<3|3)): assert(False);
-            elif (self._IR == (0x8f<<3|4)): assert(False);
-            elif (self._IR == (0x8f<<3|5)): assert(False);
-            elif (self._IR == (0x8f<<3|6)): assert(False);
-            elif (self._IR == (0x8f<<3|7)): assert(False);
-
-
-
-            # BCC r
-            elif (self._IR == (0x90<<3|0)): self._SA(self._PC);self._INCPC();
-            elif (self._IR == (0x90<<3|1)):
-                self._SA(self._PC);self._AD=self._PC+self._GD();
-                if((self._P&0x1)!=0x0):self._FETCH();
-            elif (self._IR == (0x90<<3|2)):
-                self._SA((self._PC&0xFF00)|(self._AD&0x00FF));
-                if((self._AD&0xFF00)==(self._PC&0xFF00)):self._PC=self._AD;self._irq_pip>>=1;self._nmi_pip>>=1;self._FETCH();
-            elif (self._IR == (0x90<<3|3)): self._PC=self._AD;self._FETCH();
-            elif (self._IR == (0x90<<3|4)): assert(False);
-            elif (self._IR == (0x90<<3|5)): assert(False);
-            elif (self._IR == (0x90<<3|6)): assert(False);
-            elif (self._IR == (0x90<<3|7)): assert(False);
-
-            # STA (zp),y
-            elif (self._IR == (0x91<<3|0)): self._SA(self._PC);self._INCPC();
-            elif (self._IR == (0x91<<3|1)): self._AD=self._GD();self._SA(self._AD);
-            elif (self._IR == (0x91<<3|2)): self._SA((self._AD+1)&0xFF);self._AD=self._GD();
-            elif (self._IR == (0x91<<3|3)): self._AD|=self._GD()<<8;self._SA((self._AD&0xFF00)|((self._AD+self._Y)&0xFF));
-            elif (self._IR == (0x91<<3|4)): self._SA(self._AD+self._Y);self._SD(self._A);self._WR();
-            elif (self._IR == (0x91<<3|5)): self._FETCH();
-            elif (self._IR == (0x91<<3|6)): assert(False);
-            elif (self._IR == (0x91<<3|7)): assert(False);
-
-            # STA (zp)
-            elif (self._IR == (0x92<<3|0)): self._SA(self._PC);self._INCPC();
-            elif (self._IR == (0x92<<3|1)): self._AD=self._GD();self._SA(self._AD);
-            elif (self._IR == (0x92<<3|2)): self._SA((self._AD+1)&0xFF);self._AD=self._GD();
-            elif (self._IR == (0x92<<3|3)): self._AD|=self._GD()<<8;self._SA((self._AD&0xFF00)|((self._AD)&0xFF));
-            elif (self._IR == (0x92<<3|4)): self._SA(self._AD);self._SD(self._A);self._WR();
-            elif (self._IR == (0x92<<3|5)): self._FETCH();
-            elif (self._IR == (0x92<<3|6)): assert(False);
-            elif (self._IR == (0x92<<3|7)): assert(False);
-
-            # None
-            elif (self._IR == (0x93<<3|0)): assert(False);
-            elif (self._IR == (0x93<<3|1)): assert(False);
-            elif (self._IR == (0x93<<3|2)): assert(False);
-            elif (self._IR == (0x93<<3|3)): assert(False);
-            elif (self._IR == (0x93<<3|4)): assert(False);
-            elif (self._IR == (0x93<<3|5)): assert(False);
-            elif (self._IR == (0x93<<3|6)): assert(False);
-            elif (self._IR == (0x93<<3|7)): assert(False);
-
-            # STY zp,x
-            elif (self._IR == (0x94<<3|0)): self._SA(self._PC);self._INCPC();
-            elif (self._IR == (0x94<<3|1)): self._AD=self._GD();self._SA(self._AD);
-            elif (self._IR == (0x94<<3|2)): self._SA((self._AD+self._X)&0x00FF);self._SD(self._Y);self._WR();
-            elif (self._IR == (0x94<<3|3)): self._FETCH();
-            elif (self._IR == (0x94<<3|4)): assert(False);
-            elif (self._IR == (0x94<<3|5)): assert(False);
-            elif (self._IR == (0x94<<3|6)): assert(False);
-            elif (self._IR == (0x94<<3|7)): assert(False);
-
-            # STA zp,x
-            elif (self._IR == (0x95<<3|0)): self._SA(self._PC);self._INCPC();
-            elif (self._IR == (0x95<<3|1)): self._AD=self._GD();self._SA(self._AD);
-            elif (self._IR == (0x95<<3|2)): self._SA((self._AD+self._X)&0x00FF);self._SD(self._A);self._WR();
-            elif (self._IR == (0x95<<3|3)): self._FETCH();
-            elif (self._IR == (0x95<<3|4)): assert(False);
-            elif (self._IR == (0x95<<3|5)): assert(False);
-            elif (self._IR == (0x95<<3|6)): assert(False);
-            elif (self._IR == (0x95<<3|7)): assert(False);
-
-            # STX zp,y
-            elif (self._IR == (0x96<<3|0)): self._SA(self._PC);self._INCPC();
-            elif (self._IR == (0x96<<3|1)): self._AD=self._GD();self._SA(self._AD);
-            elif (self._IR == (0x96<<3|2)): self._SA((self._AD+self._Y)&0x00FF);self._SD(self._X);self._WR();
-            elif (self._IR == (0x96<<3|3)): self._FETCH();
-            elif (self._IR == (0x96<<3|4)): assert(False);
-            elif (self._IR == (0x96<<3|5)): assert(False);
-            elif (self._IR == (0x96<<3|6)): assert(False);
-            elif (self._IR == (0x96<<3|7)): assert(False);
-
-            # SMB1 zp
-            elif (self._IR == (0x97<<3|0)): self._SA(self._PC);self._INCPC();
-            elif (self._IR == (0x97<<3|1)): self._SA(0x00&self._GD());self._AD=self._GD();
-            elif (self._IR == (0x97<<3|2)): self._SA(0x00&self._AD);self._SD(self._GD()|(1<<1));self._WR();
-            elif (self._IR == (0x97<<3|3)): self._FETCH();
-            elif (self._IR == (0x97<<3|4)): assert(False);
-            elif (self._IR == (0x97<<3|5)): assert(False);
-            elif (self._IR == (0x97<<3|6)): assert(False);
-            elif (self._IR == (0x97<<3|7)): assert(False);
-
-            # TYA i
-            elif (self._IR == (0x98<<3|0)): self._SA(self._PC);
-            elif (self._IR == (0x98<<3|1)): self._A=self._Y;self._NZ(self._A);self._FETCH();
-            elif (self._IR == (0x98<<3|2)): assert(False);
-            elif (self._IR == (0x98<<3|3)): assert(False);
-            elif (self._IR == (0x98<<3|4)): assert(False);
-            elif (self._IR == (0x98<<3|5)): assert(False);
-            elif (self._IR == (0x98<<3|6)): assert(False);
-            elif (self._IR == (0x98<<3|7)): assert(False);
-
-            # STA a,y
-            elif (self._IR == (0x99<<3|0)): self._SA(self._PC);self._INCPC();
-            elif (self._IR == (0x99<<3|1)): self._SA(self._PC);self._INCPC();self._AD=self._GD();
-            elif (self._IR == (0x99<<3|2)): self._AD|=self._GD()<<8;self._SA((self._AD&0xFF00)|((self._AD+self._Y)&0xFF));
-            elif (self._IR == (0x99<<3|3)): self._SA(self._AD+self._Y);self._SD(self._A);self._WR();
-            elif (self._IR == (0x99<<3|4)): self._FETCH();
-            elif (self._IR == (0x99<<3|5)): assert(False);
-            elif (self._IR == (0x99<<3|6)): assert(False);
-            elif (self._IR == (0x99<<3|7)): assert(False);
-
-            # TXS i
-            elif (self._IR == (0x9a<<3|0)): self._SA(self._PC);
-            elif (self._IR == (0x9a<<3|1)): self._S=self._X;self._FETCH();
-            elif (self._IR == (0x9a<<3|2)): assert(False);
-            elif (self._IR == (0x9a<<3|3)): assert(False);
-            elif (self._IR == (0x9a<<3|4)): assert(False);
-            elif (self._IR == (0x9a<<3|5)): assert(False);
-            elif (self._IR == (0x9a<<3|6)): assert(False);
-            elif (self._IR == (0x9a<<3|7)): assert(False);
-
-            # None
-            elif (self._IR == (0x9b<<3|0)): assert(False);
-            elif (self._IR == (0x9b<<3|1)): assert(False);
-            elif (self._IR == (0x9b<<3|2)): assert(False);
-            elif (self._IR == (0x9b<<3|3)): assert(False);
-            elif (self._IR == (0x9b<<3|4)): assert(False);
-            elif (self._IR == (0x9b<<3|5)): assert(False);
-            elif (self._IR == (0x9b<<3|6)): assert(False);
-            elif (self._IR == (0x9b<<3|7)): assert(False);
-
-            # STZ a
-            elif (self._IR == (0x9c<<3|0)): self._SA(self._PC);self._INCPC();
-            elif (self._IR == (0x9c<<3|1)): self._SA(self._PC);self._INCPC();self._AD=self._GD();
-            elif (self._IR == (0x9c<<3|2)): self._SA((self._GD()<<8)|self._AD);self._SD(0x00);self._WR();
-            elif (self._IR == (0x9c<<3|3)): self._FETCH();
-            elif (self._IR == (0x9c<<3|4)): assert(False);
-            elif (self._IR == (0x9c<<3|5)): assert(False);
-            elif (self._IR == (0x9c<<3|6)): assert(False);
-            elif (self._IR == (0x9c<<3|7)): assert(False);
-
-            # STA a,x
-            elif (self._IR == (0x9d<<3|0)): self._SA(self._PC);self._INCPC();
-            elif (self._IR == (0x9d<<3|1)): self._SA(self._PC);self._INCPC();self._AD=self._GD();
-            elif (self._IR == (0x9d<<3|2)): self._AD|=self._GD()<<8;self._SA((self._AD&0xFF00)|((self._AD+self._X)&0xFF));
-            elif (self._IR == (0x9d<<3|3)): self._SA(self._AD+self._X);self._SD(self._A);self._WR();
-            elif (self._IR == (0x9d<<3|4)): self._FETCH();
-            elif (self._IR == (0x9d<<3|5)): assert(False);
-            elif (self._IR == (0x9d<<3|6)): assert(False);
-            elif (self._IR == (0x9d<<3|7)): assert(False);
-
-            # STZ a,x
-            elif (self._IR == (0x9e<<3|0)): self._SA(self._PC);self._INCPC();
-            elif (self._IR == (0x9e<<3|1)): self._SA(self._PC);self._INCPC();self._AD=self._GD();
-            elif (self._IR == (0x9e<<3|2)): self._AD|=self._GD()<<8;self._SA((self._AD&0xFF00)|((self._AD+self._X)&0xFF));
-            elif (self._IR == (0x9e<<3|3)): self._SA(self._AD+self._X);self._SD(0x00);self._WR();
-            elif (self._IR == (0x9e<<3|4)): self._FETCH();
-            elif (self._IR == (0x9e<<3|5)): assert(False);
-            elif (self._IR == (0x9e<<3|6)): assert(False);
-            elif (self._IR == (0x9e<<3|7)): assert(False);
-
-            # BBS1 r
-            elif (self._IR == (0x9f<<3|0)): self._SA(self._PC);self._INCPC();
-            elif (self._IR == (0x9f<<3|1)):
-                self._SA(self._PC);
-                if((self._GD()&0x02)==0x02):self._INCPC();self._AD=self._PC+self._GD();self._FETCH();
-                else:self._FETCH();
-            elif (self._IR == (0x9f<<3|2)): assert(False);
-            elif (self._IR == (0x9f<<3|3)): assert(False);
-            elif (self._IR == (0x9f<<3|4)): assert(False);
-            elif (self._IR == (0x9f<<3|5)): assert(False);
-            elif (self._IR == (0x9f<<3|6)): assert(False);
-            elif (self._IR == (0x9f<<3|7)): assert(False);
-
-
-
-            # LDY #
-            elif (self._IR == (0xa0<<3|0)): self._SA(self._PC);self._INCPC();
-            elif (self._IR == (0xa0<<3|1)): self._Y=self._GD();self._NZ(self._Y);self._FETCH();
-            elif (self._IR == (0xa0<<3|2)): assert(False);
-            elif (self._IR == (0xa0<<3|3)): assert(False);
-            elif (self._IR == (0xa0<<3|4)): assert(False);
-            elif (self._IR == (0xa0<<3|5)): assert(False);
-            elif (self._IR == (0xa0<<3|6)): assert(False);
-            elif (self._IR == (0xa0<<3|7)): assert(False);
-
-            # LDA (zp,x)
-            elif (self._IR == (0xa1<<3|0)): self._SA(self._PC);self._INCPC();
-            elif (self._IR == (0xa1<<3|1)): self._AD=self._GD();self._SA(self._AD);
-            elif (self._IR == (0xa1<<3|2)): self._AD=(self._AD+self._X)&0xFF;self._SA(self._AD);
-            elif (self._IR == (0xa1<<3|3)): self._SA((self._AD+1)&0xFF);self._AD=self._GD();
-            elif (self._IR == (0xa1<<3|4)): self._SA((self._GD()<<8)|self._AD);
-            elif (self._IR == (0xa1<<3|5)): self._A=self._GD();self._NZ(self._A);self._FETCH();
-            elif (self._IR == (0xa1<<3|6)): assert(False);
-            elif (self._IR == (0xa1<<3|7)): assert(False);
-
-            # LDX #
-            elif (self._IR == (0xa3<<3|0)): self._SA(self._PC);self._INCPC();
-            elif (self._IR == (0xa2<<3|1)): self._X=self._GD();self._NZ(self._X);self._FETCH();
-            elif (self._IR == (0xa2<<3|2)): assert(False);
-            elif (self._IR == (0xa2<<3|3)): assert(False);
-            elif (self._IR == (0xa2<<3|4)): assert(False);
-            elif (self._IR == (0xa2<<3|5)): assert(False);
-            elif (self._IR == (0xa2<<3|6)): assert(False);
-            elif (self._IR == (0xa2<<3|7)): assert(False);
-
-            # None
-            elif (self._IR == (0xa3<<3|0)): assert(False);
-            elif (self._IR == (0xa3<<3|1)): assert(False);
-            elif (self._IR == (0xa3<<3|2)): assert(False);
-            elif (self._IR == (0xa3<<3|3)): assert(False);
-            elif (self._IR == (0xa3<<3|4)): assert(False);
-            elif (self._IR == (0xa3<<3|5)): assert(False);
-            elif (self._IR == (0xa3<<3|6)): assert(False);
-            elif (self._IR == (0xa3<<3|7)): assert(False);
-
-            # LDY zp
-            elif (self._IR == (0xa4<<3|0)): self._SA(self._PC);self._INCPC();
-            elif (self._IR == (0xa4<<3|1)): self._SA(self._GD());
-            elif (self._IR == (0xa4<<3|2)): self._Y=self._GD();self._NZ(self._Y);self._FETCH();
-            elif (self._IR == (0xa4<<3|3)): assert(False);
-            elif (self._IR == (0xa4<<3|4)): assert(False);
-            elif (self._IR == (0xa4<<3|5)): assert(False);
-            elif (self._IR == (0xa4<<3|6)): assert(False);
-            elif (self._IR == (0xa4<<3|7)): assert(False);
-
-            # LDA zp
-            elif (self._IR == (0xa5<<3|0)): self._SA(self._PC);self._INCPC();
-            elif (self._IR == (0xa5<<3|1)): self._SA(self._GD());
-            elif (self._IR == (0xa5<<3|2)): self._A=self._GD();self._NZ(self._A);self._FETCH();
-            elif (self._IR == (0xa5<<3|3)): assert(False);
-            elif (self._IR == (0xa5<<3|4)): assert(False);
-            elif (self._IR == (0xa5<<3|5)): assert(False);
-            elif (self._IR == (0xa5<<3|6)): assert(False);
-            elif (self._IR == (0xa5<<3|7)): assert(False);
-
-            # LDX zp
-            elif (self._IR == (0xa6<<3|0)): self._SA(self._PC);self._INCPC();
-            elif (self._IR == (0xa6<<3|1)): self._SA(self._GD());
-            elif (self._IR == (0xa6<<3|2)): self._X=self._GD();self._NZ(self._X);self._FETCH();
-            elif (self._IR == (0xa6<<3|3)): assert(False);
-            elif (self._IR == (0xa6<<3|4)): assert(False);
-            elif (self._IR == (0xa6<<3|5)): assert(False);
-            elif (self._IR == (0xa6<<3|6)): assert(False);
-            elif (self._IR == (0xa6<<3|7)): assert(False);
-
-            # SMB2 zp
-            elif (self._IR == (0xa7<<3|0)): self._SA(self._PC);self._INCPC();
-            elif (self._IR == (0xa7<<3|1)): self._SA(0x00&self._GD());self._AD=self._GD();
-            elif (self._IR == (0xa7<<3|2)): self._SA(0x00&self._AD);self._SD(self._GD()|(1<<2));self._WR();
-            elif (self._IR == (0xa7<<3|3)): self._FETCH();
-            elif (self._IR == (0xa7<<3|4)): assert(False);
-            elif (self._IR == (0xa7<<3|5)): assert(False);
-            elif (self._IR == (0xa7<<3|6)): assert(False);
-            elif (self._IR == (0xa7<<3|7)): assert(False);
-
-            # TAY i
-            elif (self._IR == (0xa8<<3|0)): self._SA(self._PC);
-            elif (self._IR == (0xa8<<3|1)): self._Y=self._A;self._NZ(self._Y);self._FETCH();
-            elif (self._IR == (0xa8<<3|2)): assert(False);
-            elif (self._IR == (0xa8<<3|3)): assert(False);
-            elif (self._IR == (0xa8<<3|4)): assert(False);
-            elif (self._IR == (0xa8<<3|5)): assert(False);
-            elif (self._IR == (0xa8<<3|6)): assert(False);
-            elif (self._IR == (0xa8<<3|7)): assert(False);
-
-            # LDA #
-            elif (self._IR == (0xa9<<3|0)): self._SA(self._PC);self._INCPC();
-            elif (self._IR == (0xa9<<3|1)): self._A=self._GD();self._NZ(self._A);self._FETCH();
-            elif (self._IR == (0xa9<<3|2)): assert(False);
-            elif (self._IR == (0xa9<<3|3)): assert(False);
-            elif (self._IR == (0xa9<<3|4)): assert(False);
-            elif (self._IR == (0xa9<<3|5)): assert(False);
-            elif (self._IR == (0xa9<<3|6)): assert(False);
-            elif (self._IR == (0xa9<<3|7)): assert(False);
-
-            # TAX i
-            elif (self._IR == (0xaa<<3|0)): self._SA(self._PC);
-            elif (self._IR == (0xaa<<3|1)): self._X=self._A;self._NZ(self._X);self._FETCH();
-            elif (self._IR == (0xaa<<3|2)): assert(False);
-            elif (self._IR == (0xaa<<3|3)): assert(False);
-            elif (self._IR == (0xaa<<3|4)): assert(False);
-            elif (self._IR == (0xaa<<3|5)): assert(False);
-            elif (self._IR == (0xaa<<3|6)): assert(False);
-            elif (self._IR == (0xaa<<3|7)): assert(False);
-
-            # None
-            elif (self._IR == (0xab<<3|0)): assert(False);
-            elif (self._IR == (0xab<<3|1)): assert(False);
-            elif (self._IR == (0xab<<3|2)): assert(False);
-            elif (self._IR == (0xab<<3|3)): assert(False);
-            elif (self._IR == (0xab<<3|4)): assert(False);
-            elif (self._IR == (0xab<<3|5)): assert(False);
-            elif (self._IR == (0xab<<3|6)): assert(False);
-            elif (self._IR == (0xab<<3|7)): assert(False);
-
-            # LDY A
-            elif (self._IR == (0xac<<3|0)): self._SA(self._PC);self._INCPC();
-            elif (self._IR == (0xac<<3|1)): self._SA(self._PC);self._INCPC();self._AD=self._GD();
-            elif (self._IR == (0xac<<3|2)): self._SA((self._GD()<<8)|self._AD);
-            elif (self._IR == (0xac<<3|3)): self._Y=self._GD();self._NZ(self._Y);self._FETCH();
-            elif (self._IR == (0xac<<3|4)): assert(False);
-            elif (self._IR == (0xac<<3|5)): assert(False);
-            elif (self._IR == (0xac<<3|6)): assert(False);
-            elif (self._IR == (0xac<<3|7)): assert(False);
-
-            # LDA a
-            elif (self._IR == (0xad<<3|0)): self._SA(self._PC);self._INCPC();
-            elif (self._IR == (0xad<<3|1)): self._SA(self._PC);self._INCPC();self._AD=self._GD();
-            elif (self._IR == (0xad<<3|2)): self._SA((self._GD()<<8)|self._AD);
-            elif (self._IR == (0xad<<3|3)): self._A=self._GD();self._NZ(self._A);self._FETCH();
-            elif (self._IR == (0xad<<3|4)): assert(False);
-            elif (self._IR == (0xad<<3|5)): assert(False);
-            elif (self._IR == (0xad<<3|6)): assert(False);
-            elif (self._IR == (0xad<<3|7)): assert(False);
-
-            # LDX a
-            elif (self._IR == (0xae<<3|0)): self._SA(self._PC);self._INCPC();
-            elif (self._IR == (0xae<<3|1)): self._SA(self._PC);self._INCPC();self._AD=self._GD();
-            elif (self._IR == (0xae<<3|2)): self._SA((self._GD()<<8)|self._AD);
-            elif (self._IR == (0xae<<3|3)): self._X=self._GD();self._NZ(self._X);self._FETCH();
-            elif (self._IR == (0xae<<3|4)): assert(False);
-            elif (self._IR == (0xae<<3|5)): assert(False);
-            elif (self._IR == (0xae<<3|6)): assert(False);
-            elif (self._IR == (0xae<<3|7)): assert(False);
-
-            # BBS2 r
-            elif (self._IR == (0xaf<<3|0)): self._SA(self._PC);self._INCPC();
-            elif (self._IR == (0xaf<<3|1)):
-                self._SA(self._PC);
-                if((self._GD()&0x04)==0x04):self._INCPC();self._AD=self._PC+self._GD();self._FETCH();
-                else:self._FETCH();
-            elif (self._IR == (0xaf<<3|2)): assert(False);
-            elif (self._IR == (0xaf<<3|3)): assert(False);
-            elif (self._IR == (0xaf<<3|4)): assert(False);
-            elif (self._IR == (0xaf<<3|5)): assert(False);
-            elif (self._IR == (0xaf<<3|6)): assert(False);
-            elif (self._IR == (0xaf<<3|7)): assert(False);
-
-
-
-            # BCS r
-            elif (self._IR == (0xb0<<3|0)): self._SA(self._PC);self._INCPC();
-            elif (self._IR == (0xb0<<3|1)):
-                self._SA(self._PC);self._AD=self._PC+self._GD();
-                if((self._P&0x1)!=0x1):self._FETCH();
-            elif (self._IR == (0xb0<<3|2)):
-                self._SA((self._PC&0xFF00)|(self._AD&0x00FF));
-                if((self._AD&0xFF00)==(self._PC&0xFF00)):self._PC=self._AD;self._irq_pip>>=1;self._nmi_pip>>=1;self._FETCH();
-            elif (self._IR == (0xb0<<3|3)): self._PC=self._AD;self._FETCH();
-            elif (self._IR == (0xb0<<3|4)): assert(False);
-            elif (self._IR == (0xb0<<3|5)): assert(False);
-            elif (self._IR == (0xb0<<3|6)): assert(False);
-            elif (self._IR == (0xb0<<3|7)): assert(False);
-
-            # LDA (zp),y
-            elif (self._IR == (0xb1<<3|0)): self._SA(self._PC);self._INCPC();
-            elif (self._IR == (0xb1<<3|1)): self._AD=self._GD();self._SA(self._AD);
-            elif (self._IR == (0xb1<<3|2)): self._SA((self._AD+1)&0xFF);self._AD=self._GD();
-            elif (self._IR == (0xb1<<3|3)): self._AD|=self._GD()<<8;self._SA((self._AD&0xFF00)|((self._AD+self._Y)&0xFF));self._IR+=(~((self._AD>>8)-((self._AD+self._Y)>>8)))&1;
-            elif (self._IR == (0xb1<<3|4)): self._SA(self._AD+self._Y);
-            elif (self._IR == (0xb1<<3|5)): self._A=self._GD();self._NZ(self._A);self._FETCH();
-            elif (self._IR == (0xb1<<3|6)): assert(False);
-            elif (self._IR == (0xb1<<3|7)): assert(False);
-
-            # LDA (zp)
-            elif (self._IR == (0xb2<<3|0)): self._SA(self._PC);self._INCPC();
-            elif (self._IR == (0xb2<<3|1)): self._AD=self._GD();self._SA(self._AD);
-            elif (self._IR == (0xb2<<3|2)): self._SA((self._AD+1)&0xFF);self._AD=self._GD();
-            elif (self._IR == (0xb2<<3|3)): self._AD|=self._GD()<<8;self._SA((self._AD&0xFF00)|((self._AD)&0xFF));self._IR+=(~((self._AD>>8)-((self._AD)>>8)))&1;
-            elif (self._IR == (0xb2<<3|4)): self._SA(self._AD);
-            elif (self._IR == (0xb2<<3|5)): self._A=self._GD();self._NZ(self._A);self._FETCH();
-            elif (self._IR == (0xb2<<3|6)): assert(False);
-            elif (self._IR == (0xb2<<3|7)): assert(False);
-
-            # None
-            elif (self._IR == (0xb3<<3|0)): assert(False);
-            elif (self._IR == (0xb3<<3|1)): assert(False);
-            elif (self._IR == (0xb3<<3|2)): assert(False);
-            elif (self._IR == (0xb3<<3|3)): assert(False);
-            elif (self._IR == (0xb3<<3|4)): assert(False);
-            elif (self._IR == (0xb3<<3|5)): assert(False);
-            elif (self._IR == (0xb3<<3|6)): assert(False);
-            elif (self._IR == (0xb3<<3|7)): assert(False);
-
-            # LDY zp,x
-            elif (self._IR == (0xb4<<3|0)): self._SA(self._PC);self._INCPC();
-            elif (self._IR == (0xb4<<3|1)): self._AD=self._GD();self._SA(self._AD);
-            elif (self._IR == (0xb4<<3|2)): self._SA((self._AD+self._X)&0x00FF);
-            elif (self._IR == (0xb4<<3|3)): self._Y=self._GD();self._NZ(self._Y);self._FETCH();
-            elif (self._IR == (0xb4<<3|4)): assert(False);
-            elif (self._IR == (0xb4<<3|5)): assert(False);
-            elif (self._IR == (0xb4<<3|6)): assert(False);
-            elif (self._IR == (0xb4<<3|7)): assert(False);
-
-            # LDA zp,x
-            elif (self._IR == (0xb5<<3|0)): self._SA(self._PC);self._INCPC();
-            elif (self._IR == (0xb5<<3|1)): self._AD=self._GD();self._SA(self._AD);
-            elif (self._IR == (0xb5<<3|2)): self._SA((self._AD+self._X)&0x00FF);
-            elif (self._IR == (0xb5<<3|3)): self._A=self._GD();self._NZ(self._A);self._FETCH();
-            elif (self._IR == (0xb5<<3|4)): assert(False);
-            elif (self._IR == (0xb5<<3|5)): assert(False);
-            elif (self._IR == (0xb5<<3|6)): assert(False);
-            elif (self._IR == (0xb5<<3|7)): assert(False);
-
-            # LDX zp,y
-            elif (self._IR == (0xb6<<3|0)): self._SA(self._PC);self._INCPC();
-            elif (self._IR == (0xb6<<3|1)): self._AD=self._GD();self._SA(self._AD);
-            elif (self._IR == (0xb6<<3|2)): self._SA((self._AD+self._Y)&0x00FF);
-            elif (self._IR == (0xb6<<3|3)): self._X=self._GD();self._NZ(self._X);self._FETCH();
-            elif (self._IR == (0xb6<<3|4)): assert(False);
-            elif (self._IR == (0xb6<<3|5)): assert(False);
-            elif (self._IR == (0xb6<<3|6)): assert(False);
-            elif (self._IR == (0xb6<<3|7)): assert(False);
-
-            # SMB3 zp
-            elif (self._IR == (0xb7<<3|0)): self._SA(self._PC);self._INCPC();
-            elif (self._IR == (0xb7<<3|1)): self._SA(0x00&self._GD());self._AD=self._GD();
-            elif (self._IR == (0xb7<<3|2)): self._SA(0x00&self._AD);self._SD(self._GD()|(1<<3));self._WR();
-            elif (self._IR == (0xb7<<3|3)): self._FETCH();
-            elif (self._IR == (0xb7<<3|4)): assert(False);
-            elif (self._IR == (0xb7<<3|5)): assert(False);
-            elif (self._IR == (0xb7<<3|6)): assert(False);
-            elif (self._IR == (0xb7<<3|7)): assert(False);
-
-            # CLV i
-            elif (self._IR == (0xb8<<3|0)): self._SA(self._PC);
-            elif (self._IR == (0xb8<<3|1)): self._P&=~M65C02_VF;self._FETCH();
-            elif (self._IR == (0xb8<<3|2)): assert(False);
-            elif (self._IR == (0xb8<<3|3)): assert(False);
-            elif (self._IR == (0xb8<<3|4)): assert(False);
-            elif (self._IR == (0xb8<<3|5)): assert(False);
-            elif (self._IR == (0xb8<<3|6)): assert(False);
-            elif (self._IR == (0xb8<<3|7)): assert(False);
-
-            # LDA A,y
-            elif (self._IR == (0xb9<<3|0)): self._SA(self._PC);self._INCPC();
-            elif (self._IR == (0xb9<<3|1)): self._SA(self._PC);self._INCPC();self._AD=self._GD();
-            elif (self._IR == (0xb9<<3|2)): self._AD|=self._GD()<<8;self._SA((self._AD&0xFF00)|((self._AD+self._Y)&0xFF));self._IR+=(~((self._AD>>8)-((self._AD+self._Y)>>8)))&1;
-            elif (self._IR == (0xb9<<3|3)): self._SA(self._AD+self._Y);
-            elif (self._IR == (0xb9<<3|4)): self._A=self._GD();self._NZ(self._A);self._FETCH();
-            elif (self._IR == (0xb9<<3|5)): assert(False);
-            elif (self._IR == (0xb9<<3|6)): assert(False);
-            elif (self._IR == (0xb9<<3|7)): assert(False);
-
-            # TSX i
-            elif (self._IR == (0xba<<3|0)): self._SA(self._PC);
-            elif (self._IR == (0xba<<3|1)): self._X=self._S;self._NZ(self._X);self._FETCH();
-            elif (self._IR == (0xba<<3|2)): assert(False);
-            elif (self._IR == (0xba<<3|3)): assert(False);
-            elif (self._IR == (0xba<<3|4)): assert(False);
-            elif (self._IR == (0xba<<3|5)): assert(False);
-            elif (self._IR == (0xba<<3|6)): assert(False);
-            elif (self._IR == (0xba<<3|7)): assert(False);
-
-            # None
-            elif (self._IR == (0xbb<<3|0)): assert(False);
-            elif (self._IR == (0xbb<<3|1)): assert(False);
-            elif (self._IR == (0xbb<<3|2)): assert(False);
-            elif (self._IR == (0xbb<<3|3)): assert(False);
-            elif (self._IR == (0xbb<<3|4)): assert(False);
-            elif (self._IR == (0xbb<<3|5)): assert(False);
-            elif (self._IR == (0xbb<<3|6)): assert(False);
-            elif (self._IR == (0xbb<<3|7)): assert(False);
-
-            # LDY a,x
-            elif (self._IR == (0xbc<<3|0)): self._SA(self._PC);self._INCPC();
-            elif (self._IR == (0xbc<<3|1)): self._SA(self._PC);self._INCPC();self._AD=self._GD();
-            elif (self._IR == (0xbc<<3|2)): self._AD|=self._GD()<<8;self._SA((self._AD&0xFF00)|((self._AD+self._X)&0xFF));self._IR+=(~((self._AD>>8)-((self._AD+self._X)>>8)))&1;
-            elif (self._IR == (0xbc<<3|3)): self._SA(self._AD+self._X);
-            elif (self._IR == (0xbc<<3|4)): self._Y=self._GD();self._NZ(self._Y);self._FETCH();
-            elif (self._IR == (0xbc<<3|5)): assert(False);
-            elif (self._IR == (0xbc<<3|6)): assert(False);
-            elif (self._IR == (0xbc<<3|7)): assert(False);
-
-            # LDA a,x
-            elif (self._IR == (0xbd<<3|0)): self._SA(self._PC);self._INCPC();
-            elif (self._IR == (0xbd<<3|1)): self._SA(self._PC);self._INCPC();self._AD=self._GD();
-            elif (self._IR == (0xbd<<3|2)): self._AD|=self._GD()<<8;self._SA((self._AD&0xFF00)|((self._AD+self._X)&0xFF));self._IR+=(~((self._AD>>8)-((self._AD+self._X)>>8)))&1;
-            elif (self._IR == (0xbd<<3|3)): self._SA(self._AD+self._X);
-            elif (self._IR == (0xbd<<3|4)): self._A=self._GD();self._NZ(self._A);self._FETCH();
-            elif (self._IR == (0xbd<<3|5)): assert(False);
-            elif (self._IR == (0xbd<<3|6)): assert(False);
-            elif (self._IR == (0xbd<<3|7)): assert(False);
-
-            # LDX a,y
-            elif (self._IR == (0xbe<<3|0)): self._SA(self._PC);self._INCPC();
-            elif (self._IR == (0xbe<<3|1)): self._SA(self._PC);self._INCPC();self._AD=self._GD();
-            elif (self._IR == (0xbe<<3|2)): self._AD|=self._GD()<<8;self._SA((self._AD&0xFF00)|((self._AD+self._Y)&0xFF));self._IR+=(~((self._AD>>8)-((self._AD+self._Y)>>8)))&1;
-            elif (self._IR == (0xbe<<3|3)): self._SA(self._AD+self._Y);
-            elif (self._IR == (0xbe<<3|4)): self._X=self._GD();self._NZ(self._X);self._FETCH();
-            elif (self._IR == (0xbe<<3|5)): assert(False);
-            elif (self._IR == (0xbe<<3|6)): assert(False);
-            elif (self._IR == (0xbe<<3|7)): assert(False);
-
-            # BBS3 r
-            elif (self._IR == (0xbf<<3|0)): self._SA(self._PC);self._INCPC();
-            elif (self._IR == (0xbf<<3|1)):
-                self._SA(self._PC);
-                if((self._GD()&0x08)==0x08):self._INCPC();self._AD=self._PC+self._GD();self._FETCH();
-                else:self._FETCH();
-            elif (self._IR == (0xbf<<3|2)): assert(False);
-            elif (self._IR == (0xbf<<3|3)): assert(False);
-            elif (self._IR == (0xbf<<3|4)): assert(False);
-            elif (self._IR == (0xbf<<3|5)): assert(False);
-            elif (self._IR == (0xbf<<3|6)): assert(False);
-            elif (self._IR == (0xbf<<3|7)): assert(False);
-
-
-
-            # CPY #
-            elif (self._IR == (0xc0<<3|0)): self._SA(self._PC);self._INCPC();
-            elif (self._IR == (0xc0<<3|1)): self._cmp(self._Y, self._GD());self._FETCH();
-            elif (self._IR == (0xc0<<3|2)): assert(False);
-            elif (self._IR == (0xc0<<3|3)): assert(False);
-            elif (self._IR == (0xc0<<3|4)): assert(False);
-            elif (self._IR == (0xc0<<3|5)): assert(False);
-            elif (self._IR == (0xc0<<3|6)): assert(False);
-            elif (self._IR == (0xc0<<3|7)): assert(False);
-
-            # CMP (zp,x)
-            elif (self._IR == (0xc1<<3|0)): self._SA(self._PC);self._INCPC();
-            elif (self._IR == (0xc1<<3|1)): self._AD=self._GD();self._SA(self._AD);
-            elif (self._IR == (0xc1<<3|2)): self._AD=(self._AD+self._X)&0xFF;self._SA(self._AD);
-            elif (self._IR == (0xc1<<3|3)): self._SA((self._AD+1)&0xFF);self._AD=self._GD();
-            elif (self._IR == (0xc1<<3|4)): self._SA((self._GD()<<8)|self._AD);
-            elif (self._IR == (0xc1<<3|5)): self._cmp(self._A, self._GD());self._FETCH();
-            elif (self._IR == (0xc1<<3|6)): assert(False);
-            elif (self._IR == (0xc1<<3|7)): assert(False);
-
-            # None
-            elif (self._IR == (0xc2<<3|0)): assert(False);
-            elif (self._IR == (0xc2<<3|1)): assert(False);
-            elif (self._IR == (0xc2<<3|2)): assert(False);
-            elif (self._IR == (0xc2<<3|3)): assert(False);
-            elif (self._IR == (0xc2<<3|4)): assert(False);
-            elif (self._IR == (0xc2<<3|5)): assert(False);
-            elif (self._IR == (0xc2<<3|6)): assert(False);
-            elif (self._IR == (0xc2<<3|7)): assert(False);
-
-            # None
-            elif (self._IR == (0xc3<<3|0)): assert(False);
-            elif (self._IR == (0xc3<<3|1)): assert(False);
-            elif (self._IR == (0xc3<<3|2)): assert(False);
-            elif (self._IR == (0xc3<<3|3)): assert(False);
-            elif (self._IR == (0xc3<<3|4)): assert(False);
-            elif (self._IR == (0xc3<<3|5)): assert(False);
-            elif (self._IR == (0xc3<<3|6)): assert(False);
-            elif (self._IR == (0xc3<<3|7)): assert(False);
-
-            # CPY zp
-            elif (self._IR == (0xc4<<3|0)): self._SA(self._PC);self._INCPC();
-            elif (self._IR == (0xc4<<3|1)): self._SA(self._GD());
-            elif (self._IR == (0xc4<<3|2)): self._cmp(self._Y, self._GD());self._FETCH();
-            elif (self._IR == (0xc4<<3|3)): assert(False);
-            elif (self._IR == (0xc4<<3|4)): assert(False);
-            elif (self._IR == (0xc4<<3|5)): assert(False);
-            elif (self._IR == (0xc4<<3|6)): assert(False);
-            elif (self._IR == (0xc4<<3|7)): assert(False);
-
-            # CMP zp
-            elif (self._IR == (0xc5<<3|0)): self._SA(self._PC);self._INCPC();
-            elif (self._IR == (0xc5<<3|1)): self._SA(self._GD());
-            elif (self._IR == (0xc5<<3|2)): self._cmp(self._A, self._GD());self._FETCH();
-            elif (self._IR == (0xc5<<3|3)): assert(False);
-            elif (self._IR == (0xc5<<3|4)): assert(False);
-            elif (self._IR == (0xc5<<3|5)): assert(False);
-            elif (self._IR == (0xc5<<3|6)): assert(False);
-            elif (self._IR == (0xc5<<3|7)): assert(False);
-
-            # DEC zp
-            elif (self._IR == (0xc6<<3|0)): self._SA(self._PC);self._INCPC();
-            elif (self._IR == (0xc6<<3|1)): self._SA(self._GD());
-            elif (self._IR == (0xc6<<3|2)): self._AD=self._GD();self._WR();
-            elif (self._IR == (0xc6<<3|3)): self._DECAD();self._NZ(self._AD);self._SD(self._AD);self._WR();
-            elif (self._IR == (0xc6<<3|4)): self._FETCH();
-            elif (self._IR == (0xc6<<3|5)): assert(False);
-            elif (self._IR == (0xc6<<3|6)): assert(False);
-            elif (self._IR == (0xc6<<3|7)): assert(False);
-
-            # SMB4 zp
-            elif (self._IR == (0xc7<<3|0)): self._SA(self._PC);self._INCPC();
-            elif (self._IR == (0xc7<<3|1)): self._SA(0x00&self._GD());self._AD=self._GD();
-            elif (self._IR == (0xc7<<3|2)): self._SA(0x00&self._AD);self._SD(self._GD()|(1<<4));self._WR();
-            elif (self._IR == (0xc7<<3|3)): self._FETCH();
-            elif (self._IR == (0xc7<<3|4)): assert(False);
-            elif (self._IR == (0xc7<<3|5)): assert(False);
-            elif (self._IR == (0xc7<<3|6)): assert(False);
-            elif (self._IR == (0xc7<<3|7)): assert(False);
-
-            # INY i
-            elif (self._IR == (0xc8<<3|0)): self._SA(self._PC);
-            elif (self._IR == (0xc8<<3|1)): self._INY();self._NZ(self._Y);self._FETCH();
-            elif (self._IR == (0xc8<<3|2)): assert(False);
-            elif (self._IR == (0xc8<<3|3)): assert(False);
-            elif (self._IR == (0xc8<<3|4)): assert(False);
-            elif (self._IR == (0xc8<<3|5)): assert(False);
-            elif (self._IR == (0xc8<<3|6)): assert(False);
-            elif (self._IR == (0xc8<<3|7)): assert(False);
-
-            # CMP #
-            elif (self._IR == (0xc9<<3|0)): self._SA(self._PC);self._INCPC();
-            elif (self._IR == (0xc9<<3|1)): self._cmp(self._A, self._GD());self._FETCH();
-            elif (self._IR == (0xc9<<3|2)): assert(False);
-            elif (self._IR == (0xc9<<3|3)): assert(False);
-            elif (self._IR == (0xc9<<3|4)): assert(False);
-            elif (self._IR == (0xc9<<3|5)): assert(False);
-            elif (self._IR == (0xc9<<3|6)): assert(False);
-            elif (self._IR == (0xc9<<3|7)): assert(False);
-
-            # DEX i
-            elif (self._IR == (0xca<<3|0)): self._SA(self._PC);
-            elif (self._IR == (0xca<<3|1)): self._DEX();self._NZ(self._X);self._FETCH();
-            elif (self._IR == (0xca<<3|2)): assert(False);
-            elif (self._IR == (0xca<<3|3)): assert(False);
-            elif (self._IR == (0xca<<3|4)): assert(False);
-            elif (self._IR == (0xca<<3|5)): assert(False);
-            elif (self._IR == (0xca<<3|6)): assert(False);
-            elif (self._IR == (0xca<<3|7)): assert(False);
-
-            # WAI I
-            elif (self._IR == (0xcb<<3|0)): assert(False);
-            elif (self._IR == (0xcb<<3|1)): assert(False);
-            elif (self._IR == (0xcb<<3|2)): assert(False);
-            elif (self._IR == (0xcb<<3|3)): assert(False);
-            elif (self._IR == (0xcb<<3|4)): assert(False);
-            elif (self._IR == (0xcb<<3|5)): assert(False);
-            elif (self._IR == (0xcb<<3|6)): assert(False);
-            elif (self._IR == (0xcb<<3|7)): assert(False);
-
-            # CPY a
-            elif (self._IR == (0xcc<<3|0)): self._SA(self._PC);self._INCPC();
-            elif (self._IR == (0xcc<<3|1)): self._SA(self._PC);self._INCPC();self._AD=self._GD();
-            elif (self._IR == (0xcc<<3|2)): self._SA((self._GD()<<8)|self._AD);
-            elif (self._IR == (0xcc<<3|3)): self._cmp(self._Y, self._GD());self._FETCH();
-            elif (self._IR == (0xcc<<3|4)): assert(False);
-            elif (self._IR == (0xcc<<3|5)): assert(False);
-            elif (self._IR == (0xcc<<3|6)): assert(False);
-            elif (self._IR == (0xcc<<3|7)): assert(False);
-
-            # CMP a
-            elif (self._IR == (0xcd<<3|0)): self._SA(self._PC);self._INCPC();
-            elif (self._IR == (0xcd<<3|1)): self._SA(self._PC);self._INCPC();self._AD=self._GD();
-            elif (self._IR == (0xcd<<3|2)): self._SA((self._GD()<<8)|self._AD);
-            elif (self._IR == (0xcd<<3|3)): self._cmp(self._A, self._GD());self._FETCH();
-            elif (self._IR == (0xcd<<3|4)): assert(False);
-            elif (self._IR == (0xcd<<3|5)): assert(False);
-            elif (self._IR == (0xcd<<3|6)): assert(False);
-            elif (self._IR == (0xcd<<3|7)): assert(False);
-
-            # DEC a
-            elif (self._IR == (0xce<<3|0)): self._SA(self._PC);self._INCPC();
-            elif (self._IR == (0xce<<3|1)): self._SA(self._PC);self._INCPC();self._AD=self._GD();
-            elif (self._IR == (0xce<<3|2)): self._SA((self._GD()<<8)|self._AD);
-            elif (self._IR == (0xce<<3|3)): self._AD=self._GD();self._WR();
-            elif (self._IR == (0xce<<3|4)): self._DECAD();self._NZ(self._AD);self._SD(self._AD);self._WR();
-            elif (self._IR == (0xce<<3|5)): self._FETCH();
-            elif (self._IR == (0xce<<3|6)): assert(False);
-            elif (self._IR == (0xce<<3|7)): assert(False);
-
-            # BBS4 r
-            elif (self._IR == (0xcf<<3|0)): self._SA(self._PC);self._INCPC();
-            elif (self._IR == (0xcf<<3|1)):
-                self._SA(self._PC);
-                if((self._GD()&0x10)==0x10):self._INCPC();self._AD=self._PC+self._GD();self._FETCH();
-                else:self._FETCH();
-            elif (self._IR == (0xcf<<3|2)): assert(False);
-            elif (self._IR == (0xcf<<3|3)): assert(False);
-            elif (self._IR == (0xcf<<3|4)): assert(False);
-            elif (self._IR == (0xcf<<3|5)): assert(False);
-            elif (self._IR == (0xcf<<3|6)): assert(False);
-            elif (self._IR == (0xcf<<3|7)): assert(False);
-
-
-
-            # BNE r
-            elif (self._IR == (0xd0<<3|0)): self._SA(self._PC);self._INCPC();
-            elif (self._IR == (0xd0<<3|1)):
-                self._SA(self._PC);self._AD=self._PC+self._GD();
-                if((self._P&0x2)!=0x0):self._FETCH();
-            elif (self._IR == (0xd0<<3|2)):
-                self._SA((self._PC&0xFF00)|(self._AD&0x00FF));
-                if((self._AD&0xFF00)==(self._PC&0xFF00)):self._PC=self._AD;self._irq_pip>>=1;self._nmi_pip>>=1;self._FETCH();
-            elif (self._IR == (0xd0<<3|3)): self._PC=self._AD;self._FETCH();
-            elif (self._IR == (0xd0<<3|4)): assert(False);
-            elif (self._IR == (0xd0<<3|5)): assert(False);
-            elif (self._IR == (0xd0<<3|6)): assert(False);
-            elif (self._IR == (0xd0<<3|7)): assert(False);
-
-            # CMP (zp),y
-            elif (self._IR == (0xd1<<3|0)): self._SA(self._PC);self._INCPC();
-            elif (self._IR == (0xd1<<3|1)): self._AD=self._GD();self._SA(self._AD);
-            elif (self._IR == (0xd1<<3|2)): self._SA((self._AD+1)&0xFF);self._AD=self._GD();
-            elif (self._IR == (0xd1<<3|3)): self._AD|=self._GD()<<8;self._SA((self._AD&0xFF00)|((self._AD+self._Y)&0xFF));self._IR+=(~((self._AD>>8)-((self._AD+self._Y)>>8)))&1;
-            elif (self._IR == (0xd1<<3|4)): self._SA(self._AD+self._Y);
-            elif (self._IR == (0xd1<<3|5)): self._cmp(self._A, self._GD());self._FETCH();
-            elif (self._IR == (0xd1<<3|6)): assert(False);
-            elif (self._IR == (0xd1<<3|7)): assert(False);
-
-            # CMP (zp)
-            elif (self._IR == (0xd2<<3|0)): self._SA(self._PC);self._INCPC();
-            elif (self._IR == (0xd2<<3|1)): self._AD=self._GD();self._SA(self._AD);
-            elif (self._IR == (0xd2<<3|2)): self._SA((self._AD+1)&0xFF);self._AD=self._GD();
-            elif (self._IR == (0xd2<<3|3)): self._AD|=self._GD()<<8;self._SA((self._AD&0xFF00)|((self._AD)&0xFF));self._IR+=(~((self._AD>>8)-((self._AD)>>8)))&1;
-            elif (self._IR == (0xd2<<3|4)): self._SA(self._AD);
-            elif (self._IR == (0xd2<<3|5)): self._cmp(self._A, self._GD());self._FETCH();
-            elif (self._IR == (0xd2<<3|6)): assert(False);
-            elif (self._IR == (0xd2<<3|7)): assert(False);
-
-            # None
-            elif (self._IR == (0xd3<<3|0)): assert(False);
-            elif (self._IR == (0xd3<<3|1)): assert(False);
-            elif (self._IR == (0xd3<<3|2)): assert(False);
-            elif (self._IR == (0xd3<<3|3)): assert(False);
-            elif (self._IR == (0xd3<<3|4)): assert(False);
-            elif (self._IR == (0xd3<<3|5)): assert(False);
-            elif (self._IR == (0xd3<<3|6)): assert(False);
-            elif (self._IR == (0xd3<<3|7)): assert(False);
-
-            # None
-            elif (self._IR == (0xd4<<3|0)): assert(False);
-            elif (self._IR == (0xd4<<3|1)): assert(False);
-            elif (self._IR == (0xd4<<3|2)): assert(False);
-            elif (self._IR == (0xd4<<3|3)): assert(False);
-            elif (self._IR == (0xd4<<3|4)): assert(False);
-            elif (self._IR == (0xd4<<3|5)): assert(False);
-            elif (self._IR == (0xd4<<3|6)): assert(False);
-            elif (self._IR == (0xd4<<3|7)): assert(False);
-
-            # CMP zp,x
-            elif (self._IR == (0xd5<<3|0)): self._SA(self._PC);self._INCPC();
-            elif (self._IR == (0xd5<<3|1)): self._AD=self._GD();self._SA(self._AD);
-            elif (self._IR == (0xd5<<3|2)): self._SA((self._AD+self._X)&0x00FF);
-            elif (self._IR == (0xd5<<3|3)): self._cmp(self._A, self._GD());self._FETCH();
-            elif (self._IR == (0xd5<<3|4)): assert(False);
-            elif (self._IR == (0xd5<<3|5)): assert(False);
-            elif (self._IR == (0xd5<<3|6)): assert(False);
-            elif (self._IR == (0xd5<<3|7)): assert(False);
-
-            # DEC zp,x
-            elif (self._IR == (0xd6<<3|0)): self._SA(self._PC);self._INCPC();
-            elif (self._IR == (0xd6<<3|1)): self._AD=self._GD();self._SA(self._AD);
-            elif (self._IR == (0xd6<<3|2)): self._SA((self._AD+self._X)&0x00FF);
-            elif (self._IR == (0xd6<<3|3)): self._AD=self._GD();self._WR();
-            elif (self._IR == (0xd6<<3|4)): self._DECAD();self._NZ(self._AD);self._SD(self._AD);self._WR();
-            elif (self._IR == (0xd6<<3|5)): self._FETCH();
-            elif (self._IR == (0xd6<<3|6)): assert(False);
-            elif (self._IR == (0xd6<<3|7)): assert(False);
-
-            # SMB5 zp
-            elif (self._IR == (0xd7<<3|0)): self._SA(self._PC);self._INCPC();
-            elif (self._IR == (0xd7<<3|1)): self._SA(0x00&self._GD());self._AD=self._GD();
-            elif (self._IR == (0xd7<<3|2)): self._SA(0x00&self._AD);self._SD(self._GD()|(1<<5));self._WR();
-            elif (self._IR == (0xd7<<3|3)): self._FETCH();
-            elif (self._IR == (0xd7<<3|4)): assert(False);
-            elif (self._IR == (0xd7<<3|5)): assert(False);
-            elif (self._IR == (0xd7<<3|6)): assert(False);
-            elif (self._IR == (0xd7<<3|7)): assert(False);
-
-            # CLD i
-            elif (self._IR == (0xd8<<3|0)): self._SA(self._PC);
-            elif (self._IR == (0xd8<<3|1)): self._P&=~M65C02_DF;self._FETCH();
-            elif (self._IR == (0xd8<<3|2)): assert(False);
-            elif (self._IR == (0xd8<<3|3)): assert(False);
-            elif (self._IR == (0xd8<<3|4)): assert(False);
-            elif (self._IR == (0xd8<<3|5)): assert(False);
-            elif (self._IR == (0xd8<<3|6)): assert(False);
-            elif (self._IR == (0xd8<<3|7)): assert(False);
-
-            # CMP a,y
-            elif (self._IR == (0xd9<<3|0)): self._SA(self._PC);self._INCPC();
-            elif (self._IR == (0xd9<<3|1)): self._SA(self._PC);self._INCPC();self._AD=self._GD();
-            elif (self._IR == (0xd9<<3|2)): self._AD|=self._GD()<<8;self._SA((self._AD&0xFF00)|((self._AD+self._Y)&0xFF));self._IR+=(~((self._AD>>8)-((self._AD+self._Y)>>8)))&1;
-            elif (self._IR == (0xd9<<3|3)): self._SA(self._AD+self._Y);
-            elif (self._IR == (0xd9<<3|4)): self._cmp(self._A, self._GD());self._FETCH();
-            elif (self._IR == (0xd9<<3|5)): assert(False);
-            elif (self._IR == (0xd9<<3|6)): assert(False);
-            elif (self._IR == (0xd9<<3|7)): assert(False);
-
-            # PHX s
-            elif (self._IR == (0xda<<3|0)): self._SA(self._PC);
-            elif (self._IR == (0xda<<3|1)): self._SAD(0x0100|self._S,self._X);self._DES();self._WR();
-            elif (self._IR == (0xda<<3|2)): self._FETCH();
-            elif (self._IR == (0xda<<3|3)): assert(False);
-            elif (self._IR == (0xda<<3|4)): assert(False);
-            elif (self._IR == (0xda<<3|5)): assert(False);
-            elif (self._IR == (0xda<<3|6)): assert(False);
-            elif (self._IR == (0xda<<3|7)): assert(False);
-
-            # STP I
-            elif (self._IR == (0xdb<<3|0)): assert(False);
-            elif (self._IR == (0xdb<<3|1)): assert(False);
-            elif (self._IR == (0xdb<<3|2)): assert(False);
-            elif (self._IR == (0xdb<<3|3)): assert(False);
-            elif (self._IR == (0xdb<<3|4)): assert(False);
-            elif (self._IR == (0xdb<<3|5)): assert(False);
-            elif (self._IR == (0xdb<<3|6)): assert(False);
-            elif (self._IR == (0xdb<<3|7)): assert(False);
-
-            # None
-            elif (self._IR == (0xdc<<3|0)): assert(False);
-            elif (self._IR == (0xdc<<3|1)): assert(False);
-            elif (self._IR == (0xdc<<3|2)): assert(False);
-            elif (self._IR == (0xdc<<3|3)): assert(False);
-            elif (self._IR == (0xdc<<3|4)): assert(False);
-            elif (self._IR == (0xdc<<3|5)): assert(False);
-            elif (self._IR == (0xdc<<3|6)): assert(False);
-            elif (self._IR == (0xdc<<3|7)): assert(False);
-
-            # CMP a,x
-            elif (self._IR == (0xdd<<3|0)): self._SA(self._PC);self._INCPC();
-            elif (self._IR == (0xdd<<3|1)): self._SA(self._PC);self._INCPC();self._AD=self._GD();
-            elif (self._IR == (0xdd<<3|2)): self._AD|=self._GD()<<8;self._SA((self._AD&0xFF00)|((self._AD+self._X)&0xFF));self._IR+=(~((self._AD>>8)-((self._AD+self._X)>>8)))&1;
-            elif (self._IR == (0xdd<<3|3)): self._SA(self._AD+self._X);
-            elif (self._IR == (0xdd<<3|4)): self._cmp(self._A, self._GD());self._FETCH();
-            elif (self._IR == (0xdd<<3|5)): assert(False);
-            elif (self._IR == (0xdd<<3|6)): assert(False);
-            elif (self._IR == (0xdd<<3|7)): assert(False);
-
-            # DEC a,x
-            elif (self._IR == (0xde<<3|0)): self._SA(self._PC);self._INCPC();
-            elif (self._IR == (0xde<<3|1)): self._SA(self._PC);self._INCPC();self._AD=self._GD();
-            elif (self._IR == (0xde<<3|2)): self._AD|=self._GD()<<8;self._SA((self._AD&0xFF00)|((self._AD+self._X)&0xFF));
-            elif (self._IR == (0xde<<3|3)): self._SA(self._AD+self._X);
-            elif (self._IR == (0xde<<3|4)): self._AD=self._GD();self._WR();
-            elif (self._IR == (0xde<<3|5)): self._DECAD();self._NZ(self._AD);self._SD(self._AD);self._WR();
-            elif (self._IR == (0xde<<3|6)): self._FETCH();
-            elif (self._IR == (0xde<<3|7)): assert(False);
-
-            # BBS5 r
-            elif (self._IR == (0xdf<<3|0)): self._SA(self._PC);self._INCPC();
-            elif (self._IR == (0xdf<<3|1)):
-                self._SA(self._PC);
-                if((self._GD()&0x20)==0x20):self._INCPC();self._AD=self._PC+self._GD();self._FETCH();
-                else:self._FETCH();
-            elif (self._IR == (0xdf<<3|2)): assert(False);
-            elif (self._IR == (0xdf<<3|3)): assert(False);
-            elif (self._IR == (0xdf<<3|4)): assert(False);
-            elif (self._IR == (0xdf<<3|5)): assert(False);
-            elif (self._IR == (0xdf<<3|6)): assert(False);
-            elif (self._IR == (0xdf<<3|7)): assert(False);
-
-
-
-            # CPX #
-            elif (self._IR == (0xe0<<3|0)): self._SA(self._PC);self._INCPC;
-            elif (self._IR == (0xe0<<3|1)): self._cmp(self._X, self._GD());self._FETCH();
-            elif (self._IR == (0xe0<<3|2)): assert(False);
-            elif (self._IR == (0xe0<<3|3)): assert(False);
-            elif (self._IR == (0xe0<<3|4)): assert(False);
-            elif (self._IR == (0xe0<<3|5)): assert(False);
-            elif (self._IR == (0xe0<<3|6)): assert(False);
-            elif (self._IR == (0xe0<<3|7)): assert(False);
-
-            # SBC (zp,x)
-            elif (self._IR == (0xe1<<3|0)): self._SA(self._PC);self._INCPC();
-            elif (self._IR == (0xe1<<3|1)): self._AD=self._GD();self._SA(self._AD);
-            elif (self._IR == (0xe1<<3|2)): self._AD=(self._AD+self._X)&0xFF;self._SA(self._AD);
-            elif (self._IR == (0xe1<<3|3)): self._SA((self._AD+1)&0xFF);self._AD=self._GD();
-            elif (self._IR == (0xe1<<3|4)): self._SA((self._GD()<<8)|self._AD);
-            elif (self._IR == (0xe1<<3|5)): self._sbc(self._GD());self._FETCH();
-            elif (self._IR == (0xe1<<3|6)): assert(False);
-            elif (self._IR == (0xe1<<3|7)): assert(False);
-
-            # None
-            elif (self._IR == (0xe2<<3|0)): assert(False);
-            elif (self._IR == (0xe2<<3|1)): assert(False);
-            elif (self._IR == (0xe2<<3|2)): assert(False);
-            elif (self._IR == (0xe2<<3|3)): assert(False);
-            elif (self._IR == (0xe2<<3|4)): assert(False);
-            elif (self._IR == (0xe2<<3|5)): assert(False);
-            elif (self._IR == (0xe2<<3|6)): assert(False);
-            elif (self._IR == (0xe2<<3|7)): assert(False);
-
-            # None
-            elif (self._IR == (0xe3<<3|0)): assert(False);
-            elif (self._IR == (0xe3<<3|1)): assert(False);
-            elif (self._IR == (0xe3<<3|2)): assert(False);
-            elif (self._IR == (0xe3<<3|3)): assert(False);
-            elif (self._IR == (0xe3<<3|4)): assert(False);
-            elif (self._IR == (0xe3<<3|5)): assert(False);
-            elif (self._IR == (0xe3<<3|6)): assert(False);
-            elif (self._IR == (0xe3<<3|7)): assert(False);
-
-            # CPX zp
-            elif (self._IR == (0xe4<<3|0)): self._SA(self._PC);self._INCPC();
-            elif (self._IR == (0xe4<<3|1)): self._SA(self._GD());
-            elif (self._IR == (0xe4<<3|2)): self._cmp(self._X, self._GD());self._FETCH();
-            elif (self._IR == (0xe4<<3|3)): assert(False);
-            elif (self._IR == (0xe4<<3|4)): assert(False);
-            elif (self._IR == (0xe4<<3|5)): assert(False);
-            elif (self._IR == (0xe4<<3|6)): assert(False);
-            elif (self._IR == (0xe4<<3|7)): assert(False);
-
-            # SBC zp
-            elif (self._IR == (0xe5<<3|0)): self._SA(self._PC);self._INCPC();
-            elif (self._IR == (0xe5<<3|1)): self._SA(self._GD());
-            elif (self._IR == (0xe5<<3|2)): self._sbc(self._GD());self._FETCH();
-            elif (self._IR == (0xe5<<3|3)): assert(False);
-            elif (self._IR == (0xe5<<3|4)): assert(False);
-            elif (self._IR == (0xe5<<3|5)): assert(False);
-            elif (self._IR == (0xe5<<3|6)): assert(False);
-            elif (self._IR == (0xe5<<3|7)): assert(False);
-
-            # INC zp
-            elif (self._IR == (0xe6<<3|0)): self._SA(self._PC);self._INCPC();
-            elif (self._IR == (0xe6<<3|1)): self._SA(self._GD());
-            elif (self._IR == (0xe6<<3|2)): self._AD=self._GD();self._WR();
-            elif (self._IR == (0xe6<<3|3)): self._INCAD();self._NZ(self._AD);self._SD(self._AD);self._WR();
-            elif (self._IR == (0xe6<<3|4)): self._FETCH();
-            elif (self._IR == (0xe6<<3|5)): assert(False);
-            elif (self._IR == (0xe6<<3|6)): assert(False);
-            elif (self._IR == (0xe6<<3|7)): assert(False);
-
-            # SMB6 zp
-            elif (self._IR == (0xe7<<3|0)): self._SA(self._PC);self._INCPC();
-            elif (self._IR == (0xe7<<3|1)): self._SA(0x00&self._GD());self._AD=self._GD();
-            elif (self._IR == (0xe7<<3|2)): self._SA(0x00&self._AD);self._SD(self._GD()|(1<<6));self._WR();
-            elif (self._IR == (0xe7<<3|3)): self._FETCH();
-            elif (self._IR == (0xe7<<3|4)): assert(False);
-            elif (self._IR == (0xe7<<3|5)): assert(False);
-            elif (self._IR == (0xe7<<3|6)): assert(False);
-            elif (self._IR == (0xe7<<3|7)): assert(False);
-
-            # INX i
-            elif (self._IR == (0xe8<<3|0)): self._SA(self._PC);
-            elif (self._IR == (0xe8<<3|1)): self._INX();self._NZ(self._X);self._FETCH();
-            elif (self._IR == (0xe8<<3|2)): assert(False);
-            elif (self._IR == (0xe8<<3|3)): assert(False);
-            elif (self._IR == (0xe8<<3|4)): assert(False);
-            elif (self._IR == (0xe8<<3|5)): assert(False);
-            elif (self._IR == (0xe8<<3|6)): assert(False);
-            elif (self._IR == (0xe8<<3|7)): assert(False);
-
-            # SBC #
-            elif (self._IR == (0xe9<<3|0)): self._SA(self._PC);self._INCPC();
-            elif (self._IR == (0xe9<<3|1)): self._sbc(self._GD());self._FETCH();
-            elif (self._IR == (0xe9<<3|2)): assert(False);
-            elif (self._IR == (0xe9<<3|3)): assert(False);
-            elif (self._IR == (0xe9<<3|4)): assert(False);
-            elif (self._IR == (0xe9<<3|5)): assert(False);
-            elif (self._IR == (0xe9<<3|6)): assert(False);
-            elif (self._IR == (0xe9<<3|7)): assert(False);
-
-            # NOP i
-            elif (self._IR == (0xea<<3|0)): self._SA(self._PC);
-            elif (self._IR == (0xea<<3|1)): self._FETCH();
-            elif (self._IR == (0xea<<3|2)): assert(False);
-            elif (self._IR == (0xea<<3|3)): assert(False);
-            elif (self._IR == (0xea<<3|4)): assert(False);
-            elif (self._IR == (0xea<<3|5)): assert(False);
-            elif (self._IR == (0xea<<3|6)): assert(False);
-            elif (self._IR == (0xea<<3|7)): assert(False);
-
-            # None
-            elif (self._IR == (0xeb<<3|0)): assert(False);
-            elif (self._IR == (0xeb<<3|1)): assert(False);
-            elif (self._IR == (0xeb<<3|2)): assert(False);
-            elif (self._IR == (0xeb<<3|3)): assert(False);
-            elif (self._IR == (0xeb<<3|4)): assert(False);
-            elif (self._IR == (0xeb<<3|5)): assert(False);
-            elif (self._IR == (0xeb<<3|6)): assert(False);
-            elif (self._IR == (0xeb<<3|7)): assert(False);
-
-            # CPX a
-            elif (self._IR == (0xec<<3|0)): self._SA(self._PC);self._INCPC();
-            elif (self._IR == (0xec<<3|1)): self._SA(self._PC);self._INCPC();self._AD=self._GD();
-            elif (self._IR == (0xec<<3|2)): self._SA((self._GD()<<8)|self._AD);
-            elif (self._IR == (0xec<<3|3)): self._cmp(self._X, self._GD());self._FETCH();
-            elif (self._IR == (0xec<<3|4)): assert(False);
-            elif (self._IR == (0xec<<3|5)): assert(False);
-            elif (self._IR == (0xec<<3|6)): assert(False);
-            elif (self._IR == (0xec<<3|7)): assert(False);
-
-            # SBC a
-            elif (self._IR == (0xed<<3|0)): self._SA(self._PC);self._INCPC();
-            elif (self._IR == (0xed<<3|1)): self._SA(self._PC);self._INCPC();self._AD=self._GD();
-            elif (self._IR == (0xed<<3|2)): self._SA((self._GD()<<8)|self._AD);
-            elif (self._IR == (0xed<<3|3)): self._sbc(c,self._GD());self._FETCH();
-            elif (self._IR == (0xed<<3|4)): assert(False);
-            elif (self._IR == (0xed<<3|5)): assert(False);
-            elif (self._IR == (0xed<<3|6)): assert(False);
-            elif (self._IR == (0xed<<3|7)): assert(False);
-
-            # INC a
-            elif (self._IR == (0xee<<3|0)): self._SA(self._PC);self._INCPC();
-            elif (self._IR == (0xee<<3|1)): self._SA(self._PC);self._INCPC();self._AD=self._GD();
-            elif (self._IR == (0xee<<3|2)): self._SA((self._GD()<<8)|self._AD);
-            elif (self._IR == (0xee<<3|3)): self._AD=self._GD();self._WR();
-            elif (self._IR == (0xee<<3|4)): self._INCAD();self._NZ(self._AD);self._SD(self._AD);self._WR();
-            elif (self._IR == (0xee<<3|5)): self._FETCH();
-            elif (self._IR == (0xee<<3|6)): assert(False);
-            elif (self._IR == (0xee<<3|7)): assert(False);
-
-            # BBS6 r
-            elif (self._IR == (0xef<<3|0)): self._SA(self._PC);self._INCPC();
-            elif (self._IR == (0xef<<3|1)):
-                self._SA(self._PC);
-                if((self._GD()&0x40)==0x40):self._INCPC();self._AD=self._PC+self._GD();self._FETCH();
-                else:self._FETCH();
-            elif (self._IR == (0xef<<3|2)): assert(False);
-            elif (self._IR == (0xef<<3|3)): assert(False);
-            elif (self._IR == (0xef<<3|4)): assert(False);
-            elif (self._IR == (0xef<<3|5)): assert(False);
-            elif (self._IR == (0xef<<3|6)): assert(False);
-            elif (self._IR == (0xef<<3|7)): assert(False);
-
-
-
-            # BEQ r
-            elif (self._IR == (0xf0<<3|0)): self._SA(self._PC);self._INCPC();
-            elif (self._IR == (0xf0<<3|1)):
-                self._SA(self._PC);self._AD=self._PC+self._GD();
-                if((self._P&0x2)!=0x2):self._FETCH();
-            elif (self._IR == (0xf0<<3|2)):
-                self._SA((self._PC&0xFF00)|(self._AD&0x00FF));
-                if((self._AD&0xFF00)==(self._PC&0xFF00)):self._PC=self._AD;self._irq_pip>>=1;self._nmi_pip>>=1;self._FETCH();
-            elif (self._IR == (0xf0<<3|3)): self._PC=self._AD;self._FETCH();
-            elif (self._IR == (0xf0<<3|4)): assert(False);
-            elif (self._IR == (0xf0<<3|5)): assert(False);
-            elif (self._IR == (0xf0<<3|6)): assert(False);
-            elif (self._IR == (0xf0<<3|7)): assert(False);
-
-            # SBC (zp),y
-            elif (self._IR == (0xf1<<3|0)): self._SA(self._PC);self._INCPC();
-            elif (self._IR == (0xf1<<3|1)): self._AD=self._GD();self._SA(self._AD);
-            elif (self._IR == (0xf1<<3|2)): self._SA((self._AD+1)&0xFF);self._AD=self._GD();
-            elif (self._IR == (0xf1<<3|3)): self._AD|=self._GD()<<8;self._SA((self._AD&0xFF00)|((self._AD+self._Y)&0xFF));self._IR+=(~((self._AD>>8)-((self._AD+self._Y)>>8)))&1;
-            elif (self._IR == (0xf1<<3|4)): self._SA(self._AD+self._Y);
-            elif (self._IR == (0xf1<<3|5)): self._sbc(self._GD());self._FETCH();
-            elif (self._IR == (0xf1<<3|6)): assert(False);
-            elif (self._IR == (0xf1<<3|7)): assert(False);
-
-            # SBC (zp)
-            elif (self._IR == (0xf2<<3|0)): self._SA(self._PC);self._INCPC();
-            elif (self._IR == (0xf2<<3|1)): self._AD=self._GD();self._SA(self._AD);
-            elif (self._IR == (0xf2<<3|2)): self._SA((self._AD+1)&0xFF);self._AD=self._GD();
-            elif (self._IR == (0xf2<<3|3)): self._AD|=self._GD()<<8;self._SA((self._AD&0xFF00)|((self._AD)&0xFF));self._IR+=(~((self._AD>>8)-((self._AD)>>8)))&1;
-            elif (self._IR == (0xf2<<3|4)): self._SA(self._AD);
-            elif (self._IR == (0xf2<<3|5)): self._sbc(self._GD());self._FETCH();
-            elif (self._IR == (0xf2<<3|6)): assert(False);
-            elif (self._IR == (0xf2<<3|7)): assert(False);
-
-            # None
-            elif (self._IR == (0xf3<<3|0)): assert(False);
-            elif (self._IR == (0xf3<<3|1)): assert(False);
-            elif (self._IR == (0xf3<<3|2)): assert(False);
-            elif (self._IR == (0xf3<<3|3)): assert(False);
-            elif (self._IR == (0xf3<<3|4)): assert(False);
-            elif (self._IR == (0xf3<<3|5)): assert(False);
-            elif (self._IR == (0xf3<<3|6)): assert(False);
-            elif (self._IR == (0xf3<<3|7)): assert(False);
-
-            # None
-            elif (self._IR == (0xf4<<3|0)): assert(False);
-            elif (self._IR == (0xf4<<3|1)): assert(False);
-            elif (self._IR == (0xf4<<3|2)): assert(False);
-            elif (self._IR == (0xf4<<3|3)): assert(False);
-            elif (self._IR == (0xf4<<3|4)): assert(False);
-            elif (self._IR == (0xf4<<3|5)): assert(False);
-            elif (self._IR == (0xf4<<3|6)): assert(False);
-            elif (self._IR == (0xf4<<3|7)): assert(False);
-
-            # SBC zp,x
-            elif (self._IR == (0xf5<<3|0)): self._SA(self._PC);self._INCPC();
-            elif (self._IR == (0xf5<<3|1)): self._AD=self._GD();self._SA(self._AD);
-            elif (self._IR == (0xf5<<3|2)): self._SA((self._AD+self._X)&0x00FF);
-            elif (self._IR == (0xf5<<3|3)): self._sbc(self._GD());self._FETCH();
-            elif (self._IR == (0xf5<<3|4)): assert(False);
-            elif (self._IR == (0xf5<<3|5)): assert(False);
-            elif (self._IR == (0xf5<<3|6)): assert(False);
-            elif (self._IR == (0xf5<<3|7)): assert(False);
-
-            # INC zp,x
-            elif (self._IR == (0xf6<<3|0)): self._SA(self._PC);self._INCPC();
-            elif (self._IR == (0xf6<<3|1)): self._AD=self._GD();self._SA(self._AD);
-            elif (self._IR == (0xf6<<3|2)): self._SA((self._AD+self._X)&0x00FF);
-            elif (self._IR == (0xf6<<3|3)): self._AD=self._GD();self._WR();
-            elif (self._IR == (0xf6<<3|4)): self._INCAD();self._NZ(self._AD);self._SD(self._AD);self._WR();
-            elif (self._IR == (0xf6<<3|5)): self._FETCH();
-            elif (self._IR == (0xf6<<3|6)): assert(False);
-            elif (self._IR == (0xf6<<3|7)): assert(False);
-
-            # SMB7 zp
-            elif (self._IR == (0xf7<<3|0)): self._SA(self._PC);self._INCPC();
-            elif (self._IR == (0xf7<<3|1)): self._SA(0x00&self._GD());self._AD=self._GD();
-            elif (self._IR == (0xf7<<3|2)): self._SA(0x00&self._AD);self._SD(self._GD()|(1<<7));self._WR();
-            elif (self._IR == (0xf7<<3|3)): self._FETCH();
-            elif (self._IR == (0xf7<<3|4)): assert(False);
-            elif (self._IR == (0xf7<<3|5)): assert(False);
-            elif (self._IR == (0xf7<<3|6)): assert(False);
-            elif (self._IR == (0xf7<<3|7)): assert(False);
-
-            # SED i
-            elif (self._IR == (0xf8<<3|0)): self._SA(self._PC);
-            elif (self._IR == (0xf8<<3|1)): self._P|=M65C02_DF;self._FETCH();
-            elif (self._IR == (0xf8<<3|2)): assert(False);
-            elif (self._IR == (0xf8<<3|3)): assert(False);
-            elif (self._IR == (0xf8<<3|4)): assert(False);
-            elif (self._IR == (0xf8<<3|5)): assert(False);
-            elif (self._IR == (0xf8<<3|6)): assert(False);
-            elif (self._IR == (0xf8<<3|7)): assert(False);
-
-            # SBC a,y
-            elif (self._IR == (0xf9<<3|0)): self._SA(self._PC);self._INCPC();
-            elif (self._IR == (0xf9<<3|1)): self._SA(self._PC);self._INCPC();self._AD=self._GD();
-            elif (self._IR == (0xf9<<3|2)): self._AD|=self._GD()<<8;self._SA((self._AD&0xFF00)|((self._AD+self._Y)&0xFF));self._IR+=(~((self._AD>>8)-((self._AD+self._Y)>>8)))&1;
-            elif (self._IR == (0xf9<<3|3)): self._SA(self._AD+self._Y);
-            elif (self._IR == (0xf9<<3|4)): self._sbc(self._GD());self._FETCH();
-            elif (self._IR == (0xf9<<3|5)): assert(False);
-            elif (self._IR == (0xf9<<3|6)): assert(False);
-            elif (self._IR == (0xf9<<3|7)): assert(False);
-
-            # PLX s
-            elif (self._IR == (0xfa<<3|0)): self._SA(self._PC);
-            elif (self._IR == (0xfa<<3|1)): self._SA(0x0100|self._S);self._INS();
-            elif (self._IR == (0xfa<<3|2)): self._SA(0x0100|self._S);
-            elif (self._IR == (0xfa<<3|3)): self._X=self._GD();self._NZ(self._X);self._FETCH();
-            elif (self._IR == (0xfa<<3|4)): assert(False);
-            elif (self._IR == (0xfa<<3|5)): assert(False);
-            elif (self._IR == (0xfa<<3|6)): assert(False);
-            elif (self._IR == (0xfa<<3|7)): assert(False);
-
-            # None
-            elif (self._IR == (0xfb<<3|0)): assert(False);
-            elif (self._IR == (0xfb<<3|1)): assert(False);
-            elif (self._IR == (0xfb<<3|2)): assert(False);
-            elif (self._IR == (0xfb<<3|3)): assert(False);
-            elif (self._IR == (0xfb<<3|4)): assert(False);
-            elif (self._IR == (0xfb<<3|5)): assert(False);
-            elif (self._IR == (0xfb<<3|6)): assert(False);
-            elif (self._IR == (0xfb<<3|7)): assert(False);
-
-            #;self._INCPC() None
-            elif (self._IR == (0xfc<<3|0)): assert(False);
-            elif (self._IR == (0xfc<<3|1)): assert(False);
-            elif (self._IR == (0xfc<<3|2)): assert(False);
-            elif (self._IR == (0xfc<<3|3)): assert(False);
-            elif (self._IR == (0xfc<<3|4)): assert(False);
-            elif (self._IR == (0xfc<<3|5)): assert(False);
-            elif (self._IR == (0xfc<<3|6)): assert(False);
-            elif (self._IR == (0xfc<<3|7)): assert(False);
-
-            # SBC a,x
-            elif (self._IR == (0xfd<<3|0)): self._SA(self._PC);self._INCPC();
-            elif (self._IR == (0xfd<<3|1)): self._SA(self._PC);self._INCPC();self._AD=self._GD();
-            elif (self._IR == (0xfd<<3|2)): self._AD|=self._GD()<<8;self._SA((self._AD&0xFF00)|((self._AD+self._X)&0xFF));self._IR+=(~((self._AD>>8)-((self._AD+self._X)>>8)))&1;
-            elif (self._IR == (0xfd<<3|3)): self._SA(self._AD+self._X);
-            elif (self._IR == (0xfd<<3|4)): self._sbc(self._GD());self._FETCH();
-            elif (self._IR == (0xfd<<3|5)): assert(False);
-            elif (self._IR == (0xfd<<3|6)): assert(False);
-            elif (self._IR == (0xfd<<3|7)): assert(False);
-
-            # INC a,x
-            elif (self._IR == (0xfe<<3|0)): self._SA(self._PC);self._INCPC();
-            elif (self._IR == (0xfe<<3|1)): self._SA(self._PC);self._INCPC();self._AD=self._GD();
-            elif (self._IR == (0xfe<<3|2)): self._AD|=self._GD()<<8;self._SA((self._AD&0xFF00)|((self._AD+self._X)&0xFF));
-            elif (self._IR == (0xfe<<3|3)): self._SA(self._AD+self._X);
-            elif (self._IR == (0xfe<<3|4)): self._AD=self._GD();self._WR();
-            elif (self._IR == (0xfe<<3|5)): self._INCAD();self._NZ(self._AD);self._SD(self._AD);self._WR();
-            elif (self._IR == (0xfe<<3|6)): self._FETCH();
-            elif (self._IR == (0xfe<<3|7)): assert(False);
-
-            # BBS7 r
-            elif (self._IR == (0xff<<3|0)): self._SA(self._PC);self._INCPC();
-            elif (self._IR == (0xff<<3|1)):
-                self._SA(self._PC);
-                if((self._GD()&0x80)==0x80):self._INCPC();self._AD=self._PC+self._GD();self._FETCH();
-                else:self._FETCH();
-            elif (self._IR == (0xff<<3|2)): assert(False);
-            elif (self._IR == (0xff<<3|3)): assert(False);
-            elif (self._IR == (0xff<<3|4)): assert(False);
-            elif (self._IR == (0xff<<3|5)): assert(False);
-            elif (self._IR == (0xff<<3|6)): assert(False);
-            elif (self._IR == (0xff<<3|7)): assert(False);
-
-            self._IR += 1
-
-        self._PINS = self.circuit.pins
-        return self.circuit.pins
+
+            if not (self._brk_flags):
+                self._INCPC()
+
+        self._RD()
+        self._OPS[self._IR](self)
+        self._IR += 1
+
+    def reset(self):
+        """ the reset sequence at instruction level: load PC from the RES vector, 7 cycles. """
+        m = self.circuit.memory
+        self._S = (self._S-3)&0xFF
+        self._P = (self._P|M65C02_IF|M65C02_BF)&~M65C02_DF
+        self._PC = m[0xFFFC]|(m[0xFFFD]<<8)
+        self._brk_flags = 0
+        self.halted = None
+        self._cycles += 7
+
+    def step_instruction(self):
+        """ execute a whole instruction directly against memory, returns its cycle count. """
+        m = self.circuit.memory
+        start = self._cycles
+        op = m[self._PC]
+        self._PC = (self._PC+1)&0xFFFF
+        if self.lazy_flags:
+            self._lazy()
+            c = self._EXEC_LAZY[op](self, m)  # the handler may add page-crossing cycles first.
+            self._P = self._flags()
+        else:
+            c = self._EXEC[op](self, m)
+        self._cycles += c
+        return self._cycles - start
+
+    def run(self, instructions=None, cycles=None):
+        """
+            Runs the instruction-level engine, without going through the pins.
+
+            Args
+            ----
+            instructions : int, optional
+                the number of instructions to execute.
+            cycles : int, optional
+                the number of clock cycles to run for, the last instruction is
+                always completed and may overshoot by a few cycles, an idle loop
+                by less than one of its iterations.
+
+            Returns
+            -------
+            cycles : int
+                the number of elapsed clock cycles.
+        """
+        if instructions is None and cycles is None:
+            raise ValueError("run needs a number of instructions or cycles.")
+        m = self.circuit.memory
+        ops = self._EXEC_LAZY if self.lazy_flags else self._EXEC
+        start = self._cycles
+        end = start + cycles if cycles is not None else float("inf")
+        n = instructions if instructions is not None else -1
+        self._lazy()
+        idle = self.idle_skip and instructions is None
+        self._until = 0
+        while n and self._cycles < end:
+            self._boundary(m, end, self.lazy_flags)
+            if self.icache is not None:
+                n = self._run_cached(m, ops, n, idle)
+                continue
+            while n and self._cycles < self._until:
+                pc = self._PC
+                op = m[pc]
+                self._PC = (pc+1)&0xFFFF
+                c = ops[op](self, m)
+                self._cycles += c
+                n -= 1
+                if self._PC <= pc and idle:
+                    self._spin(pc)
+        if self.lazy_flags:
+            self._P = self._flags()
+        return self._cycles - start
+
+    def _run_cached(self, m, ops, n, idle):
+        """ the run loop over decoded instructions, the handlers take their operands from _o. """
+        icache = self.icache
+        entries = icache.entries
+        decode = icache.decode
+        self._imm = self._imm_o
+        self._abs = self._abs_o
+        try:
+            while n and self._cycles < self._until:
+                pc = self._PC
+                entry = entries[pc]
+                if entry is None:
+                    entry = decode(pc)
+                op, self._o, self._PC = entry
+                c = ops[op](self, m)
+                self._cycles += c
+                n -= 1
+                if self._PC <= pc and idle:
+                    self._spin(pc)
+        finally:
+            del self._imm
+            del self._abs
+        return n
+
+    # events and interrupts: the run loops stop at the cycle of the next event,
+    # or as soon as an interrupt line is driven, or I cleared, to dispatch the
+    # events due and service the interrupt the lines ask for. Nothing is polled
+    # in between.
+    def _boundary(self, m, end, lazy):
+        """ dispatches the events due, services a pending interrupt and sets the cycle the run loops next stop at. """
+        circuit = self.circuit
+        circuit.dispatch()
+        interrupt = self._pending()
+        if interrupt is not None:
+            self._interrupt(m, interrupt, lazy)
+        event = circuit.next_event()
+        self._until = end if event is None or event > end else event
+
+    def _pending(self):
+        """ samples the interrupt lines at an instruction boundary: "reset", "nmi", "irq" or None. """
+        pins = self._CTRL
+        nmib = pins&M65C02_NMIB
+        if self._nmib and not nmib:
+            self._nmi_edge = True
+        self._nmib = nmib
+        if not (pins&M65C02_RESB):
+            return "reset"
+        if self.halted == "stop":
+            return None
+        if self._nmi_edge:
+            return "nmi"
+        if not (pins&M65C02_IRQB) and not (self._P&M65C02_IF):
+            return "irq"
+        return None
+
+    def _interrupt(self, m, interrupt, lazy):
+        """ the interrupt sequence at instruction level, a BRK with B clear through the NMI or IRQ vector, 7 cycles. """
+        if interrupt == "reset":
+            self.reset()
+            return
+        if self.halted is not None:
+            # woken up from a WAI, the return address is the next instruction.
+            self.halted = None
+            self._PC = (self._PC+1)&0xFFFF
+        p = self._flags() if lazy else self._P
+        self._push(m,self._PC>>8);self._push(m,self._PC&0xFF);self._push(m,(p|M65C02_XF)&~M65C02_BF)
+        self._P = (self._P|M65C02_IF)&~M65C02_DF
+        if interrupt == "nmi":
+            self._nmi_edge = False
+            self._PC = m[0xFFFA]|(m[0xFFFB]<<8)
+        else:
+            self._PC = m[0xFFFE]|(m[0xFFFF]<<8)
+        self._cycles += 7
+
+    # idle loops: a loop that only reads RAM or ROM and finds the same registers
+    # at two jumps back in a row, one straight iteration apart, spins until an
+    # interrupt, and so does a CPU parked by WAI or STP. The cycle counter skips
+    # whole iterations up to the next event.
+    _IDLE = {"LDA", "LDX", "LDY", "CMP", "CPX", "CPY", "BIT", "AND", "ORA", "EOR",
+             "TAX", "TAY", "TXA", "TYA", "INX", "INY", "DEX", "DEY", "CLC", "SEC", "CLV", "NOP",
+             "BPL", "BMI", "BVC", "BVS", "BCC", "BCS", "BNE", "BEQ"}
+
+    def _spin(self, pc):
+        """ called after the instruction at pc jumped back, fast-forwards the cycles of an idle loop up to the next stop. """
+        period = 1 if self.halted is not None else self._period(self._PC, pc)
+        if not period:
+            return
+        state = (self._PC, pc, self._A, self._X, self._Y, self._S, self._P, self._nz)
+        if self.halted is None and (state != self._spun or self._cycles - self._spun_at != period):
+            self._spun = state
+            self._spun_at = self._cycles
+            return
+        stop = self._until
+        if self._cycles < stop < float("inf"):
+            self._cycles += (stop - self._cycles + period - 1)//period*period
+            self._spun_at = self._cycles
+
+    def _period(self, lo, hi):
+        """
+            The cycles of one straight iteration of the loop from lo to the jump
+            back at hi, 0 if the loop may write, read a device, or use the stack.
+            The results are kept, but the idle loops of writable pages, which may
+            be rewritten.
+        """
+        period = self._loops.get((lo, hi))
+        if period is not None:
+            return period
+        m = self.circuit.memory
+        pages = {lo>>8, hi>>8}
+        cycles = 0
+        addr = lo
+        while addr < hi and cycles < 64:
+            op = m[addr]
+            mode = MODES[MODE[op]]
+            if MNEMONICS[op] not in self._IDLE or mode not in ("i", "A", "#", "zp", "a", "r"):
+                break
+            if mode in ("zp", "a"):
+                pages.add((m[(addr+1)&0xFFFF]|(m[(addr+2)&0xFFFF]<<8 if mode == "a" else 0))>>8)
+            cycles += CYCLES[op]
+            addr += LENGTH[op]
+        period = 0
+        if addr == hi and all(m._read_pages[page] is not None for page in pages):
+            op = m[hi]
+            mnemonic, mode = MNEMONICS[op], MODES[MODE[op]]
+            operand = m[(hi+1)&0xFFFF]
+            nxt = (hi+2)&0xFFFF
+            if mnemonic == "JMP" and mode == "a" and operand|(m[nxt]<<8) == lo:
+                period = cycles + 3
+            elif mode == "r" and operand&0x80 and nxt - lo == 0x100 - operand:
+                period = cycles + (3 if lo>>8 == nxt>>8 else 4)
+        if period == 0 or all(m._write_pages[page] is None for page in pages):
+            self._loops[(lo, hi)] = period
+        return period
+
+    # micro-op decoder: one method per (opcode<<3|step) value of the IR register,
+    # collected into the M65C02._OPS dispatch table at import.
+    def _illegal(self):
+        assert(False)
+
+    # BRK s
+    def _op_00_0(self): self._SA(self._PC); # put PC on addr bus.
+    def _op_00_1(self):
+        if (0==(self._brk_flags&(M65C02_BRK_IRQ|M65C02_BRK_NMI))):self._INCPC();
+        self._SAD(0x0100|self._S,self._PC>>8);self._DES();  # push MSB of PC onto stack.
+        if(0==(self._brk_flags&M65C02_BRK_RESET)):self._WR(); # write to stack.
+    def _op_00_2(self):
+        self._SAD(0x0100|self._S,self._PC);self._DES();
+        if(0==(self._brk_flags&M65C02_BRK_RESET)):self._WR();
+    def _op_00_3(self):
+        self._SAD(0x0100|self._S,self._P|M65C02_XF|(0 if self._brk_flags else M65C02_BF));self._DES();
+        if(self._brk_flags&M65C02_BRK_RESET):self._AD=0xFFFC;
+        else:
+            self._WR();
+            if(self._brk_flags&M65C02_BRK_NMI):self._AD=0xFFFA;
+            else:self._AD=0xFFFE;
+    def _op_00_4(self): self._SA(self._AD);self._INCAD();self._P=(self._P|M65C02_IF|M65C02_BF)&~M65C02_DF;self._brk_flags=0; # RES/NMI hijacking.
+    def _op_00_5(self): self._SA(self._AD);self._AD=self._DATA; # NMI "half-hijacking" not possible.
+    def _op_00_6(self): self._PC=(self._DATA<<8)|self._AD;self._FETCH();
+
+    # ORA (zp,x)
+    def _op_01_0(self): self._SA(self._PC);self._INCPC();
+    def _op_01_1(self): self._AD=self._DATA;self._SA(self._AD);
+    def _op_01_2(self): self._AD=(self._AD+self._X)&0xFF;self._SA(self._AD);
+    def _op_01_3(self): self._SA((self._AD+1)&0xFF);self._AD=self._DATA;
+    def _op_01_4(self): self._SA((self._DATA<<8)|self._AD);
+    def _op_01_5(self): self._A|=self._DATA;self._NZ(self._A);self._FETCH();
+
+    # TSB zp
+    def _op_04_0(self): self._SA(self._PC);self._INCPC();
+    def _op_04_1(self): self._AD=self._DATA;self._SA(self._AD);
+    def _op_04_2(self): self._SA(self._AD);
+    def _op_04_3(self): self._P=(self._P&~M65C02_ZF)|(0 if self._A&self._DATA else M65C02_ZF);self._SD(self._A|self._DATA);self._WR();
+    def _op_04_4(self): self._FETCH();
+
+    # ORA zp
+    def _op_05_0(self): self._SA(self._PC);self._INCPC();
+    def _op_05_1(self): self._SA(self._DATA);
+    def _op_05_2(self): self._A|=self._DATA;self._NZ(self._A);self._FETCH();
+
+    # ASL zp
+    def _op_06_0(self): self._SA(self._PC);self._INCPC();
+    def _op_06_1(self): self._SA(self._DATA);
+    def _op_06_2(self): self._AD=self._DATA;self._WR();
+    def _op_06_3(self): self._SD(self._asl(self._AD));self._WR();
+    def _op_06_4(self): self._FETCH();
+
+    # RMB0 zp
+    def _op_07_0(self): self._SA(self._PC);self._INCPC();
+    def _op_07_1(self): self._AD=self._DATA;self._SA(self._AD);
+    def _op_07_2(self): self._SA(self._AD);
+    def _op_07_3(self): self._SD(self._DATA&~(1<<0));self._WR();
+    def _op_07_4(self): self._FETCH();
+
+    # PHP s
+    def _op_08_0(self): self._SA(self._PC);
+    def _op_08_1(self): self._SAD(0x0100|self._S,self._P|M65C02_XF|M65C02_BF);self._DES();self._WR();
+    def _op_08_2(self): self._FETCH();
+
+    # ORA #
+    def _op_09_0(self): self._SA(self._PC);self._INCPC();
+    def _op_09_1(self): self._A|=self._DATA;self._NZ(self._A);self._FETCH();
+
+    # ASL A
+    def _op_0a_0(self): self._SA(self._PC);
+    def _op_0a_1(self): self._A=self._asl(self._A);self._FETCH();
+
+    # TSB a
+    def _op_0c_0(self): self._SA(self._PC);self._INCPC();
+    def _op_0c_1(self): self._SA(self._PC);self._INCPC();self._AD=self._DATA;
+    def _op_0c_2(self): self._AD|=self._DATA<<8;self._SA(self._AD);
+    def _op_0c_3(self): self._SA(self._AD);
+    def _op_0c_4(self): self._P=(self._P&~M65C02_ZF)|(0 if self._A&self._DATA else M65C02_ZF);self._SD(self._A|self._DATA);self._WR();
+    def _op_0c_5(self): self._FETCH();
+
+    # ORA a
+    def _op_0d_0(self): self._SA(self._PC);self._INCPC();
+    def _op_0d_1(self): self._SA(self._PC);self._INCPC();self._AD=self._DATA;
+    def _op_0d_2(self): self._SA((self._DATA<<8)|self._AD);
+    def _op_0d_3(self): self._A|=self._DATA;self._NZ(self._A);self._FETCH();
+
+    # ASL a
+    def _op_0e_0(self): self._SA(self._PC);self._INCPC();
+    def _op_0e_1(self): self._SA(self._PC);self._INCPC();self._AD=self._DATA;
+    def _op_0e_2(self): self._SA((self._DATA<<8)|self._AD);
+    def _op_0e_3(self): self._AD=self._DATA;self._WR();
+    def _op_0e_4(self): self._SD(self._asl(self._AD));self._WR();
+    def _op_0e_5(self): self._FETCH();
+
+    # BBR0 r
+    def _op_0f_0(self): self._SA(self._PC);self._INCPC();
+    def _op_0f_1(self): self._SA(self._DATA);
+    def _op_0f_2(self): self._AD=self._DATA;
+    def _op_0f_3(self): self._SA(self._PC);self._INCPC();
+    def _op_0f_4(self):
+        self._SA(self._PC);
+        if(not self._AD&(1<<0)):self._AD=(self._PC+((self._DATA^0x80)-0x80))&0xFFFF;
+        else:self._FETCH();
+    def _op_0f_5(self):
+        self._SA((self._PC&0xFF00)|(self._AD&0x00FF));
+        if((self._AD&0xFF00)==(self._PC&0xFF00)):self._PC=self._AD;self._FETCH();
+    def _op_0f_6(self): self._PC=self._AD;self._FETCH();
+
+    # BPL r
+    def _op_10_0(self): self._SA(self._PC);self._INCPC();
+    def _op_10_1(self):
+        self._SA(self._PC);self._AD=(self._PC+((self._DATA^0x80)-0x80))&0xFFFF;
+        if((self._P&0x80)!=0x0):self._FETCH();
+    def _op_10_2(self):
+        self._SA((self._PC&0xFF00)|(self._AD&0x00FF));
+        if((self._AD&0xFF00)==(self._PC&0xFF00)):self._PC=self._AD;self._FETCH();
+    def _op_10_3(self): self._PC=self._AD;self._FETCH();
+
+    # ORA (zp),y
+    def _op_11_0(self): self._SA(self._PC);self._INCPC();
+    def _op_11_1(self): self._AD=self._DATA;self._SA(self._AD);
+    def _op_11_2(self): self._SA((self._AD+1)&0xFF);self._AD=self._DATA;
+    def _op_11_3(self): self._AD|=self._DATA<<8;self._SA((self._AD&0xFF00)|((self._AD+self._Y)&0xFF));self._IR+=(~((self._AD>>8)-((self._AD+self._Y)>>8)))&1;
+    def _op_11_4(self): self._SA(self._AD+self._Y);
+    def _op_11_5(self): self._A|=self._DATA;self._NZ(self._A);self._FETCH();
+
+    # ORA (zp)
+    def _op_12_0(self): self._SA(self._PC);self._INCPC();
+    def _op_12_1(self): self._AD=self._DATA;self._SA(self._AD);
+    def _op_12_2(self): self._SA((self._AD+1)&0xFF);self._AD=self._DATA;
+    def _op_12_3(self): self._AD|=self._DATA<<8;self._SA((self._AD&0xFF00)|((self._AD)&0xFF));self._IR+=(~((self._AD>>8)-((self._AD)>>8)))&1;
+    def _op_12_4(self): self._SA(self._AD);
+    def _op_12_5(self): self._A|=self._DATA;self._NZ(self._A);self._FETCH();
+
+    # TRB zp
+    def _op_14_0(self): self._SA(self._PC);self._INCPC();
+    def _op_14_1(self): self._AD=self._DATA;self._SA(self._AD);
+    def _op_14_2(self): self._SA(self._AD);
+    def _op_14_3(self): self._P=(self._P&~M65C02_ZF)|(0 if self._A&self._DATA else M65C02_ZF);self._SD(self._DATA&~self._A);self._WR();
+    def _op_14_4(self): self._FETCH();
+
+    # ORA zp,x
+    def _op_15_0(self): self._SA(self._PC);self._INCPC();
+    def _op_15_1(self): self._AD=self._DATA;self._SA(self._AD);
+    def _op_15_2(self): self._SA((self._AD+self._X)&0x00FF);
+    def _op_15_3(self): self._A|=self._DATA;self._NZ(self._A);self._FETCH();
+
+    # ASL zp,x
+    def _op_16_0(self): self._SA(self._PC);self._INCPC();
+    def _op_16_1(self): self._AD=self._DATA;self._SA(self._AD);
+    def _op_16_2(self): self._SA((self._AD+self._X)&0x00FF);
+    def _op_16_3(self): self._AD=self._DATA;self._WR();
+    def _op_16_4(self): self._SD(self._asl(self._AD));self._WR();
+    def _op_16_5(self): self._FETCH();
+
+    # RMB1 zp
+    def _op_17_0(self): self._SA(self._PC);self._INCPC();
+    def _op_17_1(self): self._AD=self._DATA;self._SA(self._AD);
+    def _op_17_2(self): self._SA(self._AD);
+    def _op_17_3(self): self._SD(self._DATA&~(1<<1));self._WR();
+    def _op_17_4(self): self._FETCH();
+
+    # CLC i
+    def _op_18_0(self): self._SA(self._PC);
+    def _op_18_1(self): self._P&=~M65C02_CF;self._FETCH();
+
+    # ORA a,y
+    def _op_19_0(self): self._SA(self._PC);self._INCPC();
+    def _op_19_1(self): self._SA(self._PC);self._INCPC();self._AD=self._DATA;
+    def _op_19_2(self): self._AD|=self._DATA<<8;self._SA((self._AD&0xFF00)|((self._AD+self._Y)&0xFF));self._IR+=(~((self._AD>>8)-((self._AD+self._Y)>>8)))&1;
+    def _op_19_3(self): self._SA(self._AD+self._Y);
+    def _op_19_4(self): self._A|=self._DATA;self._NZ(self._A);self._FETCH();
+
+    # INC A
+    def _op_1a_0(self): self._SA(self._PC);
+    def _op_1a_1(self): self._INA();self._NZ(self._A);self._FETCH();
+
+    # TRB a
+    def _op_1c_0(self): self._SA(self._PC);self._INCPC();
+    def _op_1c_1(self): self._SA(self._PC);self._INCPC();self._AD=self._DATA;
+    def _op_1c_2(self): self._AD|=self._DATA<<8;self._SA(self._AD);
+    def _op_1c_3(self): self._SA(self._AD);
+    def _op_1c_4(self): self._P=(self._P&~M65C02_ZF)|(0 if self._A&self._DATA else M65C02_ZF);self._SD(self._DATA&~self._A);self._WR();
+    def _op_1c_5(self): self._FETCH();
+
+    # ORA a,x
+    def _op_1d_0(self): self._SA(self._PC);self._INCPC();
+    def _op_1d_1(self): self._SA(self._PC);self._INCPC();self._AD=self._DATA;
+    def _op_1d_2(self): self._AD|=self._DATA<<8;self._SA((self._AD&0xFF00)|((self._AD+self._X)&0xFF));self._IR+=(~((self._AD>>8)-((self._AD+self._X)>>8)))&1;
+    def _op_1d_3(self): self._SA(self._AD+self._X);
+    def _op_1d_4(self): self._A|=self._DATA;self._NZ(self._A);self._FETCH();
+
+    # ASL a,x
+    def _op_1e_0(self): self._SA(self._PC);self._INCPC();
+    def _op_1e_1(self): self._SA(self._PC);self._INCPC();self._AD=self._DATA;
+    def _op_1e_2(self): self._AD|=self._DATA<<8;self._SA((self._AD&0xFF00)|((self._AD+self._X)&0xFF));self._IR+=(~((self._AD>>8)-((self._AD+self._X)>>8)))&1;
+    def _op_1e_3(self): self._SA(self._AD+self._X);
+    def _op_1e_4(self): self._AD=self._DATA;
+    def _op_1e_5(self): self._SD(self._asl(self._AD));self._WR();
+    def _op_1e_6(self): self._FETCH();
+
+    # BBR1 r
+    def _op_1f_0(self): self._SA(self._PC);self._INCPC();
+    def _op_1f_1(self): self._SA(self._DATA);
+    def _op_1f_2(self): self._AD=self._DATA;
+    def _op_1f_3(self): self._SA(self._PC);self._INCPC();
+    def _op_1f_4(self):
+        self._SA(self._PC);
+        if(not self._AD&(1<<1)):self._AD=(self._PC+((self._DATA^0x80)-0x80))&0xFFFF;
+        else:self._FETCH();
+    def _op_1f_5(self):
+        self._SA((self._PC&0xFF00)|(self._AD&0x00FF));
+        if((self._AD&0xFF00)==(self._PC&0xFF00)):self._PC=self._AD;self._FETCH();
+    def _op_1f_6(self): self._PC=self._AD;self._FETCH();
+
+    # JSR a
+    def _op_20_0(self): self._SA(self._PC);self._INCPC();
+    def _op_20_1(self): self._SA(0x0100|self._S);self._AD=self._DATA;
+    def _op_20_2(self): self._SAD(0x0100|self._S,self._PC>>8);self._DES();self._WR();
+    def _op_20_3(self): self._SAD(0x0100|self._S,self._PC);self._DES();self._WR();
+    def _op_20_4(self): self._SA(self._PC);
+    def _op_20_5(self): self._PC=(self._DATA<<8)|self._AD;self._FETCH();
+
+    # AND (zp,x)
+    def _op_21_0(self): self._SA(self._PC);self._INCPC();
+    def _op_21_1(self): self._AD=self._DATA;self._SA(self._AD);
+    def _op_21_2(self): self._AD=(self._AD+self._X)&0xFF;self._SA(self._AD);
+    def _op_21_3(self): self._SA((self._AD+1)&0xFF);self._AD=self._DATA;
+    def _op_21_4(self): self._SA((self._DATA<<8)|self._AD);
+    def _op_21_5(self): self._A&=self._DATA;self._NZ(self._A);self._FETCH();
+
+    # BIT zp
+    def _op_24_0(self): self._SA(self._PC);self._INCPC();
+    def _op_24_1(self): self._SA(self._DATA);
+    def _op_24_2(self): self._bit(self._DATA);self._FETCH();
+
+    # AND zp
+    def _op_25_0(self): self._SA(self._PC);self._INCPC();
+    def _op_25_1(self): self._SA(self._DATA);
+    def _op_25_2(self): self._A&=self._DATA;self._NZ(self._A);self._FETCH();
+
+    # ROL zp
+    def _op_26_0(self): self._SA(self._PC);self._INCPC();
+    def _op_26_1(self): self._SA(self._DATA);
+    def _op_26_2(self): self._AD=self._DATA;self._WR();
+    def _op_26_3(self): self._SD(self._rol(self._AD));self._WR();
+    def _op_26_4(self): self._FETCH();
+
+    # RMB2 zp
+    def _op_27_0(self): self._SA(self._PC);self._INCPC();
+    def _op_27_1(self): self._AD=self._DATA;self._SA(self._AD);
+    def _op_27_2(self): self._SA(self._AD);
+    def _op_27_3(self): self._SD(self._DATA&~(1<<2));self._WR();
+    def _op_27_4(self): self._FETCH();
+
+    # PLP s
+    def _op_28_0(self): self._SA(self._PC);
+    def _op_28_1(self): self._SA(0x0100|self._S);self._INS();
+    def _op_28_2(self): self._SA(0x0100|self._S);
+    def _op_28_3(self): self._P=(self._DATA|M65C02_BF)&~M65C02_XF;self._FETCH();
+
+    # AND #
+    def _op_29_0(self): self._SA(self._PC);self._INCPC();
+    def _op_29_1(self): self._A&=self._DATA;self._NZ(self._A);self._FETCH();
+
+    # ROL A
+    def _op_2a_0(self): self._SA(self._PC);
+    def _op_2a_1(self): self._A=self._rol(self._A);self._FETCH();
+
+    # BIT a
+    def _op_2c_0(self): self._SA(self._PC);self._INCPC();
+    def _op_2c_1(self): self._SA(self._PC);self._INCPC();self._AD=self._DATA;
+    def _op_2c_2(self): self._SA((self._DATA<<8)|self._AD);
+    def _op_2c_3(self): self._bit(self._DATA);self._FETCH();
+
+    # AND a
+    def _op_2d_0(self): self._SA(self._PC);self._INCPC();
+    def _op_2d_1(self): self._SA(self._PC);self._INCPC();self._AD=self._DATA;
+    def _op_2d_2(self): self._SA((self._DATA<<8)|self._AD);
+    def _op_2d_3(self): self._A&=self._DATA;self._NZ(self._A);self._FETCH();
+
+    # ROL a
+    def _op_2e_0(self): self._SA(self._PC);self._INCPC();
+    def _op_2e_1(self): self._SA(self._PC);self._INCPC();self._AD=self._DATA;
+    def _op_2e_2(self): self._SA((self._DATA<<8)|self._AD);
+    def _op_2e_3(self): self._AD=self._DATA;self._WR();
+    def _op_2e_4(self): self._SD(self._rol(self._AD));self._WR();
+    def _op_2e_5(self): self._FETCH();
+
+    # BBR2 r
+    def _op_2f_0(self): self._SA(self._PC);self._INCPC();
+    def _op_2f_1(self): self._SA(self._DATA);
+    def _op_2f_2(self): self._AD=self._DATA;
+    def _op_2f_3(self): self._SA(self._PC);self._INCPC();
+    def _op_2f_4(self):
+        self._SA(self._PC);
+        if(not self._AD&(1<<2)):self._AD=(self._PC+((self._DATA^0x80)-0x80))&0xFFFF;
+        else:self._FETCH();
+    def _op_2f_5(self):
+        self._SA((self._PC&0xFF00)|(self._AD&0x00FF));
+        if((self._AD&0xFF00)==(self._PC&0xFF00)):self._PC=self._AD;self._FETCH();
+    def _op_2f_6(self): self._PC=self._AD;self._FETCH();
+
+    # BMI r
+    def _op_30_0(self): self._SA(self._PC);self._INCPC();
+    def _op_30_1(self):
+        self._SA(self._PC);self._AD=(self._PC+((self._DATA^0x80)-0x80))&0xFFFF;
+        if((self._P&0x80)!=0x80):self._FETCH();
+    def _op_30_2(self):
+        self._SA((self._PC&0xFF00)|(self._AD&0x00FF));
+        if((self._AD&0xFF00)==(self._PC&0xFF00)):self._PC=self._AD;self._FETCH();
+    def _op_30_3(self): self._PC=self._AD;self._FETCH();
+
+    # AND (zp),y
+    def _op_31_0(self): self._SA(self._PC);self._INCPC();
+    def _op_31_1(self): self._AD=self._DATA;self._SA(self._AD);
+    def _op_31_2(self): self._SA((self._AD+1)&0xFF);self._AD=self._DATA;
+    def _op_31_3(self): self._AD|=self._DATA<<8;self._SA((self._AD&0xFF00)|((self._AD+self._Y)&0xFF));self._IR+=(~((self._AD>>8)-((self._AD+self._Y)>>8)))&1;
+    def _op_31_4(self): self._SA(self._AD+self._Y);
+    def _op_31_5(self): self._A&=self._DATA;self._NZ(self._A);self._FETCH();
+
+    # AND (zp)
+    def _op_32_0(self): self._SA(self._PC);self._INCPC();
+    def _op_32_1(self): self._AD=self._DATA;self._SA(self._AD);
+    def _op_32_2(self): self._SA((self._AD+1)&0xFF);self._AD=self._DATA;
+    def _op_32_3(self): self._AD|=self._DATA<<8;self._SA((self._AD&0xFF00)|((self._AD)&0xFF));self._IR+=(~((self._AD>>8)-((self._AD)>>8)))&1;
+    def _op_32_4(self): self._SA(self._AD);
+    def _op_32_5(self): self._A&=self._DATA;self._NZ(self._A);self._FETCH();
+
+    # BIT zp,x
+    def _op_34_0(self): self._SA(self._PC);self._INCPC();
+    def _op_34_1(self): self._AD=self._DATA;self._SA(self._AD);
+    def _op_34_2(self): self._SA((self._AD+self._X)&0x00FF);
+    def _op_34_3(self): self._bit(self._DATA);self._FETCH();
+
+    # AND zp,x
+    def _op_35_0(self): self._SA(self._PC);self._INCPC();
+    def _op_35_1(self): self._AD=self._DATA;self._SA(self._AD);
+    def _op_35_2(self): self._SA((self._AD+self._X)&0x00FF);
+    def _op_35_3(self): self._A&=self._DATA;self._NZ(self._A);self._FETCH();
+
+    # ROL zp,x
+    def _op_36_0(self): self._SA(self._PC);self._INCPC();
+    def _op_36_1(self): self._AD=self._DATA;self._SA(self._AD);
+    def _op_36_2(self): self._SA((self._AD+self._X)&0x00FF);
+    def _op_36_3(self): self._AD=self._DATA;self._WR();
+    def _op_36_4(self): self._SD(self._rol(self._AD));self._WR();
+    def _op_36_5(self): self._FETCH();
+
+    # RMB3 zp
+    def _op_37_0(self): self._SA(self._PC);self._INCPC();
+    def _op_37_1(self): self._AD=self._DATA;self._SA(self._AD);
+    def _op_37_2(self): self._SA(self._AD);
+    def _op_37_3(self): self._SD(self._DATA&~(1<<3));self._WR();
+    def _op_37_4(self): self._FETCH();
+
+    # SEC I
+    def _op_38_0(self): self._SA(self._PC);
+    def _op_38_1(self): self._P|=M65C02_CF;self._FETCH();
+
+    # AND a,y
+    def _op_39_0(self): self._SA(self._PC);self._INCPC();
+    def _op_39_1(self): self._SA(self._PC);self._INCPC();self._AD=self._DATA;
+    def _op_39_2(self): self._AD|=self._DATA<<8;self._SA((self._AD&0xFF00)|((self._AD+self._Y)&0xFF));self._IR+=(~((self._AD>>8)-((self._AD+self._Y)>>8)))&1;
+    def _op_39_3(self): self._SA(self._AD+self._Y);
+    def _op_39_4(self): self._A&=self._DATA;self._NZ(self._A);self._FETCH();
+
+    # DEC A
+    def _op_3a_0(self): self._SA(self._PC);
+    def _op_3a_1(self): self._DEA();self._NZ(self._A);self._FETCH();
+
+    # BIT a,x
+    def _op_3c_0(self): self._SA(self._PC);self._INCPC();
+    def _op_3c_1(self): self._SA(self._PC);self._INCPC();self._AD=self._DATA;
+    def _op_3c_2(self): self._AD|=self._DATA<<8;self._SA((self._AD&0xFF00)|((self._AD+self._X)&0xFF));self._IR+=(~((self._AD>>8)-((self._AD+self._X)>>8)))&1;
+    def _op_3c_3(self): self._SA(self._AD+self._X);
+    def _op_3c_4(self): self._bit(self._DATA);self._FETCH();
+
+    # AND a,x
+    def _op_3d_0(self): self._SA(self._PC);self._INCPC();
+    def _op_3d_1(self): self._SA(self._PC);self._INCPC();self._AD=self._DATA;
+    def _op_3d_2(self): self._AD|=self._DATA<<8;self._SA((self._AD&0xFF00)|((self._AD+self._X)&0xFF));self._IR+=(~((self._AD>>8)-((self._AD+self._X)>>8)))&1;
+    def _op_3d_3(self): self._SA(self._AD+self._X);
+    def _op_3d_4(self): self._A&=self._DATA;self._NZ(self._A);self._FETCH();
+
+    # ROL a,x
+    def _op_3e_0(self): self._SA(self._PC);self._INCPC();
+    def _op_3e_1(self): self._SA(self._PC);self._INCPC();self._AD=self._DATA;
+    def _op_3e_2(self): self._AD|=self._DATA<<8;self._SA((self._AD&0xFF00)|((self._AD+self._X)&0xFF));self._IR+=(~((self._AD>>8)-((self._AD+self._X)>>8)))&1;
+    def _op_3e_3(self): self._SA(self._AD+self._X);
+    def _op_3e_4(self): self._AD=self._DATA;
+    def _op_3e_5(self): self._SD(self._rol(self._AD));self._WR();
+    def _op_3e_6(self): self._FETCH();
+
+    # BBR3 r
+    def _op_3f_0(self): self._SA(self._PC);self._INCPC();
+    def _op_3f_1(self): self._SA(self._DATA);
+    def _op_3f_2(self): self._AD=self._DATA;
+    def _op_3f_3(self): self._SA(self._PC);self._INCPC();
+    def _op_3f_4(self):
+        self._SA(self._PC);
+        if(not self._AD&(1<<3)):self._AD=(self._PC+((self._DATA^0x80)-0x80))&0xFFFF;
+        else:self._FETCH();
+    def _op_3f_5(self):
+        self._SA((self._PC&0xFF00)|(self._AD&0x00FF));
+        if((self._AD&0xFF00)==(self._PC&0xFF00)):self._PC=self._AD;self._FETCH();
+    def _op_3f_6(self): self._PC=self._AD;self._FETCH();
+
+    # RTI s
+    def _op_40_0(self): self._SA(self._PC);
+    def _op_40_1(self): self._SA(0x0100|self._S);self._INS();
+    def _op_40_2(self): self._SA(0x0100|self._S);self._INS();
+    def _op_40_3(self): self._SA(0x0100|self._S);self._INS();self._P=(self._DATA|M65C02_BF)&~M65C02_XF;
+    def _op_40_4(self): self._SA(0x0100|self._S);self._AD=self._DATA;
+    def _op_40_5(self): self._PC=(self._DATA<<8)|self._AD;self._FETCH();
+
+    # EOR (zp,x)
+    def _op_41_0(self): self._SA(self._PC);self._INCPC();
+    def _op_41_1(self): self._AD=self._DATA;self._SA(self._AD);
+    def _op_41_2(self): self._AD=(self._AD+self._X)&0xFF;self._SA(self._AD);
+    def _op_41_3(self): self._SA((self._AD+1)&0xFF);self._AD=self._DATA;
+    def _op_41_4(self): self._SA((self._DATA<<8)|self._AD);
+    def _op_41_5(self): self._A^=self._DATA;self._NZ(self._A);self._FETCH();
+
+    # EOR zp
+    def _op_45_0(self): self._SA(self._PC);self._INCPC();
+    def _op_45_1(self): self._SA(self._DATA);
+    def _op_45_2(self): self._A^=self._DATA;self._NZ(self._A);self._FETCH();
+
+    # LSR zp
+    def _op_46_0(self): self._SA(self._PC);self._INCPC();
+    def _op_46_1(self): self._SA(self._DATA);
+    def _op_46_2(self): self._AD=self._DATA;self._WR();
+    def _op_46_3(self): self._SD(self._lsr(self._AD));self._WR();
+    def _op_46_4(self): self._FETCH();
+
+    # RMB4 zp
+    def _op_47_0(self): self._SA(self._PC);self._INCPC();
+    def _op_47_1(self): self._AD=self._DATA;self._SA(self._AD);
+    def _op_47_2(self): self._SA(self._AD);
+    def _op_47_3(self): self._SD(self._DATA&~(1<<4));self._WR();
+    def _op_47_4(self): self._FETCH();
+
+    # PHA s
+    def _op_48_0(self): self._SA(self._PC);
+    def _op_48_1(self): self._SAD(0x0100|self._S,self._A);self._DES();self._WR();
+    def _op_48_2(self): self._FETCH();
+
+    # EOR #
+    def _op_49_0(self): self._SA(self._PC);self._INCPC();
+    def _op_49_1(self): self._A^=self._DATA;self._NZ(self._A);self._FETCH();
+
+    # LSR A
+    def _op_4a_0(self): self._SA(self._PC);
+    def _op_4a_1(self): self._A=self._lsr(self._A);self._FETCH();
+
+    # JMP a
+    def _op_4c_0(self): self._SA(self._PC);self._INCPC();
+    def _op_4c_1(self): self._SA(self._PC);self._INCPC();self._AD=self._DATA;
+    def _op_4c_2(self): self._PC=(self._DATA<<8)|self._AD;self._FETCH();
+
+    # EOR a
+    def _op_4d_0(self): self._SA(self._PC);self._INCPC();
+    def _op_4d_1(self): self._SA(self._PC);self._INCPC();self._AD=self._DATA;
+    def _op_4d_2(self): self._SA((self._DATA<<8)|self._AD);
+    def _op_4d_3(self): self._A^=self._DATA;self._NZ(self._A);self._FETCH();
+
+    # LSR a
+    def _op_4e_0(self): self._SA(self._PC);self._INCPC();
+    def _op_4e_1(self): self._SA(self._PC);self._INCPC();self._AD=self._DATA;
+    def _op_4e_2(self): self._SA((self._DATA<<8)|self._AD);
+    def _op_4e_3(self): self._AD=self._DATA;self._WR();
+    def _op_4e_4(self): self._SD(self._lsr(self._AD));self._WR();
+    def _op_4e_5(self): self._FETCH();
+
+    # BBR4 r
+    def _op_4f_0(self): self._SA(self._PC);self._INCPC();
+    def _op_4f_1(self): self._SA(self._DATA);
+    def _op_4f_2(self): self._AD=self._DATA;
+    def _op_4f_3(self): self._SA(self._PC);self._INCPC();
+    def _op_4f_4(self):
+        self._SA(self._PC);
+        if(not self._AD&(1<<4)):self._AD=(self._PC+((self._DATA^0x80)-0x80))&0xFFFF;
+        else:self._FETCH();
+    def _op_4f_5(self):
+        self._SA((self._PC&0xFF00)|(self._AD&0x00FF));
+        if((self._AD&0xFF00)==(self._PC&0xFF00)):self._PC=self._AD;self._FETCH();
+    def _op_4f_6(self): self._PC=self._AD;self._FETCH();
+
+    # BVC r
+    def _op_50_0(self): self._SA(self._PC);self._INCPC();
+    def _op_50_1(self):
+        self._SA(self._PC);self._AD=(self._PC+((self._DATA^0x80)-0x80))&0xFFFF;
+        if((self._P&0x40)!=0x0):self._FETCH();
+    def _op_50_2(self):
+        self._SA((self._PC&0xFF00)|(self._AD&0x00FF));
+        if((self._AD&0xFF00)==(self._PC&0xFF00)):self._PC=self._AD;self._FETCH();
+    def _op_50_3(self): self._PC=self._AD;self._FETCH();
+
+    # EOR (zp),y
+    def _op_51_0(self): self._SA(self._PC);self._INCPC();
+    def _op_51_1(self): self._AD=self._DATA;self._SA(self._AD);
+    def _op_51_2(self): self._SA((self._AD+1)&0xFF);self._AD=self._DATA;
+    def _op_51_3(self): self._AD|=self._DATA<<8;self._SA((self._AD&0xFF00)|((self._AD+self._Y)&0xFF));self._IR+=(~((self._AD>>8)-((self._AD+self._Y)>>8)))&1;
+    def _op_51_4(self): self._SA(self._AD+self._Y);
+    def _op_51_5(self): self._A^=self._DATA;self._NZ(self._A);self._FETCH();
+
+    # EOR (zp)
+    def _op_52_0(self): self._SA(self._PC);self._INCPC();
+    def _op_52_1(self): self._AD=self._DATA;self._SA(self._AD);
+    def _op_52_2(self): self._SA((self._AD+1)&0xFF);self._AD=self._DATA;
+    def _op_52_3(self): self._AD|=self._DATA<<8;self._SA((self._AD&0xFF00)|((self._AD)&0xFF));self._IR+=(~((self._AD>>8)-((self._AD)>>8)))&1;
+    def _op_52_4(self): self._SA(self._AD);
+    def _op_52_5(self): self._A^=self._DATA;self._NZ(self._A);self._FETCH();
+
+    # EOR zp,x
+    def _op_55_0(self): self._SA(self._PC);self._INCPC();
+    def _op_55_1(self): self._AD=self._DATA;self._SA(self._AD);
+    def _op_55_2(self): self._SA((self._AD+self._X)&0x00FF);
+    def _op_55_3(self): self._A^=self._DATA;self._NZ(self._A);self._FETCH();
+
+    # LSR zp,x
+    def _op_56_0(self): self._SA(self._PC);self._INCPC();
+    def _op_56_1(self): self._AD=self._DATA;self._SA(self._AD);
+    def _op_56_2(self): self._SA((self._AD+self._X)&0x00FF);
+    def _op_56_3(self): self._AD=self._DATA;self._WR();
+    def _op_56_4(self): self._SD(self._lsr(self._AD));self._WR();
+    def _op_56_5(self): self._FETCH();
+
+    # RMB5 zp
+    def _op_57_0(self): self._SA(self._PC);self._INCPC();
+    def _op_57_1(self): self._AD=self._DATA;self._SA(self._AD);
+    def _op_57_2(self): self._SA(self._AD);
+    def _op_57_3(self): self._SD(self._DATA&~(1<<5));self._WR();
+    def _op_57_4(self): self._FETCH();
+
+    # CLI i
+    def _op_58_0(self): self._SA(self._PC);
+    def _op_58_1(self): self._P&=~M65C02_IF;self._FETCH();
+
+    # EOR a,y
+    def _op_59_0(self): self._SA(self._PC);self._INCPC();
+    def _op_59_1(self): self._SA(self._PC);self._INCPC();self._AD=self._DATA;
+    def _op_59_2(self): self._AD|=self._DATA<<8;self._SA((self._AD&0xFF00)|((self._AD+self._Y)&0xFF));self._IR+=(~((self._AD>>8)-((self._AD+self._Y)>>8)))&1;
+    def _op_59_3(self): self._SA(self._AD+self._Y);
+    def _op_59_4(self): self._A^=self._DATA;self._NZ(self._A);self._FETCH();
+
+    # PHY s
+    def _op_5a_0(self): self._SA(self._PC);
+    def _op_5a_1(self): self._SAD(0x0100|self._S,self._Y);self._DES();self._WR();
+    def _op_5a_2(self): self._FETCH();
+
+    # EOR a,x
+    def _op_5d_0(self): self._SA(self._PC);self._INCPC();
+    def _op_5d_1(self): self._SA(self._PC);self._INCPC();self._AD=self._DATA;
+    def _op_5d_2(self): self._AD|=self._DATA<<8;self._SA((self._AD&0xFF00)|((self._AD+self._X)&0xFF));self._IR+=(~((self._AD>>8)-((self._AD+self._X)>>8)))&1;
+    def _op_5d_3(self): self._SA(self._AD+self._X);
+    def _op_5d_4(self): self._A^=self._DATA;self._NZ(self._A);self._FETCH();
+
+    # LSR a,x
+    def _op_5e_0(self): self._SA(self._PC);self._INCPC();
+    def _op_5e_1(self): self._SA(self._PC);self._INCPC();self._AD=self._DATA;
+    def _op_5e_2(self): self._AD|=self._DATA<<8;self._SA((self._AD&0xFF00)|((self._AD+self._X)&0xFF));self._IR+=(~((self._AD>>8)-((self._AD+self._X)>>8)))&1;
+    def _op_5e_3(self): self._SA(self._AD+self._X);
+    def _op_5e_4(self): self._AD=self._DATA;
+    def _op_5e_5(self): self._SD(self._lsr(self._AD));self._WR();
+    def _op_5e_6(self): self._FETCH();
+
+    # BBR5 r
+    def _op_5f_0(self): self._SA(self._PC);self._INCPC();
+    def _op_5f_1(self): self._SA(self._DATA);
+    def _op_5f_2(self): self._AD=self._DATA;
+    def _op_5f_3(self): self._SA(self._PC);self._INCPC();
+    def _op_5f_4(self):
+        self._SA(self._PC);
+        if(not self._AD&(1<<5)):self._AD=(self._PC+((self._DATA^0x80)-0x80))&0xFFFF;
+        else:self._FETCH();
+    def _op_5f_5(self):
+        self._SA((self._PC&0xFF00)|(self._AD&0x00FF));
+        if((self._AD&0xFF00)==(self._PC&0xFF00)):self._PC=self._AD;self._FETCH();
+    def _op_5f_6(self): self._PC=self._AD;self._FETCH();
+
+    # RTS s
+    def _op_60_0(self): self._SA(self._PC);
+    def _op_60_1(self): self._SA(0x0100|self._S);self._INS();
+    def _op_60_2(self): self._SA(0x0100|self._S);self._INS();
+    def _op_60_3(self): self._SA(0x0100|self._S);self._AD=self._DATA;
+    def _op_60_4(self): self._PC=(self._DATA<<8)|self._AD;self._SA(self._PC);self._INCPC();
+    def _op_60_5(self): self._FETCH();
+
+    # ADC (zp,x)
+    def _op_61_0(self): self._SA(self._PC);self._INCPC();
+    def _op_61_1(self): self._AD=self._DATA;self._SA(self._AD);
+    def _op_61_2(self): self._AD=(self._AD+self._X)&0xFF;self._SA(self._AD);
+    def _op_61_3(self): self._SA((self._AD+1)&0xFF);self._AD=self._DATA;
+    def _op_61_4(self): self._SA((self._DATA<<8)|self._AD);
+    def _op_61_5(self): self._adc(self._DATA);self._FETCH_DF();
+    def _op_61_6(self): self._FETCH();
+
+    # STZ zp
+    def _op_64_0(self): self._SA(self._PC);self._INCPC();
+    def _op_64_1(self): self._SA(self._DATA);self._SD(0x00);self._WR();
+    def _op_64_2(self): self._FETCH();
+
+    # ADC zp
+    def _op_65_0(self): self._SA(self._PC);self._INCPC();
+    def _op_65_1(self): self._SA(self._DATA);
+    def _op_65_2(self): self._adc(self._DATA);self._FETCH_DF();
+    def _op_65_3(self): self._FETCH();
+
+    # ROR zp
+    def _op_66_0(self): self._SA(self._PC);self._INCPC();
+    def _op_66_1(self): self._SA(self._DATA);
+    def _op_66_2(self): self._AD=self._DATA;self._WR();
+    def _op_66_3(self): self._SD(self._ror(self._AD));self._WR();
+    def _op_66_4(self): self._FETCH();
+
+    # RMB6 zp
+    def _op_67_0(self): self._SA(self._PC);self._INCPC();
+    def _op_67_1(self): self._AD=self._DATA;self._SA(self._AD);
+    def _op_67_2(self): self._SA(self._AD);
+    def _op_67_3(self): self._SD(self._DATA&~(1<<6));self._WR();
+    def _op_67_4(self): self._FETCH();
+
+    # PLA s
+    def _op_68_0(self): self._SA(self._PC);
+    def _op_68_1(self): self._SA(0x0100|self._S);self._INS();
+    def _op_68_2(self): self._SA(0x0100|self._S);
+    def _op_68_3(self): self._A=self._DATA;self._NZ(self._A);self._FETCH();
+
+    # ADC #
+    def _op_69_0(self): self._SA(self._PC);self._INCPC();
+    def _op_69_1(self): self._adc(self._DATA);self._FETCH_DF();
+    def _op_69_2(self): self._FETCH();
+
+    # ROR A
+    def _op_6a_0(self): self._SA(self._PC);
+    def _op_6a_1(self): self._A=self._ror(self._A);self._FETCH();
+
+    # JMP (a)
+    def _op_6c_0(self): self._SA(self._PC);self._INCPC();
+    def _op_6c_1(self): self._SA(self._PC);self._INCPC();self._AD=self._DATA;
+    def _op_6c_2(self): self._AD|=self._DATA<<8;self._SA(self._PC);
+    def _op_6c_3(self): self._SA(self._AD);
+    def _op_6c_4(self): self._SA(self._AD+1);self._AD=self._DATA;
+    def _op_6c_5(self): self._PC=(self._DATA<<8)|self._AD;self._FETCH();
+
+    # ADC a
+    def _op_6d_0(self): self._SA(self._PC);self._INCPC();
+    def _op_6d_1(self): self._SA(self._PC);self._INCPC();self._AD=self._DATA;
+    def _op_6d_2(self): self._SA((self._DATA<<8)|self._AD);
+    def _op_6d_3(self): self._adc(self._DATA);self._FETCH_DF();
+    def _op_6d_4(self): self._FETCH();
+
+    # ROR a
+    def _op_6e_0(self): self._SA(self._PC);self._INCPC();
+    def _op_6e_1(self): self._SA(self._PC);self._INCPC();self._AD=self._DATA;
+    def _op_6e_2(self): self._SA((self._DATA<<8)|self._AD);
+    def _op_6e_3(self): self._AD=self._DATA;self._WR();
+    def _op_6e_4(self): self._SD(self._ror(self._AD));self._WR();
+    def _op_6e_5(self): self._FETCH();
+
+    # BBR6 r
+    def _op_6f_0(self): self._SA(self._PC);self._INCPC();
+    def _op_6f_1(self): self._SA(self._DATA);
+    def _op_6f_2(self): self._AD=self._DATA;
+    def _op_6f_3(self): self._SA(self._PC);self._INCPC();
+    def _op_6f_4(self):
+        self._SA(self._PC);
+        if(not self._AD&(1<<6)):self._AD=(self._PC+((self._DATA^0x80)-0x80))&0xFFFF;
+        else:self._FETCH();
+    def _op_6f_5(self):
+        self._SA((self._PC&0xFF00)|(self._AD&0x00FF));
+        if((self._AD&0xFF00)==(self._PC&0xFF00)):self._PC=self._AD;self._FETCH();
+    def _op_6f_6(self): self._PC=self._AD;self._FETCH();
+
+    # BVS r
+    def _op_70_0(self): self._SA(self._PC);self._INCPC();
+    def _op_70_1(self):
+        self._SA(self._PC);self._AD=(self._PC+((self._DATA^0x80)-0x80))&0xFFFF;
+        if((self._P&0x40)!=0x40):self._FETCH();
+    def _op_70_2(self):
+        self._SA((self._PC&0xFF00)|(self._AD&0x00FF));
+        if((self._AD&0xFF00)==(self._PC&0xFF00)):self._PC=self._AD;self._FETCH();
+    def _op_70_3(self): self._PC=self._AD;self._FETCH();
+
+    # ADC (zp),y
+    def _op_71_0(self): self._SA(self._PC);self._INCPC();
+    def _op_71_1(self): self._AD=self._DATA;self._SA(self._AD);
+    def _op_71_2(self): self._SA((self._AD+1)&0xFF);self._AD=self._DATA;
+    def _op_71_3(self): self._AD|=self._DATA<<8;self._SA((self._AD&0xFF00)|((self._AD+self._Y)&0xFF));self._IR+=(~((self._AD>>8)-((self._AD+self._Y)>>8)))&1;
+    def _op_71_4(self): self._SA(self._AD+self._Y);
+    def _op_71_5(self): self._adc(self._DATA);self._FETCH_DF();
+    def _op_71_6(self): self._FETCH();
+
+    # ADC (zp)
+    def _op_72_0(self): self._SA(self._PC);self._INCPC();
+    def _op_72_1(self): self._AD=self._DATA;self._SA(self._AD);
+    def _op_72_2(self): self._SA((self._AD+1)&0xFF);self._AD=self._DATA;
+    def _op_72_3(self): self._AD|=self._DATA<<8;self._SA((self._AD&0xFF00)|((self._AD)&0xFF));self._IR+=(~((self._AD>>8)-((self._AD)>>8)))&1;
+    def _op_72_4(self): self._SA(self._AD);
+    def _op_72_5(self): self._adc(self._DATA);self._FETCH_DF();
+    def _op_72_6(self): self._FETCH();
+
+    # STZ zp,x
+    def _op_74_0(self): self._SA(self._PC);self._INCPC();
+    def _op_74_1(self): self._AD=self._DATA;self._SA(self._AD);
+    def _op_74_2(self): self._SA((self._AD+self._X)&0x00ff);self._SD(0x00);self._WR();
+    def _op_74_3(self): self._FETCH();
+
+    # ADC zp,x
+    def _op_75_0(self): self._SA(self._PC);self._INCPC();
+    def _op_75_1(self): self._AD=self._DATA;self._SA(self._AD);
+    def _op_75_2(self): self._SA((self._AD+self._X)&0x00FF);
+    def _op_75_3(self): self._adc(self._DATA);self._FETCH_DF();
+    def _op_75_4(self): self._FETCH();
+
+    # ROR zp,x
+    def _op_76_0(self): self._SA(self._PC);self._INCPC();
+    def _op_76_1(self): self._AD=self._DATA;self._SA(self._AD);
+    def _op_76_2(self): self._SA((self._AD+self._X)&0x00FF);
+    def _op_76_3(self): self._AD=self._DATA;self._WR();
+    def _op_76_4(self): self._SD(self._ror(self._AD));self._WR();
+    def _op_76_5(self): self._FETCH();
+
+    # RMB7 zp
+    def _op_77_0(self): self._SA(self._PC);self._INCPC();
+    def _op_77_1(self): self._AD=self._DATA;self._SA(self._AD);
+    def _op_77_2(self): self._SA(self._AD);
+    def _op_77_3(self): self._SD(self._DATA&~(1<<7));self._WR();
+    def _op_77_4(self): self._FETCH();
+
+    # SEI i
+    def _op_78_0(self): self._SA(self._PC);
+    def _op_78_1(self): self._P|=M65C02_IF;self._FETCH();
+
+    # ADC a,y
+    def _op_79_0(self): self._SA(self._PC);self._INCPC();
+    def _op_79_1(self): self._SA(self._PC);self._INCPC();self._AD=self._DATA;
+    def _op_79_2(self): self._AD|=self._DATA<<8;self._SA((self._AD&0xFF00)|((self._AD+self._Y)&0xFF));self._IR+=(~((self._AD>>8)-((self._AD+self._Y)>>8)))&1;
+    def _op_79_3(self): self._SA(self._AD+self._Y);
+    def _op_79_4(self): self._adc(self._DATA);self._FETCH_DF();
+    def _op_79_5(self): self._FETCH();
+
+    # PLY s
+    def _op_7a_0(self): self._SA(self._PC);
+    def _op_7a_1(self): self._SA(0x0100|self._S);self._INS();
+    def _op_7a_2(self): self._SA(0x0100|self._S);
+    def _op_7a_3(self): self._Y=self._DATA;self._NZ(self._Y);self._FETCH();
+
+    # JMP (a,x)
+    def _op_7c_0(self): self._SA(self._PC);self._INCPC();
+    def _op_7c_1(self): self._SA(self._PC);self._INCPC();self._AD=self._DATA;
+    def _op_7c_2(self): self._AD|=self._DATA<<8;self._SA(self._PC);
+    def _op_7c_3(self): self._AD=(self._AD+self._X)&0xFFFF;self._SA(self._AD);
+    def _op_7c_4(self): self._SA(self._AD+1);self._AD=self._DATA;
+    def _op_7c_5(self): self._PC=(self._DATA<<8)|self._AD;self._FETCH();
+
+    # ADC a,x
+    def _op_7d_0(self): self._SA(self._PC);self._INCPC();
+    def _op_7d_1(self): self._SA(self._PC);self._INCPC();self._AD=self._DATA;
+    def _op_7d_2(self): self._AD|=self._DATA<<8;self._SA((self._AD&0xFF00)|((self._AD+self._X)&0xFF));self._IR+=(~((self._AD>>8)-((self._AD+self._X)>>8)))&1;
+    def _op_7d_3(self): self._SA(self._AD+self._X);
+    def _op_7d_4(self): self._adc(self._DATA);self._FETCH_DF();
+    def _op_7d_5(self): self._FETCH();
+
+    # ROR a,x
+    def _op_7e_0(self): self._SA(self._PC);self._INCPC();
+    def _op_7e_1(self): self._SA(self._PC);self._INCPC();self._AD=self._DATA;
+    def _op_7e_2(self): self._AD|=self._DATA<<8;self._SA((self._AD&0xFF00)|((self._AD+self._X)&0xFF));self._IR+=(~((self._AD>>8)-((self._AD+self._X)>>8)))&1;
+    def _op_7e_3(self): self._SA(self._AD+self._X);
+    def _op_7e_4(self): self._AD=self._DATA;
+    def _op_7e_5(self): self._SD(self._ror(self._AD));self._WR();
+    def _op_7e_6(self): self._FETCH();
+
+    # BBR7 r
+    def _op_7f_0(self): self._SA(self._PC);self._INCPC();
+    def _op_7f_1(self): self._SA(self._DATA);
+    def _op_7f_2(self): self._AD=self._DATA;
+    def _op_7f_3(self): self._SA(self._PC);self._INCPC();
+    def _op_7f_4(self):
+        self._SA(self._PC);
+        if(not self._AD&(1<<7)):self._AD=(self._PC+((self._DATA^0x80)-0x80))&0xFFFF;
+        else:self._FETCH();
+    def _op_7f_5(self):
+        self._SA((self._PC&0xFF00)|(self._AD&0x00FF));
+        if((self._AD&0xFF00)==(self._PC&0xFF00)):self._PC=self._AD;self._FETCH();
+    def _op_7f_6(self): self._PC=self._AD;self._FETCH();
+
+    # BRA r
+    def _op_80_0(self): self._SA(self._PC);self._INCPC();
+    def _op_80_1(self): self._SA(self._PC);self._AD=(self._PC+((self._DATA^0x80)-0x80))&0xFFFF;
+    def _op_80_2(self):
+        self._SA((self._PC&0xFF00)|(self._AD&0x00FF));
+        if((self._AD&0xFF00)==(self._PC&0xFF00)):self._PC=self._AD;self._FETCH();
+    def _op_80_3(self): self._PC=self._AD;self._FETCH();
+
+    # STA (zp,x)
+    def _op_81_0(self): self._SA(self._PC);self._INCPC();
+    def _op_81_1(self): self._AD=self._DATA;self._SA(self._AD);
+    def _op_81_2(self): self._AD=(self._AD+self._X)&0xFF;self._SA(self._AD);
+    def _op_81_3(self): self._SA((self._AD+1)&0xFF);self._AD=self._DATA;
+    def _op_81_4(self): self._SA((self._DATA<<8)|self._AD);self._SD(self._A);self._WR();
+    def _op_81_5(self): self._FETCH();
+
+    # STY zp
+    def _op_84_0(self): self._SA(self._PC);self._INCPC();
+    def _op_84_1(self): self._SA(self._DATA);self._SD(self._Y);self._WR();
+    def _op_84_2(self): self._FETCH();
+
+    # STA zp
+    def _op_85_0(self): self._SA(self._PC);self._INCPC();
+    def _op_85_1(self): self._SA(self._DATA);self._SD(self._A);self._WR();
+    def _op_85_2(self): self._FETCH();
+
+    # STX zp
+    def _op_86_0(self): self._SA(self._PC);self._INCPC();
+    def _op_86_1(self): self._SA(self._DATA);self._SD(self._X);self._WR();
+    def _op_86_2(self): self._FETCH();
+
+    # SMB0 zp
+    def _op_87_0(self): self._SA(self._PC);self._INCPC();
+    def _op_87_1(self): self._AD=self._DATA;self._SA(self._AD);
+    def _op_87_2(self): self._SA(self._AD);
+    def _op_87_3(self): self._SD(self._DATA|(1<<0));self._WR();
+    def _op_87_4(self): self._FETCH();
+
+    # DEY i
+    def _op_88_0(self): self._SA(self._PC);
+    def _op_88_1(self): self._DEY();self._NZ(self._Y);self._FETCH();
+
+    # BIT #
+    def _op_89_0(self): self._SA(self._PC);self._INCPC();
+    def _op_89_1(self): self._P=(self._P&~M65C02_ZF)|(0 if self._A&self._DATA else M65C02_ZF);self._FETCH();
+
+    # TXA i
+    def _op_8a_0(self): self._SA(self._PC);
+    def _op_8a_1(self): self._A=self._X;self._NZ(self._A);self._FETCH();
+
+    # STY a
+    def _op_8c_0(self): self._SA(self._PC);self._INCPC();
+    def _op_8c_1(self): self._SA(self._PC);self._INCPC();self._AD=self._DATA;
+    def _op_8c_2(self): self._SA((self._DATA<<8)|self._AD);self._SD(self._Y);self._WR();
+    def _op_8c_3(self): self._FETCH();
+
+    # STA a
+    def _op_8d_0(self): self._SA(self._PC);self._INCPC();
+    def _op_8d_1(self): self._SA(self._PC);self._INCPC();self._AD=self._DATA;
+    def _op_8d_2(self): self._SA((self._DATA<<8)|self._AD);self._SD(self._A);self._WR();
+    def _op_8d_3(self): self._FETCH();
+
+    # STX a
+    def _op_8e_0(self): self._SA(self._PC);self._INCPC();
+    def _op_8e_1(self): self._SA(self._PC);self._INCPC();self._AD=self._DATA;
+    def _op_8e_2(self): self._SA((self._DATA<<8)|self._AD);self._SD(self._X);self._WR();
+    def _op_8e_3(self): self._FETCH();
+
+    # BBS0 r
+    def _op_8f_0(self): self._SA(self._PC);self._INCPC();
+    def _op_8f_1(self): self._SA(self._DATA);
+    def _op_8f_2(self): self._AD=self._DATA;
+    def _op_8f_3(self): self._SA(self._PC);self._INCPC();
+    def _op_8f_4(self):
+        self._SA(self._PC);
+        if(self._AD&(1<<0)):self._AD=(self._PC+((self._DATA^0x80)-0x80))&0xFFFF;
+        else:self._FETCH();
+    def _op_8f_5(self):
+        self._SA((self._PC&0xFF00)|(self._AD&0x00FF));
+        if((self._AD&0xFF00)==(self._PC&0xFF00)):self._PC=self._AD;self._FETCH();
+    def _op_8f_6(self): self._PC=self._AD;self._FETCH();
+
+    # BCC r
+    def _op_90_0(self): self._SA(self._PC);self._INCPC();
+    def _op_90_1(self):
+        self._SA(self._PC);self._AD=(self._PC+((self._DATA^0x80)-0x80))&0xFFFF;
+        if((self._P&0x1)!=0x0):self._FETCH();
+    def _op_90_2(self):
+        self._SA((self._PC&0xFF00)|(self._AD&0x00FF));
+        if((self._AD&0xFF00)==(self._PC&0xFF00)):self._PC=self._AD;self._FETCH();
+    def _op_90_3(self): self._PC=self._AD;self._FETCH();
+
+    # STA (zp),y
+    def _op_91_0(self): self._SA(self._PC);self._INCPC();
+    def _op_91_1(self): self._AD=self._DATA;self._SA(self._AD);
+    def _op_91_2(self): self._SA((self._AD+1)&0xFF);self._AD=self._DATA;
+    def _op_91_3(self): self._AD|=self._DATA<<8;self._SA((self._AD&0xFF00)|((self._AD+self._Y)&0xFF));
+    def _op_91_4(self): self._SA(self._AD+self._Y);self._SD(self._A);self._WR();
+    def _op_91_5(self): self._FETCH();
+
+    # STA (zp)
+    def _op_92_0(self): self._SA(self._PC);self._INCPC();
+    def _op_92_1(self): self._AD=self._DATA;self._SA(self._AD);
+    def _op_92_2(self): self._SA((self._AD+1)&0xFF);self._AD=self._DATA;
+    def _op_92_3(self): self._SA((self._DATA<<8)|self._AD);self._SD(self._A);self._WR();
+    def _op_92_4(self): self._FETCH();
+
+    # STY zp,x
+    def _op_94_0(self): self._SA(self._PC);self._INCPC();
+    def _op_94_1(self): self._AD=self._DATA;self._SA(self._AD);
+    def _op_94_2(self): self._SA((self._AD+self._X)&0x00FF);self._SD(self._Y);self._WR();
+    def _op_94_3(self): self._FETCH();
+
+    # STA zp,x
+    def _op_95_0(self): self._SA(self._PC);self._INCPC();
+    def _op_95_1(self): self._AD=self._DATA;self._SA(self._AD);
+    def _op_95_2(self): self._SA((self._AD+self._X)&0x00FF);self._SD(self._A);self._WR();
+    def _op_95_3(self): self._FETCH();
+
+    # STX zp,y
+    def _op_96_0(self): self._SA(self._PC);self._INCPC();
+    def _op_96_1(self): self._AD=self._DATA;self._SA(self._AD);
+    def _op_96_2(self): self._SA((self._AD+self._Y)&0x00FF);self._SD(self._X);self._WR();
+    def _op_96_3(self): self._FETCH();
+
+    # SMB1 zp
+    def _op_97_0(self): self._SA(self._PC);self._INCPC();
+    def _op_97_1(self): self._AD=self._DATA;self._SA(self._AD);
+    def _op_97_2(self): self._SA(self._AD);
+    def _op_97_3(self): self._SD(self._DATA|(1<<1));self._WR();
+    def _op_97_4(self): self._FETCH();
+
+    # TYA i
+    def _op_98_0(self): self._SA(self._PC);
+    def _op_98_1(self): self._A=self._Y;self._NZ(self._A);self._FETCH();
+
+    # STA a,y
+    def _op_99_0(self): self._SA(self._PC);self._INCPC();
+    def _op_99_1(self): self._SA(self._PC);self._INCPC();self._AD=self._DATA;
+    def _op_99_2(self): self._AD|=self._DATA<<8;self._SA((self._AD&0xFF00)|((self._AD+self._Y)&0xFF));
+    def _op_99_3(self): self._SA(self._AD+self._Y);self._SD(self._A);self._WR();
+    def _op_99_4(self): self._FETCH();
+
+    # TXS i
+    def _op_9a_0(self): self._SA(self._PC);
+    def _op_9a_1(self): self._S=self._X;self._FETCH();
+
+    # STZ a
+    def _op_9c_0(self): self._SA(self._PC);self._INCPC();
+    def _op_9c_1(self): self._SA(self._PC);self._INCPC();self._AD=self._DATA;
+    def _op_9c_2(self): self._SA((self._DATA<<8)|self._AD);self._SD(0x00);self._WR();
+    def _op_9c_3(self): self._FETCH();
+
+    # STA a,x
+    def _op_9d_0(self): self._SA(self._PC);self._INCPC();
+    def _op_9d_1(self): self._SA(self._PC);self._INCPC();self._AD=self._DATA;
+    def _op_9d_2(self): self._AD|=self._DATA<<8;self._SA((self._AD&0xFF00)|((self._AD+self._X)&0xFF));
+    def _op_9d_3(self): self._SA(self._AD+self._X);self._SD(self._A);self._WR();
+    def _op_9d_4(self): self._FETCH();
+
+    # STZ a,x
+    def _op_9e_0(self): self._SA(self._PC);self._INCPC();
+    def _op_9e_1(self): self._SA(self._PC);self._INCPC();self._AD=self._DATA;
+    def _op_9e_2(self): self._AD|=self._DATA<<8;self._SA((self._AD&0xFF00)|((self._AD+self._X)&0xFF));
+    def _op_9e_3(self): self._SA(self._AD+self._X);self._SD(0x00);self._WR();
+    def _op_9e_4(self): self._FETCH();
+
+    # BBS1 r
+    def _op_9f_0(self): self._SA(self._PC);self._INCPC();
+    def _op_9f_1(self): self._SA(self._DATA);
+    def _op_9f_2(self): self._AD=self._DATA;
+    def _op_9f_3(self): self._SA(self._PC);self._INCPC();
+    def _op_9f_4(self):
+        self._SA(self._PC);
+        if(self._AD&(1<<1)):self._AD=(self._PC+((self._DATA^0x80)-0x80))&0xFFFF;
+        else:self._FETCH();
+    def _op_9f_5(self):
+        self._SA((self._PC&0xFF00)|(self._AD&0x00FF));
+        if((self._AD&0xFF00)==(self._PC&0xFF00)):self._PC=self._AD;self._FETCH();
+    def _op_9f_6(self): self._PC=self._AD;self._FETCH();
+
+    # LDY #
+    def _op_a0_0(self): self._SA(self._PC);self._INCPC();
+    def _op_a0_1(self): self._Y=self._DATA;self._NZ(self._Y);self._FETCH();
+
+    # LDA (zp,x)
+    def _op_a1_0(self): self._SA(self._PC);self._INCPC();
+    def _op_a1_1(self): self._AD=self._DATA;self._SA(self._AD);
+    def _op_a1_2(self): self._AD=(self._AD+self._X)&0xFF;self._SA(self._AD);
+    def _op_a1_3(self): self._SA((self._AD+1)&0xFF);self._AD=self._DATA;
+    def _op_a1_4(self): self._SA((self._DATA<<8)|self._AD);
+    def _op_a1_5(self): self._A=self._DATA;self._NZ(self._A);self._FETCH();
+
+    # LDX #
+    def _op_a2_0(self): self._SA(self._PC);self._INCPC();
+    def _op_a2_1(self): self._X=self._DATA;self._NZ(self._X);self._FETCH();
+
+    # LDY zp
+    def _op_a4_0(self): self._SA(self._PC);self._INCPC();
+    def _op_a4_1(self): self._SA(self._DATA);
+    def _op_a4_2(self): self._Y=self._DATA;self._NZ(self._Y);self._FETCH();
+
+    # LDA zp
+    def _op_a5_0(self): self._SA(self._PC);self._INCPC();
+    def _op_a5_1(self): self._SA(self._DATA);
+    def _op_a5_2(self): self._A=self._DATA;self._NZ(self._A);self._FETCH();
+
+    # LDX zp
+    def _op_a6_0(self): self._SA(self._PC);self._INCPC();
+    def _op_a6_1(self): self._SA(self._DATA);
+    def _op_a6_2(self): self._X=self._DATA;self._NZ(self._X);self._FETCH();
+
+    # SMB2 zp
+    def _op_a7_0(self): self._SA(self._PC);self._INCPC();
+    def _op_a7_1(self): self._AD=self._DATA;self._SA(self._AD);
+    def _op_a7_2(self): self._SA(self._AD);
+    def _op_a7_3(self): self._SD(self._DATA|(1<<2));self._WR();
+    def _op_a7_4(self): self._FETCH();
+
+    # TAY i
+    def _op_a8_0(self): self._SA(self._PC);
+    def _op_a8_1(self): self._Y=self._A;self._NZ(self._Y);self._FETCH();
+
+    # LDA #
+    def _op_a9_0(self): self._SA(self._PC);self._INCPC();
+    def _op_a9_1(self): self._A=self._DATA;self._NZ(self._A);self._FETCH();
+
+    # TAX i
+    def _op_aa_0(self): self._SA(self._PC);
+    def _op_aa_1(self): self._X=self._A;self._NZ(self._X);self._FETCH();
+
+    # LDY A
+    def _op_ac_0(self): self._SA(self._PC);self._INCPC();
+    def _op_ac_1(self): self._SA(self._PC);self._INCPC();self._AD=self._DATA;
+    def _op_ac_2(self): self._SA((self._DATA<<8)|self._AD);
+    def _op_ac_3(self): self._Y=self._DATA;self._NZ(self._Y);self._FETCH();
+
+    # LDA a
+    def _op_ad_0(self): self._SA(self._PC);self._INCPC();
+    def _op_ad_1(self): self._SA(self._PC);self._INCPC();self._AD=self._DATA;
+    def _op_ad_2(self): self._SA((self._DATA<<8)|self._AD);
+    def _op_ad_3(self): self._A=self._DATA;self._NZ(self._A);self._FETCH();
+
+    # LDX a
+    def _op_ae_0(self): self._SA(self._PC);self._INCPC();
+    def _op_ae_1(self): self._SA(self._PC);self._INCPC();self._AD=self._DATA;
+    def _op_ae_2(self): self._SA((self._DATA<<8)|self._AD);
+    def _op_ae_3(self): self._X=self._DATA;self._NZ(self._X);self._FETCH();
+
+    # BBS2 r
+    def _op_af_0(self): self._SA(self._PC);self._INCPC();
+    def _op_af_1(self): self._SA(self._DATA);
+    def _op_af_2(self): self._AD=self._DATA;
+    def _op_af_3(self): self._SA(self._PC);self._INCPC();
+    def _op_af_4(self):
+        self._SA(self._PC);
+        if(self._AD&(1<<2)):self._AD=(self._PC+((self._DATA^0x80)-0x80))&0xFFFF;
+        else:self._FETCH();
+    def _op_af_5(self):
+        self._SA((self._PC&0xFF00)|(self._AD&0x00FF));
+        if((self._AD&0xFF00)==(self._PC&0xFF00)):self._PC=self._AD;self._FETCH();
+    def _op_af_6(self): self._PC=self._AD;self._FETCH();
+
+    # BCS r
+    def _op_b0_0(self): self._SA(self._PC);self._INCPC();
+    def _op_b0_1(self):
+        self._SA(self._PC);self._AD=(self._PC+((self._DATA^0x80)-0x80))&0xFFFF;
+        if((self._P&0x1)!=0x1):self._FETCH();
+    def _op_b0_2(self):
+        self._SA((self._PC&0xFF00)|(self._AD&0x00FF));
+        if((self._AD&0xFF00)==(self._PC&0xFF00)):self._PC=self._AD;self._FETCH();
+    def _op_b0_3(self): self._PC=self._AD;self._FETCH();
+
+    # LDA (zp),y
+    def _op_b1_0(self): self._SA(self._PC);self._INCPC();
+    def _op_b1_1(self): self._AD=self._DATA;self._SA(self._AD);
+    def _op_b1_2(self): self._SA((self._AD+1)&0xFF);self._AD=self._DATA;
+    def _op_b1_3(self): self._AD|=self._DATA<<8;self._SA((self._AD&0xFF00)|((self._AD+self._Y)&0xFF));self._IR+=(~((self._AD>>8)-((self._AD+self._Y)>>8)))&1;
+    def _op_b1_4(self): self._SA(self._AD+self._Y);
+    def _op_b1_5(self): self._A=self._DATA;self._NZ(self._A);self._FETCH();
+
+    # LDA (zp)
+    def _op_b2_0(self): self._SA(self._PC);self._INCPC();
+    def _op_b2_1(self): self._AD=self._DATA;self._SA(self._AD);
+    def _op_b2_2(self): self._SA((self._AD+1)&0xFF);self._AD=self._DATA;
+    def _op_b2_3(self): self._AD|=self._DATA<<8;self._SA((self._AD&0xFF00)|((self._AD)&0xFF));self._IR+=(~((self._AD>>8)-((self._AD)>>8)))&1;
+    def _op_b2_4(self): self._SA(self._AD);
+    def _op_b2_5(self): self._A=self._DATA;self._NZ(self._A);self._FETCH();
+
+    # LDY zp,x
+    def _op_b4_0(self): self._SA(self._PC);self._INCPC();
+    def _op_b4_1(self): self._AD=self._DATA;self._SA(self._AD);
+    def _op_b4_2(self): self._SA((self._AD+self._X)&0x00FF);
+    def _op_b4_3(self): self._Y=self._DATA;self._NZ(self._Y);self._FETCH();
+
+    # LDA zp,x
+    def _op_b5_0(self): self._SA(self._PC);self._INCPC();
+    def _op_b5_1(self): self._AD=self._DATA;self._SA(self._AD);
+    def _op_b5_2(self): self._SA((self._AD+self._X)&0x00FF);
+    def _op_b5_3(self): self._A=self._DATA;self._NZ(self._A);self._FETCH();
+
+    # LDX zp,y
+    def _op_b6_0(self): self._SA(self._PC);self._INCPC();
+    def _op_b6_1(self): self._AD=self._DATA;self._SA(self._AD);
+    def _op_b6_2(self): self._SA((self._AD+self._Y)&0x00FF);
+    def _op_b6_3(self): self._X=self._DATA;self._NZ(self._X);self._FETCH();
+
+    # SMB3 zp
+    def _op_b7_0(self): self._SA(self._PC);self._INCPC();
+    def _op_b7_1(self): self._AD=self._DATA;self._SA(self._AD);
+    def _op_b7_2(self): self._SA(self._AD);
+    def _op_b7_3(self): self._SD(self._DATA|(1<<3));self._WR();
+    def _op_b7_4(self): self._FETCH();
+
+    # CLV i
+    def _op_b8_0(self): self._SA(self._PC);
+    def _op_b8_1(self): self._P&=~M65C02_VF;self._FETCH();
+
+    # LDA A,y
+    def _op_b9_0(self): self._SA(self._PC);self._INCPC();
+    def _op_b9_1(self): self._SA(self._PC);self._INCPC();self._AD=self._DATA;
+    def _op_b9_2(self): self._AD|=self._DATA<<8;self._SA((self._AD&0xFF00)|((self._AD+self._Y)&0xFF));self._IR+=(~((self._AD>>8)-((self._AD+self._Y)>>8)))&1;
+    def _op_b9_3(self): self._SA(self._AD+self._Y);
+    def _op_b9_4(self): self._A=self._DATA;self._NZ(self._A);self._FETCH();
+
+    # TSX i
+    def _op_ba_0(self): self._SA(self._PC);
+    def _op_ba_1(self): self._X=self._S;self._NZ(self._X);self._FETCH();
+
+    # LDY a,x
+    def _op_bc_0(self): self._SA(self._PC);self._INCPC();
+    def _op_bc_1(self): self._SA(self._PC);self._INCPC();self._AD=self._DATA;
+    def _op_bc_2(self): self._AD|=self._DATA<<8;self._SA((self._AD&0xFF00)|((self._AD+self._X)&0xFF));self._IR+=(~((self._AD>>8)-((self._AD+self._X)>>8)))&1;
+    def _op_bc_3(self): self._SA(self._AD+self._X);
+    def _op_bc_4(self): self._Y=self._DATA;self._NZ(self._Y);self._FETCH();
+
+    # LDA a,x
+    def _op_bd_0(self): self._SA(self._PC);self._INCPC();
+    def _op_bd_1(self): self._SA(self._PC);self._INCPC();self._AD=self._DATA;
+    def _op_bd_2(self): self._AD|=self._DATA<<8;self._SA((self._AD&0xFF00)|((self._AD+self._X)&0xFF));self._IR+=(~((self._AD>>8)-((self._AD+self._X)>>8)))&1;
+    def _op_bd_3(self): self._SA(self._AD+self._X);
+    def _op_bd_4(self): self._A=self._DATA;self._NZ(self._A);self._FETCH();
+
+    # LDX a,y
+    def _op_be_0(self): self._SA(self._PC);self._INCPC();
+    def _op_be_1(self): self._SA(self._PC);self._INCPC();self._AD=self._DATA;
+    def _op_be_2(self): self._AD|=self._DATA<<8;self._SA((self._AD&0xFF00)|((self._AD+self._Y)&0xFF));self._IR+=(~((self._AD>>8)-((self._AD+self._Y)>>8)))&1;
+    def _op_be_3(self): self._SA(self._AD+self._Y);
+    def _op_be_4(self): self._X=self._DATA;self._NZ(self._X);self._FETCH();
+
+    # BBS3 r
+    def _op_bf_0(self): self._SA(self._PC);self._INCPC();
+    def _op_bf_1(self): self._SA(self._DATA);
+    def _op_bf_2(self): self._AD=self._DATA;
+    def _op_bf_3(self): self._SA(self._PC);self._INCPC();
+    def _op_bf_4(self):
+        self._SA(self._PC);
+        if(self._AD&(1<<3)):self._AD=(self._PC+((self._DATA^0x80)-0x80))&0xFFFF;
+        else:self._FETCH();
+    def _op_bf_5(self):
+        self._SA((self._PC&0xFF00)|(self._AD&0x00FF));
+        if((self._AD&0xFF00)==(self._PC&0xFF00)):self._PC=self._AD;self._FETCH();
+    def _op_bf_6(self): self._PC=self._AD;self._FETCH();
+
+    # CPY #
+    def _op_c0_0(self): self._SA(self._PC);self._INCPC();
+    def _op_c0_1(self): self._cmp(self._Y, self._DATA);self._FETCH();
+
+    # CMP (zp,x)
+    def _op_c1_0(self): self._SA(self._PC);self._INCPC();
+    def _op_c1_1(self): self._AD=self._DATA;self._SA(self._AD);
+    def _op_c1_2(self): self._AD=(self._AD+self._X)&0xFF;self._SA(self._AD);
+    def _op_c1_3(self): self._SA((self._AD+1)&0xFF);self._AD=self._DATA;
+    def _op_c1_4(self): self._SA((self._DATA<<8)|self._AD);
+    def _op_c1_5(self): self._cmp(self._A, self._DATA);self._FETCH();
+
+    # CPY zp
+    def _op_c4_0(self): self._SA(self._PC);self._INCPC();
+    def _op_c4_1(self): self._SA(self._DATA);
+    def _op_c4_2(self): self._cmp(self._Y, self._DATA);self._FETCH();
+
+    # CMP zp
+    def _op_c5_0(self): self._SA(self._PC);self._INCPC();
+    def _op_c5_1(self): self._SA(self._DATA);
+    def _op_c5_2(self): self._cmp(self._A, self._DATA);self._FETCH();
+
+    # DEC zp
+    def _op_c6_0(self): self._SA(self._PC);self._INCPC();
+    def _op_c6_1(self): self._SA(self._DATA);
+    def _op_c6_2(self): self._AD=self._DATA;self._WR();
+    def _op_c6_3(self): self._DECAD();self._NZ(self._AD);self._SD(self._AD);self._WR();
+    def _op_c6_4(self): self._FETCH();
+
+    # SMB4 zp
+    def _op_c7_0(self): self._SA(self._PC);self._INCPC();
+    def _op_c7_1(self): self._AD=self._DATA;self._SA(self._AD);
+    def _op_c7_2(self): self._SA(self._AD);
+    def _op_c7_3(self): self._SD(self._DATA|(1<<4));self._WR();
+    def _op_c7_4(self): self._FETCH();
+
+    # INY i
+    def _op_c8_0(self): self._SA(self._PC);
+    def _op_c8_1(self): self._INY();self._NZ(self._Y);self._FETCH();
+
+    # CMP #
+    def _op_c9_0(self): self._SA(self._PC);self._INCPC();
+    def _op_c9_1(self): self._cmp(self._A, self._DATA);self._FETCH();
+
+    # DEX i
+    def _op_ca_0(self): self._SA(self._PC);
+    def _op_ca_1(self): self._DEX();self._NZ(self._X);self._FETCH();
+
+    # WAI i: parked on the last step until IRQB or NMIB is low.
+    def _op_cb_0(self): self._SA(self._PC);
+    def _op_cb_1(self): self._SA(self._PC);self.halted="wait";
+    def _op_cb_2(self):
+        if self._woken():self.halted=None;self._FETCH();
+        else:self._IR-=1;
+
+    # CPY a
+    def _op_cc_0(self): self._SA(self._PC);self._INCPC();
+    def _op_cc_1(self): self._SA(self._PC);self._INCPC();self._AD=self._DATA;
+    def _op_cc_2(self): self._SA((self._DATA<<8)|self._AD);
+    def _op_cc_3(self): self._cmp(self._Y, self._DATA);self._FETCH();
+
+    # CMP a
+    def _op_cd_0(self): self._SA(self._PC);self._INCPC();
+    def _op_cd_1(self): self._SA(self._PC);self._INCPC();self._AD=self._DATA;
+    def _op_cd_2(self): self._SA((self._DATA<<8)|self._AD);
+    def _op_cd_3(self): self._cmp(self._A, self._DATA);self._FETCH();
+
+    # DEC a
+    def _op_ce_0(self): self._SA(self._PC);self._INCPC();
+    def _op_ce_1(self): self._SA(self._PC);self._INCPC();self._AD=self._DATA;
+    def _op_ce_2(self): self._SA((self._DATA<<8)|self._AD);
+    def _op_ce_3(self): self._AD=self._DATA;self._WR();
+    def _op_ce_4(self): self._DECAD();self._NZ(self._AD);self._SD(self._AD);self._WR();
+    def _op_ce_5(self): self._FETCH();
+
+    # BBS4 r
+    def _op_cf_0(self): self._SA(self._PC);self._INCPC();
+    def _op_cf_1(self): self._SA(self._DATA);
+    def _op_cf_2(self): self._AD=self._DATA;
+    def _op_cf_3(self): self._SA(self._PC);self._INCPC();
+    def _op_cf_4(self):
+        self._SA(self._PC);
+        if(self._AD&(1<<4)):self._AD=(self._PC+((self._DATA^0x80)-0x80))&0xFFFF;
+        else:self._FETCH();
+    def _op_cf_5(self):
+        self._SA((self._PC&0xFF00)|(self._AD&0x00FF));
+        if((self._AD&0xFF00)==(self._PC&0xFF00)):self._PC=self._AD;self._FETCH();
+    def _op_cf_6(self): self._PC=self._AD;self._FETCH();
+
+    # BNE r
+    def _op_d0_0(self): self._SA(self._PC);self._INCPC();
+    def _op_d0_1(self):
+        self._SA(self._PC);self._AD=(self._PC+((self._DATA^0x80)-0x80))&0xFFFF;
+        if((self._P&0x2)!=0x0):self._FETCH();
+    def _op_d0_2(self):
+        self._SA((self._PC&0xFF00)|(self._AD&0x00FF));
+        if((self._AD&0xFF00)==(self._PC&0xFF00)):self._PC=self._AD;self._FETCH();
+    def _op_d0_3(self): self._PC=self._AD;self._FETCH();
+
+    # CMP (zp),y
+    def _op_d1_0(self): self._SA(self._PC);self._INCPC();
+    def _op_d1_1(self): self._AD=self._DATA;self._SA(self._AD);
+    def _op_d1_2(self): self._SA((self._AD+1)&0xFF);self._AD=self._DATA;
+    def _op_d1_3(self): self._AD|=self._DATA<<8;self._SA((self._AD&0xFF00)|((self._AD+self._Y)&0xFF));self._IR+=(~((self._AD>>8)-((self._AD+self._Y)>>8)))&1;
+    def _op_d1_4(self): self._SA(self._AD+self._Y);
+    def _op_d1_5(self): self._cmp(self._A, self._DATA);self._FETCH();
+
+    # CMP (zp)
+    def _op_d2_0(self): self._SA(self._PC);self._INCPC();
+    def _op_d2_1(self): self._AD=self._DATA;self._SA(self._AD);
+    def _op_d2_2(self): self._SA((self._AD+1)&0xFF);self._AD=self._DATA;
+    def _op_d2_3(self): self._AD|=self._DATA<<8;self._SA((self._AD&0xFF00)|((self._AD)&0xFF));self._IR+=(~((self._AD>>8)-((self._AD)>>8)))&1;
+    def _op_d2_4(self): self._SA(self._AD);
+    def _op_d2_5(self): self._cmp(self._A, self._DATA);self._FETCH();
+
+    # CMP zp,x
+    def _op_d5_0(self): self._SA(self._PC);self._INCPC();
+    def _op_d5_1(self): self._AD=self._DATA;self._SA(self._AD);
+    def _op_d5_2(self): self._SA((self._AD+self._X)&0x00FF);
+    def _op_d5_3(self): self._cmp(self._A, self._DATA);self._FETCH();
+
+    # DEC zp,x
+    def _op_d6_0(self): self._SA(self._PC);self._INCPC();
+    def _op_d6_1(self): self._AD=self._DATA;self._SA(self._AD);
+    def _op_d6_2(self): self._SA((self._AD+self._X)&0x00FF);
+    def _op_d6_3(self): self._AD=self._DATA;self._WR();
+    def _op_d6_4(self): self._DECAD();self._NZ(self._AD);self._SD(self._AD);self._WR();
+    def _op_d6_5(self): self._FETCH();
+
+    # SMB5 zp
+    def _op_d7_0(self): self._SA(self._PC);self._INCPC();
+    def _op_d7_1(self): self._AD=self._DATA;self._SA(self._AD);
+    def _op_d7_2(self): self._SA(self._AD);
+    def _op_d7_3(self): self._SD(self._DATA|(1<<5));self._WR();
+    def _op_d7_4(self): self._FETCH();
+
+    # CLD i
+    def _op_d8_0(self): self._SA(self._PC);
+    def _op_d8_1(self): self._P&=~M65C02_DF;self._FETCH();
+
+    # CMP a,y
+    def _op_d9_0(self): self._SA(self._PC);self._INCPC();
+    def _op_d9_1(self): self._SA(self._PC);self._INCPC();self._AD=self._DATA;
+    def _op_d9_2(self): self._AD|=self._DATA<<8;self._SA((self._AD&0xFF00)|((self._AD+self._Y)&0xFF));self._IR+=(~((self._AD>>8)-((self._AD+self._Y)>>8)))&1;
+    def _op_d9_3(self): self._SA(self._AD+self._Y);
+    def _op_d9_4(self): self._cmp(self._A, self._DATA);self._FETCH();
+
+    # PHX s
+    def _op_da_0(self): self._SA(self._PC);
+    def _op_da_1(self): self._SAD(0x0100|self._S,self._X);self._DES();self._WR();
+    def _op_da_2(self): self._FETCH();
+
+    # STP i: parked on the last step until RESB is low.
+    def _op_db_0(self): self._SA(self._PC);
+    def _op_db_1(self): self._SA(self._PC);self.halted="stop";
+    def _op_db_2(self): self._IR-=1;
+
+    # CMP a,x
+    def _op_dd_0(self): self._SA(self._PC);self._INCPC();
+    def _op_dd_1(self): self._SA(self._PC);self._INCPC();self._AD=self._DATA;
+    def _op_dd_2(self): self._AD|=self._DATA<<8;self._SA((self._AD&0xFF00)|((self._AD+self._X)&0xFF));self._IR+=(~((self._AD>>8)-((self._AD+self._X)>>8)))&1;
+    def _op_dd_3(self): self._SA(self._AD+self._X);
+    def _op_dd_4(self): self._cmp(self._A, self._DATA);self._FETCH();
+
+    # DEC a,x
+    def _op_de_0(self): self._SA(self._PC);self._INCPC();
+    def _op_de_1(self): self._SA(self._PC);self._INCPC();self._AD=self._DATA;
+    def _op_de_2(self): self._AD|=self._DATA<<8;self._SA((self._AD&0xFF00)|((self._AD+self._X)&0xFF));
+    def _op_de_3(self): self._SA(self._AD+self._X);
+    def _op_de_4(self): self._AD=self._DATA;self._WR();
+    def _op_de_5(self): self._DECAD();self._NZ(self._AD);self._SD(self._AD);self._WR();
+    def _op_de_6(self): self._FETCH();
+
+    # BBS5 r
+    def _op_df_0(self): self._SA(self._PC);self._INCPC();
+    def _op_df_1(self): self._SA(self._DATA);
+    def _op_df_2(self): self._AD=self._DATA;
+    def _op_df_3(self): self._SA(self._PC);self._INCPC();
+    def _op_df_4(self):
+        self._SA(self._PC);
+        if(self._AD&(1<<5)):self._AD=(self._PC+((self._DATA^0x80)-0x80))&0xFFFF;
+        else:self._FETCH();
+    def _op_df_5(self):
+        self._SA((self._PC&0xFF00)|(self._AD&0x00FF));
+        if((self._AD&0xFF00)==(self._PC&0xFF00)):self._PC=self._AD;self._FETCH();
+    def _op_df_6(self): self._PC=self._AD;self._FETCH();
+
+    # CPX #
+    def _op_e0_0(self): self._SA(self._PC);self._INCPC();
+    def _op_e0_1(self): self._cmp(self._X, self._DATA);self._FETCH();
+
+    # SBC (zp,x)
+    def _op_e1_0(self): self._SA(self._PC);self._INCPC();
+    def _op_e1_1(self): self._AD=self._DATA;self._SA(self._AD);
+    def _op_e1_2(self): self._AD=(self._AD+self._X)&0xFF;self._SA(self._AD);
+    def _op_e1_3(self): self._SA((self._AD+1)&0xFF);self._AD=self._DATA;
+    def _op_e1_4(self): self._SA((self._DATA<<8)|self._AD);
+    def _op_e1_5(self): self._sbc(self._DATA);self._FETCH_DF();
+    def _op_e1_6(self): self._FETCH();
+
+    # CPX zp
+    def _op_e4_0(self): self._SA(self._PC);self._INCPC();
+    def _op_e4_1(self): self._SA(self._DATA);
+    def _op_e4_2(self): self._cmp(self._X, self._DATA);self._FETCH();
+
+    # SBC zp
+    def _op_e5_0(self): self._SA(self._PC);self._INCPC();
+    def _op_e5_1(self): self._SA(self._DATA);
+    def _op_e5_2(self): self._sbc(self._DATA);self._FETCH_DF();
+    def _op_e5_3(self): self._FETCH();
+
+    # INC zp
+    def _op_e6_0(self): self._SA(self._PC);self._INCPC();
+    def _op_e6_1(self): self._SA(self._DATA);
+    def _op_e6_2(self): self._AD=self._DATA;self._WR();
+    def _op_e6_3(self): self._INCAD();self._NZ(self._AD);self._SD(self._AD);self._WR();
+    def _op_e6_4(self): self._FETCH();
+
+    # SMB6 zp
+    def _op_e7_0(self): self._SA(self._PC);self._INCPC();
+    def _op_e7_1(self): self._AD=self._DATA;self._SA(self._AD);
+    def _op_e7_2(self): self._SA(self._AD);
+    def _op_e7_3(self): self._SD(self._DATA|(1<<6));self._WR();
+    def _op_e7_4(self): self._FETCH();
+
+    # INX i
+    def _op_e8_0(self): self._SA(self._PC);
+    def _op_e8_1(self): self._INX();self._NZ(self._X);self._FETCH();
+
+    # SBC #
+    def _op_e9_0(self): self._SA(self._PC);self._INCPC();
+    def _op_e9_1(self): self._sbc(self._DATA);self._FETCH_DF();
+    def _op_e9_2(self): self._FETCH();
+
+    # NOP i
+    def _op_ea_0(self): self._SA(self._PC);
+    def _op_ea_1(self): self._FETCH();
+
+    # CPX a
+    def _op_ec_0(self): self._SA(self._PC);self._INCPC();
+    def _op_ec_1(self): self._SA(self._PC);self._INCPC();self._AD=self._DATA;
+    def _op_ec_2(self): self._SA((self._DATA<<8)|self._AD);
+    def _op_ec_3(self): self._cmp(self._X, self._DATA);self._FETCH();
+
+    # SBC a
+    def _op_ed_0(self): self._SA(self._PC);self._INCPC();
+    def _op_ed_1(self): self._SA(self._PC);self._INCPC();self._AD=self._DATA;
+    def _op_ed_2(self): self._SA((self._DATA<<8)|self._AD);
+    def _op_ed_3(self): self._sbc(self._DATA);self._FETCH_DF();
+    def _op_ed_4(self): self._FETCH();
+
+    # INC a
+    def _op_ee_0(self): self._SA(self._PC);self._INCPC();
+    def _op_ee_1(self): self._SA(self._PC);self._INCPC();self._AD=self._DATA;
+    def _op_ee_2(self): self._SA((self._DATA<<8)|self._AD);
+    def _op_ee_3(self): self._AD=self._DATA;self._WR();
+    def _op_ee_4(self): self._INCAD();self._NZ(self._AD);self._SD(self._AD);self._WR();
+    def _op_ee_5(self): self._FETCH();
+
+    # BBS6 r
+    def _op_ef_0(self): self._SA(self._PC);self._INCPC();
+    def _op_ef_1(self): self._SA(self._DATA);
+    def _op_ef_2(self): self._AD=self._DATA;
+    def _op_ef_3(self): self._SA(self._PC);self._INCPC();
+    def _op_ef_4(self):
+        self._SA(self._PC);
+        if(self._AD&(1<<6)):self._AD=(self._PC+((self._DATA^0x80)-0x80))&0xFFFF;
+        else:self._FETCH();
+    def _op_ef_5(self):
+        self._SA((self._PC&0xFF00)|(self._AD&0x00FF));
+        if((self._AD&0xFF00)==(self._PC&0xFF00)):self._PC=self._AD;self._FETCH();
+    def _op_ef_6(self): self._PC=self._AD;self._FETCH();
+
+    # BEQ r
+    def _op_f0_0(self): self._SA(self._PC);self._INCPC();
+    def _op_f0_1(self):
+        self._SA(self._PC);self._AD=(self._PC+((self._DATA^0x80)-0x80))&0xFFFF;
+        if((self._P&0x2)!=0x2):self._FETCH();
+    def _op_f0_2(self):
+        self._SA((self._PC&0xFF00)|(self._AD&0x00FF));
+        if((self._AD&0xFF00)==(self._PC&0xFF00)):self._PC=self._AD;self._FETCH();
+    def _op_f0_3(self): self._PC=self._AD;self._FETCH();
+
+    # SBC (zp),y
+    def _op_f1_0(self): self._SA(self._PC);self._INCPC();
+    def _op_f1_1(self): self._AD=self._DATA;self._SA(self._AD);
+    def _op_f1_2(self): self._SA((self._AD+1)&0xFF);self._AD=self._DATA;
+    def _op_f1_3(self): self._AD|=self._DATA<<8;self._SA((self._AD&0xFF00)|((self._AD+self._Y)&0xFF));self._IR+=(~((self._AD>>8)-((self._AD+self._Y)>>8)))&1;
+    def _op_f1_4(self): self._SA(self._AD+self._Y);
+    def _op_f1_5(self): self._sbc(self._DATA);self._FETCH_DF();
+    def _op_f1_6(self): self._FETCH();
+
+    # SBC (zp)
+    def _op_f2_0(self): self._SA(self._PC);self._INCPC();
+    def _op_f2_1(self): self._AD=self._DATA;self._SA(self._AD);
+    def _op_f2_2(self): self._SA((self._AD+1)&0xFF);self._AD=self._DATA;
+    def _op_f2_3(self): self._AD|=self._DATA<<8;self._SA((self._AD&0xFF00)|((self._AD)&0xFF));self._IR+=(~((self._AD>>8)-((self._AD)>>8)))&1;
+    def _op_f2_4(self): self._SA(self._AD);
+    def _op_f2_5(self): self._sbc(self._DATA);self._FETCH_DF();
+    def _op_f2_6(self): self._FETCH();
+
+    # SBC zp,x
+    def _op_f5_0(self): self._SA(self._PC);self._INCPC();
+    def _op_f5_1(self): self._AD=self._DATA;self._SA(self._AD);
+    def _op_f5_2(self): self._SA((self._AD+self._X)&0x00FF);
+    def _op_f5_3(self): self._sbc(self._DATA);self._FETCH_DF();
+    def _op_f5_4(self): self._FETCH();
+
+    # INC zp,x
+    def _op_f6_0(self): self._SA(self._PC);self._INCPC();
+    def _op_f6_1(self): self._AD=self._DATA;self._SA(self._AD);
+    def _op_f6_2(self): self._SA((self._AD+self._X)&0x00FF);
+    def _op_f6_3(self): self._AD=self._DATA;self._WR();
+    def _op_f6_4(self): self._INCAD();self._NZ(self._AD);self._SD(self._AD);self._WR();
+    def _op_f6_5(self): self._FETCH();
+
+    # SMB7 zp
+    def _op_f7_0(self): self._SA(self._PC);self._INCPC();
+    def _op_f7_1(self): self._AD=self._DATA;self._SA(self._AD);
+    def _op_f7_2(self): self._SA(self._AD);
+    def _op_f7_3(self): self._SD(self._DATA|(1<<7));self._WR();
+    def _op_f7_4(self): self._FETCH();
+
+    # SED i
+    def _op_f8_0(self): self._SA(self._PC);
+    def _op_f8_1(self): self._P|=M65C02_DF;self._FETCH();
+
+    # SBC a,y
+    def _op_f9_0(self): self._SA(self._PC);self._INCPC();
+    def _op_f9_1(self): self._SA(self._PC);self._INCPC();self._AD=self._DATA;
+    def _op_f9_2(self): self._AD|=self._DATA<<8;self._SA((self._AD&0xFF00)|((self._AD+self._Y)&0xFF));self._IR+=(~((self._AD>>8)-((self._AD+self._Y)>>8)))&1;
+    def _op_f9_3(self): self._SA(self._AD+self._Y);
+    def _op_f9_4(self): self._sbc(self._DATA);self._FETCH_DF();
+    def _op_f9_5(self): self._FETCH();
+
+    # PLX s
+    def _op_fa_0(self): self._SA(self._PC);
+    def _op_fa_1(self): self._SA(0x0100|self._S);self._INS();
+    def _op_fa_2(self): self._SA(0x0100|self._S);
+    def _op_fa_3(self): self._X=self._DATA;self._NZ(self._X);self._FETCH();
+
+    # SBC a,x
+    def _op_fd_0(self): self._SA(self._PC);self._INCPC();
+    def _op_fd_1(self): self._SA(self._PC);self._INCPC();self._AD=self._DATA;
+    def _op_fd_2(self): self._AD|=self._DATA<<8;self._SA((self._AD&0xFF00)|((self._AD+self._X)&0xFF));self._IR+=(~((self._AD>>8)-((self._AD+self._X)>>8)))&1;
+    def _op_fd_3(self): self._SA(self._AD+self._X);
+    def _op_fd_4(self): self._sbc(self._DATA);self._FETCH_DF();
+    def _op_fd_5(self): self._FETCH();
+
+    # INC a,x
+    def _op_fe_0(self): self._SA(self._PC);self._INCPC();
+    def _op_fe_1(self): self._SA(self._PC);self._INCPC();self._AD=self._DATA;
+    def _op_fe_2(self): self._AD|=self._DATA<<8;self._SA((self._AD&0xFF00)|((self._AD+self._X)&0xFF));
+    def _op_fe_3(self): self._SA(self._AD+self._X);
+    def _op_fe_4(self): self._AD=self._DATA;self._WR();
+    def _op_fe_5(self): self._INCAD();self._NZ(self._AD);self._SD(self._AD);self._WR();
+    def _op_fe_6(self): self._FETCH();
+
+    # BBS7 r
+    def _op_ff_0(self): self._SA(self._PC);self._INCPC();
+    def _op_ff_1(self): self._SA(self._DATA);
+    def _op_ff_2(self): self._AD=self._DATA;
+    def _op_ff_3(self): self._SA(self._PC);self._INCPC();
+    def _op_ff_4(self):
+        self._SA(self._PC);
+        if(self._AD&(1<<7)):self._AD=(self._PC+((self._DATA^0x80)-0x80))&0xFFFF;
+        else:self._FETCH();
+    def _op_ff_5(self):
+        self._SA((self._PC&0xFF00)|(self._AD&0x00FF));
+        if((self._AD&0xFF00)==(self._PC&0xFF00)):self._PC=self._AD;self._FETCH();
+    def _op_ff_6(self): self._PC=self._AD;self._FETCH();
+
+    # unused opcodes: no-ops of various lengths and durations, picked by length and cycles.
+    def _nop_i_0(self): self._FETCH();
+
+    def _nop_imm_0(self): self._SA(self._PC);self._INCPC();
+    def _nop_imm_1(self): self._FETCH();
+
+    def _nop_zp_0(self): self._SA(self._PC);self._INCPC();
+    def _nop_zp_1(self): self._SA(self._DATA);
+    def _nop_zp_2(self): self._FETCH();
+
+    def _nop_zpx_0(self): self._SA(self._PC);self._INCPC();
+    def _nop_zpx_1(self): self._AD=self._DATA;self._SA(self._AD);
+    def _nop_zpx_2(self): self._SA((self._AD+self._X)&0x00FF);
+    def _nop_zpx_3(self): self._FETCH();
+
+    def _nop_abs_0(self): self._SA(self._PC);self._INCPC();
+    def _nop_abs_1(self): self._SA(self._PC);self._INCPC();self._AD=self._DATA;
+    def _nop_abs_2(self): self._SA((self._DATA<<8)|self._AD);
+    def _nop_abs_3(self): self._FETCH();
+
+    # nop a, 8 cycles
+    def _op_5c_0(self): self._SA(self._PC);self._INCPC();
+    def _op_5c_1(self): self._SA(self._PC);self._INCPC();self._AD=self._DATA;
+    def _op_5c_2(self): self._SA((self._DATA<<8)|self._AD);
+    def _op_5c_3(self): self._SA(self._PC);
+    def _op_5c_4(self): self._SA(self._PC);
+    def _op_5c_5(self): self._SA(self._PC);
+    def _op_5c_6(self): self._SA(self._PC);
+    def _op_5c_7(self): self._FETCH();
+
+    # instruction-level engine: one method per opcode, executing a whole instruction
+    # directly against memory and returning its cycle count. page-crossing penalties
+    # are added to the cycle counter by the addressing helpers themselves.
+    def _imm(self, m):
+        """ fetch an immediate operand byte. """
+        v=m[self._PC];self._PC=(self._PC+1)&0xFFFF
+        return v
+
+    def _imm_o(self, m):
+        """ the next pre-decoded operand byte, stands in for _imm over decoded instructions. """
+        v=self._o&0xFF;self._o>>=8
+        return v
+
+    def _abs_o(self, m):
+        """ the pre-decoded absolute address, stands in for _abs over decoded instructions. """
+        return self._o
+
+    def _zpx(self, m):
+        """ zero page,x address. """
+        return (self._imm(m)+self._X)&0xFF
+
+    def _zpy(self, m):
+        """ zero page,y address. """
+        return (self._imm(m)+self._Y)&0xFF
+
+    def _abs(self, m):
+        """ absolute address. """
+        pc=self._PC;self._PC=(pc+2)&0xFFFF
+        return m[pc]|(m[(pc+1)&0xFFFF]<<8)
+
+    def _abx(self, m):
+        """ absolute,x address, one more cycle when a page is crossed. """
+        b=self._abs(m);a=(b+self._X)&0xFFFF
+        if ((a^b)&0xFF00):self._cycles+=1
+        return a
+
+    def _aby(self, m):
+        """ absolute,y address, one more cycle when a page is crossed. """
+        b=self._abs(m);a=(b+self._Y)&0xFFFF
+        if ((a^b)&0xFF00):self._cycles+=1
+        return a
+
+    def _abx_(self, m):
+        """ absolute,x address, fixed cycle count. """
+        return (self._abs(m)+self._X)&0xFFFF
+
+    def _aby_(self, m):
+        """ absolute,y address, fixed cycle count. """
+        return (self._abs(m)+self._Y)&0xFFFF
+
+    def _izp(self, m):
+        """ (zero page) address. """
+        z=self._imm(m)
+        return m[z]|(m[(z+1)&0xFF]<<8)
+
+    def _izx(self, m):
+        """ (zero page,x) address. """
+        z=self._zpx(m)
+        return m[z]|(m[(z+1)&0xFF]<<8)
+
+    def _izy(self, m):
+        """ (zero page),y address, one more cycle when a page is crossed. """
+        b=self._izp(m);a=(b+self._Y)&0xFFFF
+        if ((a^b)&0xFF00):self._cycles+=1
+        return a
+
+    def _izy_(self, m):
+        """ (zero page),y address, fixed cycle count. """
+        return (self._izp(m)+self._Y)&0xFFFF
+
+    def _push(self, m, v):
+        """ push a byte onto the stack. """
+        m[0x0100|self._S]=v;self._S=(self._S-1)&0xFF
+
+    def _pull(self, m):
+        """ pull a byte from the stack. """
+        self._S=(self._S+1)&0xFF
+        return m[0x0100|self._S]
+
+    def _branch(self, m, taken):
+        """ relative branch, returns 2 cycles, 3 when taken, 4 when taken to another page. """
+        o=self._imm(m)
+        if not taken:return 2
+        a=(self._PC+o-((o&0x80)<<1))&0xFFFF
+        c=3 if ((a^self._PC)&0xFF00)==0 else 4
+        self._PC=a
+        return c
+
+    def _bbr(self, m, b):
+        """ branch on bit b of a zero page byte reset. """
+        return self._branch(m, not (m[self._imm(m)]&b))+3
+
+    def _bbs(self, m, b):
+        """ branch on bit b of a zero page byte set. """
+        return self._branch(m, m[self._imm(m)]&b)+3
+
+    def _woken(self):
+        """ whether the interrupt lines wake up a halted CPU, RESB only after a STP. """
+        pins = self._CTRL
+        if self.halted == "stop":
+            return not (pins&M65C02_RESB)
+        return not (pins&M65C02_IRQB) or not (pins&M65C02_NMIB) or not (pins&M65C02_RESB)
+
+    def _park(self, m, halted):
+        """
+            WAI and STP: 3 cycles, then PC stays on the opcode, one cycle per
+            execution, until the interrupt lines wake the CPU up. The run loops
+            see a jump back and fast-forward the parked cycles.
+        """
+        c = 3 if self.halted is None else 1
+        self.halted = halted
+        if self._woken():
+            self.halted = None
+        else:
+            self._PC = (self._PC-1)&0xFFFF
+        return c
+
+    def _tsb(self, m, a):
+        """ test and set memory bits against the accumulator. """
+        v=m[a];self._P=(self._P&~M65C02_ZF)|(0 if v&self._A else M65C02_ZF);m[a]=v|self._A
+
+    def _trb(self, m, a):
+        """ test and reset memory bits against the accumulator. """
+        v=m[a];self._P=(self._P&~M65C02_ZF)|(0 if v&self._A else M65C02_ZF);m[a]=v&~self._A
+
+    # BRK s
+    def _ex_00(self, m):
+        self._INCPC();self._push(m,self._PC>>8);self._push(m,self._PC&0xFF);self._push(m,self._P|M65C02_XF|M65C02_BF);
+        self._P=(self._P|M65C02_IF|M65C02_BF)&~M65C02_DF;self._PC=m[0xFFFE]|(m[0xFFFF]<<8);return 7
+    # ORA (zp,x)
+    def _ex_01(self, m): self._A|=m[self._izx(m)];self._NZ(self._A);return 6
+    # TSB zp
+    def _ex_04(self, m): self._tsb(m,self._imm(m));return 5
+    # ORA zp
+    def _ex_05(self, m): self._A|=m[self._imm(m)];self._NZ(self._A);return 3
+    # ASL zp
+    def _ex_06(self, m): a=self._imm(m);m[a]=self._asl(m[a]);return 5
+    # RMB0 zp
+    def _ex_07(self, m): a=self._imm(m);m[a]&=~0x01;return 5
+    # PHP s
+    def _ex_08(self, m): self._push(m,self._P|M65C02_XF|M65C02_BF);return 3
+    # ORA #
+    def _ex_09(self, m): self._A|=self._imm(m);self._NZ(self._A);return 2
+    # ASL A
+    def _ex_0a(self, m): self._A=self._asl(self._A);return 2
+    # TSB a
+    def _ex_0c(self, m): self._tsb(m,self._abs(m));return 6
+    # ORA a
+    def _ex_0d(self, m): self._A|=m[self._abs(m)];self._NZ(self._A);return 4
+    # ASL a
+    def _ex_0e(self, m): a=self._abs(m);m[a]=self._asl(m[a]);return 6
+    # BBR0 r
+    def _ex_0f(self, m): return self._bbr(m,0x01)
+    # BPL r
+    def _ex_10(self, m): return self._branch(m,not (self._P&M65C02_NF))
+    # ORA (zp),y
+    def _ex_11(self, m): self._A|=m[self._izy(m)];self._NZ(self._A);return 5
+    # ORA (zp)
+    def _ex_12(self, m): self._A|=m[self._izp(m)];self._NZ(self._A);return 5
+    # TRB zp
+    def _ex_14(self, m): self._trb(m,self._imm(m));return 5
+    # ORA zp,x
+    def _ex_15(self, m): self._A|=m[self._zpx(m)];self._NZ(self._A);return 4
+    # ASL zp,x
+    def _ex_16(self, m): a=self._zpx(m);m[a]=self._asl(m[a]);return 6
+    # RMB1 zp
+    def _ex_17(self, m): a=self._imm(m);m[a]&=~0x02;return 5
+    # CLC i
+    def _ex_18(self, m): self._P&=~M65C02_CF;return 2
+    # ORA a,y
+    def _ex_19(self, m): self._A|=m[self._aby(m)];self._NZ(self._A);return 4
+    # INC A
+    def _ex_1a(self, m): self._INA();self._NZ(self._A);return 2
+    # TRB a
+    def _ex_1c(self, m): self._trb(m,self._abs(m));return 6
+    # ORA a,x
+    def _ex_1d(self, m): self._A|=m[self._abx(m)];self._NZ(self._A);return 4
+    # ASL a,x
+    def _ex_1e(self, m): a=self._abx(m);m[a]=self._asl(m[a]);return 6
+    # BBR1 r
+    def _ex_1f(self, m): return self._bbr(m,0x02)
+    # JSR a
+    def _ex_20(self, m): a=self._abs(m);self._DECPC();self._push(m,self._PC>>8);self._push(m,self._PC&0xFF);self._PC=a;return 6
+    # AND (zp,x)
+    def _ex_21(self, m): self._A&=m[self._izx(m)];self._NZ(self._A);return 6
+    # BIT zp
+    def _ex_24(self, m): self._bit(m[self._imm(m)]);return 3
+    # AND zp
+    def _ex_25(self, m): self._A&=m[self._imm(m)];self._NZ(self._A);return 3
+    # ROL zp
+    def _ex_26(self, m): a=self._imm(m);m[a]=self._rol(m[a]);return 5
+    # RMB2 zp
+    def _ex_27(self, m): a=self._imm(m);m[a]&=~0x04;return 5
+    # PLP s
+    def _ex_28(self, m): self._P=(self._pull(m)|M65C02_BF)&~M65C02_XF;self._until=0;return 4
+    # AND #
+    def _ex_29(self, m): self._A&=self._imm(m);self._NZ(self._A);return 2
+    # ROL A
+    def _ex_2a(self, m): self._A=self._rol(self._A);return 2
+    # BIT a
+    def _ex_2c(self, m): self._bit(m[self._abs(m)]);return 4
+    # AND a
+    def _ex_2d(self, m): self._A&=m[self._abs(m)];self._NZ(self._A);return 4
+    # ROL a
+    def _ex_2e(self, m): a=self._abs(m);m[a]=self._rol(m[a]);return 6
+    # BBR2 r
+    def _ex_2f(self, m): return self._bbr(m,0x04)
+    # BMI r
+    def _ex_30(self, m): return self._branch(m,self._P&M65C02_NF)
+    # AND (zp),y
+    def _ex_31(self, m): self._A&=m[self._izy(m)];self._NZ(self._A);return 5
+    # AND (zp)
+    def _ex_32(self, m): self._A&=m[self._izp(m)];self._NZ(self._A);return 5
+    # BIT zp,x
+    def _ex_34(self, m): self._bit(m[self._zpx(m)]);return 4
+    # AND zp,x
+    def _ex_35(self, m): self._A&=m[self._zpx(m)];self._NZ(self._A);return 4
+    # ROL zp,x
+    def _ex_36(self, m): a=self._zpx(m);m[a]=self._rol(m[a]);return 6
+    # RMB3 zp
+    def _ex_37(self, m): a=self._imm(m);m[a]&=~0x08;return 5
+    # SEC i
+    def _ex_38(self, m): self._P|=M65C02_CF;return 2
+    # AND a,y
+    def _ex_39(self, m): self._A&=m[self._aby(m)];self._NZ(self._A);return 4
+    # DEC A
+    def _ex_3a(self, m): self._DEA();self._NZ(self._A);return 2
+    # BIT a,x
+    def _ex_3c(self, m): self._bit(m[self._abx(m)]);return 4
+    # AND a,x
+    def _ex_3d(self, m): self._A&=m[self._abx(m)];self._NZ(self._A);return 4
+    # ROL a,x
+    def _ex_3e(self, m): a=self._abx(m);m[a]=self._rol(m[a]);return 6
+    # BBR3 r
+    def _ex_3f(self, m): return self._bbr(m,0x08)
+    # RTI s
+    def _ex_40(self, m): self._P=(self._pull(m)|M65C02_BF)&~M65C02_XF;self._until=0;self._PC=self._pull(m);self._PC|=self._pull(m)<<8;return 6
+    # EOR (zp,x)
+    def _ex_41(self, m): self._A^=m[self._izx(m)];self._NZ(self._A);return 6
+    # EOR zp
+    def _ex_45(self, m): self._A^=m[self._imm(m)];self._NZ(self._A);return 3
+    # LSR zp
+    def _ex_46(self, m): a=self._imm(m);m[a]=self._lsr(m[a]);return 5
+    # RMB4 zp
+    def _ex_47(self, m): a=self._imm(m);m[a]&=~0x10;return 5
+    # PHA s
+    def _ex_48(self, m): self._push(m,self._A);return 3
+    # EOR #
+    def _ex_49(self, m): self._A^=self._imm(m);self._NZ(self._A);return 2
+    # LSR A
+    def _ex_4a(self, m): self._A=self._lsr(self._A);return 2
+    # JMP a
+    def _ex_4c(self, m): self._PC=self._abs(m);return 3
+    # EOR a
+    def _ex_4d(self, m): self._A^=m[self._abs(m)];self._NZ(self._A);return 4
+    # LSR a
+    def _ex_4e(self, m): a=self._abs(m);m[a]=self._lsr(m[a]);return 6
+    # BBR4 r
+    def _ex_4f(self, m): return self._bbr(m,0x10)
+    # BVC r
+    def _ex_50(self, m): return self._branch(m,not (self._P&M65C02_VF))
+    # EOR (zp),y
+    def _ex_51(self, m): self._A^=m[self._izy(m)];self._NZ(self._A);return 5
+    # EOR (zp)
+    def _ex_52(self, m): self._A^=m[self._izp(m)];self._NZ(self._A);return 5
+    # EOR zp,x
+    def _ex_55(self, m): self._A^=m[self._zpx(m)];self._NZ(self._A);return 4
+    # LSR zp,x
+    def _ex_56(self, m): a=self._zpx(m);m[a]=self._lsr(m[a]);return 6
+    # RMB5 zp
+    def _ex_57(self, m): a=self._imm(m);m[a]&=~0x20;return 5
+    # CLI i
+    def _ex_58(self, m): self._P&=~M65C02_IF;self._until=0;return 2
+    # EOR a,y
+    def _ex_59(self, m): self._A^=m[self._aby(m)];self._NZ(self._A);return 4
+    # PHY s
+    def _ex_5a(self, m): self._push(m,self._Y);return 3
+    # EOR a,x
+    def _ex_5d(self, m): self._A^=m[self._abx(m)];self._NZ(self._A);return 4
+    # LSR a,x
+    def _ex_5e(self, m): a=self._abx(m);m[a]=self._lsr(m[a]);return 6
+    # BBR5 r
+    def _ex_5f(self, m): return self._bbr(m,0x20)
+    # RTS s
+    def _ex_60(self, m): self._PC=self._pull(m);self._PC|=self._pull(m)<<8;self._INCPC();return 6
+    # ADC (zp,x)
+    def _ex_61(self, m): self._adc(m[self._izx(m)]);return 6+((self._P&M65C02_DF)!=0)
+    # STZ zp
+    def _ex_64(self, m): m[self._imm(m)]=0;return 3
+    # ADC zp
+    def _ex_65(self, m): self._adc(m[self._imm(m)]);return 3+((self._P&M65C02_DF)!=0)
+    # ROR zp
+    def _ex_66(self, m): a=self._imm(m);m[a]=self._ror(m[a]);return 5
+    # RMB6 zp
+    def _ex_67(self, m): a=self._imm(m);m[a]&=~0x40;return 5
+    # PLA s
+    def _ex_68(self, m): self._A=self._pull(m);self._NZ(self._A);return 4
+    # ADC #
+    def _ex_69(self, m): self._adc(self._imm(m));return 2+((self._P&M65C02_DF)!=0)
+    # ROR A
+    def _ex_6a(self, m): self._A=self._ror(self._A);return 2
+    # JMP (a)
+    def _ex_6c(self, m): a=self._abs(m);self._PC=m[a]|(m[(a+1)&0xFFFF]<<8);return 6
+    # ADC a
+    def _ex_6d(self, m): self._adc(m[self._abs(m)]);return 4+((self._P&M65C02_DF)!=0)
+    # ROR a
+    def _ex_6e(self, m): a=self._abs(m);m[a]=self._ror(m[a]);return 6
+    # BBR6 r
+    def _ex_6f(self, m): return self._bbr(m,0x40)
+    # BVS r
+    def _ex_70(self, m): return self._branch(m,self._P&M65C02_VF)
+    # ADC (zp),y
+    def _ex_71(self, m): self._adc(m[self._izy(m)]);return 5+((self._P&M65C02_DF)!=0)
+    # ADC (zp)
+    def _ex_72(self, m): self._adc(m[self._izp(m)]);return 5+((self._P&M65C02_DF)!=0)
+    # STZ zp,x
+    def _ex_74(self, m): m[self._zpx(m)]=0;return 4
+    # ADC zp,x
+    def _ex_75(self, m): self._adc(m[self._zpx(m)]);return 4+((self._P&M65C02_DF)!=0)
+    # ROR zp,x
+    def _ex_76(self, m): a=self._zpx(m);m[a]=self._ror(m[a]);return 6
+    # RMB7 zp
+    def _ex_77(self, m): a=self._imm(m);m[a]&=~0x80;return 5
+    # SEI i
+    def _ex_78(self, m): self._P|=M65C02_IF;return 2
+    # ADC a,y
+    def _ex_79(self, m): self._adc(m[self._aby(m)]);return 4+((self._P&M65C02_DF)!=0)
+    # PLY s
+    def _ex_7a(self, m): self._Y=self._pull(m);self._NZ(self._Y);return 4
+    # JMP (a,x)
+    def _ex_7c(self, m): a=self._abx_(m);self._PC=m[a]|(m[(a+1)&0xFFFF]<<8);return 6
+    # ADC a,x
+    def _ex_7d(self, m): self._adc(m[self._abx(m)]);return 4+((self._P&M65C02_DF)!=0)
+    # ROR a,x
+    def _ex_7e(self, m): a=self._abx(m);m[a]=self._ror(m[a]);return 6
+    # BBR7 r
+    def _ex_7f(self, m): return self._bbr(m,0x80)
+    # BRA r
+    def _ex_80(self, m): return self._branch(m,True)
+    # STA (zp,x)
+    def _ex_81(self, m): m[self._izx(m)]=self._A;return 6
+    # STY zp
+    def _ex_84(self, m): m[self._imm(m)]=self._Y;return 3
+    # STA zp
+    def _ex_85(self, m): m[self._imm(m)]=self._A;return 3
+    # STX zp
+    def _ex_86(self, m): m[self._imm(m)]=self._X;return 3
+    # SMB0 zp
+    def _ex_87(self, m): a=self._imm(m);m[a]|=0x01;return 5
+    # DEY i
+    def _ex_88(self, m): self._DEY();self._NZ(self._Y);return 2
+    # BIT #
+    def _ex_89(self, m): self._P=(self._P&~M65C02_ZF)|(0 if self._A&self._imm(m) else M65C02_ZF);return 2
+    # TXA i
+    def _ex_8a(self, m): self._A=self._X;self._NZ(self._A);return 2
+    # STY a
+    def _ex_8c(self, m): m[self._abs(m)]=self._Y;return 4
+    # STA a
+    def _ex_8d(self, m): m[self._abs(m)]=self._A;return 4
+    # STX a
+    def _ex_8e(self, m): m[self._abs(m)]=self._X;return 4
+    # BBS0 r
+    def _ex_8f(self, m): return self._bbs(m,0x01)
+    # BCC r
+    def _ex_90(self, m): return self._branch(m,not (self._P&M65C02_CF))
+    # STA (zp),y
+    def _ex_91(self, m): m[self._izy_(m)]=self._A;return 6
+    # STA (zp)
+    def _ex_92(self, m): m[self._izp(m)]=self._A;return 5
+    # STY zp,x
+    def _ex_94(self, m): m[self._zpx(m)]=self._Y;return 4
+    # STA zp,x
+    def _ex_95(self, m): m[self._zpx(m)]=self._A;return 4
+    # STX zp,y
+    def _ex_96(self, m): m[self._zpy(m)]=self._X;return 4
+    # SMB1 zp
+    def _ex_97(self, m): a=self._imm(m);m[a]|=0x02;return 5
+    # TYA i
+    def _ex_98(self, m): self._A=self._Y;self._NZ(self._A);return 2
+    # STA a,y
+    def _ex_99(self, m): m[self._aby_(m)]=self._A;return 5
+    # TXS i
+    def _ex_9a(self, m): self._S=self._X;return 2
+    # STZ a
+    def _ex_9c(self, m): m[self._abs(m)]=0;return 4
+    # STA a,x
+    def _ex_9d(self, m): m[self._abx_(m)]=self._A;return 5
+    # STZ a,x
+    def _ex_9e(self, m): m[self._abx_(m)]=0;return 5
+    # BBS1 r
+    def _ex_9f(self, m): return self._bbs(m,0x02)
+    # LDY #
+    def _ex_a0(self, m): self._Y=self._imm(m);self._NZ(self._Y);return 2
+    # LDA (zp,x)
+    def _ex_a1(self, m): self._A=m[self._izx(m)];self._NZ(self._A);return 6
+    # LDX #
+    def _ex_a2(self, m): self._X=self._imm(m);self._NZ(self._X);return 2
+    # LDY zp
+    def _ex_a4(self, m): self._Y=m[self._imm(m)];self._NZ(self._Y);return 3
+    # LDA zp
+    def _ex_a5(self, m): self._A=m[self._imm(m)];self._NZ(self._A);return 3
+    # LDX zp
+    def _ex_a6(self, m): self._X=m[self._imm(m)];self._NZ(self._X);return 3
+    # SMB2 zp
+    def _ex_a7(self, m): a=self._imm(m);m[a]|=0x04;return 5
+    # TAY i
+    def _ex_a8(self, m): self._Y=self._A;self._NZ(self._Y);return 2
+    # LDA #
+    def _ex_a9(self, m): self._A=self._imm(m);self._NZ(self._A);return 2
+    # TAX i
+    def _ex_aa(self, m): self._X=self._A;self._NZ(self._X);return 2
+    # LDY a
+    def _ex_ac(self, m): self._Y=m[self._abs(m)];self._NZ(self._Y);return 4
+    # LDA a
+    def _ex_ad(self, m): self._A=m[self._abs(m)];self._NZ(self._A);return 4
+    # LDX a
+    def _ex_ae(self, m): self._X=m[self._abs(m)];self._NZ(self._X);return 4
+    # BBS2 r
+    def _ex_af(self, m): return self._bbs(m,0x04)
+    # BCS r
+    def _ex_b0(self, m): return self._branch(m,self._P&M65C02_CF)
+    # LDA (zp),y
+    def _ex_b1(self, m): self._A=m[self._izy(m)];self._NZ(self._A);return 5
+    # LDA (zp)
+    def _ex_b2(self, m): self._A=m[self._izp(m)];self._NZ(self._A);return 5
+    # LDY zp,x
+    def _ex_b4(self, m): self._Y=m[self._zpx(m)];self._NZ(self._Y);return 4
+    # LDA zp,x
+    def _ex_b5(self, m): self._A=m[self._zpx(m)];self._NZ(self._A);return 4
+    # LDX zp,y
+    def _ex_b6(self, m): self._X=m[self._zpy(m)];self._NZ(self._X);return 4
+    # SMB3 zp
+    def _ex_b7(self, m): a=self._imm(m);m[a]|=0x08;return 5
+    # CLV i
+    def _ex_b8(self, m): self._P&=~M65C02_VF;return 2
+    # LDA a,y
+    def _ex_b9(self, m): self._A=m[self._aby(m)];self._NZ(self._A);return 4
+    # TSX i
+    def _ex_ba(self, m): self._X=self._S;self._NZ(self._X);return 2
+    # LDY a,x
+    def _ex_bc(self, m): self._Y=m[self._abx(m)];self._NZ(self._Y);return 4
+    # LDA a,x
+    def _ex_bd(self, m): self._A=m[self._abx(m)];self._NZ(self._A);return 4
+    # LDX a,y
+    def _ex_be(self, m): self._X=m[self._aby(m)];self._NZ(self._X);return 4
+    # BBS3 r
+    def _ex_bf(self, m): return self._bbs(m,0x08)
+    # CPY #
+    def _ex_c0(self, m): self._cmp(self._Y,self._imm(m));return 2
+    # CMP (zp,x)
+    def _ex_c1(self, m): self._cmp(self._A,m[self._izx(m)]);return 6
+    # CPY zp
+    def _ex_c4(self, m): self._cmp(self._Y,m[self._imm(m)]);return 3
+    # CMP zp
+    def _ex_c5(self, m): self._cmp(self._A,m[self._imm(m)]);return 3
+    # DEC zp
+    def _ex_c6(self, m): a=self._imm(m);v=(m[a]-1)&0xFF;m[a]=v;self._NZ(v);return 5
+    # SMB4 zp
+    def _ex_c7(self, m): a=self._imm(m);m[a]|=0x10;return 5
+    # INY i
+    def _ex_c8(self, m): self._INY();self._NZ(self._Y);return 2
+    # CMP #
+    def _ex_c9(self, m): self._cmp(self._A,self._imm(m));return 2
+    # DEX i
+    def _ex_ca(self, m): self._DEX();self._NZ(self._X);return 2
+    # WAI i
+    def _ex_cb(self, m): return self._park(m,"wait")
+    # CPY a
+    def _ex_cc(self, m): self._cmp(self._Y,m[self._abs(m)]);return 4
+    # CMP a
+    def _ex_cd(self, m): self._cmp(self._A,m[self._abs(m)]);return 4
+    # DEC a
+    def _ex_ce(self, m): a=self._abs(m);v=(m[a]-1)&0xFF;m[a]=v;self._NZ(v);return 6
+    # BBS4 r
+    def _ex_cf(self, m): return self._bbs(m,0x10)
+    # BNE r
+    def _ex_d0(self, m): return self._branch(m,not (self._P&M65C02_ZF))
+    # CMP (zp),y
+    def _ex_d1(self, m): self._cmp(self._A,m[self._izy(m)]);return 5
+    # CMP (zp)
+    def _ex_d2(self, m): self._cmp(self._A,m[self._izp(m)]);return 5
+    # CMP zp,x
+    def _ex_d5(self, m): self._cmp(self._A,m[self._zpx(m)]);return 4
+    # DEC zp,x
+    def _ex_d6(self, m): a=self._zpx(m);v=(m[a]-1)&0xFF;m[a]=v;self._NZ(v);return 6
+    # SMB5 zp
+    def _ex_d7(self, m): a=self._imm(m);m[a]|=0x20;return 5
+    # CLD i
+    def _ex_d8(self, m): self._P&=~M65C02_DF;return 2
+    # CMP a,y
+    def _ex_d9(self, m): self._cmp(self._A,m[self._aby(m)]);return 4
+    # PHX s
+    def _ex_da(self, m): self._push(m,self._X);return 3
+    # STP i
+    def _ex_db(self, m): return self._park(m,"stop")
+    # CMP a,x
+    def _ex_dd(self, m): self._cmp(self._A,m[self._abx(m)]);return 4
+    # DEC a,x
+    def _ex_de(self, m): a=self._abx_(m);v=(m[a]-1)&0xFF;m[a]=v;self._NZ(v);return 7
+    # BBS5 r
+    def _ex_df(self, m): return self._bbs(m,0x20)
+    # CPX #
+    def _ex_e0(self, m): self._cmp(self._X,self._imm(m));return 2
+    # SBC (zp,x)
+    def _ex_e1(self, m): self._sbc(m[self._izx(m)]);return 6+((self._P&M65C02_DF)!=0)
+    # CPX zp
+    def _ex_e4(self, m): self._cmp(self._X,m[self._imm(m)]);return 3
+    # SBC zp
+    def _ex_e5(self, m): self._sbc(m[self._imm(m)]);return 3+((self._P&M65C02_DF)!=0)
+    # INC zp
+    def _ex_e6(self, m): a=self._imm(m);v=(m[a]+1)&0xFF;m[a]=v;self._NZ(v);return 5
+    # SMB6 zp
+    def _ex_e7(self, m): a=self._imm(m);m[a]|=0x40;return 5
+    # INX i
+    def _ex_e8(self, m): self._INX();self._NZ(self._X);return 2
+    # SBC #
+    def _ex_e9(self, m): self._sbc(self._imm(m));return 2+((self._P&M65C02_DF)!=0)
+    # NOP i
+    def _ex_ea(self, m): return 2
+    # CPX a
+    def _ex_ec(self, m): self._cmp(self._X,m[self._abs(m)]);return 4
+    # SBC a
+    def _ex_ed(self, m): self._sbc(m[self._abs(m)]);return 4+((self._P&M65C02_DF)!=0)
+    # INC a
+    def _ex_ee(self, m): a=self._abs(m);v=(m[a]+1)&0xFF;m[a]=v;self._NZ(v);return 6
+    # BBS6 r
+    def _ex_ef(self, m): return self._bbs(m,0x40)
+    # BEQ r
+    def _ex_f0(self, m): return self._branch(m,self._P&M65C02_ZF)
+    # SBC (zp),y
+    def _ex_f1(self, m): self._sbc(m[self._izy(m)]);return 5+((self._P&M65C02_DF)!=0)
+    # SBC (zp)
+    def _ex_f2(self, m): self._sbc(m[self._izp(m)]);return 5+((self._P&M65C02_DF)!=0)
+    # SBC zp,x
+    def _ex_f5(self, m): self._sbc(m[self._zpx(m)]);return 4+((self._P&M65C02_DF)!=0)
+    # INC zp,x
+    def _ex_f6(self, m): a=self._zpx(m);v=(m[a]+1)&0xFF;m[a]=v;self._NZ(v);return 6
+    # SMB7 zp
+    def _ex_f7(self, m): a=self._imm(m);m[a]|=0x80;return 5
+    # SED i
+    def _ex_f8(self, m): self._P|=M65C02_DF;return 2
+    # SBC a,y
+    def _ex_f9(self, m): self._sbc(m[self._aby(m)]);return 4+((self._P&M65C02_DF)!=0)
+    # PLX s
+    def _ex_fa(self, m): self._X=self._pull(m);self._NZ(self._X);return 4
+    # SBC a,x
+    def _ex_fd(self, m): self._sbc(m[self._abx(m)]);return 4+((self._P&M65C02_DF)!=0)
+    # INC a,x
+    def _ex_fe(self, m): a=self._abx_(m);v=(m[a]+1)&0xFF;m[a]=v;self._NZ(v);return 7
+    # BBS7 r
+    def _ex_ff(self, m): return self._bbs(m,0x80)
+
+    # unused opcodes are no-ops of various lengths and durations on the 65C02.
+    def _nop(self, m): return 1
+    def _nop_imm(self, m): self._INCPC();return 2
+    def _nop_zp(self, m): self._INCPC();return 3
+    def _nop_zpx(self, m): self._INCPC();return 4
+    def _nop_abs(self, m): self._PC=(self._PC+2)&0xFFFF;return 4
+    def _ex_5c(self, m): self._PC=(self._PC+2)&0xFFFF;return 8
+
+    # lazy flags: the fast engine keeps the last N and Z source in _nz instead of
+    # rebuilding P, Z being set when its low byte is zero and N by bit 7 or 8. The
+    # N and Z bits of P are stale until _flags() folds _nz back, where P is observed.
+    def _lazy(self):
+        """ moves the N and Z flags of P to the lazy result. """
+        self._nz=((self._P&M65C02_NF)<<1)|(0 if self._P&M65C02_ZF else 1)
+
+    def _flags(self):
+        """ the status register, with the N and Z flags of the lazy result. """
+        return (self._P&~(M65C02_NF|M65C02_ZF))|(M65C02_NF if self._nz&0x180 else 0)|(0 if self._nz&0xFF else M65C02_ZF)
+
+    def _lz_asl(self, v):
+        self._P=(self._P&~M65C02_CF)|(v>>7);v=(v<<1)&0xFF;self._nz=v;return v
+
+    def _lz_lsr(self, v):
+        self._P=(self._P&~M65C02_CF)|(v&1);v>>=1;self._nz=v;return v
+
+    def _lz_rol(self, v):
+        c=self._P&M65C02_CF;self._P=(self._P&~M65C02_CF)|(v>>7);v=((v<<1)|c)&0xFF;self._nz=v;return v
+
+    def _lz_ror(self, v):
+        c=self._P&M65C02_CF;self._P=(self._P&~M65C02_CF)|(v&1);v=(v>>1)|(c<<7);self._nz=v;return v
+
+    def _lz_cmp(self, r, v):
+        t=r-v;self._P=(self._P&~M65C02_CF)|(0 if t&0xFF00 else M65C02_CF);self._nz=t&0xFF
+
+    def _lz_bit(self, v):
+        self._P=(self._P&~M65C02_VF)|(v&M65C02_VF);self._nz=((v&0x80)<<1)|(self._A&v)
+
+    def _lz_tsb(self, m, a):
+        v=m[a];self._nz=(0x100 if self._nz&0x180 else 0)|(1 if v&self._A else 0);m[a]=v|self._A
+
+    def _lz_trb(self, m, a):
+        v=m[a];self._nz=(0x100 if self._nz&0x180 else 0)|(1 if v&self._A else 0);m[a]=v&~self._A
+
+    def _lz_adc(self, val):
+        if self._P&M65C02_DF:
+            self._adc(val);self._lazy()
+        else:
+            s=self._A+val+(self._P&M65C02_CF)
+            self._P=(self._P&~(M65C02_VF|M65C02_CF))|(M65C02_VF if ~(self._A^val)&(self._A^s)&0x80 else 0)|(s>>8)
+            self._A=self._nz=s&0xFF
+
+    def _lz_sbc(self, val):
+        if self._P&M65C02_DF:
+            self._sbc(val);self._lazy()
+        else:
+            d=self._A-val-(1-(self._P&M65C02_CF))
+            self._P=(self._P&~(M65C02_VF|M65C02_CF))|(M65C02_VF if (self._A^val)&(self._A^d)&0x80 else 0)|(0 if d&0xFF00 else M65C02_CF)
+            self._A=self._nz=d&0xFF
+
+    # BRK s
+    def _lz_00(self, m):
+        self._INCPC();self._push(m,self._PC>>8);self._push(m,self._PC&0xFF);self._push(m,self._flags()|M65C02_XF|M65C02_BF);
+        self._P=(self._P|M65C02_IF|M65C02_BF)&~M65C02_DF;self._PC=m[0xFFFE]|(m[0xFFFF]<<8);return 7
+    # ORA (zp,x)
+    def _lz_01(self, m): self._A|=m[self._izx(m)];self._nz=self._A;return 6
+    # TSB zp
+    def _lz_04(self, m): self._lz_tsb(m,self._imm(m));return 5
+    # ORA zp
+    def _lz_05(self, m): self._A|=m[self._imm(m)];self._nz=self._A;return 3
+    # ASL zp
+    def _lz_06(self, m): a=self._imm(m);m[a]=self._lz_asl(m[a]);return 5
+    # PHP s
+    def _lz_08(self, m): self._push(m,self._flags()|M65C02_XF|M65C02_BF);return 3
+    # ORA #
+    def _lz_09(self, m): self._A|=self._imm(m);self._nz=self._A;return 2
+    # ASL A
+    def _lz_0a(self, m): self._A=self._lz_asl(self._A);return 2
+    # TSB a
+    def _lz_0c(self, m): self._lz_tsb(m,self._abs(m));return 6
+    # ORA a
+    def _lz_0d(self, m): self._A|=m[self._abs(m)];self._nz=self._A;return 4
+    # ASL a
+    def _lz_0e(self, m): a=self._abs(m);m[a]=self._lz_asl(m[a]);return 6
+    # BPL r
+    def _lz_10(self, m): return self._branch(m,not (self._nz&0x180))
+    # ORA (zp),y
+    def _lz_11(self, m): self._A|=m[self._izy(m)];self._nz=self._A;return 5
+    # ORA (zp)
+    def _lz_12(self, m): self._A|=m[self._izp(m)];self._nz=self._A;return 5
+    # TRB zp
+    def _lz_14(self, m): self._lz_trb(m,self._imm(m));return 5
+    # ORA zp,x
+    def _lz_15(self, m): self._A|=m[self._zpx(m)];self._nz=self._A;return 4
+    # ASL zp,x
+    def _lz_16(self, m): a=self._zpx(m);m[a]=self._lz_asl(m[a]);return 6
+    # ORA a,y
+    def _lz_19(self, m): self._A|=m[self._aby(m)];self._nz=self._A;return 4
+    # INC A
+    def _lz_1a(self, m): self._INA();self._nz=self._A;return 2
+    # TRB a
+    def _lz_1c(self, m): self._lz_trb(m,self._abs(m));return 6
+    # ORA a,x
+    def _lz_1d(self, m): self._A|=m[self._abx(m)];self._nz=self._A;return 4
+    # ASL a,x
+    def _lz_1e(self, m): a=self._abx(m);m[a]=self._lz_asl(m[a]);return 6
+    # AND (zp,x)
+    def _lz_21(self, m): self._A&=m[self._izx(m)];self._nz=self._A;return 6
+    # BIT zp
+    def _lz_24(self, m): self._lz_bit(m[self._imm(m)]);return 3
+    # AND zp
+    def _lz_25(self, m): self._A&=m[self._imm(m)];self._nz=self._A;return 3
+    # ROL zp
+    def _lz_26(self, m): a=self._imm(m);m[a]=self._lz_rol(m[a]);return 5
+    # PLP s
+    def _lz_28(self, m): self._P=(self._pull(m)|M65C02_BF)&~M65C02_XF;self._lazy();self._until=0;return 4
+    # AND #
+    def _lz_29(self, m): self._A&=self._imm(m);self._nz=self._A;return 2
+    # ROL A
+    def _lz_2a(self, m): self._A=self._lz_rol(self._A);return 2
+    # BIT a
+    def _lz_2c(self, m): self._lz_bit(m[self._abs(m)]);return 4
+    # AND a
+    def _lz_2d(self, m): self._A&=m[self._abs(m)];self._nz=self._A;return 4
+    # ROL a
+    def _lz_2e(self, m): a=self._abs(m);m[a]=self._lz_rol(m[a]);return 6
+    # BMI r
+    def _lz_30(self, m): return self._branch(m,self._nz&0x180)
+    # AND (zp),y
+    def _lz_31(self, m): self._A&=m[self._izy(m)];self._nz=self._A;return 5
+    # AND (zp)
+    def _lz_32(self, m): self._A&=m[self._izp(m)];self._nz=self._A;return 5
+    # BIT zp,x
+    def _lz_34(self, m): self._lz_bit(m[self._zpx(m)]);return 4
+    # AND zp,x
+    def _lz_35(self, m): self._A&=m[self._zpx(m)];self._nz=self._A;return 4
+    # ROL zp,x
+    def _lz_36(self, m): a=self._zpx(m);m[a]=self._lz_rol(m[a]);return 6
+    # AND a,y
+    def _lz_39(self, m): self._A&=m[self._aby(m)];self._nz=self._A;return 4
+    # DEC A
+    def _lz_3a(self, m): self._DEA();self._nz=self._A;return 2
+    # BIT a,x
+    def _lz_3c(self, m): self._lz_bit(m[self._abx(m)]);return 4
+    # AND a,x
+    def _lz_3d(self, m): self._A&=m[self._abx(m)];self._nz=self._A;return 4
+    # ROL a,x
+    def _lz_3e(self, m): a=self._abx(m);m[a]=self._lz_rol(m[a]);return 6
+    # RTI s
+    def _lz_40(self, m): self._P=(self._pull(m)|M65C02_BF)&~M65C02_XF;self._lazy();self._until=0;self._PC=self._pull(m);self._PC|=self._pull(m)<<8;return 6
+    # EOR (zp,x)
+    def _lz_41(self, m): self._A^=m[self._izx(m)];self._nz=self._A;return 6
+    # EOR zp
+    def _lz_45(self, m): self._A^=m[self._imm(m)];self._nz=self._A;return 3
+    # LSR zp
+    def _lz_46(self, m): a=self._imm(m);m[a]=self._lz_lsr(m[a]);return 5
+    # EOR #
+    def _lz_49(self, m): self._A^=self._imm(m);self._nz=self._A;return 2
+    # LSR A
+    def _lz_4a(self, m): self._A=self._lz_lsr(self._A);return 2
+    # EOR a
+    def _lz_4d(self, m): self._A^=m[self._abs(m)];self._nz=self._A;return 4
+    # LSR a
+    def _lz_4e(self, m): a=self._abs(m);m[a]=self._lz_lsr(m[a]);return 6
+    # EOR (zp),y
+    def _lz_51(self, m): self._A^=m[self._izy(m)];self._nz=self._A;return 5
+    # EOR (zp)
+    def _lz_52(self, m): self._A^=m[self._izp(m)];self._nz=self._A;return 5
+    # EOR zp,x
+    def _lz_55(self, m): self._A^=m[self._zpx(m)];self._nz=self._A;return 4
+    # LSR zp,x
+    def _lz_56(self, m): a=self._zpx(m);m[a]=self._lz_lsr(m[a]);return 6
+    # EOR a,y
+    def _lz_59(self, m): self._A^=m[self._aby(m)];self._nz=self._A;return 4
+    # EOR a,x
+    def _lz_5d(self, m): self._A^=m[self._abx(m)];self._nz=self._A;return 4
+    # LSR a,x
+    def _lz_5e(self, m): a=self._abx(m);m[a]=self._lz_lsr(m[a]);return 6
+    # ADC (zp,x)
+    def _lz_61(self, m): self._lz_adc(m[self._izx(m)]);return 6+((self._P&M65C02_DF)!=0)
+    # ADC zp
+    def _lz_65(self, m): self._lz_adc(m[self._imm(m)]);return 3+((self._P&M65C02_DF)!=0)
+    # ROR zp
+    def _lz_66(self, m): a=self._imm(m);m[a]=self._lz_ror(m[a]);return 5
+    # PLA s
+    def _lz_68(self, m): self._A=self._pull(m);self._nz=self._A;return 4
+    # ADC #
+    def _lz_69(self, m): self._lz_adc(self._imm(m));return 2+((self._P&M65C02_DF)!=0)
+    # ROR A
+    def _lz_6a(self, m): self._A=self._lz_ror(self._A);return 2
+    # ADC a
+    def _lz_6d(self, m): self._lz_adc(m[self._abs(m)]);return 4+((self._P&M65C02_DF)!=0)
+    # ROR a
+    def _lz_6e(self, m): a=self._abs(m);m[a]=self._lz_ror(m[a]);return 6
+    # ADC (zp),y
+    def _lz_71(self, m): self._lz_adc(m[self._izy(m)]);return 5+((self._P&M65C02_DF)!=0)
+    # ADC (zp)
+    def _lz_72(self, m): self._lz_adc(m[self._izp(m)]);return 5+((self._P&M65C02_DF)!=0)
+    # ADC zp,x
+    def _lz_75(self, m): self._lz_adc(m[self._zpx(m)]);return 4+((self._P&M65C02_DF)!=0)
+    # ROR zp,x
+    def _lz_76(self, m): a=self._zpx(m);m[a]=self._lz_ror(m[a]);return 6
+    # ADC a,y
+    def _lz_79(self, m): self._lz_adc(m[self._aby(m)]);return 4+((self._P&M65C02_DF)!=0)
+    # PLY s
+    def _lz_7a(self, m): self._Y=self._pull(m);self._nz=self._Y;return 4
+    # ADC a,x
+    def _lz_7d(self, m): self._lz_adc(m[self._abx(m)]);return 4+((self._P&M65C02_DF)!=0)
+    # ROR a,x
+    def _lz_7e(self, m): a=self._abx(m);m[a]=self._lz_ror(m[a]);return 6
+    # DEY i
+    def _lz_88(self, m): self._DEY();self._nz=self._Y;return 2
+    # BIT #
+    def _lz_89(self, m): self._nz=(0x100 if self._nz&0x180 else 0)|(1 if self._A&self._imm(m) else 0);return 2
+    # TXA i
+    def _lz_8a(self, m): self._A=self._X;self._nz=self._A;return 2
+    # TYA i
+    def _lz_98(self, m): self._A=self._Y;self._nz=self._A;return 2
+    # LDY #
+    def _lz_a0(self, m): self._Y=self._imm(m);self._nz=self._Y;return 2
+    # LDA (zp,x)
+    def _lz_a1(self, m): self._A=m[self._izx(m)];self._nz=self._A;return 6
+    # LDX #
+    def _lz_a2(self, m): self._X=self._imm(m);self._nz=self._X;return 2
+    # LDY zp
+    def _lz_a4(self, m): self._Y=m[self._imm(m)];self._nz=self._Y;return 3
+    # LDA zp
+    def _lz_a5(self, m): self._A=m[self._imm(m)];self._nz=self._A;return 3
+    # LDX zp
+    def _lz_a6(self, m): self._X=m[self._imm(m)];self._nz=self._X;return 3
+    # TAY i
+    def _lz_a8(self, m): self._Y=self._A;self._nz=self._Y;return 2
+    # LDA #
+    def _lz_a9(self, m): self._A=self._imm(m);self._nz=self._A;return 2
+    # TAX i
+    def _lz_aa(self, m): self._X=self._A;self._nz=self._X;return 2
+    # LDY a
+    def _lz_ac(self, m): self._Y=m[self._abs(m)];self._nz=self._Y;return 4
+    # LDA a
+    def _lz_ad(self, m): self._A=m[self._abs(m)];self._nz=self._A;return 4
+    # LDX a
+    def _lz_ae(self, m): self._X=m[self._abs(m)];self._nz=self._X;return 4
+    # LDA (zp),y
+    def _lz_b1(self, m): self._A=m[self._izy(m)];self._nz=self._A;return 5
+    # LDA (zp)
+    def _lz_b2(self, m): self._A=m[self._izp(m)];self._nz=self._A;return 5
+    # LDY zp,x
+    def _lz_b4(self, m): self._Y=m[self._zpx(m)];self._nz=self._Y;return 4
+    # LDA zp,x
+    def _lz_b5(self, m): self._A=m[self._zpx(m)];self._nz=self._A;return 4
+    # LDX zp,y
+    def _lz_b6(self, m): self._X=m[self._zpy(m)];self._nz=self._X;return 4
+    # LDA a,y
+    def _lz_b9(self, m): self._A=m[self._aby(m)];self._nz=self._A;return 4
+    # TSX i
+    def _lz_ba(self, m): self._X=self._S;self._nz=self._X;return 2
+    # LDY a,x
+    def _lz_bc(self, m): self._Y=m[self._abx(m)];self._nz=self._Y;return 4
+    # LDA a,x
+    def _lz_bd(self, m): self._A=m[self._abx(m)];self._nz=self._A;return 4
+    # LDX a,y
+    def _lz_be(self, m): self._X=m[self._aby(m)];self._nz=self._X;return 4
+    # CPY #
+    def _lz_c0(self, m): self._lz_cmp(self._Y,self._imm(m));return 2
+    # CMP (zp,x)
+    def _lz_c1(self, m): self._lz_cmp(self._A,m[self._izx(m)]);return 6
+    # CPY zp
+    def _lz_c4(self, m): self._lz_cmp(self._Y,m[self._imm(m)]);return 3
+    # CMP zp
+    def _lz_c5(self, m): self._lz_cmp(self._A,m[self._imm(m)]);return 3
+    # DEC zp
+    def _lz_c6(self, m): a=self._imm(m);v=(m[a]-1)&0xFF;m[a]=v;self._nz=v;return 5
+    # INY i
+    def _lz_c8(self, m): self._INY();self._nz=self._Y;return 2
+    # CMP #
+    def _lz_c9(self, m): self._lz_cmp(self._A,self._imm(m));return 2
+    # DEX i
+    def _lz_ca(self, m): self._DEX();self._nz=self._X;return 2
+    # CPY a
+    def _lz_cc(self, m): self._lz_cmp(self._Y,m[self._abs(m)]);return 4
+    # CMP a
+    def _lz_cd(self, m): self._lz_cmp(self._A,m[self._abs(m)]);return 4
+    # DEC a
+    def _lz_ce(self, m): a=self._abs(m);v=(m[a]-1)&0xFF;m[a]=v;self._nz=v;return 6
+    # BNE r
+    def _lz_d0(self, m): return self._branch(m,self._nz&0xFF)
+    # CMP (zp),y
+    def _lz_d1(self, m): self._lz_cmp(self._A,m[self._izy(m)]);return 5
+    # CMP (zp)
+    def _lz_d2(self, m): self._lz_cmp(self._A,m[self._izp(m)]);return 5
+    # CMP zp,x
+    def _lz_d5(self, m): self._lz_cmp(self._A,m[self._zpx(m)]);return 4
+    # DEC zp,x
+    def _lz_d6(self, m): a=self._zpx(m);v=(m[a]-1)&0xFF;m[a]=v;self._nz=v;return 6
+    # CMP a,y
+    def _lz_d9(self, m): self._lz_cmp(self._A,m[self._aby(m)]);return 4
+    # CMP a,x
+    def _lz_dd(self, m): self._lz_cmp(self._A,m[self._abx(m)]);return 4
+    # DEC a,x
+    def _lz_de(self, m): a=self._abx_(m);v=(m[a]-1)&0xFF;m[a]=v;self._nz=v;return 7
+    # CPX #
+    def _lz_e0(self, m): self._lz_cmp(self._X,self._imm(m));return 2
+    # SBC (zp,x)
+    def _lz_e1(self, m): self._lz_sbc(m[self._izx(m)]);return 6+((self._P&M65C02_DF)!=0)
+    # CPX zp
+    def _lz_e4(self, m): self._lz_cmp(self._X,m[self._imm(m)]);return 3
+    # SBC zp
+    def _lz_e5(self, m): self._lz_sbc(m[self._imm(m)]);return 3+((self._P&M65C02_DF)!=0)
+    # INC zp
+    def _lz_e6(self, m): a=self._imm(m);v=(m[a]+1)&0xFF;m[a]=v;self._nz=v;return 5
+    # INX i
+    def _lz_e8(self, m): self._INX();self._nz=self._X;return 2
+    # SBC #
+    def _lz_e9(self, m): self._lz_sbc(self._imm(m));return 2+((self._P&M65C02_DF)!=0)
+    # CPX a
+    def _lz_ec(self, m): self._lz_cmp(self._X,m[self._abs(m)]);return 4
+    # SBC a
+    def _lz_ed(self, m): self._lz_sbc(m[self._abs(m)]);return 4+((self._P&M65C02_DF)!=0)
+    # INC a
+    def _lz_ee(self, m): a=self._abs(m);v=(m[a]+1)&0xFF;m[a]=v;self._nz=v;return 6
+    # BEQ r
+    def _lz_f0(self, m): return self._branch(m,not (self._nz&0xFF))
+    # SBC (zp),y
+    def _lz_f1(self, m): self._lz_sbc(m[self._izy(m)]);return 5+((self._P&M65C02_DF)!=0)
+    # SBC (zp)
+    def _lz_f2(self, m): self._lz_sbc(m[self._izp(m)]);return 5+((self._P&M65C02_DF)!=0)
+    # SBC zp,x
+    def _lz_f5(self, m): self._lz_sbc(m[self._zpx(m)]);return 4+((self._P&M65C02_DF)!=0)
+    # INC zp,x
+    def _lz_f6(self, m): a=self._zpx(m);v=(m[a]+1)&0xFF;m[a]=v;self._nz=v;return 6
+    # SBC a,y
+    def _lz_f9(self, m): self._lz_sbc(m[self._aby(m)]);return 4+((self._P&M65C02_DF)!=0)
+    # PLX s
+    def _lz_fa(self, m): self._X=self._pull(m);self._nz=self._X;return 4
+    # SBC a,x
+    def _lz_fd(self, m): self._lz_sbc(m[self._abx(m)]);return 4+((self._P&M65C02_DF)!=0)
+    # INC a,x
+    def _lz_fe(self, m): a=self._abx_(m);v=(m[a]+1)&0xFF;m[a]=v;self._nz=v;return 7
 
     def flip(self, stdscr, y, x):
         lines = [f" PC: {to_hex(self._PC, 4)}",
@@ -2948,41 +2990,59 @@ class M65C02:
                  f"  S: {to_hex(self._S, 2)}",
                  f"  P: {to_hex(self._P, 2)}",
                  "",
-                 f" IR: {to_hex(self._IR>>3, 2)} {to_bin(self._IR&7, 3)}",
+                 f" IR: {to_hex(self._IR>>3, 2)} {to_bin(self._IR&7, 3)} {MNEMONICS[(self._IR>>3)&0xFF]}",
                  f"BRK: {to_bin(self._brk_flags, 3)}"
                 ]
         stdscr.addstr(y, x+14, "65C02")
         for row, line in enumerate(lines):
             stdscr.addstr(y+1 + row, x+12, line)
 
+        pins = self.pins
         lines = [
                                                         "       +-------+  ",
-                    f"  VPB {(self.circuit.pins&(1<< 0))>> 0:1d}| 1   40|{(self.circuit.pins&(1<<39))>>39:1d} RESB",
-                    f"  RDY {(self.circuit.pins&(1<< 1))>> 1:1d}| 2   39|{(self.circuit.pins&(1<<38))>>38:1d} PHI2O",
-                    f"PHI1O {(self.circuit.pins&(1<< 2))>> 2:1d}| 3   38|{(self.circuit.pins&(1<<37))>>37:1d} SOB",
-                    f" IRQB {(self.circuit.pins&(1<< 3))>> 3:1d}| 4   37|{(self.circuit.pins&(1<<36))>>36:1d} PHI2",
-                    f"  MLB {(self.circuit.pins&(1<< 4))>> 4:1d}| 5   36|{(self.circuit.pins&(1<<35))>>35:1d} BE",
-                    f" NMIB {(self.circuit.pins&(1<< 5))>> 5:1d}| 6   35|{(self.circuit.pins&(1<<34))>>34:1d} NC",
-                    f" SYNC {(self.circuit.pins&(1<< 6))>> 6:1d}| 7   34|{(self.circuit.pins&(1<<33))>>33:1d} RWB",
-                    f"  VCC {(self.circuit.pins&(1<< 7))>> 7:1d}| 8   33|{(self.circuit.pins&(1<<32))>>32:1d} D0",
-                    f"   A0 {(self.circuit.pins&(1<< 8))>> 8:1d}| 9   32|{(self.circuit.pins&(1<<31))>>31:1d} D1",
-                    f"   A1 {(self.circuit.pins&(1<< 9))>> 9:1d}|10   31|{(self.circuit.pins&(1<<30))>>30:1d} D2",
-                    f"   A2 {(self.circuit.pins&(1<<10))>>10:1d}|11   30|{(self.circuit.pins&(1<<29))>>29:1d} D3",
-                    f"   A3 {(self.circuit.pins&(1<<11))>>11:1d}|12   29|{(self.circuit.pins&(1<<28))>>28:1d} D4",
-                    f"   A4 {(self.circuit.pins&(1<<12))>>12:1d}|13   28|{(self.circuit.pins&(1<<27))>>27:1d} D5",
-                    f"   A5 {(self.circuit.pins&(1<<13))>>13:1d}|14   27|{(self.circuit.pins&(1<<26))>>26:1d} D6",
-                    f"   A6 {(self.circuit.pins&(1<<14))>>14:1d}|15   26|{(self.circuit.pins&(1<<25))>>25:1d} D7",
-                    f"   A7 {(self.circuit.pins&(1<<15))>>15:1d}|16   25|{(self.circuit.pins&(1<<24))>>24:1d} A15",
-                    f"   A8 {(self.circuit.pins&(1<<16))>>16:1d}|17   24|{(self.circuit.pins&(1<<23))>>23:1d} A14",
-                    f"   A9 {(self.circuit.pins&(1<<17))>>17:1d}|18   23|{(self.circuit.pins&(1<<22))>>22:1d} A13",
-                    f"  A10 {(self.circuit.pins&(1<<18))>>18:1d}|19   22|{(self.circuit.pins&(1<<21))>>21:1d} A12",
-                    f"  A11 {(self.circuit.pins&(1<<19))>>19:1d}|20   21|{(self.circuit.pins&(1<<20))>>20:1d} GND",
+                    f"  VPB {(pins&(1<< 0))>> 0:1d}| 1   40|{(pins&(1<<39))>>39:1d} RESB",
+                    f"  RDY {(pins&(1<< 1))>> 1:1d}| 2   39|{(pins&(1<<38))>>38:1d} PHI2O",
+                    f"PHI1O {(pins&(1<< 2))>> 2:1d}| 3   38|{(pins&(1<<37))>>37:1d} SOB",
+                    f" IRQB {(pins&(1<< 3))>> 3:1d}| 4   37|{(pins&(1<<36))>>36:1d} PHI2",
+                    f"  MLB {(pins&(1<< 4))>> 4:1d}| 5   36|{(pins&(1<<35))>>35:1d} BE",
+                    f" NMIB {(pins&(1<< 5))>> 5:1d}| 6   35|{(pins&(1<<34))>>34:1d} NC",
+                    f" SYNC {(pins&(1<< 6))>> 6:1d}| 7   34|{(pins&(1<<33))>>33:1d} RWB",
+                    f"  VCC {(pins&(1<< 7))>> 7:1d}| 8   33|{(pins&(1<<32))>>32:1d} D0",
+                    f"   A0 {(pins&(1<< 8))>> 8:1d}| 9   32|{(pins&(1<<31))>>31:1d} D1",
+                    f"   A1 {(pins&(1<< 9))>> 9:1d}|10   31|{(pins&(1<<30))>>30:1d} D2",
+                    f"   A2 {(pins&(1<<10))>>10:1d}|11   30|{(pins&(1<<29))>>29:1d} D3",
+                    f"   A3 {(pins&(1<<11))>>11:1d}|12   29|{(pins&(1<<28))>>28:1d} D4",
+                    f"   A4 {(pins&(1<<12))>>12:1d}|13   28|{(pins&(1<<27))>>27:1d} D5",
+                    f"   A5 {(pins&(1<<13))>>13:1d}|14   27|{(pins&(1<<26))>>26:1d} D6",
+                    f"   A6 {(pins&(1<<14))>>14:1d}|15   26|{(pins&(1<<25))>>25:1d} D7",
+                    f"   A7 {(pins&(1<<15))>>15:1d}|16   25|{(pins&(1<<24))>>24:1d} A15",
+                    f"   A8 {(pins&(1<<16))>>16:1d}|17   24|{(pins&(1<<23))>>23:1d} A14",
+                    f"   A9 {(pins&(1<<17))>>17:1d}|18   23|{(pins&(1<<22))>>22:1d} A13",
+                    f"  A10 {(pins&(1<<18))>>18:1d}|19   22|{(pins&(1<<21))>>21:1d} A12",
+                    f"  A11 {(pins&(1<<19))>>19:1d}|20   21|{(pins&(1<<20))>>20:1d} GND",
                                                         "       +-------+  "
                 ]
         for row, line in enumerate(lines):
             stdscr.addstr(y+11 + row, x+5, line)
 
 
+
+# decoder table indexed by the IR register, unused opcodes are no-ops picked by length and cycles,
+# the steps past the end of an instruction trap as illegal.
+_NOP_STEPS = {(1, 1): "_nop_i", (2, 2): "_nop_imm", (2, 3): "_nop_zp", (2, 4): "_nop_zpx", (3, 4): "_nop_abs"}
+M65C02._OPS = tuple(getattr(M65C02, f"_op_{ir>>3:02x}_{ir&7}" if hasattr(M65C02, f"_op_{ir>>3:02x}_0")
+                            else f"{_NOP_STEPS[(LENGTH[ir>>3], CYCLES[ir>>3])]}_{ir&7}", M65C02._illegal)
+                    for ir in range(2048))
+
+# instruction table indexed by opcode, unused opcodes are no-ops picked by length and cycles.
+_NOPS = {(1, 1): M65C02._nop, (2, 2): M65C02._nop_imm, (2, 3): M65C02._nop_zp,
+         (2, 4): M65C02._nop_zpx, (3, 4): M65C02._nop_abs}
+M65C02._EXEC = tuple(getattr(M65C02, f"_ex_{op:02x}", None) or _NOPS[(LENGTH[op], CYCLES[op])] for op in range(256))
+
+# the same table with lazy N and Z flags, only the handlers touching them differ.
+M65C02._EXEC_LAZY = tuple(getattr(M65C02, f"_lz_{op:02x}", M65C02._EXEC[op]) for op in range(256))
+
+
 if __name__ == "__main__":
     pins = 0b0000000000000000000000000000000000000000
     pins |= (M65C02_VCC|M65C02_RDY|M65C02_IRQB|M65C02_NMIB|M65C02_BE|M65C02_RESB)
@@ -0,0 +1,123 @@
+from array import array
+
+from utils import to_hex
+
+
+# the 65C02 instruction set, one row per high nibble of the opcode, one
+# 'mnemonic mode cycles' entry per low nibble, in the notation of the WDC
+# datasheet. The unused opcodes are the lowercase 'nop's of various lengths.
+# Cycles are the base ones: +1 on a page crossing of the indexed reads, +1 for
+# a taken branch and +1 more to another page, +1 for ADC and SBC in decimal mode.
+_TABLE = """
+BRK s 7|ORA (zp,x) 6|nop # 2|nop i 1|TSB zp 5|ORA zp 3|ASL zp 5|RMB0 zp 5|PHP s 3|ORA # 2|ASL A 2|nop i 1|TSB a 6|ORA a 4|ASL a 6|BBR0 zp,r 5
+BPL r 2|ORA (zp),y 5|ORA (zp) 5|nop i 1|TRB zp 5|ORA zp,x 4|ASL zp,x 6|RMB1 zp 5|CLC i 2|ORA a,y 4|INC A 2|nop i 1|TRB a 6|ORA a,x 4|ASL a,x 6|BBR1 zp,r 5
+JSR a 6|AND (zp,x) 6|nop # 2|nop i 1|BIT zp 3|AND zp 3|ROL zp 5|RMB2 zp 5|PLP s 4|AND # 2|ROL A 2|nop i 1|BIT a 4|AND a 4|ROL a 6|BBR2 zp,r 5
+BMI r 2|AND (zp),y 5|AND (zp) 5|nop i 1|BIT zp,x 4|AND zp,x 4|ROL zp,x 6|RMB3 zp 5|SEC i 2|AND a,y 4|DEC A 2|nop i 1|BIT a,x 4|AND a,x 4|ROL a,x 6|BBR3 zp,r 5
+RTI s 6|EOR (zp,x) 6|nop # 2|nop i 1|nop zp 3|EOR zp 3|LSR zp 5|RMB4 zp 5|PHA s 3|EOR # 2|LSR A 2|nop i 1|JMP a 3|EOR a 4|LSR a 6|BBR4 zp,r 5
+BVC r 2|EOR (zp),y 5|EOR (zp) 5|nop i 1|nop zp,x 4|EOR zp,x 4|LSR zp,x 6|RMB5 zp 5|CLI i 2|EOR a,y 4|PHY s 3|nop i 1|nop a 8|EOR a,x 4|LSR a,x 6|BBR5 zp,r 5
+RTS s 6|ADC (zp,x) 6|nop # 2|nop i 1|STZ zp 3|ADC zp 3|ROR zp 5|RMB6 zp 5|PLA s 4|ADC # 2|ROR A 2|nop i 1|JMP (a) 6|ADC a 4|ROR a 6|BBR6 zp,r 5
+BVS r 2|ADC (zp),y 5|ADC (zp) 5|nop i 1|STZ zp,x 4|ADC zp,x 4|ROR zp,x 6|RMB7 zp 5|SEI i 2|ADC a,y 4|PLY s 4|nop i 1|JMP (a,x) 6|ADC a,x 4|ROR a,x 6|BBR7 zp,r 5
+BRA r 2|STA (zp,x) 6|nop # 2|nop i 1|STY zp 3|STA zp 3|STX zp 3|SMB0 zp 5|DEY i 2|BIT # 2|TXA i 2|nop i 1|STY a 4|STA a 4|STX a 4|BBS0 zp,r 5
+BCC r 2|STA (zp),y 6|STA (zp) 5|nop i 1|STY zp,x 4|STA zp,x 4|STX zp,y 4|SMB1 zp 5|TYA i 2|STA a,y 5|TXS i 2|nop i 1|STZ a 4|STA a,x 5|STZ a,x 5|BBS1 zp,r 5
+LDY # 2|LDA (zp,x) 6|LDX # 2|nop i 1|LDY zp 3|LDA zp 3|LDX zp 3|SMB2 zp 5|TAY i 2|LDA # 2|TAX i 2|nop i 1|LDY a 4|LDA a 4|LDX a 4|BBS2 zp,r 5
+BCS r 2|LDA (zp),y 5|LDA (zp) 5|nop i 1|LDY zp,x 4|LDA zp,x 4|LDX zp,y 4|SMB3 zp 5|CLV i 2|LDA a,y 4|TSX i 2|nop i 1|LDY a,x 4|LDA a,x 4|LDX a,y 4|BBS3 zp,r 5
+CPY # 2|CMP (zp,x) 6|nop # 2|nop i 1|CPY zp 3|CMP zp 3|DEC zp 5|SMB4 zp 5|INY i 2|CMP # 2|DEX i 2|WAI i 3|CPY a 4|CMP a 4|DEC a 6|BBS4 zp,r 5
+BNE r 2|CMP (zp),y 5|CMP (zp) 5|nop i 1|nop zp,x 4|CMP zp,x 4|DEC zp,x 6|SMB5 zp 5|CLD i 2|CMP a,y 4|PHX s 3|STP i 3|nop a 4|CMP a,x 4|DEC a,x 7|BBS5 zp,r 5
+CPX # 2|SBC (zp,x) 6|nop # 2|nop i 1|CPX zp 3|SBC zp 3|INC zp 5|SMB6 zp 5|INX i 2|SBC # 2|NOP i 2|nop i 1|CPX a 4|SBC a 4|INC a 6|BBS6 zp,r 5
+BEQ r 2|SBC (zp),y 5|SBC (zp) 5|nop i 1|nop zp,x 4|SBC zp,x 4|INC zp,x 6|SMB7 zp 5|SED i 2|SBC a,y 4|PLX s 4|nop i 1|nop a 4|SBC a,x 4|INC a,x 7|BBS7 zp,r 5
+"""
+
+# addressing modes and the length of their instructions.
+MODES = ("i", "A", "s", "#", "zp", "zp,x", "zp,y", "(zp,x)", "(zp),y", "(zp)", "r",
+         "a", "a,x", "a,y", "(a)", "(a,x)", "zp,r")
+_LENGTHS = (1, 1, 1, 2, 2, 2, 2, 2, 2, 2, 2,
+            3, 3, 3, 3, 3, 3)
+
+# the operand formats of the disassembler, by addressing mode.
+_FORMATS = ("", " A", "", " #$%s", " $%s", " $%s,X", " $%s,Y", " ($%s,X)", " ($%s),Y", " ($%s)", " $%s",
+            " $%s", " $%s,X", " $%s,Y", " ($%s)", " ($%s,X)", " $%s")
+
+
+def _build():
+    mnemonics, modes, lengths, cycles = [], array('B'), array('B'), array('B')
+    for row in _TABLE.strip().split('\n'):
+        for entry in row.split('|'):
+            mnemonic, mode, cycle = entry.split(' ')
+            mnemonics.append(mnemonic)
+            modes.append(MODES.index(mode))
+            lengths.append(_LENGTHS[MODES.index(mode)])
+            cycles.append(int(cycle))
+    # BRK skips a signature byte.
+    lengths[0x00] = 2
+    return tuple(mnemonics), modes, lengths, cycles
+
+
+# the opcode metadata, indexed by opcode byte.
+MNEMONICS, MODE, LENGTH, CYCLES = _build()
+UNUSED = bytes(mnemonic.islower() for mnemonic in MNEMONICS)
+
+
+def disassemble(memory, addr):
+    """
+        Disassembles the instruction at an address.
+
+        Args
+        ----
+        memory : indexable
+            the 64K address space, anything indexed by address.
+        addr : int
+            the address of the opcode.
+
+        Returns
+        -------
+        text : str
+            the instruction in assembly, with the branch targets resolved.
+        length : int
+            the length of the instruction in bytes.
+    """
+    op = memory[addr]
+    mode = MODE[op]
+    length = LENGTH[op]
+    operand = ""
+    if MODES[mode] == "r":
+        o = memory[(addr+1)&0xFFFF]
+        operand = to_hex((addr+2+o-((o&0x80)<<1))&0xFFFF, 4)
+    elif MODES[mode] == "zp,r":
+        o = memory[(addr+2)&0xFFFF]
+        operand = to_hex(memory[(addr+1)&0xFFFF], 2) + ",$" + to_hex((addr+3+o-((o&0x80)<<1))&0xFFFF, 4)
+    elif length == 2 and op != 0x00:
+        operand = to_hex(memory[(addr+1)&0xFFFF], 2)
+    elif length == 3:
+        operand = to_hex(memory[(addr+1)&0xFFFF]|(memory[(addr+2)&0xFFFF]<<8), 4)
+    fmt = _FORMATS[mode] if operand or mode == 1 else ""
+    return MNEMONICS[op] + (fmt % operand if "%s" in fmt else fmt), length
+
+
+def coverage(counts):
+    """
+        Formats the number of executions of each opcode as a 16x16 table, like
+        the one of the README, with 'X' for the executed opcodes, '.' for the
+        ones never executed and nothing for the unused ones.
+
+        Args
+        ----
+        counts : sequence of int
+            the number of executions, indexed by opcode byte.
+
+        Returns
+        -------
+        table : str
+            the formatted table, followed by the executed/used opcode ratio.
+    """
+    header = "|   | " + " | ".join("0123456789abcdef") + " |   |"
+    lines = [header, "|---" * 18 + "|"]
+    for hi in range(16):
+        cells = []
+        for lo in range(16):
+            op = hi<<4|lo
+            cells.append(" " if UNUSED[op] else ("X" if counts[op] else "."))
+        lines.append(f"| {hi:x} | " + " | ".join(cells) + f" | {hi:x} |")
+    lines.append(header)
+    used = [op for op in range(256) if not UNUSED[op]]
+    lines.append(f"{sum(1 for op in used if counts[op])}/{len(used)} opcodes executed.")
+    return "\n".join(lines)
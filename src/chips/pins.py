@@ -47,6 +47,10 @@ M65C02_GND   = (1<<39)
 
 # pin mask for all the pins of the 65c02 chip.
 M65C02_PIN_MASK = ((1<<40)-1)
+# masks of the address, data and control lines inside the pin mask.
+M65C02_ADDR_MASK = (((1<<16)-1)<<7)
+M65C02_DATA_MASK = (((1<<8)-1)<<23)
+M65C02_CTRL_MASK = M65C02_PIN_MASK^M65C02_ADDR_MASK^M65C02_DATA_MASK
 
 # internal status register bits.
 M65C02_CF = (1<<0)
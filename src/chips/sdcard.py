@@ -0,0 +1,102 @@
+# the R1 response bits.
+SD_IDLE    = (1<<0)
+SD_ILLEGAL = (1<<2)
+
+# data tokens.
+SD_START_BLOCK = 0xFE
+SD_ACCEPTED    = 0x05
+SD_WRITE_ERROR = 0x0D
+
+SD_BLOCK = 512
+
+
+class SDCard:
+    """
+        An SD card in SPI mode, at byte granularity behind an SPIAdapter:
+        the reset and initialization commands (CMD0, CMD8, CMD55, ACMD41,
+        CMD58, CMD16), single block reads (CMD17) and writes (CMD24). It
+        answers as an SDHC card, addressed by blocks of 512 bytes, and the
+        blocks are those of the image, any bytes-like object (a bytearray,
+        or a mmap for a file), written only when writable: the blocks
+        written to a read-only card are answered with a write error.
+    """
+    def __init__(self, image, writable=True):
+        self.image = image
+        self.writable = writable
+        self.blocks = len(image) // SD_BLOCK
+        self._idle = True
+        self._app = False         # the next command is an application one, after CMD55.
+        self._command = bytearray()
+        self._reply = b""
+        self._position = 0
+        self._write = None        # the block address of a CMD24 waiting for its data.
+        self._data = None         # the data of the block written, with its CRC.
+
+    def select(self, selected):
+        if not selected:
+            self._command.clear()
+
+    def exchange(self, byte):
+        """ the byte received, returns the byte sent during the next transfer. """
+        if self._data is not None:
+            self._data.append(byte)
+            if len(self._data) == SD_BLOCK + 2:
+                self._store()
+        elif self._write is not None and byte == SD_START_BLOCK:
+            self._data = bytearray()
+        elif self._command or byte&0xC0 == 0x40:
+            self._command.append(byte)
+            if len(self._command) == 6:
+                self._execute()
+                self._command.clear()
+        if self._position < len(self._reply):
+            self._position += 1
+            return self._reply[self._position - 1]
+        return 0xFF
+
+    def _respond(self, *parts):
+        self._reply = b"".join(bytes(part) for part in parts)
+        self._position = 0
+
+    def _execute(self):
+        index = self._command[0]&0x3F
+        argument = int.from_bytes(self._command[1:5], "big")
+        app, self._app = self._app, False
+        r1 = SD_IDLE if self._idle else 0x00
+        if index == 0:
+            self._idle = True
+            self._respond([SD_IDLE])
+        elif index == 8:
+            self._respond([r1, 0x00, 0x00, (argument>>8)&0x0F, argument&0xFF])
+        elif index == 55:
+            self._app = True
+            self._respond([r1])
+        elif index == 41 and app:
+            self._idle = False
+            self._respond([0x00])
+        elif index == 58:
+            # powered up, high capacity.
+            self._respond([r1, 0xC0, 0xFF, 0x80, 0x00])
+        elif index == 16:
+            self._respond([r1])
+        elif index == 17 and not self._idle and argument < self.blocks:
+            start = argument*SD_BLOCK
+            self._respond([0x00, 0xFF, SD_START_BLOCK], self.image[start:start + SD_BLOCK], [0xFF, 0xFF])
+        elif index == 24 and not self._idle and argument < self.blocks:
+            self._write = argument
+            self._respond([0x00])
+        else:
+            self._respond([r1|SD_ILLEGAL])
+
+    def _store(self):
+        if not self.writable:
+            self._write = None
+            self._data = None
+            self._respond([SD_WRITE_ERROR])
+            return
+        start = self._write*SD_BLOCK
+        self.image[start:start + SD_BLOCK] = self._data[:SD_BLOCK]
+        self._write = None
+        self._data = None
+        # accepted, then busy for a byte.
+        self._respond([SD_ACCEPTED, 0x00])
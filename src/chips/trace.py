@@ -0,0 +1,180 @@
+import struct
+from array import array
+
+from utils import to_hex
+
+from chips.opcodes import MNEMONICS
+
+
+# layout of a packed bus record, one 64-bit word per cycle.
+TRACE_ADDR_SHIFT  = 0
+TRACE_DATA_SHIFT  = 16
+TRACE_RWB_SHIFT   = 24
+TRACE_SYNC_SHIFT  = 25
+TRACE_CYCLE_SHIFT = 26
+
+
+def pack(cycle, addr, data, rwb, sync):
+    """ packs a bus cycle into a 64-bit record, rwb and sync are booleans or pin masks. """
+    return ((cycle<<TRACE_CYCLE_SHIFT)
+            | ((1 if sync else 0)<<TRACE_SYNC_SHIFT)
+            | ((1 if rwb else 0)<<TRACE_RWB_SHIFT)
+            | (data<<TRACE_DATA_SHIFT)
+            | addr)
+
+
+def unpack(record):
+    """ the (cycle, addr, data, rwb, sync) of a packed record. """
+    return (record>>TRACE_CYCLE_SHIFT,
+            record&0xFFFF,
+            (record>>TRACE_DATA_SHIFT)&0xFF,
+            (record>>TRACE_RWB_SHIFT)&1,
+            (record>>TRACE_SYNC_SHIFT)&1)
+
+
+def format_record(record):
+    """ the 'addr r/W data' line shown in the TUI, followed by the mnemonic on opcode fetches. """
+    _, addr, data, rwb, sync = unpack(record)
+    line = ' '.join([to_hex(addr, 4), ('r' if rwb else 'W'), to_hex(data, 2)])
+    return line + ' ' + MNEMONICS[data] if sync else line
+
+
+class BusTrace:
+    """
+        A fixed-capacity ring buffer of the last bus cycles, as packed 64-bit
+        records, the oldest ones being overwritten. Nothing is formatted until
+        asked for.
+    """
+    def __init__(self, capacity=1024):
+        self._records = array('Q', bytes(8 * capacity))
+        self._capacity = capacity
+        self._next = 0
+        self._count = 0
+
+    def __len__(self):
+        return self._count
+
+    def append(self, record):
+        i = self._next
+        self._records[i] = record
+        i += 1
+        self._next = 0 if i == self._capacity else i
+        if self._count < self._capacity:
+            self._count += 1
+
+    def clear(self):
+        self._next = 0
+        self._count = 0
+
+    def records(self, n=None):
+        """ the last n packed records, all of them by default, oldest first. """
+        n = self._count if n is None else min(n, self._count)
+        start = self._next - n
+        if start >= 0:
+            return self._records[start:self._next].tolist()
+        return self._records[start:].tolist() + self._records[:self._next].tolist()
+
+    def __iter__(self):
+        return map(unpack, self.records())
+
+    def lines(self, n=None):
+        """ the last n records formatted for the TUI, oldest first. """
+        return [format_record(record) for record in self.records(n)]
+
+
+# a trace file: a magic string followed by fixed-width little-endian records,
+# the cycle on 8 bytes, the address on 2, the data and the flags on 1 each.
+TRACE_MAGIC = b"M65C02TR"
+TRACE_RECORD = struct.Struct("<QHBB")
+TRACE_FLAG_RWB  = 1 << 0
+TRACE_FLAG_SYNC = 1 << 1
+
+
+class TraceWriter:
+    """
+        Streams packed bus records to a trace file, through a buffer of a
+        fixed number of records written out in one go when full.
+    """
+    def __init__(self, path, buffered=65536):
+        self._file = open(path, "wb")
+        self._file.write(TRACE_MAGIC)
+        self._buffer = bytearray(TRACE_RECORD.size * buffered)
+        self._view = memoryview(self._buffer)
+        self._pack = TRACE_RECORD.pack_into
+        self._offset = 0
+        self.count = 0
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def append(self, record):
+        self._pack(self._buffer, self._offset,
+                   record>>TRACE_CYCLE_SHIFT,
+                   record&0xFFFF,
+                   (record>>TRACE_DATA_SHIFT)&0xFF,
+                   (record>>TRACE_RWB_SHIFT)&(TRACE_FLAG_RWB|TRACE_FLAG_SYNC))
+        self._offset += TRACE_RECORD.size
+        self.count += 1
+        if self._offset == len(self._buffer):
+            self.flush()
+
+    def flush(self):
+        self._file.write(self._view[:self._offset])
+        self._offset = 0
+
+    def close(self):
+        if not self._file.closed:
+            self.flush()
+            self._file.close()
+
+
+class TraceReader:
+    """
+        A trace file memory-mapped as a NumPy structured array, with the
+        'cycle', 'addr', 'data' and 'flags' fields. Nothing is read until
+        sliced.
+    """
+    def __init__(self, path):
+        import numpy as np
+
+        with open(path, "rb") as file:
+            if file.read(len(TRACE_MAGIC)) != TRACE_MAGIC:
+                raise ValueError(f"{path} is not a bus trace file.")
+            empty = not file.read(1)
+        self._np = np
+        dtype = np.dtype([("cycle", "<u8"), ("addr", "<u2"), ("data", "u1"), ("flags", "u1")])
+        if empty:
+            self.records = np.zeros(0, dtype=dtype)
+        else:
+            self.records = np.memmap(path, dtype=dtype, mode="r", offset=len(TRACE_MAGIC))
+
+    def __len__(self):
+        return len(self.records)
+
+    def __getitem__(self, index):
+        return self.records[index]
+
+    def cycles(self, lo, hi):
+        """ the records of the cycles in [lo, hi), cycles being recorded in order. """
+        cycle = self.records["cycle"]
+        return self.records[cycle.searchsorted(lo, "left"):cycle.searchsorted(hi, "left")]
+
+    def address(self, addr, hi=None):
+        """ the records of the bus accesses to [addr, hi], or to addr alone. """
+        addrs = self.records["addr"]
+        if hi is None:
+            return self.records[addrs == addr]
+        return self.records[(addrs >= addr) & (addrs <= hi)]
+
+    def opcodes(self):
+        """ the number of fetches of each opcode, indexed by opcode byte, for opcodes.coverage. """
+        records = self.records
+        return self._np.bincount(records["data"][(records["flags"] & TRACE_FLAG_SYNC) != 0], minlength=256)
+
+    def pc(self, pc):
+        """ the opcode fetches at a given program counter. """
+        records = self.records
+        return records[(records["addr"] == pc) & ((records["flags"] & TRACE_FLAG_SYNC) != 0)]
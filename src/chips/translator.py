@@ -0,0 +1,438 @@
+import re
+
+from chips.opcodes import MNEMONICS
+from chips.opcodes import MODE
+from chips.opcodes import MODES
+from chips.opcodes import LENGTH
+from chips.opcodes import CYCLES
+from chips.memory import RAM
+
+
+# flags tracked by the liveness analysis: the lazy N and Z result, and V.
+_NZ = 1
+_V  = 2
+
+# instructions ending a block, and the ones left to the interpreter, those
+# clearing I among them stop the run for a masked interrupt.
+_BRANCHES = {"BPL": "not nz&0x180", "BMI": "nz&0x180", "BVC": "not P&0x40", "BVS": "P&0x40",
+             "BCC": "not P&1", "BCS": "P&1", "BNE": "nz&0xFF", "BEQ": "not nz&0xFF", "BRA": "True"}
+_JUMPS = {"JMP", "JSR", "RTS"} | {f"BBR{b}" for b in range(8)} | {f"BBS{b}" for b in range(8)} | set(_BRANCHES)
+_INTERPRETED = {"BRK", "RTI", "WAI", "STP", "CLI", "PLP"}
+_ALU = {"ORA": "|", "AND": "&", "EOR": "^"}
+
+# flags written, and read, by each mnemonic.
+_WRITES = dict.fromkeys("LDA LDX LDY ORA AND EOR CMP CPX CPY ASL LSR ROL ROR INC DEC INX INY DEX DEY "
+                        "TAX TAY TXA TYA TSX PLA PLX PLY TSB TRB".split(), _NZ)
+_WRITES.update(ADC=_NZ|_V, SBC=_NZ|_V, BIT=_NZ|_V, PLP=_NZ|_V, CLV=_V)
+_READS = dict.fromkeys("BPL BMI BNE BEQ TSB TRB".split(), _NZ)
+_READS.update(BVC=_V, BVS=_V, PHP=_NZ|_V)
+
+# indexed reads taking one more cycle on a page crossing.
+_PENALTY = {"a,x", "a,y", "(zp),y"}
+_NO_PENALTY = {"STA", "STZ", "INC", "DEC", "JMP"}
+
+# the materialized status register, from P and the lazy N and Z result.
+_FLAGS = "(P&0x7D)|(0x80 if nz&0x180 else 0)|(0 if nz&0xFF else 2)"
+_LAZY = "((P&0x80)<<1)|(0 if P&2 else 1)"
+
+_LOADED = re.compile(r"\b(A|X|Y|S|P|nz|c)\b")
+_STORED = re.compile(r"\b(A|X|Y|S|P|nz)\s*(?:>>|<<|[-+|&^])?=(?!=)")
+_EXIT = "@exit"
+
+
+def _interpret(cpu, m):
+    """ the block of an instruction left to the interpreter, a CPU parked by WAI or STP skips to the next stop. """
+    cpu.step_instruction()
+    if cpu.halted is not None and cpu.idle_skip and cpu._cycles < cpu._until:
+        cpu._cycles = cpu._until
+
+
+def _target(mode, operand, nxt):
+    """ the target of a relative branch, nxt being the address of the next instruction. """
+    o = operand >> 8 if mode == "zp,r" else operand
+    return (nxt + o - ((o & 0x80) << 1)) & 0xFFFF
+
+
+class BlockTranslator:
+    """
+        Translates the basic blocks of the program into Python functions,
+        registers held in locals, N and Z kept as a lazy result, and the flags
+        only computed where a later instruction, or the end of the block,
+        observes them. Blocks are cached by (address, bank) and dropped on a
+        write into their bytes, a block writing into itself leaves right after
+        the store.
+        The translator takes the place of the instruction cache of the memory,
+        a bank switch takes effect at the next block.
+    """
+    # the longest run of instructions translated into one block.
+    MAX_LENGTH = 64
+
+    def __init__(self, cpu):
+        self.cpu = cpu
+        self.memory = m = cpu.circuit.memory
+        self.blocks = {}
+        self._dead = {}                        # the flag a block checks after its stores, by key.
+        self._pages = [[] for _ in range(256)]  # (key, lo, hi) of the blocks overlapping each page.
+        self._banked = [None] * 256             # the banked RAM behind each page.
+        for page, region, _ in m._views:
+            if isinstance(region, RAM) and len(region._banks) > 1:
+                self._banked[page] = region
+        # zero page and stack reads skip the page map when RAM is there.
+        self._zp = "r" if m._ram_top >= 0x200 else "m"
+        m.icache = self
+
+    def _bank(self, page):
+        region = self._banked[page]
+        return 0 if region is None else region.bank
+
+    def run(self, cycles):
+        """
+            Runs the translated blocks, translating the ones reached for the
+            first time. The looping blocks stop at the next event, the idle
+            ones skip to it, and so does a driven interrupt line. Events are
+            dispatched and interrupts serviced between blocks.
+
+            Args
+            ----
+            cycles : int
+                the number of clock cycles to run for, the last block is always
+                completed and may overshoot.
+
+            Returns
+            -------
+            cycles : int
+                the number of elapsed clock cycles.
+        """
+        cpu = self.cpu
+        m = self.memory
+        blocks = self.blocks
+        banked = self._banked
+        start = cpu._cycles
+        end = start + cycles
+        cpu._until = 0
+        while cpu._cycles < end:
+            if cpu._cycles >= cpu._until:
+                cpu._boundary(m, end, False)
+            pc = cpu._PC
+            region = banked[pc >> 8]
+            block = blocks.get((pc, 0 if region is None else region.bank))
+            if block is None:
+                block = self.translate(pc)
+            block(cpu, m)
+        return cpu._cycles - start
+
+    def step(self):
+        """ runs the block at PC, returns its cycle count. """
+        cpu = self.cpu
+        start = cpu._cycles
+        block = self.blocks.get((cpu._PC, self._bank(cpu._PC >> 8)))
+        if block is None:
+            block = self.translate(cpu._PC)
+        cpu._until = 0
+        block(cpu, self.memory)
+        return cpu._cycles - start
+
+    def written(self, addr):
+        """ drops the blocks of the current bank holding a written address. """
+        page = addr >> 8
+        bank = self._bank(page)
+        keep = []
+        for key, lo, hi in self._pages[page]:
+            if key[1] == bank and lo <= addr < hi:
+                if self.blocks.pop(key, None) is not None:
+                    self._dead.pop(key)[0] = True
+            elif key in self.blocks:
+                keep.append((key, lo, hi))
+        self._pages[page] = keep
+        self.memory._code[page] = 1 if keep else 0
+
+    def remap(self, page):
+        """ blocks are cached by bank, the ones of the other banks stay valid. """
+
+    def clear(self):
+        for dead in self._dead.values():
+            dead[0] = True
+        self.blocks.clear()
+        self._dead.clear()
+        for page in range(256):
+            self._pages[page] = []
+            self.memory._code[page] = 0
+
+    def translate(self, addr):
+        """
+            Translates, and caches, the block starting at an address.
+
+            Args
+            ----
+            addr : int
+                the address of the first instruction.
+
+            Returns
+            -------
+            block : function
+                the block, called with the CPU, the memory and the cycle count
+                to stop looping at, it updates the registers and the cycle
+                counter of the CPU.
+        """
+        m = self.memory
+        region = self._banked[addr >> 8]
+        instructions = []
+        pc = addr
+        while pc < 0x10000 and len(instructions) < self.MAX_LENGTH and m._read_pages[pc >> 8] is not None:
+            op = m[pc]
+            length = LENGTH[op]
+            if (pc + length > 0x10000 or MNEMONICS[op] in _INTERPRETED
+                    or any(m._read_pages[page] is None or self._banked[page] is not region
+                           for page in (pc >> 8, (pc + length - 1) >> 8))):
+                break
+            operand = 0
+            for i in range(1, length):
+                operand |= m[pc + i] << (8 * (i - 1))
+            instructions.append((pc, op, operand))
+            pc += length
+            if MNEMONICS[op] in _JUMPS:
+                break
+
+        if m._read_pages[addr >> 8] is None:
+            return _interpret  # devices may answer differently next time.
+        key = (addr, self._bank(addr >> 8))
+        dead = [False]
+        if instructions:
+            block = self._compile(instructions, addr, pc, dead)
+        else:
+            block = _interpret
+            pc = addr + 1
+        self.blocks[key] = block
+        self._dead[key] = dead
+        for page in range(addr >> 8, ((pc - 1) >> 8) + 1):
+            self._pages[page].append((key, addr, pc))
+            m._code[page] = 1
+        return block
+
+    def _compile(self, instructions, lo, hi, dead):
+        """ the function of a block of (address, opcode, operand) instructions spanning [lo, hi). """
+        writable = any(self.memory._write_pages[page] is not None for page in range(lo >> 8, ((hi - 1) >> 8) + 1))
+
+        # liveness of the flags after each instruction, all of them live on exit.
+        live = _NZ | _V
+        lives = []
+        for i in range(len(instructions) - 1, -1, -1):
+            pc, op, operand = instructions[i]
+            mnemonic, mode = MNEMONICS[op], MODES[MODE[op]]
+            if writable and i < len(instructions) - 1 and self._checked(mnemonic, mode, operand, lo, hi):
+                live = _NZ | _V
+            lives.append(live)
+            writes = _WRITES.get(mnemonic, 0) if not (mnemonic == "BIT" and mode == "#") else 0
+            reads = _READS.get(mnemonic, 0) | (_NZ if mnemonic == "BIT" and mode == "#" else 0)
+            live = (live & ~writes) | reads
+        lives.reverse()
+
+        body = []
+        cycles = 0
+        loops = False
+        for i, (pc, op, operand) in enumerate(instructions):
+            mnemonic, mode = MNEMONICS[op], MODES[MODE[op]]
+            nxt = (pc + LENGTH[op]) & 0xFFFF
+            cycles += CYCLES[op]
+            body.append(f"# {pc:04x} {mnemonic} {mode}")
+            body += self._instruction(mnemonic, mode, operand, nxt, lives[i])
+            if i < len(instructions) - 1:
+                if writable and self._checked(mnemonic, mode, operand, lo, hi):
+                    body.append("if dead[0]:")
+                    body.append(f"    {_EXIT} {nxt} {cycles}")
+            elif mnemonic not in _JUMPS:
+                body.append(f"pc={nxt}")
+            elif mode == "a":
+                loops = mnemonic == "JMP" and operand == lo
+            elif mode in ("r", "zp,r"):
+                loops = _target(mode, operand, nxt) == lo
+
+        code = "\n".join(line for line in body if not line.startswith("#"))
+        loaded = set(_LOADED.findall(code))
+        stored = set(_STORED.findall(code))
+        if "nz" in loaded:
+            loaded.add("P")
+        exit_lines = [f"cpu._{reg}={reg}" for reg in "AXYS" if reg in stored]
+        if "nz" in stored:
+            exit_lines.append(f"cpu._P={_FLAGS}")
+        elif "P" in stored:
+            exit_lines.append("cpu._P=P")
+        c = "c+" if "c" in loaded else ""
+
+        # a block jumping back to itself loops until the cycles run out, and an idle
+        # one, finding the same registers after an iteration, skips to the end.
+        period = self.cpu._period(lo, instructions[-1][0]) if loops and self.cpu.idle_skip else 0
+        state = "(" + "".join(reg + "," for reg in ("A", "X", "Y", "S", "P", "nz") if reg in loaded) + ")"
+        lines = ["def block(cpu, m):"]
+        lines += [f"    {reg}=cpu._{reg}" for reg in "AXYSP" if reg in loaded]
+        if "nz" in loaded:
+            lines.append(f"    nz={_LAZY}")
+        if loops:
+            # the devices read the cycle count, it is kept at the start of each iteration.
+            lines += ["    n=cpu._cycles", "    while True:", "        cpu._cycles=n"]
+        indent = "        " if loops else "    "
+        if c:
+            lines.append(indent + "c=0")
+        if period:
+            lines.append(indent + f"s={state}")
+        for line in body:
+            if line.lstrip().startswith(_EXIT):
+                _, pc, n = line.split()
+                inner = indent + line[:len(line) - len(line.lstrip())]
+                lines += [inner + exit_line for exit_line in exit_lines]
+                lines += [inner + f"cpu._PC={pc}",
+                          inner + (f"cpu._cycles=n+{c}{n}" if loops else f"cpu._cycles+={c}{n}"),
+                          inner + "return"]
+            else:
+                lines.append(indent + line)
+        if loops:
+            lines += [f"        n+={c}{cycles}", f"        if pc!={lo} or n>=cpu._until: break"]
+            if period:
+                lines.append(f"        if {state}==s: n+=(cpu._until-n+{period - 1})//{period}*{period};break")
+            lines += ["    " + exit_line for exit_line in exit_lines]
+            lines += ["    cpu._PC=pc", "    cpu._cycles=n"]
+        else:
+            lines += ["    " + exit_line for exit_line in exit_lines]
+            lines += ["    cpu._PC=pc", f"    cpu._cycles+={c}{cycles}"]
+
+        namespace = {"r": self.memory._ram, "dead": dead}
+        exec(compile("\n".join(lines), f"<block ${lo:04x}>", "exec"), namespace)
+        return namespace["block"]
+
+    def _checked(self, mnemonic, mode, operand, lo, hi):
+        """ whether a store of an instruction may hit the block itself, it is followed by a check. """
+        aliases = self.memory._aliases
+        if mnemonic in ("PHA", "PHX", "PHY", "PHP"):
+            return any(lo < (page + 1) << 8 and hi > page << 8 for page in aliases[1])
+        if not (mnemonic in ("STA", "STX", "STY", "STZ", "TSB", "TRB", "ASL", "LSR", "ROL", "ROR", "INC", "DEC")
+                or mnemonic[:3] in ("RMB", "SMB")) or mode in ("A", "i"):
+            return False
+        if mode == "zp" or mode == "a":
+            # the block may be run at a mirror of the address stored to.
+            return any(lo <= (page << 8 | operand & 0xFF) < hi for page in aliases[operand >> 8])
+        return True
+
+    def _ea(self, mode, operand, penalty):
+        """ the lines computing the effective address of an operand, and the address. """
+        R = self._zp
+        if mode in ("zp", "a"):
+            return [], str(operand)
+        if mode in ("zp,x", "zp,y"):
+            return [f"ea=({operand}+{mode[-1].upper()})&0xFF"], "ea"
+        if mode in ("a,x", "a,y"):
+            reg = mode[-1].upper()
+            lines = [f"c+=({operand & 0xFF}+{reg})>>8"] if penalty else []
+            return lines + [f"ea=({operand}+{reg})&0xFFFF"], "ea"
+        if mode == "(zp,x)":
+            return [f"ea=({operand}+X)&0xFF", f"ea={R}[ea]|({R}[(ea+1)&0xFF]<<8)"], "ea"
+        lines = [f"ea={R}[{operand}]|({R}[{(operand + 1) & 0xFF}]<<8)"]
+        if mode == "(zp),y":
+            if penalty:
+                lines.append("c+=((ea&0xFF)+Y)>>8")
+            lines.append("ea=(ea+Y)&0xFFFF")
+        return lines, "ea"
+
+    def _read(self, ea):
+        """ the expression reading an address, straight from RAM when it is known to be there. """
+        if ea.isdigit() and int(ea) < self.memory._ram_top:
+            return f"r[{ea}]"
+        return f"m[{ea}]"
+
+    def _instruction(self, mnemonic, mode, operand, nxt, live):
+        """ the lines of an instruction, nxt is the address of the next one, live the flags observed later. """
+        R = self._zp
+        nz = bool(live & _NZ)
+        if mode == "#":
+            lines, v = [], str(operand)
+        elif mode in ("i", "A", "s", "r", "zp,r", "(a)", "(a,x)"):
+            lines, v = [], None
+        else:
+            lines, ea = self._ea(mode, operand, mode in _PENALTY and mnemonic not in _NO_PENALTY)
+            v = self._read(ea)
+
+        if mnemonic in ("LDA", "LDX", "LDY"):
+            reg = mnemonic[-1]
+            return lines + [f"{reg}={v}"] + ([f"nz={reg}"] if nz else [])
+        if mnemonic in ("ORA", "AND", "EOR"):
+            return lines + [f"A{_ALU[mnemonic]}={v}"] + (["nz=A"] if nz else [])
+        if mnemonic in ("STA", "STX", "STY", "STZ"):
+            return lines + [f"m[{ea}]={'0' if mnemonic == 'STZ' else mnemonic[-1]}"]
+        if mnemonic in ("CMP", "CPX", "CPY"):
+            reg = "A" if mnemonic == "CMP" else mnemonic[-1]
+            return lines + [f"k={reg}-{v}", "P=(P&0xFE)|(0 if k&0xFF00 else 1)"] + (["nz=k&0xFF"] if nz else [])
+        if mnemonic in ("ADC", "SBC"):
+            if mnemonic == "ADC":
+                binary = ["k=A+v+(P&1)",
+                          "P=(P&0xBE)|(k>>8)|(0x40 if ~(A^v)&(A^k)&0x80 else 0)" if live & _V else "P=(P&0xFE)|(k>>8)"]
+            else:
+                binary = ["k=A-v-(1-(P&1))",
+                          "P=(P&0xBE)|(0 if k&0xFF00 else 1)|(0x40 if (A^v)&(A^k)&0x80 else 0)" if live & _V
+                          else "P=(P&0xFE)|(0 if k&0xFF00 else 1)"]
+            binary += ["A=k&0xFF"] + (["nz=A"] if nz else [])
+            return lines + [f"v={v}", "if P&8:",
+                            f"    cpu._A=A;cpu._P=P;cpu._{mnemonic.lower()}(v);A=cpu._A;P=cpu._P;nz={_LAZY};c+=1",
+                            "else:"] + ["    " + line for line in binary]
+        if mnemonic == "BIT":
+            if mode == "#":
+                return [f"nz=(0x100 if nz&0x180 else 0)|(1 if A&{v} else 0)"] if nz else []
+            return lines + [f"v={v}"] + (["P=(P&0xBF)|(v&0x40)"] if live & _V else []) + (["nz=((v&0x80)<<1)|(A&v)"] if nz else [])
+        if mnemonic in ("TSB", "TRB"):
+            return lines + [f"v={v}"] + (["nz=(0x100 if nz&0x180 else 0)|(1 if v&A else 0)"] if nz else []) + \
+                [f"m[{ea}]=v|A" if mnemonic == "TSB" else f"m[{ea}]=v&~A"]
+        if mnemonic in ("ASL", "LSR", "ROL", "ROR", "INC", "DEC"):
+            x = "A" if mode == "A" else "v"
+            op = {"ASL": ["P=(P&0xFE)|({x}>>7)", "{x}=({x}<<1)&0xFF"],
+                  "LSR": ["P=(P&0xFE)|({x}&1)", "{x}>>=1"],
+                  "ROL": ["k=P&1", "P=(P&0xFE)|({x}>>7)", "{x}=(({x}<<1)|k)&0xFF"],
+                  "ROR": ["k=P&1", "P=(P&0xFE)|({x}&1)", "{x}=({x}>>1)|(k<<7)"],
+                  "INC": ["{x}=({x}+1)&0xFF"],
+                  "DEC": ["{x}=({x}-1)&0xFF"]}[mnemonic]
+            op = [line.format(x=x) for line in op] + ([f"nz={x}"] if nz else [])
+            if mode == "A":
+                return op
+            return lines + [f"v={v}"] + op + [f"m[{ea}]=v"]
+        if mnemonic[:3] in ("RMB", "SMB"):
+            bit = 1 << int(mnemonic[3])
+            return [f"m[{operand}]={R}[{operand}]&{0xFF ^ bit}" if mnemonic[0] == "R" else f"m[{operand}]={R}[{operand}]|{bit}"]
+        if mnemonic in ("INX", "INY", "DEX", "DEY"):
+            reg = mnemonic[-1]
+            return [f"{reg}=({reg}{'+' if mnemonic[0] == 'I' else '-'}1)&0xFF"] + ([f"nz={reg}"] if nz else [])
+        if mnemonic in ("TAX", "TAY", "TXA", "TYA", "TSX", "TXS"):
+            src, dst = mnemonic[1], mnemonic[2]
+            return [f"{dst}={src}"] + ([f"nz={dst}"] if nz and dst != "S" else [])
+        if mnemonic in ("CLC", "SEC", "CLI", "SEI", "CLD", "SED", "CLV"):
+            bit = {"C": 0x01, "I": 0x04, "D": 0x08, "V": 0x40}[mnemonic[2]]
+            return [f"P&={0xFF ^ bit}" if mnemonic[0] == "C" else f"P|={bit}"]
+        if mnemonic in ("PHA", "PHX", "PHY", "PHP"):
+            v = f"{_FLAGS}|0x30" if mnemonic == "PHP" else mnemonic[-1]
+            return [f"m[0x100|S]={v}", "S=(S-1)&0xFF"]
+        if mnemonic in ("PLA", "PLX", "PLY"):
+            reg = mnemonic[-1]
+            return ["S=(S+1)&0xFF", f"{reg}={R}[0x100|S]"] + ([f"nz={reg}"] if nz else [])
+        if mnemonic == "PLP":
+            return ["S=(S+1)&0xFF", f"P=({R}[0x100|S]|0x10)&0xDF"] + ([f"nz={_LAZY}"] if nz else [])
+        if mnemonic in _BRANCHES or mnemonic[:3] in ("BBR", "BBS"):
+            if mode == "zp,r":
+                zp = operand & 0xFF
+                bit = 1 << int(mnemonic[3])
+                cond = f"{'not ' if mnemonic[2] == 'R' else ''}{R}[{zp}]&{bit}"
+            else:
+                cond = _BRANCHES[mnemonic]
+            target = _target(mode, operand, nxt)
+            taken = 1 if (target ^ nxt) & 0xFF00 == 0 else 2
+            if cond == "True":
+                return [f"pc={target};c+={taken}"]
+            return [f"if {cond}:", f"    pc={target};c+={taken}", "else:", f"    pc={nxt}"]
+        if mnemonic == "JMP":
+            if mode == "a":
+                return [f"pc={operand}"]
+            if mode == "(a)":
+                return [f"pc={self._read(str(operand))}|({self._read(str((operand + 1) & 0xFFFF))}<<8)"]
+            return [f"ea=({operand}+X)&0xFFFF", "pc=m[ea]|(m[(ea+1)&0xFFFF]<<8)"]
+        if mnemonic == "JSR":
+            ret = (nxt - 1) & 0xFFFF
+            return [f"m[0x100|S]={ret >> 8}", "S=(S-1)&0xFF", f"m[0x100|S]={ret & 0xFF}", "S=(S-1)&0xFF", f"pc={operand}"]
+        if mnemonic == "RTS":
+            return ["S=(S+1)&0xFF", f"pc={R}[0x100|S]", "S=(S+1)&0xFF", f"pc=((pc|({R}[0x100|S]<<8))+1)&0xFFFF"]
+        # NOP and the unused opcodes.
+        return []
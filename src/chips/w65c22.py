@@ -0,0 +1,412 @@
+# the registers of the W65C22 VIA, by offset.
+W65C22_ORB  = 0x0
+W65C22_ORA  = 0x1
+W65C22_DDRB = 0x2
+W65C22_DDRA = 0x3
+W65C22_T1CL = 0x4
+W65C22_T1CH = 0x5
+W65C22_T1LL = 0x6
+W65C22_T1LH = 0x7
+W65C22_T2CL = 0x8
+W65C22_T2CH = 0x9
+W65C22_SR   = 0xA
+W65C22_ACR  = 0xB
+W65C22_PCR  = 0xC
+W65C22_IFR  = 0xD
+W65C22_IER  = 0xE
+W65C22_ORA_NH = 0xF
+
+# interrupt flag and enable bits.
+W65C22_CA2 = (1<<0)
+W65C22_CA1 = (1<<1)
+W65C22_SHIFT = (1<<2)
+W65C22_CB2 = (1<<3)
+W65C22_CB1 = (1<<4)
+W65C22_T2  = (1<<5)
+W65C22_T1  = (1<<6)
+W65C22_IRQ = (1<<7)
+
+# auxiliary control register bits.
+W65C22_ACR_PA_LATCH = (1<<0)
+W65C22_ACR_PB_LATCH = (1<<1)
+W65C22_ACR_SR_MASK  = (7<<2)
+W65C22_ACR_T2_COUNT = (1<<5)
+W65C22_ACR_T1_FREE  = (1<<6)
+W65C22_ACR_T1_PB7   = (1<<7)
+
+
+class W65C22:
+    """
+        The W65C22 Versatile Interface Adapter: ports A and B with their data
+        direction registers, the T1 and T2 timers, the shift register, the
+        CA1/CA2/CB1/CB2 interrupt inputs and the IRQ output, mapped in the
+        address space through an IO region of 16 bytes.
+
+        Nothing runs between two accesses: the timers and the shift register
+        are a start cycle and a value, their counters and flags are computed
+        from the cycles elapsed when a register is accessed. A timeout that
+        can pull IRQB low, enabled in IER and not yet flagged, is scheduled as
+        an event of the circuit, the only one at a time.
+
+        The peripherals wired to the ports are callables: output[port] is
+        called with the levels driven on the pins when they change, input[port]
+        gives the levels of the pins, pulled up when there is none. The
+        shift register exchanges its bytes with shift(byte), called with the
+        byte shifted out, or None when shifting in, and returning the byte
+        shifted in.
+    """
+    def __init__(self):
+        self.circuit = None
+        self.output = [None, None]
+        self.input = [None, None]
+        self.shift = None
+        self._event = None
+        self._irq = False
+        self.reset()
+
+    def attach_circuit(self, circuit):
+        self.circuit = circuit
+
+    def reset(self):
+        """ the RESB of the VIA: the ports as inputs, the interrupts disabled, the timers left counting. """
+        self._or = [0x00, 0x00]        # output registers of port A and B.
+        self._ddr = [0x00, 0x00]       # data direction registers, 1 for an output.
+        self._latched = [0xFF, 0xFF]   # the inputs latched on CA1 and CB1.
+        self._lines = [1, 1, 1, 1]     # levels of CA1, CA2, CB1 and CB2.
+        self._acr = 0x00
+        self._pcr = 0x00
+        self._ifr = 0x00
+        self._ier = 0x00
+
+        # T1: counting down from value at the base cycle, reloaded from the latch.
+        self._t1_latch = 0xFFFF
+        self._t1_base = 0
+        self._t1_value = 0xFFFF
+        self._t1_armed = False
+        self._t1_seen = 0
+        self._pb7 = 1
+        # T2: a one-shot counter, or a counter of PB6 pulses.
+        self._t2_latch = 0xFF
+        self._t2_base = 0
+        self._t2_value = 0xFFFF
+        self._t2_armed = False
+        self._t2_seen = 0
+        # shift register: the byte, and the cycle a shift started at, None when idle.
+        self._sr = 0x00
+        self._sr_start = None
+        if self.circuit is not None:
+            self._update(self._now())
+
+    def _now(self):
+        return self.circuit.cpu._cycles
+
+    # T1 and T2.
+    def _t1_counter(self, now):
+        """ the counter of T1, -1 for the cycle it shows $FFFF before a reload. """
+        e = now - self._t1_base
+        v = self._t1_value
+        if e <= v or not (self._acr&W65C22_ACR_T1_FREE):
+            return (v-e)&0xFFFF if e > v else v-e
+        k = (e-v-2) % (self._t1_latch+2)
+        return self._t1_latch-k if k <= self._t1_latch else -1
+
+    def _t1_timeouts(self, now):
+        """ the number of interrupting timeouts of T1 since its base cycle. """
+        e = now - self._t1_base
+        v = self._t1_value
+        if e <= v:
+            return 0
+        if self._acr&W65C22_ACR_T1_FREE:
+            return 1 + (e-v-1)//(self._t1_latch+2)
+        return 1 if self._t1_armed else 0
+
+    def _t1_next(self):
+        """ the cycle of the next timeout of T1 not seen yet, None if there is none. """
+        base = self._t1_base + self._t1_value + 1
+        if self._acr&W65C22_ACR_T1_FREE:
+            return base + self._t1_seen*(self._t1_latch+2)
+        return base if self._t1_armed and not self._t1_seen else None
+
+    def _t1_rebase(self, now):
+        """ restarts the arithmetic of T1 from the current cycle, before its mode or latch change. """
+        self._sync(now)
+        counter = self._t1_counter(now)
+        self._pb7 = self._t1_pb7(now)
+        if self._t1_seen and not (self._acr&W65C22_ACR_T1_FREE):
+            self._t1_armed = False
+        self._t1_base = now
+        self._t1_value = counter
+        self._t1_seen = 0
+
+    def _t1_pb7(self, now):
+        """ the level of PB7 driven by T1: toggled by each free-running timeout, high after a one-shot one. """
+        t = self._t1_timeouts(now)
+        if self._acr&W65C22_ACR_T1_FREE:
+            return self._pb7 ^ (t&1)
+        return 1 if t else self._pb7
+
+    def _t2_counter(self, now):
+        if self._acr&W65C22_ACR_T2_COUNT:
+            return self._t2_value
+        return (self._t2_value - (now-self._t2_base))&0xFFFF
+
+    def _t2_next(self):
+        if self._t2_armed and not self._t2_seen and not (self._acr&W65C22_ACR_T2_COUNT):
+            return self._t2_base + self._t2_value + 1
+        return None
+
+    def _t2_rebase(self, now):
+        self._sync(now)
+        self._t2_value = self._t2_counter(now)
+        self._t2_base = now
+        if self._t2_seen:
+            self._t2_armed = False
+        self._t2_seen = 0
+
+    def pulse(self):
+        """ a falling edge on PB6, counted down by T2 in pulse counting mode. """
+        now = self._now()
+        self._sync(now)
+        if self._acr&W65C22_ACR_T2_COUNT:
+            self._t2_value = (self._t2_value-1)&0xFFFF
+            if self._t2_value == 0 and self._t2_armed:
+                self._t2_armed = False
+                self._ifr |= W65C22_T2
+        self._update(now)
+
+    # shift register.
+    def _sr_mode(self):
+        return (self._acr&W65C22_ACR_SR_MASK)>>2
+
+    def _sr_done(self):
+        """ the cycle the shift of the current byte ends at, 2 cycles a bit, twice the T2 period under T2. """
+        mode = self._sr_mode()
+        bit = 2*((self._t2_latch&0xFF)+2) if mode in (1, 4, 5) else 2
+        return self._sr_start + 8*bit
+
+    def _sr_begin(self, now):
+        """ an access to the shift register starts shifting the next byte. """
+        self._ifr &= ~W65C22_SHIFT
+        self._sr_start = now if self._sr_mode() else None
+
+    # flags and interrupt.
+    def _sync(self, now):
+        """ flags the timeouts and the shifts that happened since the last access. """
+        t = self._t1_timeouts(now)
+        if t > self._t1_seen:
+            self._t1_seen = t
+            self._ifr |= W65C22_T1
+        if self._t2_next() is not None and now >= self._t2_next():
+            self._t2_seen = 1
+            self._ifr |= W65C22_T2
+        if self._sr_start is not None and now >= self._sr_done():
+            mode = self._sr_mode()
+            received = self.shift(self._sr if mode >= 4 else None) if self.shift is not None else None
+            if mode < 4:
+                self._sr = 0xFF if received is None else received
+            if mode == 4:
+                # free running, the byte recirculates without interrupt.
+                self._sr_start = self._sr_done()
+            else:
+                self._sr_start = None
+                self._ifr |= W65C22_SHIFT
+
+    def _update(self, now):
+        """ drives IRQB from the flags and schedules the next timeout that may pull it low. """
+        irq = (self._ifr&self._ier&0x7F) != 0
+        if irq != self._irq:
+            self._irq = irq
+            self.circuit.irq(self, irq)
+        pending = self._ier&~self._ifr
+        due = [cycle for cycle in (self._t1_next() if pending&W65C22_T1 else None,
+                                   self._t2_next() if pending&W65C22_T2 else None,
+                                   self._sr_done() if pending&W65C22_SHIFT and self._sr_start is not None else None)
+               if cycle is not None]
+        cycle = max(min(due), now) if due else None
+        if self._event is not None:
+            if cycle == self._event[0]:
+                return
+            self.circuit.cancel(self._event)
+            self._event = None
+        if cycle is not None:
+            self._event = self.circuit.schedule(cycle, self._timeout)
+
+    def _timeout(self):
+        self._event = None
+        now = self._now()
+        self._sync(now)
+        self._update(now)
+
+    # ports and control lines.
+    def _pins(self, port):
+        """ the levels of the pins of a port, the outputs driven, PB7 by T1 when told so. """
+        ddr = self._ddr[port]
+        levels = self.input[port]() if self.input[port] is not None else 0xFF
+        levels = (self._or[port]&ddr) | (levels&~ddr&0xFF)
+        if port == 1 and self._acr&W65C22_ACR_T1_PB7:
+            levels = (levels&0x7F) | (self._t1_pb7(self._now())<<7)
+        return levels
+
+    def _drive(self, port):
+        if self.output[port] is not None:
+            self.output[port](self._pins(port))
+
+    def _line(self, index, level):
+        """ a level on CA1, CA2, CB1 or CB2, flagged on the active edge of the PCR. """
+        previous, self._lines[index] = self._lines[index], level
+        if previous == level:
+            return
+        port, control = divmod(index, 2)
+        pcr = self._pcr >> (4*port)
+        if control == 0:
+            positive = pcr&0x01
+            flag = W65C22_CB1 if port else W65C22_CA1
+        else:
+            if pcr&0x08:
+                return  # CA2 or CB2 is an output.
+            positive = pcr&0x04
+            flag = W65C22_CB2 if port else W65C22_CA2
+        if bool(level) != bool(positive):
+            return
+        now = self._now()
+        self._sync(now)
+        self._ifr |= flag
+        if control == 0 and self._acr&(W65C22_ACR_PB_LATCH if port else W65C22_ACR_PA_LATCH):
+            self._latched[port] = self._pins(port)
+        self._update(now)
+
+    def ca1(self, level):
+        self._line(0, level)
+
+    def ca2(self, level):
+        self._line(1, level)
+
+    def cb1(self, level):
+        self._line(2, level)
+
+    def cb2(self, level):
+        self._line(3, level)
+
+    def _handshake(self, port):
+        """ an access to ORA or ORB clears the CA1/CB1 flag, and CA2/CB2 but in independent mode. """
+        pcr = self._pcr >> (4*port)
+        flags = W65C22_CB1 if port else W65C22_CA1
+        if (pcr&0x0A) != 0x02:
+            flags |= W65C22_CB2 if port else W65C22_CA2
+        self._ifr &= ~flags
+
+    # the bus: the ports do not look at the timers, their accesses only update
+    # IRQB when they clear a flag, bit-banged protocols go through them.
+    def _read_port(self, offset):
+        if offset in (W65C22_DDRB, W65C22_DDRA):
+            return self._ddr[1 if offset == W65C22_DDRB else 0]
+        port = 1 if offset == W65C22_ORB else 0
+        if offset != W65C22_ORA_NH and self._ifr:
+            ifr = self._ifr
+            self._handshake(port)
+            if self._ifr != ifr:
+                self._update(self._now())
+        if self._acr&(W65C22_ACR_PB_LATCH if port else W65C22_ACR_PA_LATCH):
+            ddr = self._ddr[port]
+            return (self._pins(port)&ddr) | (self._latched[port]&~ddr)
+        return self._pins(port)
+
+    def _write_port(self, offset, byte):
+        if offset in (W65C22_DDRB, W65C22_DDRA):
+            port = 1 if offset == W65C22_DDRB else 0
+            self._ddr[port] = byte
+        else:
+            port = 1 if offset == W65C22_ORB else 0
+            self._or[port] = byte
+            if offset != W65C22_ORA_NH and self._ifr:
+                ifr = self._ifr
+                self._handshake(port)
+                if self._ifr != ifr:
+                    self._update(self._now())
+        self._drive(port)
+
+    def read(self, offset):
+        offset &= 0x0F
+        if offset < W65C22_T1CL or offset == W65C22_ORA_NH:
+            return self._read_port(offset)
+        now = self._now()
+        self._sync(now)
+        if offset == W65C22_T1CL:
+            self._ifr &= ~W65C22_T1
+            value = self._t1_counter(now)&0xFF
+        elif offset == W65C22_T1CH:
+            value = (self._t1_counter(now)&0xFFFF)>>8
+        elif offset == W65C22_T1LL:
+            value = self._t1_latch&0xFF
+        elif offset == W65C22_T1LH:
+            value = self._t1_latch>>8
+        elif offset == W65C22_T2CL:
+            self._ifr &= ~W65C22_T2
+            value = self._t2_counter(now)&0xFF
+        elif offset == W65C22_T2CH:
+            value = self._t2_counter(now)>>8
+        elif offset == W65C22_SR:
+            value = self._sr
+            self._sr_begin(now)
+        elif offset == W65C22_ACR:
+            value = self._acr
+        elif offset == W65C22_PCR:
+            value = self._pcr
+        elif offset == W65C22_IFR:
+            value = self._ifr | (W65C22_IRQ if self._ifr&self._ier&0x7F else 0)
+        else:
+            value = self._ier | W65C22_IRQ
+        self._update(now)
+        return value
+
+    def write(self, offset, byte):
+        offset &= 0x0F
+        if offset < W65C22_T1CL or offset == W65C22_ORA_NH:
+            self._write_port(offset, byte)
+            return
+        now = self._now()
+        self._sync(now)
+        if offset in (W65C22_T1CL, W65C22_T1LL):
+            self._t1_rebase(now)
+            self._t1_latch = (self._t1_latch&0xFF00) | byte
+        elif offset == W65C22_T1CH:
+            # the latch is loaded into the counter, which starts on the next cycle.
+            self._t1_latch = (self._t1_latch&0x00FF) | (byte<<8)
+            self._ifr &= ~W65C22_T1
+            self._t1_base = now+1
+            self._t1_value = self._t1_latch
+            self._t1_armed = True
+            self._t1_seen = 0
+            if self._acr&W65C22_ACR_T1_PB7 and not (self._acr&W65C22_ACR_T1_FREE):
+                self._pb7 = 0
+        elif offset == W65C22_T1LH:
+            self._t1_rebase(now)
+            self._t1_latch = (self._t1_latch&0x00FF) | (byte<<8)
+            self._ifr &= ~W65C22_T1
+        elif offset == W65C22_T2CL:
+            self._t2_latch = byte
+        elif offset == W65C22_T2CH:
+            self._ifr &= ~W65C22_T2
+            self._t2_base = now+1
+            self._t2_value = (byte<<8) | self._t2_latch
+            self._t2_armed = True
+            self._t2_seen = 0
+        elif offset == W65C22_SR:
+            self._sr = byte
+            self._sr_begin(now)
+        elif offset == W65C22_ACR:
+            self._t1_rebase(now)
+            self._t2_rebase(now)
+            self._acr = byte
+            if self._sr_mode() == 0:
+                self._sr_start = None
+        elif offset == W65C22_PCR:
+            self._pcr = byte
+        elif offset == W65C22_IFR:
+            self._ifr &= ~(byte&0x7F)
+        else:
+            if byte&W65C22_IRQ:
+                self._ier |= byte&0x7F
+            else:
+                self._ier &= ~(byte&0x7F)
+        self._update(now)
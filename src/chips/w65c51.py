@@ -0,0 +1,257 @@
+import os
+import socket
+import tty
+
+# the registers of the 6551 ACIA, by offset.
+W65C51_DATA    = 0x0
+W65C51_STATUS  = 0x1
+W65C51_COMMAND = 0x2
+W65C51_CONTROL = 0x3
+
+# status register bits.
+W65C51_PARITY  = (1<<0)
+W65C51_FRAMING = (1<<1)
+W65C51_OVERRUN = (1<<2)
+W65C51_RDRF    = (1<<3)
+W65C51_TDRE    = (1<<4)
+W65C51_DCDB    = (1<<5)
+W65C51_DSRB    = (1<<6)
+W65C51_IRQ     = (1<<7)
+
+# command register bits.
+W65C51_DTR     = (1<<0)
+W65C51_IRD     = (1<<1)
+W65C51_TIC     = (3<<2)
+W65C51_TIC_IRQ = (1<<2)
+W65C51_ECHO    = (1<<4)
+
+
+class PtyBackend:
+    """ a host pseudo-terminal, a terminal program or a script opens the name of its slave side. """
+    def __init__(self):
+        self._master, self._slave = os.openpty()
+        tty.setraw(self._slave)
+        os.set_blocking(self._master, False)
+        self.name = os.ttyname(self._slave)
+
+    def read(self):
+        try:
+            return os.read(self._master, 4096)
+        except (BlockingIOError, OSError):
+            return b""
+
+    def write(self, data):
+        try:
+            return os.write(self._master, data)
+        except (BlockingIOError, OSError):
+            return 0
+
+    def close(self):
+        os.close(self._master)
+        os.close(self._slave)
+
+
+class SocketBackend:
+    """ a TCP server on localhost, the last client connected talks to the ACIA. """
+    def __init__(self, port, host="127.0.0.1"):
+        self._server = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+        self._server.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+        self._server.bind((host, port))
+        self._server.listen(1)
+        self._server.setblocking(False)
+        self._client = None
+        self.name = "%s:%d" % self._server.getsockname()
+
+    def _accept(self):
+        try:
+            client, _ = self._server.accept()
+        except BlockingIOError:
+            return
+        client.setblocking(False)
+        client.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        if self._client is not None:
+            self._client.close()
+        self._client = client
+
+    def read(self):
+        self._accept()
+        if self._client is None:
+            return b""
+        try:
+            data = self._client.recv(4096)
+        except BlockingIOError:
+            return b""
+        except OSError:
+            data = b""
+        if not data:
+            # the client left.
+            self._client.close()
+            self._client = None
+        return data
+
+    def write(self, data):
+        if self._client is None:
+            # nobody listens, the bytes are dropped as on an unplugged line.
+            return len(data)
+        try:
+            return self._client.send(data)
+        except BlockingIOError:
+            return 0
+        except OSError:
+            return len(data)
+
+    def close(self):
+        if self._client is not None:
+            self._client.close()
+        self._server.close()
+
+
+def open_backend(spec):
+    """
+        Opens the host side of a serial line.
+
+        Args
+        ----
+        spec : str
+            'pty' for a pseudo-terminal, 'tcp:PORT' for a socket on localhost.
+
+        Returns
+        -------
+        backend : PtyBackend or SocketBackend
+            the line, its name tells where to connect.
+    """
+    if spec == "pty":
+        return PtyBackend()
+    if spec.startswith("tcp:"):
+        return SocketBackend(int(spec[4:]))
+    raise ValueError("wrong serial backend: %s." % spec)
+
+
+class W65C51:
+    """
+        The 6551 Asynchronous Communications Interface Adapter, mapped in the
+        address space through an IO region of 4 bytes, its line backed by a
+        host pseudo-terminal or socket.
+
+        The bytes go through buffers: the transmitted ones are appended to
+        a buffer and the received ones popped from another, and the host is
+        only polled by an event of the circuit every period cycles, one
+        read and one write for all the bytes of the period. Without a
+        backend, scripts feed the line with receive() and collect it with
+        transmitted(). The line runs
+        at the speed of the emulation, the baud rate of the control register
+        is kept but not timed.
+    """
+    def __init__(self, backend=None, period=10000):
+        self.circuit = None
+        self.backend = backend
+        self.period = period
+        self._event = None
+        self._rx = bytearray()
+        self._tx = bytearray()
+        self._irq = False
+        self.reset()
+
+    def attach_circuit(self, circuit):
+        self.circuit = circuit
+        if self.backend is not None:
+            self._service()
+
+    def reset(self):
+        """ the RESB of the ACIA, the bytes received are dropped, those transmitted still go to the host. """
+        self._rx.clear()
+        self._command = 0x00
+        self._control = 0x00
+        self._status = W65C51_TDRE
+        self._flag = False
+        if self.circuit is not None:
+            self._update()
+
+    def close(self):
+        if self._event is not None:
+            self.circuit.cancel(self._event)
+            self._event = None
+        self.flush()
+        if self.backend is not None:
+            self.backend.close()
+
+    def flush(self):
+        """ writes the transmitted bytes to the host, as much as it accepts. """
+        if self._tx and self.backend is not None:
+            sent = self.backend.write(bytes(self._tx))
+            del self._tx[:sent]
+
+    def _service(self):
+        """ the periodic poll of the host, between two batches of cycles. """
+        self.flush()
+        data = self.backend.read()
+        if data:
+            self.receive(data)
+        self._event = self.circuit.schedule(self.circuit.cpu._cycles + self.period, self._service)
+
+    def receive(self, data):
+        """ puts bytes on the receive line, as if the host sent them. """
+        self._rx += data
+        if self._command&W65C51_ECHO and not self._command&W65C51_TIC:
+            self._tx += data
+        if not self._command&W65C51_IRD:
+            self._flag = True
+        self._update()
+
+    def transmitted(self):
+        """ takes the bytes transmitted and not flushed to the host yet. """
+        data = bytes(self._tx)
+        self._tx.clear()
+        return data
+
+    def _update(self):
+        irq = self._flag and bool(self._command&W65C51_DTR)
+        if irq != self._irq:
+            self._irq = irq
+            self.circuit.irq(self, irq)
+
+    # the bus.
+    def read(self, offset):
+        offset &= 0x03
+        if offset == W65C51_DATA:
+            if not self._rx:
+                return 0x00
+            # the head of a bytearray is dropped without moving the rest.
+            byte = self._rx[0]
+            del self._rx[:1]
+            return byte
+        if offset == W65C51_STATUS:
+            status = self._status
+            if self._rx:
+                status |= W65C51_RDRF
+            if self._irq:
+                status |= W65C51_IRQ
+            # reading the status clears the interrupt.
+            self._flag = False
+            self._update()
+            return status
+        if offset == W65C51_COMMAND:
+            return self._command
+        return self._control
+
+    def write(self, offset, byte):
+        offset &= 0x03
+        if offset == W65C51_DATA:
+            self._tx.append(byte)
+            if len(self._tx) >= 4096:
+                self.flush()
+            # the byte leaves at once, the transmit register is empty again.
+            if self._command&W65C51_TIC == W65C51_TIC_IRQ:
+                self._flag = True
+        elif offset == W65C51_STATUS:
+            # programmed reset.
+            self._command &= 0xE0
+            self._status &= ~W65C51_OVERRUN
+            self._flag = False
+        elif offset == W65C51_COMMAND:
+            self._command = byte
+            if byte&W65C51_TIC == W65C51_TIC_IRQ:
+                self._flag = True
+        else:
+            self._control = byte
+        self._update()
@@ -1,52 +1,175 @@
 import argparse
-from pynput import keyboard
-import curses
 
 from chips.mos65c02 import M65C02
 from chips.mos65c02 import *
 
 from chips.memory import RAM
 from chips.memory import ROM
+from chips.memory import Memory64
+from chips.memory import load_memory_map
+from chips.memory import InstructionCache
+from chips.memory import IO
+from chips.memory import _number
 from chips.Circuit import Circuit
 
-from utils import cpu_wrapper
-from utils import on_press
-from utils import on_release
-from utils import curses_wrapper
 
-
-@curses_wrapper
-def main(stdscr):
-    parser = argparse.ArgumentParser("parser to help the architecture of the 6502-based machine.")
-
-    parser.add_argument("--ram-bits", "-rb", default=15,
-                        help="the number of bits used by RAM (defaults to 15).")
-    parser.add_argument("--ram-org", "-ao", default=0x0000,
-                        help="the base address of RAM (defaults to $0000).")
-    parser.add_argument("--rom-file", "-rf", default="bin/a.out",
-                        help="the ROM file (defaults to'bin/a.out').")
-    parser.add_argument("--rom-org", "-oo", default=0x8000,
-                        help="the base address of ROM (defaults to $8000).")
-
-    args = parser.parse_args()
-
-    # put RAM in circuit.
-    ram = RAM(bits=args.ram_bits)
-    ram.set_org(args.ram_org)
-
-    # put ROM in circuit.
-    rom = ROM(args.rom_file)
-    rom.set_org(args.rom_org)
-
-    # put Versatile Interface Adapter in circuit.
-    via = None
+class _Devices(dict):
+    """
+        The devices of the machine by name, as named in memory maps, each
+        built on first use: the module of a device is only imported when
+        the options or the memory map ask for it.
+    """
+    def __init__(self, args):
+        super().__init__()
+        self.args = args
+
+    def built(self, name):
+        """ whether the device was built, by the options or the memory map. """
+        return super().__contains__(name)
+
+    def __contains__(self, name):
+        return super().__contains__(name) or name in ("via", "acia") or (
+            name in ("disk", "disk_window") and self.args.disk is not None)
+
+    def __missing__(self, name):
+        args = self.args
+        if name == "via":
+            # put Versatile Interface Adapter in circuit.
+            from chips.w65c22 import W65C22
+            device = W65C22()
+        elif name == "acia":
+            # put the serial line in circuit, backed by a host pty or socket.
+            from chips.w65c51 import W65C51
+            from chips.w65c51 import open_backend
+            device = W65C51(open_backend(args.acia) if args.acia is not None else None)
+            if device.backend is not None:
+                print(f"ACIA on {device.backend.name}")
+        elif name == "disk" and args.disk is not None:
+            # put the block device in circuit, over a disk image mapped from the host.
+            from chips.blockdev import BlockDevice
+            from chips.blockdev import open_image
+            device = BlockDevice(open_image(args.disk, writable=args.disk_writable), writable=args.disk_writable)
+        elif name == "disk_window" and args.disk is not None:
+            device = self["disk"].window
+        else:
+            raise KeyError(name)
+        self[name] = device
+        return device
+
+
+def build(args):
+    """ puts the memory and the CPU of the machine described by the arguments in a circuit. """
+    devices = _Devices(args)
+    if args.acia is not None:
+        # the line is served even when the ACIA is not mapped.
+        devices["acia"]
+
+    if args.memory_map is not None:
+        memory = load_memory_map(args.memory_map, devices)
+    else:
+        # put RAM in circuit.
+        ram = RAM(bits=args.ram_bits)
+        ram.set_org(args.ram_org)
+
+        # put ROM in circuit.
+        rom = ROM(args.rom_file)
+        rom.set_org(args.rom_org)
+
+        regions = [ram, rom]
+        if args.via_org is not None:
+            io = IO(devices["via"], 16)
+            io.set_org(args.via_org)
+            regions.append(io)
+        if args.acia_org is not None:
+            io = IO(devices["acia"], 4)
+            io.set_org(args.acia_org)
+            regions.append(io)
+        if args.disk_org is not None and args.disk is not None:
+            io = IO(devices["disk"], 8)
+            io.set_org(args.disk_org)
+            window = IO(devices["disk_window"], 512)
+            window.set_org(args.disk_org + 0x200)
+            regions += [io, window]
+        memory = Memory64(*regions)
+
+    # the LCD and the SD card are wired to the VIA, of no use unless the VIA is mapped.
+    if args.lcd and not devices.built("via"):
+        raise ValueError("--lcd needs the VIA mapped, with --via-org or in the memory map.")
+    if args.sd is not None and not devices.built("via"):
+        raise ValueError("--sd needs the VIA mapped, with --via-org or in the memory map.")
 
     # put CPU in the circuit.
     cpu = M65C02()
     pins = 0b0000000000000000000000000000000000000000
     pins |= (M65C02_VCC|M65C02_RDY|M65C02_IRQB|M65C02_NMIB|M65C02_BE|M65C02_RESB|M65C02_SYNC)
-    circuit = Circuit(pins, cpu, ram, rom)
+    circuit = Circuit(pins, cpu, memory)
     cpu.attach_circuit(circuit)
+    for name, device in devices.items():
+        if name != "disk_window":
+            circuit.attach(device)
+    # put the LCD on the ports of the VIA.
+    if args.lcd:
+        from chips.hd44780 import HD44780
+        from chips.hd44780 import connect_via
+        lcd = HD44780()
+        connect_via(lcd, devices["via"])
+        circuit.attach(lcd)
+    # put the SD card on the port B of the VIA, bit-banged SPI decoded a byte at a time.
+    if args.sd is not None:
+        from chips.bitbang import SPIAdapter
+        from chips.sdcard import SDCard
+        from chips.blockdev import open_image
+        SPIAdapter(devices["via"], SDCard(open_image(args.sd, writable=args.sd_writable), writable=args.sd_writable))
+    return circuit
+
+
+def headless(circuit, args):
+    """ resets the machine and runs it for a number of cycles, without any UI. """
+    cpu = circuit.cpu
+    if args.translate:
+        from chips.translator import BlockTranslator
+        translator = BlockTranslator(cpu)
+        cpu.reset()
+        translator.run(args.cycles)
+    elif args.fast:
+        cpu.icache = InstructionCache(circuit.memory)
+        cpu.reset()
+        cpu.run(cycles=args.cycles)
+    else:
+        if args.trace is not None:
+            circuit.stream(args.trace)
+        circuit.reset()
+        circuit.run(args.cycles)
+        circuit.stream(None)
+    for device in circuit.devices:
+        if hasattr(device, "flush"):
+            device.flush()
+    if args.lcd:
+        from chips.hd44780 import HD44780
+        for device in circuit.devices:
+            if isinstance(device, HD44780):
+                print(device)
+    print(f"PC={cpu._PC:04x} A={cpu._A:02x} X={cpu._X:02x} Y={cpu._Y:02x} "
+          f"S={cpu._S:02x} P={cpu._P:02x} cycles={cpu._cycles}")
+
+
+def interactive(circuit):
+    """ runs the machine in the curses UI, clocked from the keyboard. """
+    # the UI and keyboard backends are only loaded here, headless runs never need them.
+    from utils import curses_wrapper
+
+    # the keyboard drives PHI2 edge by edge, the pins being shown in between.
+    circuit.half_cycles = True
+    curses_wrapper(_tui)(circuit=circuit)
+
+
+def _tui(stdscr, circuit):
+    import curses
+    from pynput import keyboard
+
+    from utils import cpu_wrapper
+    from utils import on_press
+    from utils import on_release
 
     curses.curs_set(0)
     stdscr.nodelay(1)
@@ -60,6 +183,71 @@ def main(stdscr):
         listener.join()
 
 
+def arguments():
+    """ the parser of the command line options describing the machine and its run. """
+    parser = argparse.ArgumentParser("parser to help the architecture of the 6502-based machine.")
+
+    parser.add_argument("--ram-bits", "-rb", type=int, default=15,
+                        help="the number of bits used by RAM (defaults to 15).")
+    parser.add_argument("--ram-org", "-ao", default=0x0000,
+                        help="the base address of RAM (defaults to $0000).")
+    parser.add_argument("--rom-file", "-rf", default="bin/a.out",
+                        help="the ROM file (defaults to'bin/a.out').")
+    parser.add_argument("--rom-org", "-oo", default=0x8000,
+                        help="the base address of ROM (defaults to $8000).")
+    parser.add_argument("--via-org", "-vo", type=_number, default=None,
+                        help="the base address of the 16 registers of the VIA, not mapped by default.")
+    parser.add_argument("--acia-org", "-so", type=_number, default=None,
+                        help="the base address of the 4 registers of the ACIA, not mapped by default.")
+    parser.add_argument("--acia", "-s", default=None,
+                        help="the host side of the ACIA line: 'pty' or 'tcp:PORT' on localhost.")
+    parser.add_argument("--lcd", action="store_true",
+                        help="wire an HD44780 LCD to the VIA, D0-D7 on port B, E, RW and RS on PA7-PA5.")
+    parser.add_argument("--sd", default=None,
+                        help="an SD card image, on the VIA: SCK on PB0, MOSI on PB1, CS on PB2 and MISO on PB6.")
+    parser.add_argument("--sd-writable", action="store_true",
+                        help="write the blocks written to the SD card into its image, read-only otherwise.")
+    parser.add_argument("--disk", default=None,
+                        help="a disk image for the block device, mapped in memory.")
+    parser.add_argument("--disk-writable", action="store_true",
+                        help="write the sectors written to the block device into its image in place, read-only otherwise.")
+    parser.add_argument("--disk-org", "-do", type=_number, default=None,
+                        help="the base address of the block device, its 512-byte window is at +$200.")
+    parser.add_argument("--memory-map", "-mm", default=None,
+                        help="a JSON or TOML memory-map file, replaces the RAM and ROM options.")
+    parser.add_argument("--headless", action="store_true",
+                        help="run without curses nor keyboard, for a number of cycles.")
+    parser.add_argument("--cycles", "-c", type=int, default=1000000,
+                        help="the number of cycles of a headless run (defaults to 1000000).")
+    parser.add_argument("--fast", "-f", action="store_true",
+                        help="use the instruction-level engine for the headless run.")
+    parser.add_argument("--translate", "-x", action="store_true",
+                        help="run the headless run as basic blocks translated to Python functions.")
+    parser.add_argument("--trace", "-t", default=None,
+                        help="stream every bus cycle of the headless run to a binary trace file, cycle-stepped core only.")
+    return parser
+
+
+def main():
+    parser = arguments()
+    args = parser.parse_args()
+    # the SD card is wired to the port B of the VIA, the LCD takes it for its data.
+    if args.sd is not None and args.lcd:
+        parser.error("--sd and --lcd both use the port B of the VIA.")
+    # only the cycle-stepped core goes through the bus cycle by cycle.
+    if args.trace is not None and (args.fast or args.translate):
+        parser.error("--trace needs the cycle-stepped core, not --fast nor --translate.")
+
+    try:
+        circuit = build(args)
+    except ValueError as error:
+        parser.error(str(error))
+    if args.headless:
+        headless(circuit, args)
+    else:
+        interactive(circuit=circuit)
+
+
 if __name__ == "__main__":
     try:
         main()
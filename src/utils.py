@@ -1,17 +1,18 @@
 import os
-import curses
-import traceback
-from pynput import keyboard
 
 from chips.pins import M65C02_PHI2
 from chips.pins import M65C02_RESB
+from chips.pins import M65C02_IRQB
+from chips.pins import M65C02_NMIB
 
-# directories initializations.
+# directories, the log one is created on the first log.
+# curses, pynput and traceback are only imported by the interactive helpers below, so that
+# the core modules and the headless runs stick to the standard library.
 _root = os.path.dirname(os.path.realpath(__file__)) + "/.."
-_log = os.path.join(_root, ".log")
-if not os.path.exists(_log):
-    os.makedirs(_log)
-_log = os.path.join(_log, "log")
+_log = os.path.join(_root, ".log", "log")
+
+# the number of cycles run by the fast engine on each 'f' key stroke.
+FAST_CYCLES = 1000000
 
 
 def print8(byte):
@@ -72,11 +73,14 @@ def log(*args, sep=' ', end='\n'):
         -------
         None
     """
+    os.makedirs(os.path.dirname(_log), exist_ok=True)
     with open(_log, 'a') as file:
         file.write(sep.join(map(str, args)) + end)
 
 def curses_wrapper(func):
     def wrapper(*args, **kwargs):
+        import curses
+
         log("init")
         stdscr = curses.initscr()
         curses.noecho()
@@ -123,6 +127,7 @@ def cpu_wrapper(func, stdscr, circuit):
         try:
             func(*args, stdscr=stdscr, circuit=circuit, **kwargs)
         except Exception as e:  # looking for real exceptions to handle, temporary.
+            import traceback
             print(f"EXCEPTION of type {type(e)} SKIPPED:", e)
             print(traceback.format_exc())
     return wrapped_func
@@ -138,12 +143,22 @@ def on_press(key, stdscr, circuit, prt=print):
         prt : function, optional
             a print-like function. Might be void if no verbose.
     """
+    from pynput import keyboard
+
     if isinstance(key, keyboard._xorg.KeyCode):
         print('\r', end='')
         if key.char.lower() == 'c':
             circuit.pins |= M65C02_PHI2
         elif key.char.lower() == 'r':
-            circuit.pins &= (M65C02_RESB ^ ((1<<40) - 1))
+            circuit.drive(M65C02_RESB, True)
+        elif key.char.lower() == 'i':
+            circuit.drive(M65C02_IRQB, True)
+        elif key.char.lower() == 'n':
+            circuit.drive(M65C02_NMIB, True)
+        elif key.char.lower() == 'f':
+            if not circuit.fast:
+                circuit.to_fast(stdscr)
+            circuit.run_fast(FAST_CYCLES)
 
     circuit.update(stdscr)
     circuit.flip(stdscr)
@@ -159,11 +174,17 @@ def on_release(key, stdscr, circuit, prt=print):
         prt : function, optional
             a print-like function. Might be void if no verbose.
     """
+    from pynput import keyboard
+
     if isinstance(key, keyboard._xorg.KeyCode):
         if key.char.lower() == 'c':
             circuit.pins &= (M65C02_PHI2 ^ ((1<<40) - 1))
         elif key.char.lower() == 'r':
-            circuit.pins |= M65C02_RESB
+            circuit.drive(M65C02_RESB, False)
+        elif key.char.lower() == 'i':
+            circuit.drive(M65C02_IRQB, False)
+        elif key.char.lower() == 'n':
+            circuit.drive(M65C02_NMIB, False)
 
     circuit.update(stdscr)
     circuit.flip(stdscr)